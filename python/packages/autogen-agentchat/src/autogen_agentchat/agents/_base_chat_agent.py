@@ -8,6 +8,7 @@
 from ..messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionOutputEvent,
     ModelClientStreamingChunkEvent,
     TextMessage,
 )
@@ -206,8 +207,8 @@ async def run_stream(
                     yield TaskResult(messages=output_messages)
                 else:
                     yield message
-                    if isinstance(message, ModelClientStreamingChunkEvent):
-                        # Skip the model client streaming chunk events.
+                    if isinstance(message, (ModelClientStreamingChunkEvent, CodeExecutionOutputEvent)):
+                        # Skip the streaming chunk events.
                         continue
                     output_messages.append(message)
 
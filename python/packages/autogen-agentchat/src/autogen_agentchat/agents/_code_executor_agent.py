@@ -9,7 +9,7 @@
 )
 
 from autogen_core import CancellationToken, Component, ComponentModel
-from autogen_core.code_executor import CodeBlock, CodeExecutor, CodeResult
+from autogen_core.code_executor import CodeBlock, CodeExecutor, CodeOutputChunk, CodeResult
 from autogen_core.model_context import (
     ChatCompletionContext,
     UnboundedChatCompletionContext,
@@ -31,6 +31,7 @@
     BaseAgentEvent,
     BaseChatMessage,
     CodeExecutionEvent,
+    CodeExecutionOutputEvent,
     CodeGenerationEvent,
     HandoffMessage,
     ModelClientStreamingChunkEvent,
@@ -55,6 +56,7 @@ class CodeExecutorAgentConfig(BaseModel):
     model_client_stream: bool = False
     model_context: ComponentModel | None = None
     supported_languages: List[str] | None = None
+    stream_code_output: bool = False
 
 
 class RetryDecision(BaseModel):
@@ -113,6 +115,11 @@ class CodeExecutorAgent(BaseChatAgent, Component[CodeExecutorAgentConfig]):
             If the code execution fails after this number of retries, the agent will yield a reflection result.
         supported_languages (List[str], optional): List of programming languages that will be parsed and executed from agent response;
             others will be ignored. Defaults to DEFAULT_SUPPORTED_LANGUAGES.
+        stream_code_output (bool, optional): If `True`, the code is executed with
+            :meth:`~autogen_core.code_executor.CodeExecutor.execute_code_blocks_stream`, and
+            :meth:`on_messages_stream` and :meth:`BaseChatAgent.run_stream` methods also yield
+            :class:`~autogen_agentchat.messages.CodeExecutionOutputEvent` messages as the code produces output.
+            Like model client streaming chunks, these events are not included in the task result. Defaults to `False`.
 
 
     .. note::
@@ -350,6 +357,7 @@ def __init__(
         system_message: str | None = DEFAULT_SYSTEM_MESSAGE,
         sources: Sequence[str] | None = None,
         supported_languages: List[str] | None = None,
+        stream_code_output: bool = False,
     ) -> None:
         if description is None:
             if model_client is None:
@@ -362,6 +370,7 @@ def __init__(
         self._sources = sources
         self._model_client_stream = model_client_stream
         self._max_retries_on_error = max_retries_on_error
+        self._stream_code_output = stream_code_output
 
         if supported_languages is not None:
             self._supported_languages = supported_languages
@@ -436,7 +445,12 @@ async def on_messages_stream(
                     )
                 )
                 return
-            execution_result = await self.execute_code_block(code_blocks, cancellation_token)
+            async for execution_output in self._execute_code_block_stream(code_blocks, 0, cancellation_token):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    yield execution_output
+            assert execution_result is not None
             yield Response(chat_message=TextMessage(content=execution_result.output, source=self.name))
             return
 
@@ -507,7 +521,15 @@ async def on_messages_stream(
             yield inferred_text_message
 
             # Step 8: Execute the extracted code blocks
-            execution_result = await self.execute_code_block(inferred_text_message.code_blocks, cancellation_token)
+            execution_result = None
+            async for execution_output in self._execute_code_block_stream(
+                inferred_text_message.code_blocks, nth_try, cancellation_token
+            ):
+                if isinstance(execution_output, CodeResult):
+                    execution_result = execution_output
+                else:
+                    yield execution_output
+            assert execution_result is not None
 
             # Step 9: Update model context with the code execution result
             await model_context.add_message(
@@ -586,7 +608,31 @@ async def execute_code_block(
     ) -> CodeResult:
         # Execute the code blocks.
         result = await self._code_executor.execute_code_blocks(code_blocks, cancellation_token=cancellation_token)
+        return self._format_execution_result(result)
+
+    async def _execute_code_block_stream(
+        self, code_blocks: List[CodeBlock], retry_attempt: int, cancellation_token: CancellationToken
+    ) -> AsyncGenerator[CodeExecutionOutputEvent | CodeResult, None]:
+        """Execute the code blocks, yielding output events if output streaming is enabled and then the result."""
+        if not self._stream_code_output:
+            yield await self.execute_code_block(code_blocks, cancellation_token)
+            return
 
+        result: CodeResult | None = None
+        async for item in self._code_executor.execute_code_blocks_stream(
+            code_blocks, cancellation_token=cancellation_token
+        ):
+            if isinstance(item, CodeOutputChunk):
+                yield CodeExecutionOutputEvent(
+                    content=item.output, stream=item.stream, retry_attempt=retry_attempt, source=self.name
+                )
+            else:
+                result = item
+        assert result is not None, "The code executor should yield the result as the last item."
+        yield self._format_execution_result(result)
+
+    @staticmethod
+    def _format_execution_result(result: CodeResult) -> CodeResult:
         if result.output.strip() == "":
             # No output
             result.output = f"The script ran but produced no output to console. The POSIX exit code was: {result.exit_code}. If you were expecting output, consider revising the script to ensure content is printed to stdout."
@@ -625,6 +671,7 @@ def _to_config(self) -> CodeExecutorAgentConfig:
             model_client_stream=self._model_client_stream,
             model_context=self._model_context.dump_component(),
             supported_languages=self._supported_languages,
+            stream_code_output=self._stream_code_output,
         )
 
     @classmethod
@@ -641,6 +688,7 @@ def _from_config(cls, config: CodeExecutorAgentConfig) -> Self:
             model_client_stream=config.model_client_stream,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
             supported_languages=config.supported_languages,
+            stream_code_output=config.stream_code_output,
         )
 
     @staticmethod
@@ -16,6 +16,7 @@
 from ..messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionOutputEvent,
     HandoffMessage,
     ModelClientStreamingChunkEvent,
     TextMessage,
@@ -199,8 +200,8 @@ async def on_messages_stream(
                 result = inner_msg
             else:
                 yield inner_msg
-                if isinstance(inner_msg, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(inner_msg, (ModelClientStreamingChunkEvent, CodeExecutionOutputEvent)):
+                    # Skip the streaming chunk events.
                     continue
                 inner_messages.append(inner_msg)
         assert result is not None
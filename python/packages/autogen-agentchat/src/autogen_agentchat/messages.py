@@ -487,6 +487,26 @@ def to_text(self) -> str:
         return self.result.output
 
 
+class CodeExecutionOutputEvent(BaseAgentEvent):
+    """An event signaling a chunk of output from code that is being executed.
+
+    The complete output is in the :class:`CodeExecutionEvent` that follows the chunks."""
+
+    content: str
+    """A chunk of the output."""
+
+    stream: Literal["stdout", "stderr"]
+    """The output stream the chunk was written to."""
+
+    retry_attempt: int = 0
+    "Retry number, 0 means first execution"
+
+    type: Literal["CodeExecutionOutputEvent"] = "CodeExecutionOutputEvent"
+
+    def to_text(self) -> str:
+        return self.content
+
+
 class ToolCallExecutionEvent(BaseAgentEvent):
     """An event signaling the execution of tool calls."""
 
@@ -605,6 +625,7 @@ def __init__(self) -> None:
         self._message_types[SelectSpeakerEvent.__name__] = SelectSpeakerEvent
         self._message_types[CodeGenerationEvent.__name__] = CodeGenerationEvent
         self._message_types[CodeExecutionEvent.__name__] = CodeExecutionEvent
+        self._message_types[CodeExecutionOutputEvent.__name__] = CodeExecutionOutputEvent
 
     def is_registered(self, message_type: type[BaseAgentEvent | BaseChatMessage]) -> bool:
         """Check if a message type is registered with the factory."""
@@ -660,7 +681,8 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
     | ThoughtEvent
     | SelectSpeakerEvent
     | CodeGenerationEvent
-    | CodeExecutionEvent,
+    | CodeExecutionEvent
+    | CodeExecutionOutputEvent,
     Field(discriminator="type"),
 ]
 """The union type of all built-in concrete subclasses of :class:`BaseAgentEvent`."""
@@ -690,4 +712,5 @@ def create(self, data: Mapping[str, Any]) -> BaseAgentEvent | BaseChatMessage:
     "MessageFactory",
     "CodeGenerationEvent",
     "CodeExecutionEvent",
+    "CodeExecutionOutputEvent",
 ]
@@ -18,6 +18,7 @@
 from ...messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionOutputEvent,
     MessageFactory,
     ModelClientStreamingChunkEvent,
     StopMessage,
@@ -361,7 +362,8 @@ async def run_stream(
 
         .. note::
 
-            If an agent produces :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`,
+            If an agent produces :class:`~autogen_agentchat.messages.ModelClientStreamingChunkEvent`
+            or :class:`~autogen_agentchat.messages.CodeExecutionOutputEvent`,
             the message will be yielded in the stream but it will not be included in the
             :attr:`~autogen_agentchat.base.TaskResult.messages`.
 
@@ -555,8 +557,8 @@ async def stop_runtime() -> None:
                     stop_reason = message.message.content
                     break
                 yield message
-                if isinstance(message, ModelClientStreamingChunkEvent):
-                    # Skip the model client streaming chunk events.
+                if isinstance(message, (ModelClientStreamingChunkEvent, CodeExecutionOutputEvent)):
+                    # Skip the streaming chunk events.
                     continue
                 output_messages.append(message)
 
@@ -13,6 +13,7 @@
 from autogen_agentchat.messages import (
     BaseAgentEvent,
     BaseChatMessage,
+    CodeExecutionOutputEvent,
     ModelClientStreamingChunkEvent,
     MultiModalMessage,
     UserInputRequestedEvent,
@@ -113,6 +114,8 @@ async def Console(
     last_processed: Optional[T] = None
 
     streaming_chunks: List[str] = []
+    # Output of running code is streamed apart from model chunks, and is followed by its CodeExecutionEvent.
+    code_output_chunks: List[str] = []
 
     async for message in stream:
         if isinstance(message, TaskResult):
@@ -171,6 +174,21 @@ async def Console(
         else:
             # Cast required for mypy to be happy
             message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore
+            if isinstance(message, CodeExecutionOutputEvent):
+                if not code_output_chunks:
+                    if streaming_chunks:
+                        streaming_chunks.clear()
+                        await aprint("", end="\n", flush=True)
+                    await aprint(
+                        f"{'-' * 10} {message.__class__.__name__} ({message.source}) {'-' * 10}", end="\n", flush=True
+                    )
+                await aprint(message.to_text(), end="", flush=True)
+                code_output_chunks.append(message.content)
+                continue
+            if code_output_chunks:
+                if not code_output_chunks[-1].endswith("\n"):
+                    await aprint("", end="\n", flush=True)
+                code_output_chunks.clear()
             if not streaming_chunks:
                 # Print message sender.
                 await aprint(
@@ -1,12 +1,19 @@
+from typing import AsyncGenerator
+
 import pytest
 from autogen_agentchat.agents import CodeExecutorAgent
-from autogen_agentchat.base import Response
+from autogen_agentchat.base import Response, TaskResult
 from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
     CodeExecutionEvent,
+    CodeExecutionOutputEvent,
     CodeGenerationEvent,
     TextMessage,
 )
+from autogen_agentchat.ui import Console
 from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeResult
 from autogen_core.models import ModelFamily, ModelInfo
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 from autogen_ext.models.replay import ReplayChatCompletionClient
@@ -430,3 +437,63 @@ async def test_code_execution_agent_serialization_with_model_client() -> None:
     assert isinstance(deserialized_agent, CodeExecutorAgent)
     assert deserialized_agent.name == "code_executor_agent"
     assert deserialized_agent._model_client is not None  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_code_execution_output_streaming() -> None:
+    """Test that output chunks are yielded as events when streaming code output"""
+
+    agent = CodeExecutorAgent(
+        name="code_executor", code_executor=LocalCommandLineCodeExecutor(), stream_code_output=True
+    )
+    messages = [
+        TextMessage(
+            content="""
+```python
+import sys
+print("first", flush=True)
+print("warning", file=sys.stderr, flush=True)
+print("second")
+```
+""".strip(),
+            source="assistant",
+        )
+    ]
+
+    output_events: list[CodeExecutionOutputEvent] = []
+    response: Response | None = None
+    async for message in agent.on_messages_stream(messages, CancellationToken()):
+        if isinstance(message, CodeExecutionOutputEvent):
+            output_events.append(message)
+        elif isinstance(message, Response):
+            response = message
+
+    assert "".join(e.content for e in output_events if e.stream == "stdout") == "first\nsecond\n"
+    assert "".join(e.content for e in output_events if e.stream == "stderr") == "warning\n"
+    assert response is not None
+    assert isinstance(response.chat_message, TextMessage)
+    assert "first" in response.chat_message.content and "second" in response.chat_message.content
+
+    # Output events are streamed but not included in the task result.
+    result = await agent.run(task=messages[0])
+    assert not any(isinstance(m, CodeExecutionOutputEvent) for m in result.messages)
+    assert agent.dump_component().config["stream_code_output"] is True
+
+
+@pytest.mark.asyncio
+async def test_console_prints_code_execution_after_output_chunks(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the console prints the code execution result after the streamed output of the code"""
+
+    async def stream() -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+        yield CodeExecutionOutputEvent(content="first\n", stream="stdout", source="code_executor")
+        yield CodeExecutionOutputEvent(content="second\n", stream="stdout", source="code_executor")
+        result = CodeResult(exit_code=0, output="first\nsecond\n")
+        yield CodeExecutionEvent(retry_attempt=0, result=result, source="code_executor")
+        yield TaskResult(messages=[])
+
+    await Console(stream())
+
+    output = capsys.readouterr().out
+    assert output.index("CodeExecutionOutputEvent (code_executor)") < output.index("first\nsecond\n")
+    # The result of the execution follows the streamed output with its own header.
+    assert "---------- CodeExecutionEvent (code_executor) ----------\nfirst\nsecond\n" in output
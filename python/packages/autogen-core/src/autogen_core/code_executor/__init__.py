@@ -1,4 +1,4 @@
-from ._base import CodeBlock, CodeExecutor, CodeResult
+from ._base import CodeBlock, CodeExecutor, CodeOutputChunk, CodeResult
 from ._func_with_reqs import (
     Alias,
     FunctionWithRequirements,
@@ -12,6 +12,7 @@
     "CodeBlock",
     "CodeExecutor",
     "CodeResult",
+    "CodeOutputChunk",
     "Alias",
     "ImportFromModule",
     "Import",
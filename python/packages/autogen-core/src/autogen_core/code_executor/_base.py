@@ -6,7 +6,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from types import TracebackType
-from typing import List, Optional, Type
+from typing import AsyncGenerator, List, Literal, Optional, Type
 
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -31,6 +31,14 @@ class CodeResult:
     output: str
 
 
+@dataclass
+class CodeOutputChunk:
+    """A chunk of output produced while code is executing."""
+
+    output: str
+    stream: Literal["stdout", "stderr"]
+
+
 class CodeExecutor(ABC, ComponentBase[BaseModel]):
     """Executes code blocks and returns the result.
 
@@ -71,6 +79,22 @@ async def execute_code_blocks(
         """
         ...
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[CodeOutputChunk | CodeResult, None]:
+        """Execute code blocks and yield their output as it is produced.
+
+        Yields :class:`CodeOutputChunk` instances while the code runs, followed by the
+        :class:`CodeResult` of the execution as the last item. The default implementation
+        does not stream and only yields the result of :meth:`execute_code_blocks`; code
+        executors that can observe output incrementally should override it.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): A token to cancel the operation.
+        """
+        yield await self.execute_code_blocks(code_blocks, cancellation_token)
+
     @abstractmethod
     async def start(self) -> None:
         """Start the code executor."""
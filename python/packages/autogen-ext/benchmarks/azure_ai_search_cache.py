@@ -0,0 +1,169 @@
+"""Benchmark the result and embedding caches of AzureAISearchTool against a fake search service.
+
+A hybrid search tool with client-side embeddings runs ``--queries`` queries, drawn from
+``--distinct`` distinct queries with Zipf-distributed popularity, in bursts of ``--concurrency``
+concurrent runs, as from parallel agents. The search client and the embedding client are fakes
+with a fixed latency per request (``--search-ms`` and ``--embedding-ms``), and the embedding
+client serves at most ``--embedding-concurrency`` requests at a time, as under a rate limit. The phases are:
+
+- ``uncached``: every run searches and embeds its query, one embedding request per query.
+- ``cached``: the bounded result and embedding caches, with concurrent runs of the same query
+  sharing one search, and one embedding request per query.
+- ``cached_batched``: as ``cached``, with the queries embedded in the same burst batched in one request.
+
+Reported are the mean and p99 run latency, the runs per second, the cache hit rate, and the
+number of search and embedding requests.
+
+Run with::
+
+    python benchmarks/azure_ai_search_cache.py --queries 2000 --distinct 500 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from autogen_ext.tools.azure import AzureAISearchTool
+from azure.core.credentials import AzureKeyCredential
+
+
+class FakeSearchClient:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.requests = 0
+
+    async def search(self, **kwargs: Any) -> Any:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        text = kwargs.get("search_text", "")
+
+        async def documents() -> Any:
+            for i in range(5):
+                yield {"id": f"{text}-{i}", "content": f"Document {i} about {text}", "@search.score": 1.0 / (i + 1)}
+
+        return documents()
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeEmbeddingClient:
+    def __init__(self, latency: float, concurrency: int) -> None:
+        self.latency = latency
+        self.requests = 0
+        self.embeddings = self
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(self, model: str, input: Any) -> Any:
+        texts = [input] if isinstance(input, str) else input
+        async with self._semaphore:
+            self.requests += 1
+            await asyncio.sleep(self.latency)
+
+        class Data:
+            def __init__(self, embedding: List[float]) -> None:
+                self.embedding = embedding
+
+        class Response:
+            data = [Data([float(len(text))] * 8) for text in texts]
+
+        return Response()
+
+    async def close(self) -> None:
+        pass
+
+
+class BenchmarkSearchTool(AzureAISearchTool):
+    search_client: FakeSearchClient
+    embedding_client: FakeEmbeddingClient
+
+    async def _get_client(self) -> Any:
+        return self.search_client
+
+    def _create_embedding_client(self, embedding_provider: str) -> Any:
+        return self.embedding_client
+
+
+async def _run_phase(args: argparse.Namespace, queries: List[str], caching: bool, batch_size: int) -> Dict[str, Any]:
+    tool = BenchmarkSearchTool.create_hybrid_search(
+        name="search",
+        endpoint="https://benchmark.search.windows.net",
+        index_name="documents",
+        credential=AzureKeyCredential("key"),
+        search_fields=["content"],
+        vector_fields=["embedding"],
+        embedding_provider="openai",
+        embedding_model="text-embedding-3-small",
+        openai_api_key="key",
+        enable_caching=caching,
+        cache_max_entries=args.cache_entries,
+        embedding_batch_size=batch_size,
+    )
+    assert isinstance(tool, BenchmarkSearchTool)
+    tool.search_client = FakeSearchClient(args.search_ms / 1000)
+    tool.embedding_client = FakeEmbeddingClient(args.embedding_ms / 1000, args.embedding_concurrency)
+
+    latencies: List[float] = []
+
+    async def run(query: str) -> None:
+        start = time.perf_counter()
+        await tool.run(query)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(0, len(queries), args.concurrency):
+        await asyncio.gather(*(run(query) for query in queries[i : i + args.concurrency]))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    cache = tool._cache  # pyright: ignore[reportPrivateUsage]
+    return {
+        "runs_per_s": len(queries) / elapsed,
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "hit_rate": cache.hits / len(queries) if caching else 0.0,
+        "cached_entries": len(cache),
+        "search_requests": tool.search_client.requests,
+        "embedding_requests": tool.embedding_client.requests,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.distinct)]
+    queries = [f"query {i}" for i in rng.choices(range(args.distinct), weights=weights, k=args.queries)]
+    return {
+        "uncached": await _run_phase(args, queries, caching=False, batch_size=1),
+        "cached": await _run_phase(args, queries, caching=True, batch_size=1),
+        "cached_batched": await _run_phase(args, queries, caching=True, batch_size=args.concurrency),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=500, help="Distinct queries.")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of the query popularity.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent runs per burst.")
+    parser.add_argument("--cache-entries", type=int, default=200, help="Maximum cached results and embeddings.")
+    parser.add_argument("--search-ms", type=float, default=40.0)
+    parser.add_argument("--embedding-ms", type=float, default=60.0)
+    parser.add_argument("--embedding-concurrency", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = {
+        "queries": args.queries,
+        "distinct": args.distinct,
+        "concurrency": args.concurrency,
+        "cache_entries": args.cache_entries,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
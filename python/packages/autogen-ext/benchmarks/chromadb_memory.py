@@ -0,0 +1,226 @@
+"""Benchmark ChromaDBVectorMemory ingest rate, query rate and event loop latency.
+
+While each phase runs, a ticker task sleeps for 1 ms in a loop and records by how much it
+oversleeps, which is how long the event loop was blocked. The phases are:
+
+- ``inline_add``: ``--inline-count`` memories added one at a time with the ChromaDB collection
+  called directly on the event loop, as ``ChromaDBVectorMemory`` did before it used a worker thread.
+- ``add``: the same memories added one at a time with :meth:`ChromaDBVectorMemory.add`.
+- ``add_many``: ``--count`` memories added with :meth:`ChromaDBVectorMemory.add_many` in chunks of
+  ``--chunk``, embedded and inserted in batches of ``--batch-size``.
+- ``write_buffer``: ``--count`` memories added one at a time with a write buffer of ``--batch-size``.
+- ``inline_query`` and ``query``: ``--queries`` queries from ``--concurrency`` concurrent clients,
+  with the collection called on the event loop, and with :meth:`ChromaDBVectorMemory.query`, which
+  combines concurrent queries into one request.
+
+By default, embeddings are derived from a hash of the text so the benchmark measures ChromaDB and
+not an embedding model; pass ``--embedding default`` to use ChromaDB's default model, or
+``--embedding-delay`` to add a fixed delay per embedding call, as a remote embedding API would.
+Note that the local ChromaDB bindings hold the GIL while writing, so with the hash embeddings the
+event loop still stalls for about as long as a batch takes to insert; ``--batch-size`` bounds it.
+
+Run with::
+
+    python benchmarks/chromadb_memory.py --count 100000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import statistics
+import tempfile
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List
+
+import numpy as np
+from autogen_core.memory import MemoryContent, MemoryMimeType
+from autogen_ext.memory.chromadb import (
+    ChromaDBVectorMemory,
+    CustomEmbeddingFunctionConfig,
+    DefaultEmbeddingFunctionConfig,
+    PersistentChromaDBVectorMemoryConfig,
+)
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+
+class HashEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self, dim: int, delay: float) -> None:
+        self._dim = dim
+        self._delay = delay
+
+    def __call__(self, input: Documents) -> Embeddings:
+        time.sleep(self._delay)
+        embeddings: Embeddings = []
+        for text in input:
+            digest = hashlib.sha256(text.encode()).digest()
+            embeddings.append(np.resize(np.frombuffer(digest, dtype=np.uint8), self._dim).astype(np.float32))
+        return embeddings
+
+
+def _text(i: int) -> str:
+    return f"Memory {i}: the user mentioned topic {i % 997} while discussing project {i % 31}."
+
+
+async def _measure(work: Callable[[], Awaitable[int]]) -> Dict[str, float]:
+    """Run ``work``, which returns the number of operations, while measuring event loop lag."""
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(max(0.0, time.perf_counter() - start - 0.001))
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    operations = await work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker_task
+    ordered = sorted(lags) or [0.0]
+    return {
+        "operations": operations,
+        "per_second": operations / elapsed,
+        "seconds": elapsed,
+        "loop_lag_p50_ms": ordered[len(ordered) // 2] * 1000,
+        "loop_lag_p99_ms": ordered[int(len(ordered) * 0.99)] * 1000,
+        "loop_lag_max_ms": ordered[-1] * 1000,
+        "loop_lag_mean_ms": statistics.mean(ordered) * 1000,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.embedding == "hash":
+        embedding_function_config: Any = CustomEmbeddingFunctionConfig(
+            function=HashEmbeddingFunction, params={"dim": args.dim, "delay": args.embedding_delay / 1000}
+        )
+    else:
+        embedding_function_config = DefaultEmbeddingFunctionConfig()
+    count: int = args.count
+    inline_count: int = args.inline_count
+    chunk: int = args.chunk
+    concurrency: int = args.concurrency
+    per_client: int = args.queries // concurrency
+    results: Dict[str, Any] = {}
+
+    with tempfile.TemporaryDirectory() as path:
+
+        def config(name: str, **kwargs: Any) -> PersistentChromaDBVectorMemoryConfig:
+            return PersistentChromaDBVectorMemoryConfig(
+                collection_name=name,
+                persistence_path=path,
+                embedding_function_config=embedding_function_config,
+                batch_size=args.batch_size,
+                **kwargs,
+            )
+
+        # The collection used directly, the way the memory used it before.
+        inline_memory = ChromaDBVectorMemory(config("inline"))
+        inline_memory._ensure_initialized()  # type: ignore[reportPrivateUsage]
+        collection = inline_memory._collection  # type: ignore[reportPrivateUsage]
+        assert collection is not None
+
+        async def inline_add() -> int:
+            for i in range(inline_count):
+                collection.add(ids=[str(uuid.uuid4())], documents=[_text(i)], metadatas=[{"mime_type": "text/plain"}])
+                await asyncio.sleep(0)
+            return inline_count
+
+        results["inline_add"] = await _measure(inline_add)
+
+        memory = ChromaDBVectorMemory(config("add"))
+
+        async def add() -> int:
+            for i in range(inline_count):
+                await memory.add(MemoryContent(content=_text(i), mime_type=MemoryMimeType.TEXT))
+            return inline_count
+
+        results["add"] = await _measure(add)
+        await memory.close()
+
+        memory = ChromaDBVectorMemory(config("add_many"))
+
+        async def add_many() -> int:
+            for start in range(0, count, chunk):
+                await memory.add_many(
+                    [
+                        MemoryContent(content=_text(i), mime_type=MemoryMimeType.TEXT)
+                        for i in range(start, min(start + chunk, count))
+                    ]
+                )
+            return count
+
+        results["add_many"] = await _measure(add_many)
+
+        buffered_memory = ChromaDBVectorMemory(config("write_buffer", write_buffer_size=args.batch_size))
+
+        async def write_buffer() -> int:
+            for i in range(count):
+                await buffered_memory.add(MemoryContent(content=_text(i), mime_type=MemoryMimeType.TEXT))
+            await buffered_memory.flush()
+            return count
+
+        results["write_buffer"] = await _measure(write_buffer)
+        await buffered_memory.close()
+
+        # Query the add_many collection, which holds --count memories.
+        inline_memory = ChromaDBVectorMemory(config("add_many"))
+        inline_memory._ensure_initialized()  # type: ignore[reportPrivateUsage]
+        query_collection = inline_memory._collection  # type: ignore[reportPrivateUsage]
+        assert query_collection is not None
+
+        async def inline_query() -> int:
+            async def client(offset: int) -> None:
+                for i in range(per_client):
+                    query_collection.query(query_texts=[_text(offset + i)], n_results=3)
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(*(client(c * per_client) for c in range(concurrency)))
+            return per_client * concurrency
+
+        results["inline_query"] = await _measure(inline_query)
+
+        async def query() -> int:
+            async def client(offset: int) -> None:
+                for i in range(per_client):
+                    await memory.query(_text(offset + i))
+
+            await asyncio.gather(*(client(c * per_client) for c in range(concurrency)))
+            return per_client * concurrency
+
+        results["query"] = await _measure(query)
+        await memory.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="Memories added by add_many and write_buffer.")
+    parser.add_argument("--inline-count", type=int, default=5_000, help="Memories added one request at a time.")
+    parser.add_argument("--chunk", type=int, default=1_000, help="Memories per add_many call.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--embedding", choices=["hash", "default"], default="hash")
+    parser.add_argument("--dim", type=int, default=384, help="Dimension of the hash embeddings.")
+    parser.add_argument(
+        "--embedding-delay", type=float, default=0.0, help="Milliseconds each hash embedding call takes."
+    )
+    args = parser.parse_args()
+
+    result = {
+        "count": args.count,
+        "inline_count": args.inline_count,
+        "batch_size": args.batch_size,
+        "embedding": args.embedding,
+        "embedding_delay_ms": args.embedding_delay,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark memory use of LocalCommandLineCodeExecutor when a code block floods its output.
+
+Runs a code block that prints ``--megabytes`` of output and reports the peak memory
+allocated by the executor process (measured with :mod:`tracemalloc`) for:
+
+- ``communicate``: the previous approach of collecting the whole output with ``proc.communicate()``.
+- ``unbounded``: the executor without an output limit, which still keeps all output.
+- ``capped``: the executor with ``max_output_bytes``, which keeps the head and the tail.
+- ``kill_on_overflow``: the executor terminating the code block once the limit is exceeded.
+
+Run with::
+
+    python benchmarks/code_executor_output_memory.py --megabytes 200 --max-output-bytes 65536
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
+
+
+def _flood_code(megabytes: int) -> str:
+    return f"import sys\nline = 'x' * 1023 + '\\n'\nfor _ in range({megabytes} * 1024):\n    sys.stdout.write(line)\n"
+
+
+async def _measure(run: Callable[[], Awaitable[int]]) -> Dict[str, Any]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    output_size = await run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"peak_mb": peak / 2**20, "seconds": elapsed, "output_chars": output_size}
+
+
+async def bench(megabytes: int, max_output_bytes: int) -> Dict[str, Any]:
+    code = _flood_code(megabytes)
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        async def communicate() -> int:
+            script = Path(work_dir) / "flood.py"
+            script.write_text(code)
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(script),
+                cwd=work_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            stdout, stderr = await proc.communicate()
+            return len(stderr.decode() + stdout.decode())
+
+        results["communicate"] = await _measure(communicate)
+
+        for name, kwargs in [
+            ("unbounded", {}),
+            ("capped", {"max_output_bytes": max_output_bytes}),
+            ("kill_on_overflow", {"max_output_bytes": max_output_bytes, "kill_on_output_overflow": True}),
+        ]:
+            executor = LocalCommandLineCodeExecutor(work_dir=work_dir, timeout=600, **kwargs)
+
+            async def execute(executor: LocalCommandLineCodeExecutor = executor) -> int:
+                result = await executor.execute_code_blocks(
+                    [CodeBlock(code=code, language="python")], CancellationToken()
+                )
+                return len(result.output)
+
+            results[name] = await _measure(execute)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megabytes", type=int, default=200, help="Output printed by the code block.")
+    parser.add_argument("--max-output-bytes", type=int, default=65536)
+    args = parser.parse_args()
+
+    result = {
+        "megabytes": args.megabytes,
+        "max_output_bytes": args.max_output_bytes,
+        **asyncio.run(bench(args.megabytes, args.max_output_bytes)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
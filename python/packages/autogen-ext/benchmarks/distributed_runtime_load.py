@@ -0,0 +1,387 @@
+"""Load test and latency benchmark for the distributed (gRPC) agent runtime.
+
+Starts a local :class:`GrpcWorkerAgentRuntimeHost` and ``--workers`` worker processes on
+localhost, then drives the following scenarios from a driver runtime in this process:
+
+- ``rpc_chain``: request/response chains. Each request hops through ``--chain-length``
+  agents, placed round-robin across the worker processes, and the response travels back.
+  Latency is the round-trip time measured by the driver.
+- ``fanout``: the driver publishes events to a topic that ``--subscribers-per-worker``
+  agent types in every worker subscribe to. Latency is measured by each subscriber from
+  the publish timestamp.
+
+Payload sizes are drawn at random from ``--payload-sizes`` for every message. The same
+scenarios are also run against :class:`~autogen_core.SingleThreadedAgentRuntime` as a
+baseline (disable with ``--skip-baseline``).
+
+Results, including throughput and p50/p99/p999 latency, are printed as JSON and optionally
+written to ``--output`` for comparison across versions.
+
+Run with::
+
+    python benchmarks/distributed_runtime_load.py --workers 2 --messages 2000 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import platform
+import random
+import time
+from dataclasses import dataclass
+from multiprocessing.queues import Queue
+from typing import Any, Dict, List, Sequence, Tuple
+
+from autogen_core import (
+    AgentId,
+    AgentRuntime,
+    MessageContext,
+    RoutedAgent,
+    SingleThreadedAgentRuntime,
+    TopicId,
+    TypeSubscription,
+    message_handler,
+    try_get_known_serializers_for_type,
+)
+
+FANOUT_TOPIC = "bench_fanout"
+
+
+@dataclass
+class ChainRequest:
+    seq: int
+    hop: int
+    payload: str
+
+
+@dataclass
+class ChainResponse:
+    seq: int
+    payload: str
+
+
+@dataclass
+class FanoutEvent:
+    seq: int
+    sent_at: float
+    payload: str
+
+
+MESSAGE_TYPES = [ChainRequest, ChainResponse, FanoutEvent]
+
+
+class FanoutStats:
+    """Latency samples collected by the subscribers living in one process."""
+
+    def __init__(self) -> None:
+        self.expected = 0
+        self.samples: List[Tuple[int, float]] = []
+        self.last_received = 0.0
+        self.done = asyncio.Event()
+
+    def reset(self, expected: int) -> None:
+        self.expected = expected
+        self.samples = []
+        self.last_received = 0.0
+        self.done = asyncio.Event()
+        if expected == 0:
+            self.done.set()
+
+    def record(self, payload_size: int, sent_at: float) -> None:
+        now = time.time()
+        self.samples.append((payload_size, now - sent_at))
+        self.last_received = now
+        if len(self.samples) >= self.expected:
+            self.done.set()
+
+
+class ChainAgent(RoutedAgent):
+    def __init__(self, chain_length: int) -> None:
+        super().__init__("A request/response chain hop.")
+        self._chain_length = chain_length
+
+    @message_handler
+    async def on_request(self, message: ChainRequest, ctx: MessageContext) -> ChainResponse:
+        next_hop = message.hop + 1
+        if next_hop < self._chain_length:
+            response: ChainResponse = await self.send_message(
+                ChainRequest(seq=message.seq, hop=next_hop, payload=message.payload),
+                AgentId(chain_agent_type(next_hop), self.id.key),
+            )
+            return response
+        return ChainResponse(seq=message.seq, payload=message.payload)
+
+
+class FanoutAgent(RoutedAgent):
+    def __init__(self, stats: FanoutStats) -> None:
+        super().__init__("A fan-out subscriber.")
+        self._stats = stats
+
+    @message_handler
+    async def on_event(self, message: FanoutEvent, ctx: MessageContext) -> None:
+        self._stats.record(len(message.payload), message.sent_at)
+
+
+def chain_agent_type(hop: int) -> str:
+    return f"bench_chain_{hop}"
+
+
+def fanout_agent_type(worker: int, index: int) -> str:
+    return f"bench_fanout_{worker}_{index}"
+
+
+async def register_agents(
+    runtime: AgentRuntime,
+    worker: int,
+    num_workers: int,
+    chain_length: int,
+    subscribers_per_worker: int,
+    stats: FanoutStats,
+) -> None:
+    runtime.add_message_serializer([s for t in MESSAGE_TYPES for s in try_get_known_serializers_for_type(t)])
+    for hop in range(chain_length):
+        if hop % num_workers == worker:
+            await ChainAgent.register(runtime, chain_agent_type(hop), lambda: ChainAgent(chain_length))
+    for index in range(subscribers_per_worker):
+        agent_type = fanout_agent_type(worker, index)
+        await FanoutAgent.register(runtime, agent_type, lambda: FanoutAgent(stats), skip_class_subscriptions=True)
+        await runtime.add_subscription(TypeSubscription(FANOUT_TOPIC, agent_type))
+
+
+def percentiles(latencies: Sequence[float]) -> Dict[str, float]:
+    if not latencies:
+        return {"p50": 0.0, "p99": 0.0, "p999": 0.0, "mean": 0.0, "max": 0.0}
+    ordered = sorted(latencies)
+
+    def at(quantile: float) -> float:
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] * 1000
+
+    return {
+        "p50": at(0.5),
+        "p99": at(0.99),
+        "p999": at(0.999),
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def summarize(
+    runtime: str, scenario: str, samples: Sequence[Tuple[int, float]], duration: float, payload_sizes: Sequence[int]
+) -> Dict[str, Any]:
+    return {
+        "runtime": runtime,
+        "scenario": scenario,
+        "messages": len(samples),
+        "duration_s": duration,
+        "throughput_msgs_per_s": len(samples) / duration if duration > 0 else 0.0,
+        "latency_ms": percentiles([latency for _, latency in samples]),
+        "latency_ms_by_payload_size": {
+            str(size): percentiles([latency for s, latency in samples if s == size]) for size in payload_sizes
+        },
+    }
+
+
+async def drive_rpc_chain(
+    runtime: AgentRuntime, messages: int, concurrency: int, payloads: Sequence[str]
+) -> Tuple[List[Tuple[int, float]], float]:
+    samples: List[Tuple[int, float]] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(seq: int) -> None:
+        payload = payloads[seq % len(payloads)]
+        async with semaphore:
+            start = time.perf_counter()
+            await runtime.send_message(
+                ChainRequest(seq=seq, hop=0, payload=payload), AgentId(chain_agent_type(0), str(seq % concurrency))
+            )
+            samples.append((len(payload), time.perf_counter() - start))
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one(seq) for seq in range(messages)])
+    return samples, time.perf_counter() - start
+
+
+async def drive_fanout(runtime: AgentRuntime, messages: int, rate: float, payloads: Sequence[str]) -> float:
+    """Publish the events and return the wall clock time of the first publish."""
+    interval = 1.0 / rate if rate > 0 else 0.0
+    start = time.time()
+    for seq in range(messages):
+        payload = payloads[seq % len(payloads)]
+        await runtime.publish_message(
+            FanoutEvent(seq=seq, sent_at=time.time(), payload=payload), TopicId(FANOUT_TOPIC, "bench")
+        )
+        if interval:
+            await asyncio.sleep(interval)
+        elif seq % 100 == 0:
+            # Yield so that the runtime can make progress while publishing.
+            await asyncio.sleep(0)
+    return start
+
+
+def worker_main(
+    host_address: str,
+    worker: int,
+    args: argparse.Namespace,
+    commands: "Queue[Tuple[str, int]]",
+    results: "Queue[Tuple[int, Any]]",
+) -> None:
+    asyncio.run(_worker_main(host_address, worker, args, commands, results))
+
+
+async def _worker_main(
+    host_address: str,
+    worker: int,
+    args: argparse.Namespace,
+    commands: "Queue[Tuple[str, int]]",
+    results: "Queue[Tuple[int, Any]]",
+) -> None:
+    from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime
+
+    stats = FanoutStats()
+    runtime = GrpcWorkerAgentRuntime(host_address=host_address)
+    await runtime.start()
+    await register_agents(runtime, worker, args.workers, args.chain_length, args.subscribers_per_worker, stats)
+    results.put((worker, "ready"))
+    while True:
+        command, expected = await asyncio.to_thread(commands.get)
+        if command == "fanout":
+            stats.reset(expected)
+            results.put((worker, "armed"))
+            try:
+                await asyncio.wait_for(stats.done.wait(), timeout=args.timeout)
+            except asyncio.TimeoutError:
+                pass
+            results.put((worker, (stats.samples, stats.last_received)))
+        elif command == "stop":
+            break
+    await runtime.stop()
+
+
+def make_payloads(sizes: Sequence[int], count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return ["x" * rng.choice(sizes) for _ in range(count)]
+
+
+async def run_distributed(args: argparse.Namespace, payloads: Sequence[str]) -> List[Dict[str, Any]]:
+    from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+
+    host_address = f"localhost:{args.port}"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    context = mp.get_context("spawn")
+    results: "Queue[Tuple[int, Any]]" = context.Queue()
+    command_queues: List["Queue[Tuple[str, int]]"] = [context.Queue() for _ in range(args.workers)]
+    processes = [
+        context.Process(target=worker_main, args=(host_address, worker, args, command_queues[worker], results))
+        for worker in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    async def collect(status: str) -> List[Any]:
+        collected: List[Any] = []
+        while len(collected) < args.workers:
+            _, value = await asyncio.to_thread(results.get, True, args.timeout)
+            if status and value != status:
+                raise RuntimeError(f"Expected worker status {status}, got {value}.")
+            collected.append(value)
+        return collected
+
+    driver = GrpcWorkerAgentRuntime(host_address=host_address)
+    driver_started = False
+    output: List[Dict[str, Any]] = []
+    try:
+        await collect("ready")
+        await driver.start()
+        driver_started = True
+        driver.add_message_serializer([s for t in MESSAGE_TYPES for s in try_get_known_serializers_for_type(t)])
+
+        # Warm up connections and agent instances.
+        await drive_rpc_chain(driver, args.concurrency, args.concurrency, payloads)
+        samples, duration = await drive_rpc_chain(driver, args.messages, args.concurrency, payloads)
+        output.append(summarize("grpc", "rpc_chain", samples, duration, args.payload_sizes))
+
+        for queue in command_queues:
+            queue.put(("fanout", args.messages * args.subscribers_per_worker))
+        await collect("armed")
+        start = await drive_fanout(driver, args.messages, args.publish_rate, payloads)
+        worker_results = await collect("")
+        fanout_samples = [sample for samples, _ in worker_results for sample in samples]
+        end = max(last for _, last in worker_results)
+        output.append(summarize("grpc", "fanout", fanout_samples, end - start, args.payload_sizes))
+    finally:
+        for queue in command_queues:
+            queue.put(("stop", 0))
+        for process in processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        if driver_started:
+            await driver.stop()
+        await host.stop()
+    return output
+
+
+async def run_single_threaded(args: argparse.Namespace, payloads: Sequence[str]) -> List[Dict[str, Any]]:
+    stats = FanoutStats()
+    runtime = SingleThreadedAgentRuntime()
+    for worker in range(args.workers):
+        await register_agents(runtime, worker, args.workers, args.chain_length, args.subscribers_per_worker, stats)
+    runtime.start()
+    output: List[Dict[str, Any]] = []
+
+    await drive_rpc_chain(runtime, args.concurrency, args.concurrency, payloads)
+    samples, duration = await drive_rpc_chain(runtime, args.messages, args.concurrency, payloads)
+    output.append(summarize("single_threaded", "rpc_chain", samples, duration, args.payload_sizes))
+
+    stats.reset(args.messages * args.subscribers_per_worker * args.workers)
+    start = await drive_fanout(runtime, args.messages, args.publish_rate, payloads)
+    await asyncio.wait_for(stats.done.wait(), timeout=args.timeout)
+    output.append(summarize("single_threaded", "fanout", stats.samples, stats.last_received - start, args.payload_sizes))
+
+    await runtime.stop()
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes.")
+    parser.add_argument("--messages", type=int, default=1000, help="Requests and events per scenario.")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent requests in the RPC scenario.")
+    parser.add_argument("--chain-length", type=int, default=3, help="Hops per request in the RPC scenario.")
+    parser.add_argument("--subscribers-per-worker", type=int, default=4, help="Fan-out subscribers per worker.")
+    parser.add_argument(
+        "--payload-sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[64, 1024, 16384],
+        help="Comma separated payload sizes in bytes, mixed at random.",
+    )
+    parser.add_argument("--publish-rate", type=float, default=0.0, help="Events per second, 0 for as fast as possible.")
+    parser.add_argument("--port", type=int, default=50151)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for a scenario to complete.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-baseline", action="store_true", help="Do not run the single threaded baseline.")
+    parser.add_argument("--output", type=str, default=None, help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.payload_sizes, 1024, args.seed)
+    results = asyncio.run(run_distributed(args, payloads))
+    if not args.skip_baseline:
+        results += asyncio.run(run_single_threaded(args, payloads))
+
+    report = {
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "python": platform.python_version(),
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
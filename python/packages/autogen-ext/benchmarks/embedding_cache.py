@@ -0,0 +1,146 @@
+"""Benchmark query latency of ChromaDBVectorMemory with and without an EmbeddingCache.
+
+Simulates an agent whose turns repeat: ``--queries`` queries are drawn with a Zipf
+distribution (exponent ``--zipf``) from ``--distinct`` distinct texts, against a memory of
+``--memories`` entries. The embedding function sleeps for ``--embedding-delay`` milliseconds
+per call, as a remote embedding API or a model on a busy machine would. The phases are:
+
+- ``no_cache``: every query is embedded.
+- ``memory_cache``: an :class:`EmbeddingCache` with only the in-memory tier.
+- ``disk_cache_restart``: a fresh :class:`EmbeddingCache` whose second tier is a
+  :class:`DiskCacheStore` filled by an earlier run, as after a process restart.
+
+Reported are query latencies, embedding calls and the hit rates of the cache.
+
+Run with::
+
+    python benchmarks/embedding_cache.py --queries 2000 --distinct 300 --embedding-delay 20
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from autogen_core.memory import MemoryContent, MemoryMimeType
+from autogen_ext.cache_store.diskcache import DiskCacheStore
+from autogen_ext.memory.chromadb import (
+    ChromaDBVectorMemory,
+    CustomEmbeddingFunctionConfig,
+    PersistentChromaDBVectorMemoryConfig,
+)
+from autogen_ext.memory.embedding_cache import EmbeddingCache
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from diskcache import Cache
+
+
+class SlowEmbeddingFunction(EmbeddingFunction[Documents]):
+    def __init__(self, delay: float, counter: List[int]) -> None:
+        self._delay = delay
+        self._counter = counter
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self._counter.append(len(input))
+        time.sleep(self._delay)
+        return [
+            np.resize(np.frombuffer(hashlib.sha256(text.encode()).digest(), dtype=np.uint8), 384).astype(np.float32)
+            for text in input
+        ]
+
+
+async def _run(
+    path: str,
+    args: argparse.Namespace,
+    queries: List[str],
+    embedding_cache: Optional[EmbeddingCache],
+) -> Dict[str, Any]:
+    calls: List[int] = []
+    memory = ChromaDBVectorMemory(
+        PersistentChromaDBVectorMemoryConfig(
+            collection_name="memories",
+            persistence_path=path,
+            embedding_function_config=CustomEmbeddingFunctionConfig(
+                function=SlowEmbeddingFunction, params={"delay": args.embedding_delay / 1000, "counter": calls}
+            ),
+            embedding_cache=embedding_cache,
+        )
+    )
+    # Only the first run adds the memories; the collection persists across runs.
+    if not args.populated:
+        await memory.add_many(
+            [MemoryContent(content=f"memory {i}", mime_type=MemoryMimeType.TEXT) for i in range(args.memories)]
+        )
+        args.populated = True
+    calls.clear()
+    if embedding_cache is not None:
+        embedding_cache.reset_stats()
+
+    latencies: List[float] = []
+    for query in queries:
+        start = time.perf_counter()
+        await memory.query(query)
+        latencies.append(time.perf_counter() - start)
+    await memory.close()
+
+    ordered = sorted(latencies)
+    result: Dict[str, Any] = {
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[int(len(ordered) * 0.99)] * 1000,
+        "total_s": sum(ordered),
+        "embedding_calls": len(calls),
+    }
+    if embedding_cache is not None:
+        stats = embedding_cache.stats
+        result.update(hits=stats.hits, store_hits=stats.store_hits, misses=stats.misses, hit_rate=stats.hit_rate)
+    return result
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.distinct)]
+    queries = [
+        f"what did the user say about topic {index}?"
+        for index in rng.choices(range(args.distinct), weights=weights, k=args.queries)
+    ]
+    args.populated = False
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as path, tempfile.TemporaryDirectory() as cache_dir:
+        results["no_cache"] = await _run(path, args, queries, None)
+        results["memory_cache"] = await _run(path, args, queries, EmbeddingCache(max_entries=args.max_entries))
+        with Cache(cache_dir) as disk_cache:
+            store = DiskCacheStore[bytes](disk_cache)
+            await _run(path, args, queries, EmbeddingCache(max_entries=args.max_entries, store=store))
+            results["disk_cache_restart"] = await _run(
+                path, args, queries, EmbeddingCache(max_entries=args.max_entries, store=store)
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--distinct", type=int, default=300, help="Distinct query texts.")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Exponent of the query popularity distribution.")
+    parser.add_argument("--memories", type=int, default=1_000)
+    parser.add_argument("--max-entries", type=int, default=10_000, help="Entries of the in-memory tier.")
+    parser.add_argument("--embedding-delay", type=float, default=20.0, help="Milliseconds per embedding call.")
+    args = parser.parse_args()
+
+    result = {
+        "queries": args.queries,
+        "distinct": args.distinct,
+        "embedding_delay_ms": args.embedding_delay,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
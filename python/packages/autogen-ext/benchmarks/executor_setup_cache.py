@@ -0,0 +1,103 @@
+"""Benchmark LocalCommandLineCodeExecutor startup with and without the function setup cache.
+
+Measures the time from starting an executor, whose functions require ``--packages``, to the
+end of its first code block, which includes setting up the functions:
+
+- ``no_cache``: the default, which runs ``pip install`` into the interpreter and loads the
+  functions module on every start.
+- ``cold_cache``: a :class:`FunctionSetupCache` without the entry, which installs the packages
+  into the cache.
+- ``warm_cache``: the same cache with the entry, which skips pip and the load check.
+- ``concurrent_cold_cache``: ``--concurrency`` executors starting together on an empty cache,
+  of which only one builds the entry.
+
+Run with::
+
+    python benchmarks/executor_setup_cache.py --packages requests,tabulate --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock, FunctionWithRequirements, with_requirements
+from autogen_ext.code_executors.local import FunctionSetupCache, LocalCommandLineCodeExecutor
+
+
+def import_packages(names: list[str]) -> int:
+    import importlib
+
+    return len([importlib.import_module(name) for name in names])
+
+
+async def _startup(
+    function: FunctionWithRequirements[Any, Any], packages: List[str], setup_cache: Optional[FunctionSetupCache]
+) -> float:
+    with tempfile.TemporaryDirectory() as work_dir:
+        start = time.perf_counter()
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=work_dir, timeout=600, functions=[function], setup_cache=setup_cache
+        )
+        await executor.start()
+        code = f"from {executor.functions_module} import import_packages\nprint(import_packages({packages!r}))"
+        result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken())
+        elapsed = time.perf_counter() - start
+        await executor.stop()
+    if result.exit_code != 0:
+        raise RuntimeError(result.output)
+    return elapsed
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    return {"mean_s": statistics.mean(latencies), "min_s": min(latencies), "max_s": max(latencies)}
+
+
+async def bench(packages: List[str], runs: int, concurrency: int) -> Dict[str, Any]:
+    function = with_requirements(python_packages=packages)(import_packages)
+    results: Dict[str, Any] = {}
+    results["no_cache"] = _summary([await _startup(function, packages, None) for _ in range(runs)])
+
+    cold: List[float] = []
+    warm: List[float] = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            setup_cache = FunctionSetupCache(cache_dir)
+            cold.append(await _startup(function, packages, setup_cache))
+            warm.append(await _startup(function, packages, setup_cache))
+    results["cold_cache"] = _summary(cold)
+    results["warm_cache"] = _summary(warm)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        setup_cache = FunctionSetupCache(cache_dir)
+        start = time.perf_counter()
+        await asyncio.gather(*(_startup(function, packages, setup_cache) for _ in range(concurrency)))
+        results["concurrent_cold_cache"] = {"executors": concurrency, "total_s": time.perf_counter() - start}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", default="requests,tabulate", help="Comma separated packages the functions need.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    if sys.platform == "win32":
+        parser.error("The setup cache is not supported on Windows.")
+
+    packages = [package for package in args.packages.split(",") if package]
+    result = {
+        "packages": packages,
+        "runs": args.runs,
+        **asyncio.run(bench(packages, args.runs, args.concurrency)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
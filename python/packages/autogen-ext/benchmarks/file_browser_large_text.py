@@ -0,0 +1,161 @@
+"""Benchmark MarkdownFileBrowser, as used by FileSurfer, on a large generated log file.
+
+A log of ``--mb`` megabytes is written, with a rare line near its end. For each pipeline, the
+file is opened, paged through for ``--pages`` viewports, searched ``--finds`` times for the rare
+line and for a common word, and opened again. The pipelines are:
+
+- ``baseline``: as before, the whole file converted with MarkItDown and split into viewports on open,
+  and each viewport normalized again on every search.
+- ``indexed``: the file converted lazily as it is paged through, a search index built on the first
+  search, and the converted document cached for the reopen.
+
+Reported are the times to the first viewport, to page down, of the first and later searches,
+and to reopen the file.
+
+Run with::
+
+    python benchmarks/file_browser_large_text.py --mb 50 --pages 20 --finds 5
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from autogen_ext.agents.file_surfer._markdown_file_browser import MarkdownFileBrowser
+from markitdown import MarkItDown  # type: ignore
+
+VIEWPORT_SIZE = 1024 * 5  # As used by FileSurfer
+RARE_LINE = "2024-01-01 23:59:59 ERROR checksum mismatch in segment 4471"
+
+
+def _write_log(path: str, size: int) -> None:
+    with open(path, "w") as f:
+        written = 0
+        rare_written = False
+        i = 0
+        while written < size:
+            line = f"2024-01-01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d} INFO GET /api/items/{i} 200 {i % 997}ms\n"
+            if not rare_written and written >= size * 0.9:
+                line = RARE_LINE + "\n"
+                rare_written = True
+            f.write(line)
+            written += len(line)
+            i += 1
+
+
+class _BaselineBrowser:
+    """The conversion, splitting and search of MarkdownFileBrowser before the search index and lazy conversion."""
+
+    def __init__(self) -> None:
+        self._converter = MarkItDown()
+        self.content = ""
+        self.pages: List[Tuple[int, int]] = []
+        self.current = 0
+
+    def open(self, path: str) -> str:
+        self.content = self._converter.convert_local(path).text_content
+        self.pages = []
+        start_idx = 0
+        while start_idx < len(self.content):
+            end_idx = min(start_idx + VIEWPORT_SIZE, len(self.content))
+            while end_idx < len(self.content) and self.content[end_idx - 1] not in [" ", "\t", "\r", "\n"]:
+                end_idx += 1
+            self.pages.append((start_idx, end_idx))
+            start_idx = end_idx
+        self.current = 0
+        return self.viewport
+
+    @property
+    def viewport(self) -> str:
+        start, end = self.pages[self.current]
+        return self.content[start:end]
+
+    def page_down(self) -> None:
+        self.current = min(self.current + 1, len(self.pages) - 1)
+
+    def find(self, query: str) -> int | None:
+        nquery = " " + (" ".join(re.split(r"\W+", query))).strip().lower() + " "
+        for i in list(range(self.current + 1, len(self.pages))) + list(range(0, self.current + 1)):
+            start, end = self.pages[i]
+            ncontent = " " + (" ".join(re.split(r"\W+", self.content[start:end]))).strip().lower() + " "
+            if re.search(nquery, ncontent):
+                self.current = i
+                return i
+        return None
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _bench_baseline(args: argparse.Namespace, path: str) -> Dict[str, Any]:
+    browser = _BaselineBrowser()
+    result: Dict[str, Any] = {"first_viewport_ms": _timed(lambda: browser.open(path))}
+    result["page_down_ms"] = statistics.mean(_timed(browser.page_down) for _ in range(args.pages))
+    result.update(_bench_finds(args, browser.find))
+    result["reopen_ms"] = _timed(lambda: browser.open(path))
+    return result
+
+
+def _bench_indexed(args: argparse.Namespace, path: str) -> Dict[str, Any]:
+    browser = MarkdownFileBrowser(viewport_size=VIEWPORT_SIZE, base_path=os.path.dirname(path))
+
+    def first_viewport() -> None:
+        browser.open_path(path)
+        _ = browser.viewport_count  # As shown in the FileSurfer header
+
+    result: Dict[str, Any] = {"first_viewport_ms": _timed(first_viewport)}
+
+    def page_down() -> None:
+        browser.page_down()
+        _ = browser.viewport
+
+    result["page_down_ms"] = statistics.mean(_timed(page_down) for _ in range(args.pages))
+    result["viewport_count_before_search"] = browser.viewport_count
+
+    def find(query: str) -> int | None:
+        browser.find_on_page(query)
+        return browser.viewport_current_page
+
+    result.update(_bench_finds(args, find))
+    result["viewport_count"] = browser.viewport_count
+    result["reopen_ms"] = _timed(lambda: browser.open_path(path))
+    return result
+
+
+def _bench_finds(args: argparse.Namespace, find: Callable[[str], int | None]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for name, query in (("rare", RARE_LINE), ("common", "GET api items")):
+        times = [_timed(lambda query=query: find(query)) for _ in range(args.finds)]  # type: ignore[misc]
+        result[f"find_{name}_first_ms"] = times[0]
+        result[f"find_{name}_later_ms"] = statistics.mean(times[1:]) if len(times) > 1 else None
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=50.0, help="Size of the log file in megabytes.")
+    parser.add_argument("--pages", type=int, default=20, help="Viewports to page down through.")
+    parser.add_argument("--finds", type=int, default=5, help="Searches per query.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "server.log")
+        _write_log(path, int(args.mb * 1024 * 1024))
+        result = {
+            "mb": args.mb,
+            "baseline": _bench_baseline(args, path),
+            "indexed": _bench_indexed(args, path),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Benchmark loading a synthetic GraphRAG index for the GraphRAG tools, with and without a GraphRAGIndexStore.
+
+A synthetic index with the tables and columns of a GraphRAG 2.x output is written, with ``--entities``
+entities, three relationships per entity, a text unit per four entities, and a community with a report
+per 20 entities. ``--workers`` worker processes, started one after another, each load the data of a
+``LocalSearchTool`` and a ``GlobalSearchTool``, as the workers of a server would, and stay alive while
+their memory is measured. The tools themselves are not created, as they need a tokenizer and the
+LanceDB vector store. The phases are:
+
+- ``baseline``: each tool reads its Parquet files with ``pd.read_parquet``, as without a store.
+- ``store_cold``: the tools share the :class:`GraphRAGIndexStore` of the process, which converts the
+  Parquet files to Arrow files first.
+- ``store_warm``: as ``store_cold``, with the Arrow files already converted, as for later worker starts.
+
+Reported are the mean startup time of the workers, the resident set size (RSS) of a worker after its
+imports, the mean RSS of the workers after loading, and the total proportional set size (PSS) of the
+workers, which counts memory shared between them once (from ``/proc``, so Linux only).
+
+Run with::
+
+    python benchmarks/graphrag_index_store.py --entities 20000 --workers 4
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+
+def _words(rng: random.Random, count: int) -> str:
+    vocabulary = ["graph", "community", "entity", "relation", "report", "search", "station", "master", "doctor"]
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+
+def _write_index(path: str, num_entities: int, seed: int) -> None:
+    rng = random.Random(seed)
+    entity_ids = [f"entity-{i}" for i in range(num_entities)]
+    text_unit_ids = [f"text-unit-{i}" for i in range(max(num_entities // 4, 1))]
+    relationship_ids = [f"relationship-{i}" for i in range(num_entities * 3)]
+    num_communities = max(num_entities // 20, 1)
+
+    pd.DataFrame(
+        {
+            "id": entity_ids,
+            "human_readable_id": range(num_entities),
+            "title": [f"ENTITY {i}" for i in range(num_entities)],
+            "type": [rng.choice(["PERSON", "PLACE", "EVENT"]) for _ in entity_ids],
+            "description": [_words(rng, 40) for _ in entity_ids],
+            "text_unit_ids": [[text_unit_ids[i // 4]] for i in range(num_entities)],
+            "frequency": [rng.randint(1, 10) for _ in entity_ids],
+            "degree": [rng.randint(1, 30) for _ in entity_ids],
+            "x": [0.0] * num_entities,
+            "y": [0.0] * num_entities,
+        }
+    ).to_parquet(os.path.join(path, "entities.parquet"))
+    pd.DataFrame(
+        {
+            "id": relationship_ids,
+            "human_readable_id": range(len(relationship_ids)),
+            "source": [f"ENTITY {i // 3}" for i in range(len(relationship_ids))],
+            "target": [f"ENTITY {rng.randrange(num_entities)}" for _ in relationship_ids],
+            "description": [_words(rng, 25) for _ in relationship_ids],
+            "weight": [rng.random() * 10 for _ in relationship_ids],
+            "combined_degree": [rng.randint(2, 60) for _ in relationship_ids],
+            "text_unit_ids": [[text_unit_ids[i // 12]] for i in range(len(relationship_ids))],
+        }
+    ).to_parquet(os.path.join(path, "relationships.parquet"))
+    pd.DataFrame(
+        {
+            "id": text_unit_ids,
+            "human_readable_id": range(len(text_unit_ids)),
+            "text": [_words(rng, 200) for _ in text_unit_ids],
+            "n_tokens": [300] * len(text_unit_ids),
+            "document_ids": [["document-0"]] * len(text_unit_ids),
+            "entity_ids": [entity_ids[i * 4 : i * 4 + 4] for i in range(len(text_unit_ids))],
+            "relationship_ids": [relationship_ids[i * 12 : i * 12 + 12] for i in range(len(text_unit_ids))],
+            "covariate_ids": [[]] * len(text_unit_ids),
+        }
+    ).to_parquet(os.path.join(path, "text_units.parquet"))
+    communities = range(num_communities)
+    pd.DataFrame(
+        {
+            "id": [f"community-{c}" for c in communities],
+            "human_readable_id": communities,
+            "community": communities,
+            "level": [0] * num_communities,
+            "parent": [-1] * num_communities,
+            "children": [[]] * num_communities,
+            "title": [f"Community {c}" for c in communities],
+            "entity_ids": [entity_ids[c * 20 : c * 20 + 20] for c in communities],
+            "relationship_ids": [relationship_ids[c * 60 : c * 60 + 60] for c in communities],
+            "text_unit_ids": [text_unit_ids[c * 5 : c * 5 + 5] for c in communities],
+            "period": ["2024-12-16"] * num_communities,
+            "size": [20] * num_communities,
+        }
+    ).to_parquet(os.path.join(path, "communities.parquet"))
+    findings = [[{"summary": _words(rng, 8), "explanation": _words(rng, 80)} for _ in range(5)] for _ in communities]
+    pd.DataFrame(
+        {
+            "id": [f"report-{c}" for c in communities],
+            "human_readable_id": communities,
+            "community": communities,
+            "level": [0] * num_communities,
+            "parent": [-1] * num_communities,
+            "children": [[]] * num_communities,
+            "title": [f"Report {c}" for c in communities],
+            "summary": [_words(rng, 60) for _ in communities],
+            "full_content": [_words(rng, 500) for _ in communities],
+            "rank": [rng.random() * 10 for _ in communities],
+            "rating_explanation": [_words(rng, 30) for _ in communities],
+            "findings": findings,
+            "full_content_json": [json.dumps({"findings": f, "summary": _words(rng, 60)}) for f in findings],
+            "period": ["2024-12-16"] * num_communities,
+            "size": [20] * num_communities,
+        }
+    ).to_parquet(os.path.join(path, "community_reports.parquet"))
+
+
+def _load_baseline(input_dir: str) -> List[Any]:
+    """The loading of LocalSearchTool and GlobalSearchTool before the index store."""
+    from graphrag.query.indexer_adapters import (
+        read_indexer_communities,
+        read_indexer_entities,
+        read_indexer_relationships,
+        read_indexer_reports,
+        read_indexer_text_units,
+    )
+
+    def read(table: str) -> pd.DataFrame:  # type: ignore[no-any-unimported]
+        return pd.read_parquet(f"{input_dir}/{table}.parquet")  # type: ignore
+
+    local_data = [
+        read_indexer_entities(read("entities"), read("communities"), 2),
+        read_indexer_relationships(read("relationships")),
+        read_indexer_text_units(read("text_units")),
+    ]
+    global_data = [
+        read_indexer_communities(read("communities"), read("community_reports")),
+        read_indexer_reports(read("community_reports"), read("communities"), 2),
+        read_indexer_entities(read("entities"), read("communities"), 2),
+    ]
+    return local_data + global_data
+
+
+def _load_store(input_dir: str, cache_dir: str) -> List[Any]:
+    """The loading of LocalSearchTool and GlobalSearchTool with the shared index store."""
+    from autogen_ext.tools.graphrag import GraphRAGIndexStore
+
+    store = GraphRAGIndexStore.shared(input_dir, cache_dir=cache_dir)
+    local_data = [
+        store.entities("entities", "communities", 2),
+        store.relationships("relationships"),
+        store.text_units("text_units"),
+    ]
+    store = GraphRAGIndexStore.shared(input_dir, cache_dir=cache_dir)
+    global_data = [
+        store.communities("communities", "community_reports"),
+        store.reports("community_reports", "communities", 2),
+        store.entities("entities", "communities", 2),
+    ]
+    return local_data + global_data
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _pss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _worker(args: argparse.Namespace) -> None:
+    # Import the libraries before timing, as a server worker would have
+    import autogen_ext.tools.graphrag  # noqa: F401
+
+    import_rss = _rss_mb()
+    start = time.perf_counter()
+    data = _load_baseline(args.input_dir) if args.worker == "baseline" else _load_store(args.input_dir, args.cache_dir)
+    startup = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "startup_s": startup,
+                "import_rss_mb": import_rss,
+                "rss_mb": _rss_mb(),
+                "objects": sum(len(d) for d in data),
+            }
+        ),
+        flush=True,
+    )
+    # Stay alive with the data until the parent has measured the memory
+    sys.stdin.read()
+
+
+def _run_phase(args: argparse.Namespace, mode: str, input_dir: str, cache_dir: str, workers: int) -> Dict[str, Any]:
+    command = [sys.executable, __file__, "--worker", mode, "--input-dir", input_dir, "--cache-dir", cache_dir]
+    processes: List["subprocess.Popen[str]"] = []
+    results: List[Dict[str, Any]] = []
+    try:
+        # The workers start one after another, so that their startup times are not for a shared CPU
+        for _ in range(workers):
+            process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+            processes.append(process)
+            results.append(json.loads(process.stdout.readline()))  # type: ignore[union-attr]
+        total_pss = sum(_pss_mb(process.pid) for process in processes)
+    finally:
+        for process in processes:
+            process.communicate()
+    return {
+        "startup_mean_s": sum(r["startup_s"] for r in results) / workers,
+        "import_rss_mb": results[0]["import_rss_mb"],
+        "rss_mean_mb": sum(r["rss_mb"] for r in results) / workers,
+        "pss_total_mb": total_pss,
+        "objects": results[0]["objects"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--worker", choices=["baseline", "store"], help=argparse.SUPPRESS)
+    parser.add_argument("--input-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        _worker(args)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = os.path.join(temp_dir, "output")
+        cache_dir = os.path.join(temp_dir, "cache")
+        os.makedirs(input_dir)
+        _write_index(input_dir, args.entities, args.seed)
+        index_mb = sum(os.path.getsize(os.path.join(input_dir, name)) for name in os.listdir(input_dir)) / 2**20
+        result = {
+            "entities": args.entities,
+            "workers": args.workers,
+            "index_mb": index_mb,
+            "baseline": _run_phase(args, "baseline", input_dir, cache_dir, args.workers),
+            # One worker converts the Arrow files, as the first worker to start would
+            "store_cold": _run_phase(args, "store", input_dir, cache_dir, 1),
+            "store_warm": _run_phase(args, "store", input_dir, cache_dir, args.workers),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Benchmark topic routing in the gRPC host.
+
+Compares the :class:`HostRoutingTable` used by ``GrpcWorkerAgentRuntimeHostServicer`` with
+the previous approach of resolving recipients through the generic ``SubscriptionManager``
+and mapping them to client ids under a lock, for thousands of topic types.
+
+Run with::
+
+    python benchmarks/grpc_host_routing.py --topics 2000 --clients 20 --events 50000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Set
+
+from autogen_core import TopicId, TypePrefixSubscription, TypeSubscription
+from autogen_core._runtime_impl_helpers import SubscriptionManager
+from autogen_ext.runtimes.grpc._routing_table import HostRoutingTable
+
+
+async def bench_subscription_manager(
+    agent_types: Dict[str, str],
+    subscriptions: List[TypeSubscription | TypePrefixSubscription],
+    topics: List[TopicId],
+    churn: int,
+) -> Dict[str, float]:
+    manager = SubscriptionManager()
+    lock = asyncio.Lock()
+    start = time.perf_counter()
+    for subscription in subscriptions:
+        await manager.add_subscription(subscription)
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for topic in topics:
+        recipients = await manager.get_subscribed_recipients(topic)
+        async with lock:
+            client_ids: Set[str] = set()
+            for recipient in recipients:
+                client_id = agent_types.get(recipient.type)
+                if client_id is not None:
+                    client_ids.add(client_id)
+    routing = time.perf_counter() - start
+
+    # Subscription churn once every topic has been seen triggers full rebuilds.
+    start = time.perf_counter()
+    churned = subscriptions[:churn]
+    for subscription in churned:
+        await manager.remove_subscription(subscription.id)
+        await manager.add_subscription(subscription)
+    churn_time = time.perf_counter() - start
+    return {
+        "setup_s": setup,
+        "events_per_s": len(topics) / routing,
+        "churn_ms_per_change": churn_time / (2 * len(churned)) * 1000,
+    }
+
+
+def bench_routing_table(
+    agent_types: Dict[str, str],
+    subscriptions: List[TypeSubscription | TypePrefixSubscription],
+    topics: List[TopicId],
+    churn: int,
+) -> Dict[str, float]:
+    table = HostRoutingTable()
+    start = time.perf_counter()
+    for agent_type, client_id in agent_types.items():
+        table.register_agent_type(agent_type, client_id)
+    for subscription in subscriptions:
+        table.add_subscription(subscription, agent_types[subscription.agent_type])
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for topic in topics:
+        table.get_client_ids(topic)
+    routing = time.perf_counter() - start
+
+    start = time.perf_counter()
+    churned = subscriptions[:churn]
+    for subscription in churned:
+        table.remove_subscription(subscription.id)
+        table.add_subscription(subscription, agent_types[subscription.agent_type])
+    churn_time = time.perf_counter() - start
+    return {
+        "setup_s": setup,
+        "events_per_s": len(topics) / routing,
+        "churn_ms_per_change": churn_time / (2 * len(churned)) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--prefix-subscriptions", type=int, default=10)
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--sources", type=int, default=2, help="Distinct topic sources per topic type.")
+    parser.add_argument("--churn", type=int, default=2, help="Subscriptions removed and re-added after routing.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    agent_types = {f"agent_{i}": f"client_{i % args.clients}" for i in range(args.topics)}
+    subscriptions: List[TypeSubscription | TypePrefixSubscription] = [
+        TypeSubscription(f"topic_{i}", f"agent_{i}") for i in range(args.topics)
+    ]
+    subscriptions += [
+        TypePrefixSubscription(f"topic_{i}", f"agent_{rng.randrange(args.topics)}")
+        for i in range(args.prefix_subscriptions)
+    ]
+    topics = [TopicId(f"topic_{rng.randrange(args.topics)}", f"source_{rng.randrange(args.sources)}") for _ in range(args.events)]
+
+    result = {
+        "topics": args.topics,
+        "clients": args.clients,
+        "events": args.events,
+        "subscription_manager": asyncio.run(
+            bench_subscription_manager(agent_types, subscriptions, topics, args.churn)
+        ),
+        "routing_table": bench_routing_table(agent_types, subscriptions, topics, args.churn),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Benchmark HttpTool calls against a local test server, with and without an HttpClientPool.
+
+A FastAPI server is started on uvicorn in a subprocess, optionally over TLS with a self-signed
+certificate (``--tls``, which requires the ``openssl`` command). Its GET endpoint returns a small
+JSON document per item, with ``Cache-Control: max-age`` and an ``ETag``. ``--calls`` calls for
+``--items`` distinct items are made, ``--concurrency`` at a time. The phases are:
+
+- ``per_call``: each call creates its own client, and so its own connection, as without a pool.
+- ``pooled``: the tools share an :class:`HttpClientPool`, whose connections are kept alive.
+- ``pooled_cached``: as ``pooled``, with the response cache of the pool.
+
+Reported are the calls per second, the mean and p99 call latency, and the requests the server answered.
+
+Run with::
+
+    python benchmarks/http_tool_pool.py --calls 2000 --concurrency 16 --items 50 --tls
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+from autogen_core import CancellationToken
+from autogen_ext.tools.http import HttpClientPool, HttpTool
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"item": {"type": "string", "description": "The item to get"}},
+    "required": ["item"],
+}
+
+
+def _serve(port: int, certfile: str | None, keyfile: str | None, max_age: int) -> None:
+    import uvicorn
+    from fastapi import FastAPI, Request, Response
+
+    app = FastAPI()
+    served = {"requests": 0}
+
+    @app.get("/items/{item}")
+    async def get_item(request: Request, item: str) -> Response:  # pyright: ignore[reportUnusedFunction]
+        served["requests"] += 1
+        etag = f'"{item}"'
+        headers = {"Cache-Control": f"max-age={max_age}", "ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        content = json.dumps({"item": item, "description": "A benchmark item. " * 10})
+        return Response(content=content, headers=headers, media_type="application/json")
+
+    @app.get("/served")
+    async def get_served() -> Dict[str, int]:  # pyright: ignore[reportUnusedFunction]
+        return served
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error", ssl_certfile=certfile, ssl_keyfile=keyfile)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+async def _served_requests(base_url: str) -> int:
+    async with httpx.AsyncClient() as client:
+        return int((await client.get(f"{base_url}/served")).json()["requests"])
+
+
+async def _run_phase(args: argparse.Namespace, scheme: str, port: int, pool: HttpClientPool | None) -> Dict[str, Any]:
+    base_url = f"{scheme}://127.0.0.1:{port}"
+    tools = [
+        HttpTool(
+            name=f"get_item_{i}",
+            scheme=scheme,  # type: ignore[arg-type]
+            host="127.0.0.1",
+            port=port,
+            path="/items/{item}",
+            method="GET",
+            json_schema=SCHEMA,
+            return_type="json",
+            client_pool=pool,
+        )
+        for i in range(args.concurrency)
+    ]
+    served_before = await _served_requests(base_url)
+    latencies: List[float] = []
+    next_call = 0
+
+    async def worker(tool: HttpTool) -> None:
+        nonlocal next_call
+        while next_call < args.calls:
+            item = str(next_call % args.items)
+            next_call += 1
+            start = time.perf_counter()
+            await tool.run_json({"item": item}, CancellationToken())
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(tool) for tool in tools))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "calls_per_s": args.calls / elapsed,
+        "latency_mean_ms": statistics.mean(latencies) * 1000,
+        "latency_p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "served_requests": await _served_requests(base_url) - served_before,
+    }
+
+
+async def bench(args: argparse.Namespace, scheme: str, port: int) -> Dict[str, Any]:
+    results = {"per_call": await _run_phase(args, scheme, port, None)}
+    async with HttpClientPool(max_keepalive_connections=args.concurrency) as pool:
+        results["pooled"] = await _run_phase(args, scheme, port, pool)
+    async with HttpClientPool(max_keepalive_connections=args.concurrency, cache_size=args.items) as pool:
+        results["pooled_cached"] = await _run_phase(args, scheme, port, pool)
+        results["pooled_cached"]["cache_hits"] = pool.stats.cache_hits
+        results["pooled_cached"]["cache_revalidations"] = pool.stats.cache_revalidations
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16, help="Calls in flight, each from its own tool.")
+    parser.add_argument("--items", type=int, default=50, help="Distinct items requested.")
+    parser.add_argument("--max-age", type=int, default=60, help="Max-age of the responses in seconds.")
+    parser.add_argument("--tls", action="store_true", help="Serve over HTTPS with a self-signed certificate.")
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--certfile", help=argparse.SUPPRESS)
+    parser.add_argument("--keyfile", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve is not None:
+        _serve(args.serve, args.certfile, args.keyfile, args.max_age)
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        port = _free_port()
+        server_args = [sys.executable, __file__, "--serve", str(port), "--max-age", str(args.max_age)]
+        if args.tls:
+            certfile, keyfile = os.path.join(temp_dir, "cert.pem"), os.path.join(temp_dir, "key.pem")
+            subprocess.run(
+                ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+                + ["-keyout", keyfile, "-out", certfile, "-subj", "/CN=127.0.0.1"]
+                + ["-addext", "subjectAltName=IP:127.0.0.1"],
+                check=True,
+                capture_output=True,
+            )
+            server_args += ["--certfile", certfile, "--keyfile", keyfile]
+            # Trust the certificate in the clients of this process
+            os.environ["SSL_CERT_FILE"] = certfile
+        server = subprocess.Popen(server_args)
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(0.1)
+            result = {
+                "calls": args.calls,
+                "concurrency": args.concurrency,
+                "items": args.items,
+                "tls": args.tls,
+                **asyncio.run(bench(args, "https" if args.tls else "http", port)),
+            }
+        finally:
+            server.terminate()
+            server.wait()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark JupyterCodeExecutor session start latency and throughput with and without a kernel pool.
+
+Each session starts an executor, runs ``--cells`` cells and stops the executor. Sessions run
+``--concurrency`` at a time, ``--sessions`` in total, either starting their own kernel
+(``unpooled``) or leasing one from a :class:`JupyterKernelPool` of ``--pool-size`` kernels
+(``pooled``). Returned kernels are restarted in the background, so a pool larger than the
+concurrency keeps kernels ready while others restart. Reported are the latency of ``start()``
+and the cells executed per second. With ``--image``, every cell also displays an image, which
+is written out of band as an artifact.
+
+Run with::
+
+    python benchmarks/jupyter_kernel_pool.py --sessions 20 --concurrency 4 --cells 10
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterKernelPool
+
+_IMAGE_CODE = """
+from PIL import Image
+display(Image.new("RGB", (256, 256), color=(i % 256, 0, 0)))
+"""
+
+
+async def _session(
+    output_dir: str, pool: Optional[JupyterKernelPool], cells: int, image: bool, start_latencies: List[float]
+) -> None:
+    executor = JupyterCodeExecutor(output_dir=output_dir, kernel_pool=pool)
+    start = time.perf_counter()
+    await executor.start()
+    start_latencies.append(time.perf_counter() - start)
+    await executor.execute_code_blocks([CodeBlock(code="i = 0", language="python")], CancellationToken())
+    for _ in range(cells):
+        code = "i += 1\ntotal = sum(range(10_000))\n" + (_IMAGE_CODE if image else "")
+        result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken())
+        if result.exit_code != 0:
+            raise RuntimeError(result.output)
+    await executor.stop()
+
+
+async def bench(pool_size: Optional[int], sessions: int, concurrency: int, cells: int, image: bool) -> Dict[str, Any]:
+    start_latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    pool = JupyterKernelPool(min_size=pool_size, max_size=pool_size) if pool_size is not None else None
+    pool_start = time.perf_counter()
+    if pool is not None:
+        await pool.start()
+    pool_start_s = time.perf_counter() - pool_start
+
+    async def run(output_dir: str) -> None:
+        async with semaphore:
+            await _session(output_dir, pool, cells, image, start_latencies)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        await asyncio.gather(*(run(output_dir) for _ in range(sessions)))
+        elapsed = time.perf_counter() - start
+    if pool is not None:
+        await pool.stop()
+
+    ordered = sorted(start_latencies)
+    result: Dict[str, Any] = {
+        "start_mean_ms": statistics.mean(ordered) * 1000,
+        "start_p50_ms": ordered[len(ordered) // 2] * 1000,
+        "start_max_ms": ordered[-1] * 1000,
+        "cells_per_second": sessions * cells / elapsed,
+        "seconds": elapsed,
+    }
+    if pool is not None:
+        result["pool_start_s"] = pool_start_s
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--cells", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, help="Kernels in the pool. Defaults to twice the concurrency.")
+    parser.add_argument("--image", action="store_true", help="Display an image in every cell.")
+    args = parser.parse_args()
+    pool_size = args.pool_size if args.pool_size is not None else 2 * args.concurrency
+
+    result = {
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "cells": args.cells,
+        "image": args.image,
+        "pool_size": pool_size,
+        "unpooled": asyncio.run(bench(None, args.sessions, args.concurrency, args.cells, args.image)),
+        "pooled": asyncio.run(bench(pool_size, args.sessions, args.concurrency, args.cells, args.image)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
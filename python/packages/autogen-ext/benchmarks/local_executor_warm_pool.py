@@ -0,0 +1,74 @@
+"""Benchmark per-block latency of LocalCommandLineCodeExecutor with and without the fork server.
+
+Runs the same data-analysis style code block repeatedly with a cold interpreter per block
+(the default) and with ``use_forkserver=True``, where the modules in ``--preload`` are
+imported once by the warm interpreter. The first block of the fork server mode includes
+starting the server and is reported separately.
+
+Run with::
+
+    python benchmarks/local_executor_warm_pool.py --blocks 20 --preload numpy,pandas
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import CodeBlock
+from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+async def bench(use_forkserver: bool, preload: List[str], blocks: int) -> Dict[str, object]:
+    imports = "".join(f"import {module}\n" for module in preload)
+    code = imports + "total = sum(i * i for i in range(10_000))\nprint(total)\n"
+    with tempfile.TemporaryDirectory() as work_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=work_dir, use_forkserver=use_forkserver, preload_modules=preload if use_forkserver else ()
+        )
+        await executor.start()
+        latencies: List[float] = []
+        for _ in range(blocks + 1):
+            start = time.perf_counter()
+            result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken())
+            latencies.append(time.perf_counter() - start)
+            if result.exit_code != 0:
+                raise RuntimeError(result.output)
+        await executor.stop()
+    return {"first_block_ms": latencies[0] * 1000, **_summary(latencies[1:])}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=20)
+    parser.add_argument("--preload", default="numpy,pandas", help="Comma separated modules imported by every block.")
+    args = parser.parse_args()
+    if sys.platform == "win32":
+        parser.error("The fork server is not supported on Windows.")
+
+    preload = [module for module in args.preload.split(",") if module]
+    result = {
+        "blocks": args.blocks,
+        "preload": preload,
+        "cold": asyncio.run(bench(False, preload, args.blocks)),
+        "forkserver": asyncio.run(bench(True, preload, args.blocks)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark MCP tool call throughput with and without an McpSessionPool, against a local stdio echo server.
+
+The echo server blocks for ``--work`` milliseconds per call, as a server with synchronous
+tools does, so it handles one call at a time. ``--calls`` calls are made with up to
+``--concurrency`` in flight, as for the parallel tool calls of model turns. The phases are:
+
+- ``adapter_per_call``: tool adapters without a session, which start a server per call.
+- ``workbench``: an :class:`McpWorkbench`, whose calls all go over its own session.
+- ``pooled_adapter``: tool adapters sharing an :class:`McpSessionPool`.
+- ``pooled_workbench``: two workbenches sharing an :class:`McpSessionPool`.
+
+The pool keeps ``--sessions`` warm sessions. Reported are calls per second, mean latency
+and the number of server processes started.
+
+Run with::
+
+    python benchmarks/mcp_session_pool.py --calls 200 --concurrency 8 --work 20 --sessions 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from autogen_core import CancellationToken
+from autogen_ext.tools.mcp import McpSessionPool, McpWorkbench, StdioServerParams, mcp_server_tools
+
+ECHO_SERVER = """
+import sys
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+work = float(sys.argv[1]) / 1000
+server = FastMCP("echo", log_level="WARNING")
+
+
+@server.tool()
+def echo(text: str) -> str:
+    \"\"\"Echoes the text back.\"\"\"
+    time.sleep(work)
+    return text
+
+
+server.run()
+"""
+
+
+async def _run_calls(args: argparse.Namespace, call: Callable[[int], Awaitable[None]]) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: List[float] = []
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(args.calls)))
+    elapsed = time.perf_counter() - start
+    return {"calls_per_s": args.calls / elapsed, "mean_latency_ms": statistics.mean(latencies) * 1000}
+
+
+async def bench(args: argparse.Namespace, params: StdioServerParams) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    token = CancellationToken()
+
+    tools = await mcp_server_tools(params)
+    echo = next(tool for tool in tools if tool.name == "echo")
+
+    async def call_adapter(i: int) -> None:
+        await echo.run_json({"text": str(i)}, token)
+
+    results["adapter_per_call"] = {**await _run_calls(args, call_adapter), "processes": args.calls}
+
+    async with McpWorkbench(params) as workbench:
+
+        async def call_workbench(i: int) -> None:
+            result = await workbench.call_tool("echo", {"text": str(i)})
+            assert not result.is_error, result.to_text()
+
+        results["workbench"] = {**await _run_calls(args, call_workbench), "processes": 1}
+
+    # All sessions are started before timing, to measure the throughput of a warm pool.
+    async with McpSessionPool(max_sessions_per_server=args.sessions, min_sessions_per_server=args.sessions) as pool:
+        await pool.start(params)
+        pooled_tools = await mcp_server_tools(params, session_pool=pool)
+        pooled_echo = next(tool for tool in pooled_tools if tool.name == "echo")
+
+        async def call_pooled_adapter(i: int) -> None:
+            await pooled_echo.run_json({"text": str(i)}, token)
+
+        results["pooled_adapter"] = await _run_calls(args, call_pooled_adapter)
+
+        async with McpWorkbench(params, session_pool=pool) as first, McpWorkbench(params, session_pool=pool) as second:
+            # Each workbench also starts its own session, for listing tools, which is waited for here.
+            await asyncio.gather(first.list_tools(), second.list_tools())
+
+            async def call_pooled_workbench(i: int) -> None:
+                result = await (first, second)[i % 2].call_tool("echo", {"text": str(i)})
+                assert not result.is_error, result.to_text()
+
+            results["pooled_workbench"] = await _run_calls(args, call_pooled_workbench)
+        results["pooled_processes"] = pool.stats.sessions_started
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8, help="Calls in flight at a time.")
+    parser.add_argument("--work", type=float, default=20.0, help="Milliseconds the server blocks per call.")
+    parser.add_argument("--sessions", type=int, default=4, help="Sessions kept per server by the pool.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        server_path = os.path.join(temp_dir, "echo_server.py")
+        with open(server_path, "w") as f:
+            f.write(ECHO_SERVER)
+        params = StdioServerParams(command=sys.executable, args=[server_path, str(args.work)], read_timeout_seconds=60)
+        result = {
+            "calls": args.calls,
+            "concurrency": args.concurrency,
+            "work_ms": args.work,
+            "sessions": args.sessions,
+            **asyncio.run(bench(args, params)),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
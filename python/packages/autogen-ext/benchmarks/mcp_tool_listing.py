@@ -0,0 +1,130 @@
+"""Benchmark McpWorkbench.list_tools against a local stub MCP server, with and without caching.
+
+A stub server is run over stdio with ``--tools`` tools, and takes ``--server-latency``
+milliseconds to list them, as a server that builds its tool list from a remote registry or
+a large schema would. An agent lists the tools once per turn, for ``--turns`` turns. Half way
+through, it calls the server's ``add_tool`` tool, which adds a tool and sends a
+``notifications/tools/list_changed`` notification. The phases are:
+
+- ``uncached``: ``tools_cache_ttl=0``, so every turn lists the tools from the server, as before.
+- ``cached``: the default, where the listing is cached until the server reports a change.
+
+Reported are the latency of the first ``list_tools``, which waits for the session to start,
+the mean and maximum latency of the others, and whether the added tool was listed in the turn
+after it was added.
+
+Run with::
+
+    python benchmarks/mcp_tool_listing.py --tools 50 --turns 200 --server-latency 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from autogen_ext.tools.mcp import McpWorkbench, StdioServerParams
+
+STUB_SERVER = """
+import asyncio
+import sys
+
+from mcp.server import NotificationOptions, Server
+from mcp.server.stdio import stdio_server
+from mcp.types import TextContent, Tool
+
+num_tools, latency = int(sys.argv[1]), float(sys.argv[2]) / 1000
+schema = {
+    "type": "object",
+    "properties": {"query": {"type": "string", "description": "What to look up."}},
+    "required": ["query"],
+}
+tools = [Tool(name="add_tool", description="Adds a tool.", inputSchema={"type": "object", "properties": {}})]
+tools += [Tool(name=f"tool_{i}", description=f"Looks up things of kind {i}. " * 10, inputSchema=schema) for i in range(num_tools)]
+server = Server("stub")
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    await asyncio.sleep(latency)
+    return tools
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    if name == "add_tool":
+        tools.append(Tool(name=f"tool_{len(tools) - 1}", description="An added tool.", inputSchema=schema))
+        await server.request_context.session.send_tool_list_changed()
+    return [TextContent(type="text", text="ok")]
+
+
+async def main() -> None:
+    async with stdio_server() as (read, write):
+        options = server.create_initialization_options(NotificationOptions(tools_changed=True))
+        await server.run(read, write, options)
+
+
+asyncio.run(main())
+"""
+
+
+async def _run(args: argparse.Namespace, server_path: str, tools_cache_ttl: float | None) -> Dict[str, Any]:
+    params = StdioServerParams(
+        command=sys.executable, args=[server_path, str(args.tools), str(args.server_latency)], read_timeout_seconds=30
+    )
+    latencies: List[float] = []
+    added_tool_listed = False
+    async with McpWorkbench(params, tools_cache_ttl=tools_cache_ttl) as workbench:
+        start = time.perf_counter()
+        await workbench.list_tools()
+        first_s = time.perf_counter() - start
+        for turn in range(1, args.turns):
+            if turn == args.turns // 2:
+                await workbench.call_tool("add_tool", {})
+            start = time.perf_counter()
+            tools = await workbench.list_tools()
+            latencies.append(time.perf_counter() - start)
+            if turn == args.turns // 2:
+                added_tool_listed = len(tools) == args.tools + 2
+    return {
+        "first_ms": first_s * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000,
+        "max_ms": max(latencies) * 1000,
+        "total_s": sum(latencies),
+        "added_tool_listed": added_tool_listed,
+    }
+
+
+async def bench(args: argparse.Namespace, server_path: str) -> Dict[str, Any]:
+    return {
+        "uncached": await _run(args, server_path, tools_cache_ttl=0),
+        "cached": await _run(args, server_path, tools_cache_ttl=None),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--server-latency", type=float, default=20.0, help="Milliseconds to list the tools.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        server_path = os.path.join(temp_dir, "stub_server.py")
+        with open(server_path, "w") as f:
+            f.write(STUB_SERVER)
+        result = {
+            "tools": args.tools,
+            "turns": args.turns,
+            "server_latency_ms": args.server_latency,
+            **asyncio.run(bench(args, server_path)),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Benchmark end-to-end latency of MemoryController.retrieve_relevant_memos.
+
+A memory bank is filled with ``--memos`` memos, each indexed under a few topics, and
+``--tasks`` tasks are each retrieved for ``--repeats`` times, as over repeated trials. Model
+calls go through :class:`ChatCompletionClientRecorder`: the retrievals are first recorded
+against a scripted client, then replayed with ``--latency`` milliseconds per call. Replay
+checks that every call matches the recording, so the concurrent phases are verified to send
+the same prompts, in the same order, as the sequential one. The phases are:
+
+- ``sequential``: one validation at a time, no verdict cache, as before the pipeline.
+- ``concurrent``: validations run ``--max-concurrent-validations`` at a time.
+- ``concurrent_cached``: additionally, verdicts are remembered per memo and task.
+
+The memory bank uses ChromaDB's default embedding model, which is downloaded on first use.
+
+Run with::
+
+    python benchmarks/task_centric_memory_retrieval.py --memos 40 --tasks 5 --repeats 3 --latency 300
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+from autogen_core.models import CreateResult, LLMMessage, RequestUsage
+from autogen_ext.experimental.task_centric_memory import MemoryController, MemoryControllerConfig
+from autogen_ext.experimental.task_centric_memory.utils import ChatCompletionClientRecorder, PageLogger
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+TOPICS = ["arithmetic", "logic puzzles", "geometry", "scheduling", "code review", "travel planning", "cooking"]
+
+
+class ScriptedClient(ReplayChatCompletionClient):
+    """Answers each prompt of the Prompter deterministically, to record a session."""
+
+    def __init__(self) -> None:
+        super().__init__([])
+
+    async def create(self, messages: Sequence[LLMMessage], *args: Any, **kwargs: Any) -> CreateResult:
+        content = messages[-1].content
+        text = "\n".join(part for part in content if isinstance(part, str)) if isinstance(content, list) else content
+        assert isinstance(text, str)
+        if "potential insight" in text:
+            # About half of the memos are judged useful.
+            response = "1" if hashlib.sha256(text.encode()).digest()[0] % 2 == 0 else "0"
+        elif "index for a book" in text:
+            digest = hashlib.sha256(text.encode()).digest()
+            response = "\n".join(TOPICS[byte % len(TOPICS)] for byte in digest[:3])
+        else:
+            response = "1. " + text[-200:]
+        return CreateResult(
+            finish_reason="stop",
+            content=response,
+            usage=RequestUsage(prompt_tokens=0, completion_tokens=0),
+            cached=False,
+        )
+
+
+class LatencyRecorder(ChatCompletionClientRecorder):
+    """Replays a session, answering each call after a delay, like a remote model."""
+
+    def __init__(self, session_file_path: str, latency: float) -> None:
+        super().__init__(ScriptedClient(), mode="replay", session_file_path=session_file_path)
+        self._latency = latency
+
+    async def create(self, messages: Sequence[LLMMessage], *args: Any, **kwargs: Any) -> CreateResult:
+        # The recording is checked before the delay, so that calls are checked in the order they were made.
+        result = await super().create(messages, *args, **kwargs)
+        await asyncio.sleep(self._latency)
+        return result
+
+
+async def _retrieve_all(
+    args: argparse.Namespace, path: str, session_file_path: str, config: MemoryControllerConfig, record: bool
+) -> Dict[str, Any]:
+    client: ChatCompletionClientRecorder
+    if record:
+        client = ChatCompletionClientRecorder(ScriptedClient(), mode="record", session_file_path=session_file_path)
+    else:
+        client = LatencyRecorder(session_file_path, args.latency / 1000)
+    memory_controller = MemoryController(
+        reset=False,
+        client=client,
+        config={**config, "generalize_task": False, "MemoryBank": {"path": path}},
+        logger=PageLogger(),
+    )
+
+    latencies: List[float] = []
+    num_memos = 0
+    for _ in range(args.repeats):
+        for task_index in range(args.tasks):
+            start = time.perf_counter()
+            memos = await memory_controller.retrieve_relevant_memos(
+                "Task {} about {}".format(task_index, TOPICS[task_index % len(TOPICS)])
+            )
+            latencies.append(time.perf_counter() - start)
+            num_memos += len(memos)
+    client.finalize()
+
+    return {
+        "mean_s": sum(latencies) / len(latencies),
+        "max_s": max(latencies),
+        "total_s": sum(latencies),
+        "model_calls": memory_controller.prompter.num_model_calls,
+        "memos_retrieved": num_memos,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    sequential: MemoryControllerConfig = {"max_concurrent_validations": 1, "cache_validations": False}
+    concurrent: MemoryControllerConfig = {
+        "max_concurrent_validations": args.max_concurrent_validations,
+        "cache_validations": False,
+    }
+    concurrent_cached: MemoryControllerConfig = {
+        "max_concurrent_validations": args.max_concurrent_validations,
+        "cache_validations": True,
+    }
+    common: MemoryControllerConfig = {"max_memos_to_retrieve": args.max_memos_to_retrieve}
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "memory_bank")
+        memory_controller = MemoryController(
+            reset=True, client=ScriptedClient(), config={"MemoryBank": {"path": path}}, logger=PageLogger()
+        )
+        for i in range(args.memos):
+            topics = [TOPICS[(i + offset) % len(TOPICS)] + " {}".format(i % 5) for offset in range(3)]
+            memory_controller.memory_bank.add_memo("Insight number {} about {}".format(i, topics[0]), topics)
+
+        # The sequential and concurrent phases make the same calls, so they replay the same session.
+        uncached_session = os.path.join(temp_dir, "uncached.json")
+        cached_session = os.path.join(temp_dir, "cached.json")
+        await _retrieve_all(args, path, uncached_session, {**common, **sequential}, record=True)
+        await _retrieve_all(args, path, cached_session, {**common, **concurrent_cached}, record=True)
+
+        results["sequential"] = await _retrieve_all(args, path, uncached_session, {**common, **sequential}, False)
+        results["concurrent"] = await _retrieve_all(args, path, uncached_session, {**common, **concurrent}, False)
+        results["concurrent_cached"] = await _retrieve_all(
+            args, path, cached_session, {**common, **concurrent_cached}, False
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--memos", type=int, default=40)
+    parser.add_argument("--tasks", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=3, help="Retrievals of each task.")
+    parser.add_argument("--max-memos-to-retrieve", type=int, default=10)
+    parser.add_argument("--max-concurrent-validations", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=300.0, help="Milliseconds per model call.")
+    args = parser.parse_args()
+
+    result = {
+        "memos": args.memos,
+        "tasks": args.tasks,
+        "repeats": args.repeats,
+        "latency_ms": args.latency,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
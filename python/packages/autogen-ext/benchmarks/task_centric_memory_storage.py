@@ -0,0 +1,94 @@
+"""Benchmark save and load times of the task-centric memory bank's memo store.
+
+For each size in ``--sizes``, a store of that many memos is written, then:
+
+- ``save_ms``: the mean time to add one memo and save, over ``--saves`` saves.
+- ``load_ms``: the time to open the store and read one memo, as at startup.
+
+``pickle`` pickles the whole dict on every save, as ``MemoryBank`` did before, and
+``sqlite`` is the ``SqliteDict`` it uses now, which writes only the changes.
+
+Run with::
+
+    python benchmarks/task_centric_memory_storage.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo
+from autogen_ext.experimental.task_centric_memory._sqlite_dict import SqliteDict
+
+
+def _memo(i: int) -> Memo:
+    return Memo(task="Task number {} about some topic".format(i), insight="Insight number {} ".format(i) * 8)
+
+
+def _bench_pickle(path: str, size: int, saves: int) -> Dict[str, float]:
+    memos = {str(i): _memo(i) for i in range(size)}
+    with open(path, "wb") as f:
+        pickle.dump(memos, f)
+
+    start = time.perf_counter()
+    for i in range(size, size + saves):
+        memos[str(i)] = _memo(i)
+        with open(path, "wb") as f:
+            pickle.dump(memos, f)
+    save_s = (time.perf_counter() - start) / saves
+
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        loaded: Dict[str, Memo] = pickle.load(f)
+    assert loaded["0"] == memos["0"]
+    load_s = time.perf_counter() - start
+    return {"save_ms": save_s * 1000, "load_ms": load_s * 1000, "file_mb": os.path.getsize(path) / 2**20}
+
+
+def _bench_sqlite(path: str, size: int, saves: int) -> Dict[str, float]:
+    memos: SqliteDict[Memo] = SqliteDict(path)
+    memos.set_many((str(i), _memo(i)) for i in range(size))
+    memos.commit()
+
+    start = time.perf_counter()
+    for i in range(size, size + saves):
+        memos[str(i)] = _memo(i)
+        memos.commit()
+    save_s = (time.perf_counter() - start) / saves
+    memos.close()
+
+    start = time.perf_counter()
+    memos = SqliteDict(path)
+    assert memos["0"] == _memo(0)
+    load_s = time.perf_counter() - start
+    memos.close()
+    return {"save_ms": save_s * 1000, "load_ms": load_s * 1000, "file_mb": os.path.getsize(path) / 2**20}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated numbers of memos.")
+    parser.add_argument("--saves", type=int, default=5, help="Saves to time at each size.")
+    args = parser.parse_args()
+    sizes: List[int] = [int(size) for size in args.sizes.split(",")]
+    saves: int = args.saves
+
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            results.append(
+                {
+                    "memos": size,
+                    "pickle": _bench_pickle(os.path.join(temp_dir, "{}.pkl".format(size)), size, saves),
+                    "sqlite": _bench_sqlite(os.path.join(temp_dir, "{}.sqlite3".format(size)), size, saves),
+                }
+            )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark memory and latency of TextCanvas revision storage.
+
+A ``--size`` byte file receives ``--revisions`` revisions, each editing a few lines as an
+agent's patch would. ``full_copies`` stores every revision in full, as ``TextCanvas`` did
+before (``snapshot_interval=1``); ``deltas`` uses the default snapshot interval. Reported are:
+
+- ``memory_mb``: memory held by the canvas after the last revision.
+- ``add_ms``: mean time to add a revision, including building its content.
+- ``revision_content_ms``: mean time to read a random old revision.
+- ``revision_diffs_s``: time of ``get_revision_diffs``, first and cached.
+- ``context_ms``: time of ``get_all_contents_for_context`` per turn, when a file changed and
+  when nothing did, against rendering every file again each turn.
+
+Run with::
+
+    python benchmarks/text_canvas_revisions.py --size 100000 --revisions 1000
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from autogen_ext.memory.canvas import TextCanvas
+
+
+def _render_every_file(canvas: TextCanvas) -> str:
+    out: List[str] = ["=== CANVAS FILES ==="]
+    for fname, revision in canvas.list_files().items():
+        out.append(f"File: {fname} (rev {revision}):\n{canvas.get_latest_content(fname)}\n")
+    out.append("=== END OF CANVAS ===")
+    return "\n".join(out)
+
+
+def _fill(args: argparse.Namespace, canvas: TextCanvas) -> List[str]:
+    """Add the revisions to the canvas and return the lines of the last one."""
+    rng = random.Random(0)
+    lines = ["{:06d} {}\n".format(i, "x" * 49) for i in range(args.size // 57)]
+    # A second, unchanging file, as in a session that edits one of several files.
+    canvas.add_or_update_file("notes.md", "".join(lines))
+    for revision in range(args.revisions):
+        for _ in range(args.edits):
+            lines[rng.randrange(len(lines))] = "{:06d} edited in revision {}\n".format(rng.randrange(10**6), revision)
+        canvas.add_or_update_file("main.py", "".join(lines))
+    return lines
+
+
+def _bench(args: argparse.Namespace, snapshot_interval: int) -> Dict[str, Any]:
+    rng = random.Random(0)
+
+    # Memory is measured on its own run, since tracing allocations slows them down.
+    tracemalloc.start()
+    canvas = TextCanvas(snapshot_interval=snapshot_interval)
+    _fill(args, canvas)
+    memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+
+    canvas = TextCanvas(snapshot_interval=snapshot_interval)
+    start = time.perf_counter()
+    lines = _fill(args, canvas)
+    add_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        canvas.get_revision_content("main.py", rng.randint(1, args.revisions))
+    revision_content_s = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    canvas.get_revision_diffs("main.py")
+    revision_diffs_s = time.perf_counter() - start
+    start = time.perf_counter()
+    canvas.get_revision_diffs("main.py")
+    revision_diffs_cached_s = time.perf_counter() - start
+
+    turns = 100
+    context_changed_s = 0.0
+    for turn in range(turns):
+        canvas.add_or_update_file("main.py", "".join(lines) + "# turn {}\n".format(turn))
+        start = time.perf_counter()
+        canvas.get_all_contents_for_context()
+        context_changed_s += (time.perf_counter() - start) / turns
+    start = time.perf_counter()
+    for _ in range(turns):
+        canvas.get_all_contents_for_context()
+    context_unchanged_s = (time.perf_counter() - start) / turns
+    start = time.perf_counter()
+    for _ in range(turns):
+        _render_every_file(canvas)
+    context_uncached_s = (time.perf_counter() - start) / turns
+
+    return {
+        "memory_mb": memory_mb,
+        "add_ms": add_s / (args.revisions + 1) * 1000,
+        "revision_content_ms": revision_content_s * 1000,
+        "revision_diffs_s": {"first": revision_diffs_s, "cached": revision_diffs_cached_s},
+        "context_ms": {
+            "changed": context_changed_s * 1000,
+            "unchanged": context_unchanged_s * 1000,
+            "rendering_every_file": context_uncached_s * 1000,
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="File size in bytes.")
+    parser.add_argument("--revisions", type=int, default=1_000)
+    parser.add_argument("--edits", type=int, default=3, help="Lines edited per revision.")
+    parser.add_argument("--snapshot-interval", type=int, default=32)
+    args = parser.parse_args()
+
+    result = {
+        "size": args.size,
+        "revisions": args.revisions,
+        "full_copies": _bench(args, snapshot_interval=1),
+        "deltas": _bench(args, snapshot_interval=args.snapshot_interval),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark the session startup time and memory of MultimodalWebSurfer agents, with and without a BrowserPool.
+
+``--sessions`` agents start concurrently on a local static page, as for parallel web research
+sessions. Each agent is started by opening its browser and page, as on its first message. The phases are:
+
+- ``per_agent``: each agent launches its own browser, as without a pool.
+- ``pooled``: the agents lease contexts from a :class:`BrowserPool`, with ``--sessions-per-browser``
+  contexts per browser process and ``--warm`` warm contexts, which is started before timing.
+
+Reported are the mean and maximum session startup time, the number of browser processes, and
+the memory of all browser processes (proportional set size, from ``/proc``, so Linux only) per session.
+
+Run with::
+
+    python benchmarks/web_surfer_browser_pool.py --sessions 16 --sessions-per-browser 8 --warm 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+PAGE_HTML = """<!DOCTYPE html>
+<html><head><title>Benchmark page</title></head>
+<body><h1>Benchmark page</h1><p>Some text, <a href="#more">a link</a> and <button>a button</button>.</p></body>
+</html>
+"""
+
+
+def _descendants(pid: int) -> List[int]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    found: List[int] = []
+    pending = list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        found.append(child)
+        pending.extend(children.get(child, []))
+    return found
+
+
+def _browser_memory_mb() -> float:
+    """The proportional set size of all processes started by this one, which shares memory between processes fairly."""
+    total_kb = 0
+    for pid in _descendants(os.getpid()):
+        try:
+            with open(f"/proc/{pid}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Pss:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+async def _start_sessions(args: argparse.Namespace, page_url: str, pool: BrowserPool | None) -> Dict[str, Any]:
+    model_client = ReplayChatCompletionClient(
+        ["Done."],
+        model_info={
+            "vision": True,
+            "function_calling": True,
+            "json_output": False,
+            "family": "unknown",
+            "structured_output": False,
+        },
+    )
+    surfers = [
+        MultimodalWebSurfer(f"surfer_{i}", model_client, start_page=page_url, browser_pool=pool)
+        for i in range(args.sessions)
+    ]
+
+    async def start(surfer: MultimodalWebSurfer) -> float:
+        start = time.perf_counter()
+        await surfer._lazy_init()  # pyright: ignore[reportPrivateUsage]
+        return time.perf_counter() - start
+
+    try:
+        start_times = await asyncio.gather(*(start(surfer) for surfer in surfers))
+        await asyncio.sleep(1.0)  # Let the browsers settle before measuring their memory
+        memory_mb = _browser_memory_mb()
+    finally:
+        await asyncio.gather(*(surfer.close() for surfer in surfers))
+    return {
+        "startup_mean_ms": statistics.mean(start_times) * 1000,
+        "startup_max_ms": max(start_times) * 1000,
+        "memory_mb": memory_mb,
+        "memory_per_session_mb": memory_mb / args.sessions,
+    }
+
+
+async def bench(args: argparse.Namespace, page_url: str) -> Dict[str, Any]:
+    results: Dict[str, Any] = {"per_agent": {**await _start_sessions(args, page_url, None), "browsers": args.sessions}}
+    async with BrowserPool(sessions_per_browser=args.sessions_per_browser, warm_contexts=args.warm) as pool:
+        results["pooled"] = await _start_sessions(args, page_url, pool)
+        results["pooled"]["browsers"] = pool.stats.browsers_launched
+        results["pooled"]["warm_leases"] = pool.stats.warm_leases
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=16, help="Agents started concurrently.")
+    parser.add_argument("--sessions-per-browser", type=int, default=8)
+    parser.add_argument("--warm", type=int, default=4, help="Warm contexts of the pool.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        page_path = os.path.join(temp_dir, "page.html")
+        with open(page_path, "w") as f:
+            f.write(PAGE_HTML)
+        result = {
+            "sessions": args.sessions,
+            "sessions_per_browser": args.sessions_per_browser,
+            "warm": args.warm,
+            **asyncio.run(bench(args, "file://" + page_path)),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
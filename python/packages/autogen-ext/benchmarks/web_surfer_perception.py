@@ -0,0 +1,158 @@
+"""Benchmark the per-step page perception of MultimodalWebSurfer on a local static page.
+
+A page with ``--elements`` links, buttons and inputs is written to a temporary directory and
+opened in headless Chromium. Each step, the agent reads the interactive regions and prepares
+the set-of-mark screenshot for the model. Steps are run ``--steps`` times in each of these
+states of the page:
+
+- ``unchanged``: nothing happened since the previous step.
+- ``scrolled``: the page was scrolled down by one viewport (and back up when at the bottom).
+- ``dom_changed``: an element was added to the page.
+
+for two pipelines:
+
+- ``baseline``: as before, a full resolution PNG screenshot, marked and then scaled on the event loop.
+- ``incremental``: the agent's perception, which reuses the previous step's result while the page
+  is unchanged, and otherwise marks a JPEG screenshot after scaling it, in a thread.
+
+Reported are the mean and p95 step latency and the event loop lag while the steps run.
+
+Run with::
+
+    python benchmarks/web_surfer_perception.py --elements 300 --steps 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from autogen_ext.agents.web_surfer import MultimodalWebSurfer
+from autogen_ext.agents.web_surfer._set_of_mark import add_set_of_mark
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+def _page_html(elements: int) -> str:
+    items: List[str] = []
+    for i in range(elements):
+        kind = i % 3
+        if kind == 0:
+            items.append(f'<p>Paragraph {i} with <a href="#item-{i}">a link to item {i}</a>.</p>')
+        elif kind == 1:
+            items.append(f'<p><button id="item-{i}">Button {i}</button></p>')
+        else:
+            items.append(f'<p><label>Field {i} <input type="text" name="field-{i}"></label></p>')
+    return f"<!DOCTYPE html><html><head><title>Benchmark page</title></head><body>{''.join(items)}</body></html>"
+
+
+async def _measure(steps: int, prepare: Callable[[], Awaitable[None]], step: Callable[[], Awaitable[None]]) -> Any:
+    lags: List[float] = []
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(max(0.0, time.perf_counter() - start - 0.001))
+
+    ticker_task = asyncio.create_task(ticker())
+    for _ in range(steps):
+        await prepare()
+        start = time.perf_counter()
+        await step()
+        latencies.append(time.perf_counter() - start)
+    done.set()
+    await ticker_task
+    ordered = sorted(latencies)
+    ordered_lags = sorted(lags) or [0.0]
+    return {
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "p95_ms": ordered[int(len(ordered) * 0.95)] * 1000,
+        "loop_lag_max_ms": ordered_lags[-1] * 1000,
+        "loop_lag_p99_ms": ordered_lags[int(len(ordered_lags) * 0.99)] * 1000,
+    }
+
+
+async def bench(args: argparse.Namespace, page_url: str) -> Dict[str, Any]:
+    model_client = ReplayChatCompletionClient(
+        ["Done."],
+        model_info={
+            "vision": True,
+            "function_calling": True,
+            "json_output": False,
+            "family": "unknown",
+            "structured_output": False,
+        },
+    )
+    surfer = MultimodalWebSurfer("surfer", model_client, start_page=page_url, headless=True)
+    await surfer._lazy_init()  # pyright: ignore[reportPrivateUsage]
+    page = surfer._page  # pyright: ignore[reportPrivateUsage]
+    controller = surfer._playwright_controller  # pyright: ignore[reportPrivateUsage]
+    assert page is not None
+    added = 0
+
+    async def unchanged() -> None:
+        pass
+
+    async def scrolled() -> None:
+        viewport = await controller.get_visual_viewport(page)
+        if viewport["pageTop"] + 2 * viewport["height"] > viewport["scrollHeight"]:
+            await page.evaluate("window.scrollTo(0, 0);")
+        else:
+            await controller.page_down(page)
+
+    async def dom_changed() -> None:
+        nonlocal added
+        added += 1
+        await page.evaluate(f"document.body.insertAdjacentHTML('afterbegin', '<p><button>Added {added}</button></p>');")
+
+    async def baseline_step() -> None:
+        rects = await controller.get_interactive_rects(page)
+        await controller.get_visual_viewport(page)
+        screenshot = await page.screenshot()
+        som_screenshot, _, _, _ = add_set_of_mark(screenshot, rects)
+        som_screenshot.resize((surfer.MLM_WIDTH, surfer.MLM_HEIGHT))
+        som_screenshot.close()
+
+    async def incremental_step() -> None:
+        await surfer._perceive_page()  # pyright: ignore[reportPrivateUsage]
+
+    results: Dict[str, Any] = {}
+    try:
+        for name, step in (("baseline", baseline_step), ("incremental", incremental_step)):
+            await page.evaluate("window.scrollTo(0, 0);")
+            await step()
+            results[name] = {
+                state: await _measure(args.steps, prepare, step)
+                for state, prepare in (("unchanged", unchanged), ("scrolled", scrolled), ("dom_changed", dom_changed))
+            }
+    finally:
+        await surfer.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--elements", type=int, default=300, help="Interactive elements on the page.")
+    parser.add_argument("--steps", type=int, default=30, help="Steps per state of the page.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        page_path = os.path.join(temp_dir, "page.html")
+        with open(page_path, "w") as f:
+            f.write(_page_html(args.elements))
+        result = {
+            "elements": args.elements,
+            "steps": args.steps,
+            **asyncio.run(bench(args, "file://" + page_path)),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
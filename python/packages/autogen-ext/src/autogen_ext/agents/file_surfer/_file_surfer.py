@@ -113,8 +113,12 @@ def _get_browser_state(self) -> Tuple[str, str]:
             header += f"Title: {self._browser.page_title}\n"
 
         current_page = self._browser.viewport_current_page
-        total_pages = len(self._browser.viewport_pages)
-        header += f"Viewport position: Showing page {current_page+1} of {total_pages}.\n"
+        total_pages = self._browser.viewport_count
+        if self._browser.is_fully_loaded:
+            header += f"Viewport position: Showing page {current_page+1} of {total_pages}.\n"
+        else:
+            # Large text files are read as they are paged through, so the total is estimated from the file size
+            header += f"Viewport position: Showing page {current_page+1} of about {total_pages}.\n"
 
         return (header, self._browser.viewport)
 
@@ -1,14 +1,224 @@
 # ruff: noqa: E722
+import bisect
+import codecs
 import datetime
 import io
+import math
 import os
 import re
 import time
-from typing import List, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import List, Optional, Pattern, Tuple, Union
 
 # TODO: Fix unfollowed import
 from markitdown import FileConversionException, MarkItDown, UnsupportedFormatException  # type: ignore
 
+# Plain text files of these types are converted as they are read, a viewport at a time, rather than all at once
+LAZY_TEXT_EXTENSIONS = (".txt", ".text", ".log", ".md", ".markdown")
+
+# Bytes read from a lazily converted file at a time
+_READ_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = (" ", "\t", "\r", "\n")
+
+# Maps the ASCII characters that aren't word characters to spaces
+_ASCII_NON_WORD = str.maketrans({chr(i): " " for i in range(128) if not re.match(r"\w", chr(i))})
+
+
+def _normalize_for_search(content: str) -> str:
+    """Normalize text for find on page: words separated by single spaces, in lower case, padded with spaces."""
+    if content.isascii():
+        # Same as below, but several times faster
+        return " " + " ".join(content.translate(_ASCII_NON_WORD).split()).lower() + " "
+    return " " + (" ".join(re.split(r"\W+", content))).strip().lower() + " "
+
+
+class _LazyTextSource:
+    """
+    Reads a UTF-8 text file a chunk at a time, normalizing it as MarkItDown does: trailing whitespace is
+    stripped from each line, and runs of more than one blank line are collapsed.
+    """
+
+    def __init__(self, path: str, stat: os.stat_result) -> None:
+        self.path = path
+        self.size = stat.st_size
+        self._stat = (stat.st_mtime_ns, stat.st_size)
+        self.bytes_read = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial_line = ""
+        self._held_newlines = 0
+
+    @classmethod
+    def open(cls, path: str) -> Union["_LazyTextSource", None]:
+        """Returns a source for the file, or None if it should be converted by MarkItDown."""
+        if not path.lower().endswith(LAZY_TEXT_EXTENSIONS):
+            return None
+        stat = os.stat(path)
+        with open(path, "rb") as fh:
+            sample = fh.read(64 * 1024)
+        if sample.startswith(codecs.BOM_UTF8):
+            return None
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        except UnicodeDecodeError:
+            # Not UTF-8, so let MarkItDown detect the encoding
+            return None
+        return cls(path, stat)
+
+    def read(self) -> Tuple[str, bool]:
+        """Read and normalize the next chunk. Returns the text and whether the end of the file was reached."""
+        stat = os.stat(self.path)
+        with open(self.path, "rb") as fh:
+            fh.seek(self.bytes_read)
+            data = fh.read(_READ_CHUNK_SIZE)
+        self.bytes_read += len(data)
+        # End at the end of the file, or if the file changed since it was opened
+        final = len(data) < _READ_CHUNK_SIZE or (stat.st_mtime_ns, stat.st_size) != self._stat
+        text = self._partial_line + self._decoder.decode(data, final=final)
+
+        lines = text.split("\n")
+        self._partial_line = "" if final else lines.pop()
+        if not final:
+            lines.append("")  # Keep the newline that ends the last complete line
+        text = "\n".join(line.rstrip() for line in lines)
+
+        # Collapse runs of newlines, including those spanning chunks, holding back trailing newlines until the text
+        # that follows them is read. Any run of three or more is collapsed to two, so at most three are held.
+        text = "\n" * self._held_newlines + text
+        content = text.rstrip("\n")
+        self._held_newlines = min(len(text) - len(content), 3)
+        content = re.sub(r"\n{3,}", "\n\n", content)
+        if final:
+            content += "\n" * min(self._held_newlines, 2)
+        return content, final
+
+
+class _Document:
+    """
+    The text of an opened file or directory and its viewports. The text of a lazily converted file is read as its
+    viewports are needed. A search index of the normalized text of each viewport is built on the first search.
+    """
+
+    def __init__(
+        self,
+        title: Union[str, None],
+        content: str,
+        viewport_size: Union[int, None],
+        split_pages: bool = True,
+        source: Union[_LazyTextSource, None] = None,
+    ) -> None:
+        self.title = title
+        self.viewport_size = viewport_size if split_pages else None
+        self.pages: List[Tuple[int, int]] = []
+        self._source = source
+        # The text split into pages so far, joined when needed, and the text read after it
+        self._split_parts: List[str] = []
+        self._unsplit = content
+        self._next_page_start = 0
+        self._search_text: Union[str, None] = None
+        self._search_offsets: List[int] = []
+        self._split_pages()
+
+    @property
+    def complete(self) -> bool:
+        """Whether all the text is read."""
+        return self._source is None
+
+    @property
+    def content(self) -> str:
+        """All the text, which is read first if needed."""
+        self.load_all()
+        return self._split_text()
+
+    def _split_text(self) -> str:
+        if len(self._split_parts) > 1:
+            self._split_parts = ["".join(self._split_parts)]
+        return self._split_parts[0] if self._split_parts else ""
+
+    def page_text(self, index: int) -> str:
+        """The text of a page, which must have been split already."""
+        start, end = self.pages[index]
+        return self._split_text()[start:end]
+
+    def _read_more(self) -> None:
+        assert self._source is not None
+        text, final = self._source.read()
+        self._unsplit += text
+        if final:
+            self._source = None
+        self._split_pages()
+
+    def _split_pages(self) -> None:
+        """Split the text read so far into pages that are approximately the viewport size. Small deviations are
+        permitted to ensure words are not broken. A page is only split once the text that ends it has been read."""
+        text = self._unsplit
+        if self.viewport_size is None:
+            if self.complete:
+                self.pages = [(0, len(text))]
+                self._split_parts = [text]
+                self._unsplit = ""
+            return
+
+        start_idx = 0
+        while start_idx < len(text):
+            end_idx = start_idx + self.viewport_size
+            if end_idx > len(text) and not self.complete:
+                break
+            end_idx = min(end_idx, len(text))
+            # Adjust to end on a space
+            while end_idx < len(text) and text[end_idx - 1] not in _WHITESPACE:
+                end_idx += 1
+            if end_idx == len(text) and text[end_idx - 1] not in _WHITESPACE and not self.complete:
+                break
+            self.pages.append((self._next_page_start + start_idx, self._next_page_start + end_idx))
+            start_idx = end_idx
+        if start_idx > 0:
+            self._split_parts.append(text[:start_idx])
+            self._unsplit = text[start_idx:]
+            self._next_page_start += start_idx
+
+        # Handle empty pages
+        if self.complete and len(self.pages) == 0:
+            self.pages = [(0, 0)]
+
+    def has_page(self, index: int) -> bool:
+        """Whether the page exists, reading text until it is split or the end of the file is reached."""
+        while index >= len(self.pages) and not self.complete:
+            self._read_more()
+        return index < len(self.pages)
+
+    def load_all(self) -> None:
+        """Read the rest of the text."""
+        while not self.complete:
+            self._read_more()
+
+    @property
+    def estimated_page_count(self) -> int:
+        """The number of pages, estimated from the share of the file read so far if not all of it is read."""
+        if self._source is None or self._source.bytes_read == 0:
+            return len(self.pages)
+        estimated_chars = (self._next_page_start + len(self._unsplit)) * self._source.size / self._source.bytes_read
+        return max(len(self.pages) + 1, math.ceil(estimated_chars / (self.viewport_size or 1)))
+
+    def find(self, query: Pattern[str], start_page: int) -> Union[int, None]:
+        """Search for the first page matching the query, from the start page to the last, then from the first."""
+        if self._search_text is None:
+            self.load_all()
+            # Pages are separated by a newline, which the query can't match, so that matches don't span pages
+            content = self.content
+            parts = [_normalize_for_search(content[start:end]) for start, end in self.pages]
+            offset = 0
+            for part in parts:
+                self._search_offsets.append(offset)
+                offset += len(part) + 1
+            self._search_text = "\n".join(parts)
+
+        start_offset = self._search_offsets[start_page]
+        match = query.search(self._search_text, start_offset) or query.search(self._search_text, 0, start_offset)
+        if match is None:
+            return None
+        return bisect.bisect_right(self._search_offsets, match.start()) - 1
+
 
 class MarkdownFileBrowser:
     """
@@ -21,6 +231,7 @@ def __init__(  # type: ignore
         viewport_size: Union[int, None] = 1024 * 8,
         base_path: str | None = os.getcwd(),
         cwd: str | None = None,
+        document_cache_size: int = 8,
     ):
         """
         Instantiate a new MarkdownFileBrowser.
@@ -29,15 +240,17 @@ def __init__(  # type: ignore
             viewport_size: Approximately how many *characters* fit in the viewport. Viewport dimensions are adjusted dynamically to avoid cutting off words (default: 8192).
             base_path: The base path to use for the file browser. Files outside this path cannot be accessed. Defaults to the current working directory.
             cwd: The browser's current working directory. Defaults to the system's current working directory.
+            document_cache_size: How many converted files to keep, to reopen them without converting them again while their modification time and size are unchanged (default: 8).
         """
         self.viewport_size = viewport_size  # Applies only to the standard uri types
         self.history: List[Tuple[str, float]] = list()
         self.page_title: Optional[str] = None
         self.viewport_current_page = 0
-        self.viewport_pages: List[Tuple[int, int]] = list()
         self._markdown_converter = MarkItDown()
         self._base_path = None if base_path is None else os.path.realpath(base_path)
-        self._page_content: str = ""
+        self._document = _Document(None, "", viewport_size)
+        self._document_cache_size = document_cache_size
+        self._document_cache: OrderedDict[Tuple[str, int, int], _Document] = OrderedDict()
         self._find_on_page_query: Union[str, None] = None
         self._find_on_page_last_result: Union[int, None] = None  # Location of the last result
 
@@ -114,29 +327,47 @@ def set_path(self, path: str) -> None:
     @property
     def viewport(self) -> str:
         """Return the content of the current viewport."""
-        bounds = self.viewport_pages[self.viewport_current_page]
-        return self.page_content[bounds[0] : bounds[1]]
+        self._document.has_page(self.viewport_current_page)
+        return self._document.page_text(self.viewport_current_page)
 
     @property
     def page_content(self) -> str:
         """Return the full contents of the current page."""
-        return self._page_content
+        self._document.load_all()
+        return self._document.content
+
+    @property
+    def viewport_pages(self) -> List[Tuple[int, int]]:
+        """Return the bounds of all viewports of the current page."""
+        self._document.load_all()
+        return self._document.pages
+
+    @property
+    def viewport_count(self) -> int:
+        """Return the number of viewports of the current page. If the page is still being converted, this is an estimate."""
+        return self._document.estimated_page_count
+
+    @property
+    def is_fully_loaded(self) -> bool:
+        """Return whether the current page has been converted completely."""
+        return self._document.complete
 
     def _set_page_content(self, content: str, split_pages: bool = True) -> None:
         """Sets the text content of the current page."""
-        self._page_content = content
+        self._set_document(_Document(self.page_title, content, self.viewport_size, split_pages=split_pages))
 
-        if split_pages:
-            self._split_pages()
-        else:
-            self.viewport_pages = [(0, len(self._page_content))]
+    def _set_document(self, document: _Document) -> None:
+        """Sets the document of the current page."""
+        self._document = document
+        self.page_title = document.title
 
-        if self.viewport_current_page >= len(self.viewport_pages):
-            self.viewport_current_page = len(self.viewport_pages) - 1
+        if not self._document.has_page(self.viewport_current_page):
+            self.viewport_current_page = len(self._document.pages) - 1
 
     def page_down(self) -> None:
         """Move the viewport down one page, if possible."""
-        self.viewport_current_page = min(self.viewport_current_page + 1, len(self.viewport_pages) - 1)
+        if self._document.has_page(self.viewport_current_page + 1):
+            self.viewport_current_page += 1
 
     def page_up(self) -> None:
         """Move the viewport up one page, if possible."""
@@ -172,7 +403,7 @@ def find_next(self) -> Union[str, None]:
             starting_viewport = 0
         else:
             starting_viewport += 1
-            if starting_viewport >= len(self.viewport_pages):
+            if not self._document.has_page(starting_viewport):
                 starting_viewport = 0
 
         viewport_match = self._find_next_viewport(self._find_on_page_query, starting_viewport)
@@ -199,44 +430,14 @@ def _find_next_viewport(self, query: Optional[str], starting_viewport: int) -> U
         if nquery.strip() == "":
             return None
 
-        idxs: List[int] = list()
-        idxs.extend(range(starting_viewport, len(self.viewport_pages)))
-        idxs.extend(range(0, starting_viewport))
-
-        for i in idxs:
-            bounds = self.viewport_pages[i]
-            content = self.page_content[bounds[0] : bounds[1]]
-
-            # TODO: Remove markdown links and images
-            ncontent = " " + (" ".join(re.split(r"\W+", content))).strip().lower() + " "
-            if re.search(nquery, ncontent):
-                return i
-
-        return None
+        # TODO: Remove markdown links and images
+        return self._document.find(re.compile(nquery), starting_viewport)
 
     def open_path(self, path: str) -> str:
         """Open a file or directory in the file surfer."""
         self.set_path(path)
         return self.viewport
 
-    def _split_pages(self) -> None:
-        """Split the page contents into pages that are approximately the viewport size. Small deviations are permitted to ensure words are not broken."""
-        # Handle empty pages
-        if len(self._page_content) == 0:
-            self.viewport_pages = [(0, 0)]
-            return
-
-        # Break the viewport into pages
-        self.viewport_pages = []
-        start_idx = 0
-        while start_idx < len(self._page_content):
-            end_idx = min(start_idx + self.viewport_size, len(self._page_content))  # type: ignore[operator]
-            # Adjust to end on a space
-            while end_idx < len(self._page_content) and self._page_content[end_idx - 1] not in [" ", "\t", "\r", "\n"]:
-                end_idx += 1
-            self.viewport_pages.append((start_idx, end_idx))
-            start_idx = end_idx
-
     def _open_path(
         self,
         path: str,
@@ -262,10 +463,7 @@ def _open_path(
                     self.page_title = res.title
                     self._set_page_content(res.text_content, split_pages=False)
                 else:
-                    res = self._markdown_converter.convert_local(path)
-                    assert self._validate_path(path)
-                    self.page_title = res.title
-                    self._set_page_content(res.text_content)
+                    self._set_document(self._open_file(path))
             except UnsupportedFormatException:
                 self.page_title = "UnsupportedFormatException"
                 self._set_page_content(f"# UnsupportedFormatException\n\nCannot preview '{path}' as Markdown.")
@@ -276,6 +474,29 @@ def _open_path(
                 self.page_title = "FileNotFoundError"
                 self._set_page_content(f"# FileNotFoundError\n\nFile not found: {path}")
 
+    def _open_file(self, path: str) -> _Document:
+        """Open a file, reusing the document from the cache if the file is unchanged since it was converted."""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        document = self._document_cache.get(key)
+        if document is not None:
+            self._document_cache.move_to_end(key)
+            return document
+
+        source = _LazyTextSource.open(path)
+        if source is not None:
+            document = _Document(None, "", self.viewport_size, source=source)
+        else:
+            res = self._markdown_converter.convert_local(path)
+            document = _Document(res.title, res.text_content, self.viewport_size)
+        assert self._validate_path(path)
+
+        if self._document_cache_size > 0:
+            self._document_cache[key] = document
+            while len(self._document_cache) > self._document_cache_size:
+                self._document_cache.popitem(last=False)
+        return document
+
     def _fetch_local_dir(self, local_path: str) -> str:
         """Render a local directory listing in HTML to assist with local file browsing via the "file://" protocol.
         Through rendered in HTML, later parts of the pipeline will convert the listing to Markdown.
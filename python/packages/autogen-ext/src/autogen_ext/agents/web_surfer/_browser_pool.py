@@ -0,0 +1,312 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Dict, List, Sequence, Set
+
+from playwright.async_api import Browser, BrowserContext, Frame, Page, Playwright, Route, async_playwright
+from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
+
+
+@dataclass
+class BrowserPoolStats:
+    """Counters of a :class:`BrowserPool`."""
+
+    leases: int = 0
+    """Contexts handed out by :meth:`BrowserPool.acquire`."""
+    warm_leases: int = 0
+    """Leases served by a context that was created ahead of time."""
+    browsers_launched: int = 0
+    contexts_created: int = 0
+    blocked_requests: int = 0
+    """Requests aborted because their resource type is blocked."""
+
+
+class _PooledBrowser:
+    def __init__(self, browser: Browser) -> None:
+        self.browser = browser
+        self.contexts: Set[BrowserContext] = set()
+
+    @property
+    def connected(self) -> bool:
+        return self.browser.is_connected()
+
+
+class _Lease:
+    def __init__(self, browser: _PooledBrowser) -> None:
+        self.browser = browser
+        self.navigations = 0
+
+
+class BrowserPool:
+    """(Experimental) A pool of browser contexts, shared by any number of :class:`MultimodalWebSurfer` agents.
+
+    Instead of a browser process per agent, the pool runs one Chromium process per
+    ``sessions_per_browser`` leased contexts, launching another when all are full. Each agent
+    leases its own context, so cookies, storage and cache are isolated between agents, and a
+    context is closed when it is released rather than handed to another agent. ``warm_contexts``
+    contexts are created ahead of time, so that an agent starting up doesn't wait for one.
+
+    Requests for the resource types in ``blocked_resource_types`` are aborted in every
+    context, which saves the bandwidth, memory and CPU of media and fonts, that the agent
+    doesn't need to read a page. Main frame navigations are counted per context. A context
+    that reaches ``max_navigations_per_context`` is replaced with a fresh one by the agent at its
+    next reset, which bounds the memory a long-running session accumulates.
+
+    The pool is used from one event loop, and should be closed with :meth:`close`, or used as
+    an async context manager.
+
+    Args:
+        sessions_per_browser (int): The most contexts, leased or warm, per browser process. Defaults to 8.
+        warm_contexts (int): The contexts kept ready to be leased. Defaults to 1.
+        max_navigations_per_context (int | None): Navigations after which a context is recycled.
+            ``None`` never recycles contexts. Defaults to 100.
+        blocked_resource_types (Sequence[str]): Playwright resource types to block, such as
+            ``"media"``, ``"font"`` or ``"image"``. Defaults to media and fonts.
+        headless (bool): Whether to run the browsers headless. Defaults to True.
+        browser_channel (str | None): The browser channel, such as ``"msedge"``. Defaults to None.
+        context_options (Dict[str, Any] | None): Keyword arguments for ``Browser.new_context``.
+            Defaults to the user agent of :class:`MultimodalWebSurfer`.
+        playwright (Playwright | None): A started Playwright instance to use. If None, the pool
+            starts and stops its own.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_agentchat.ui import Console
+            from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+            from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+            async def main() -> None:
+                model_client = OpenAIChatCompletionClient(model="gpt-4o")
+                tasks = ["Find the latest release of autogen.", "Find the weather in Seattle."]
+                async with BrowserPool(sessions_per_browser=8, warm_contexts=2) as pool:
+                    surfers = [
+                        MultimodalWebSurfer(f"surfer_{i}", model_client=model_client, browser_pool=pool)
+                        for i in range(len(tasks))
+                    ]
+                    try:
+                        await asyncio.gather(
+                            *(Console(surfer.run_stream(task=task)) for surfer, task in zip(surfers, tasks, strict=True))
+                        )
+                    finally:
+                        await asyncio.gather(*(surfer.close() for surfer in surfers))
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        sessions_per_browser: int = 8,
+        warm_contexts: int = 1,
+        max_navigations_per_context: int | None = 100,
+        blocked_resource_types: Sequence[str] = ("media", "font"),
+        headless: bool = True,
+        browser_channel: str | None = None,
+        context_options: Dict[str, Any] | None = None,
+        playwright: Playwright | None = None,
+    ) -> None:
+        if sessions_per_browser < 1:
+            raise ValueError("sessions_per_browser must be at least 1.")
+        if warm_contexts < 0:
+            raise ValueError("warm_contexts must not be negative.")
+        self._sessions_per_browser = sessions_per_browser
+        self._warm_contexts = warm_contexts
+        self._max_navigations = max_navigations_per_context
+        self._blocked_resource_types = frozenset(blocked_resource_types)
+        self._headless = headless
+        self._browser_channel = browser_channel
+        self._context_options = context_options if context_options is not None else {"user_agent": DEFAULT_USER_AGENT}
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
+        self._browsers: List[_PooledBrowser] = []
+        self._warm: List[BrowserContext] = []
+        self._leases: Dict[BrowserContext, _Lease] = {}
+        # Serializes launching, creating and closing browsers and contexts, so that concurrent acquires fill
+        # browsers in turn and a browser is not closed while a context is created in it.
+        self._lock = asyncio.Lock()
+        self._warming_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._stats = BrowserPoolStats()
+
+    @property
+    def stats(self) -> BrowserPoolStats:
+        return self._stats
+
+    @property
+    def num_browsers(self) -> int:
+        """The number of running browser processes."""
+        return sum(1 for browser in self._browsers if browser.connected)
+
+    @property
+    def num_leased(self) -> int:
+        """The number of contexts currently leased."""
+        return len(self._leases)
+
+    async def start(self) -> None:
+        """Launches the first browser and creates the warm contexts."""
+        self._check_open()
+        await self._fill_warm()
+
+    async def acquire(self) -> BrowserContext:
+        """Leases a context, which is used only by the caller until it is released with :meth:`release`."""
+        self._check_open()
+        while self._warm:
+            context = self._warm.pop()
+            if self._pooled_browser(context) is not None:
+                self._stats.warm_leases += 1
+                break
+        else:
+            async with self._lock:
+                context = await self._create_context()
+        browser = self._pooled_browser(context)
+        assert browser is not None
+        self._leases[context] = _Lease(browser)
+        self._stats.leases += 1
+        self._ensure_warming()
+        return context
+
+    async def release(self, context: BrowserContext) -> None:
+        """Returns a leased context to the pool, which closes it."""
+        async with self._lock:
+            lease = self._leases.pop(context, None)
+            if lease is None:
+                if self._closed:
+                    # Closing the pool closed the context already.
+                    return
+                raise ValueError("The context was not leased from this pool.")
+            await self._close_context(context, lease.browser)
+
+    def navigations(self, context: BrowserContext) -> int:
+        """Returns the number of main frame navigations in a leased context."""
+        lease = self._leases.get(context)
+        return 0 if lease is None else lease.navigations
+
+    def should_recycle(self, context: BrowserContext) -> bool:
+        """Returns whether a leased context has reached ``max_navigations_per_context``,
+        or its browser has exited, so that it should be released and replaced."""
+        lease = self._leases.get(context)
+        if lease is None:
+            return False
+        if not lease.browser.connected:
+            return True
+        return self._max_navigations is not None and lease.navigations >= self._max_navigations
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("The browser pool is closed.")
+
+    def _pooled_browser(self, context: BrowserContext) -> _PooledBrowser | None:
+        for browser in self._browsers:
+            if context in browser.contexts and browser.connected:
+                return browser
+        return None
+
+    async def _create_context(self) -> BrowserContext:
+        # Drop the browsers that exited, with the contexts they had.
+        self._browsers = [browser for browser in self._browsers if browser.connected]
+        browser = min(self._browsers, key=lambda browser: len(browser.contexts), default=None)
+        if browser is None or len(browser.contexts) >= self._sessions_per_browser:
+            browser = await self._launch_browser()
+
+        context = await browser.browser.new_context(**self._context_options)
+        browser.contexts.add(context)
+        self._stats.contexts_created += 1
+        if self._blocked_resource_types:
+            await context.route("**/*", self._route)
+        context.on("page", self._on_page)
+        return context
+
+    async def _launch_browser(self) -> _PooledBrowser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        launch_args: Dict[str, Any] = {"headless": self._headless}
+        if self._browser_channel is not None:
+            launch_args["channel"] = self._browser_channel
+        browser = _PooledBrowser(await self._playwright.chromium.launch(**launch_args))
+        self._browsers.append(browser)
+        self._stats.browsers_launched += 1
+        return browser
+
+    async def _route(self, route: Route) -> None:
+        if route.request.resource_type in self._blocked_resource_types:
+            self._stats.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_page(self, page: Page) -> None:
+        def on_navigated(frame: Frame) -> None:
+            if frame == page.main_frame:
+                lease = self._leases.get(page.context)
+                if lease is not None:
+                    lease.navigations += 1
+
+        page.on("framenavigated", on_navigated)
+
+    async def _close_context(self, context: BrowserContext, browser: _PooledBrowser) -> None:
+        browser.contexts.discard(context)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning("Error while closing a pooled browser context: %s", e)
+        # Close browsers left empty, except one to create the next contexts in.
+        if not browser.contexts and len(self._browsers) > 1 and browser in self._browsers:
+            self._browsers.remove(browser)
+            try:
+                await browser.browser.close()
+            except Exception as e:
+                logger.warning("Error while closing a pooled browser: %s", e)
+
+    def _ensure_warming(self) -> None:
+        if len(self._warm) < self._warm_contexts and (self._warming_task is None or self._warming_task.done()):
+            self._warming_task = asyncio.create_task(self._fill_warm_logged())
+
+    async def _fill_warm_logged(self) -> None:
+        try:
+            await self._fill_warm()
+        except Exception:
+            logger.exception("Error while creating warm browser contexts")
+
+    async def _fill_warm(self) -> None:
+        async with self._lock:
+            if not self._browsers:
+                await self._launch_browser()
+            while len(self._warm) < self._warm_contexts and not self._closed:
+                self._warm.append(await self._create_context())
+
+    async def close(self) -> None:
+        """Closes all contexts and browsers, including those still leased."""
+        self._closed = True
+        if self._warming_task is not None:
+            await asyncio.gather(self._warming_task, return_exceptions=True)
+            self._warming_task = None
+        self._warm.clear()
+        self._leases.clear()
+        for browser in self._browsers:
+            try:
+                await browser.browser.close()
+            except Exception as e:
+                logger.warning("Error while closing a pooled browser: %s", e)
+        self._browsers.clear()
+        if self._owns_playwright and self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close()
@@ -10,6 +10,7 @@
 import time
 import traceback
 import warnings
+from dataclasses import dataclass
 from typing import (
     Any,
     AsyncGenerator,
@@ -17,6 +18,7 @@
     List,
     Optional,
     Sequence,
+    Tuple,
 )
 from urllib.parse import quote_plus
 
@@ -42,6 +44,7 @@
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ._browser_pool import DEFAULT_USER_AGENT, BrowserPool
 from ._events import WebSurferEvent
 from ._prompts import (
     WEB_SURFER_QA_PROMPT,
@@ -49,7 +52,7 @@
     WEB_SURFER_TOOL_PROMPT_MM,
     WEB_SURFER_TOOL_PROMPT_TEXT,
 )
-from ._set_of_mark import add_set_of_mark
+from ._set_of_mark import add_set_of_mark, classify_rects
 from ._tool_definitions import (
     TOOL_CLICK,
     TOOL_HISTORY_BACK,
@@ -63,7 +66,7 @@
     TOOL_VISIT_URL,
     TOOL_WEB_SEARCH,
 )
-from ._types import InteractiveRegion, UserContent
+from ._types import InteractiveRegion, UserContent, VisualViewport
 from .playwright_controller import PlaywrightController
 
 DEFAULT_CONTEXT_SIZE = 128000
@@ -85,6 +88,20 @@ class MultimodalWebSurferConfig(BaseModel):
     to_resize_viewport: bool = True
 
 
+@dataclass
+class _PagePerception:
+    """What the agent perceived of the page in one state, reused for as long as the page stays in that state."""
+
+    state_key: Tuple[Any, ...]
+    rects: Dict[str, InteractiveRegion]
+    viewport: VisualViewport
+    visible_rects: List[str]
+    rects_above: List[str]
+    rects_below: List[str]
+    # The set-of-mark screenshot at the size sent to the MLM, or None if the model has no vision
+    som_screenshot: Image.Image | None
+
+
 class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
     """
     MultimodalWebSurfer is a multimodal agent that acts as a web surfer that can search the web and visit web pages.
@@ -144,6 +161,8 @@ class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
         to_resize_viewport (bool, optional): Whether to resize the viewport. Defaults to True.
         playwright (Playwright, optional): The playwright instance. Defaults to None.
         context (BrowserContext, optional): The browser context. Defaults to None.
+        browser_pool (BrowserPool, optional): A pool to lease the browser context from, instead of launching a browser.
+            The context is recycled on reset once the pool says so, and released on :meth:`close`. Defaults to None.
 
 
 
@@ -206,6 +225,9 @@ async def main() -> None:
 
     SCREENSHOT_TOKENS = 1105
 
+    # Quality of the JPEG screenshots the set-of-mark screenshot is drawn on
+    SCREENSHOT_QUALITY = 90
+
     def __init__(
         self,
         name: str,
@@ -223,6 +245,7 @@ def __init__(
         to_resize_viewport: bool = True,
         playwright: Playwright | None = None,
         context: BrowserContext | None = None,
+        browser_pool: BrowserPool | None = None,
     ):
         """
         Initialize the MultimodalWebSurfer.
@@ -252,9 +275,12 @@ def __init__(
         # Call init to set these in case not set
         self._playwright: Playwright | None = playwright
         self._context: BrowserContext | None = context
+        self._browser_pool = browser_pool
+        self._context_from_pool = False
         self._page: Page | None = None
         self._last_download: Download | None = None
         self._prior_metadata_hash: str | None = None
+        self._page_perception: _PagePerception | None = None
         self.logger = logging.getLogger(EVENT_LOGGER_NAME + f".{self.name}.MultimodalWebSurfer")
         self._chat_history: List[LLMMessage] = []
 
@@ -311,26 +337,39 @@ async def _lazy_init(
         self._last_download = None
         self._prior_metadata_hash = None
 
-        # Create the playwright self
-        launch_args: Dict[str, Any] = {"headless": self.headless}
-        if self.browser_channel is not None:
-            launch_args["channel"] = self.browser_channel
-        if self._playwright is None:
-            self._playwright = await async_playwright().start()
-
-        # Create the context -- are we launching persistent?
-        if self._context is None:
-            if self.browser_data_dir is None:
-                browser = await self._playwright.chromium.launch(**launch_args)
-                self._context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
-                )
-            else:
-                self._context = await self._playwright.chromium.launch_persistent_context(
-                    self.browser_data_dir, **launch_args
-                )
+        if self._context is None and self._browser_pool is not None:
+            # Lease the context from the pool, which owns the browser
+            self._context = await self._browser_pool.acquire()
+            self._context_from_pool = True
+        else:
+            # Create the playwright self
+            launch_args: Dict[str, Any] = {"headless": self.headless}
+            if self.browser_channel is not None:
+                launch_args["channel"] = self.browser_channel
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            # Create the context -- are we launching persistent?
+            if self._context is None:
+                if self.browser_data_dir is None:
+                    browser = await self._playwright.chromium.launch(**launch_args)
+                    self._context = await browser.new_context(user_agent=DEFAULT_USER_AGENT)
+                else:
+                    self._context = await self._playwright.chromium.launch_persistent_context(
+                        self.browser_data_dir, **launch_args
+                    )
 
-        # Create the page
+        await self._open_page()
+
+        # Prepare the debug directory -- which stores the screenshots generated throughout the process
+        await self._set_debug_dir(self.debug_dir)
+        self.did_lazy_init = True
+
+    async def _open_page(self) -> None:
+        """
+        Open the page in the context, and load the start page.
+        """
+        assert self._context is not None
         self._context.set_default_timeout(60000)  # One minute
         self._page = await self._context.new_page()
         assert self._page is not None
@@ -344,15 +383,32 @@ async def _lazy_init(
         await self._page.goto(self.start_page)
         await self._page.wait_for_load_state()
 
-        # Prepare the debug directory -- which stores the screenshots generated throughout the process
-        await self._set_debug_dir(self.debug_dir)
-        self.did_lazy_init = True
+    async def _recycle_context(self) -> None:
+        """
+        Release the context leased from the browser pool, and continue in a fresh one.
+        The fresh context is leased first, so the surfer keeps its page if that fails.
+        """
+        assert self._browser_pool is not None and self._context is not None
+        context = await self._browser_pool.acquire()
+        context, self._context = self._context, context
+        self._page = None
+        self._page_perception = None
+        await self._browser_pool.release(context)
+        await self._open_page()
 
     async def close(self) -> None:
         """
         Close the browser and the page.
         Should be called when the agent is no longer needed.
         """
+        self._page_perception = None
+        if self._context_from_pool:
+            # Releasing the context to the pool closes it, with its pages
+            assert self._browser_pool is not None and self._context is not None
+            self._page = None
+            await self._browser_pool.release(self._context)
+            self._context = None
+            self._context_from_pool = False
         if self._page is not None:
             await self._page.close()
             self._page = None
@@ -394,9 +450,21 @@ async def on_reset(self, cancellation_token: CancellationToken) -> None:
         assert self._page is not None
 
         self._chat_history.clear()
-        reset_prior_metadata, reset_last_download = await self._playwright_controller.visit_page(
-            self._page, self.start_page
-        )
+        self._page_perception = None
+        assert self._context is not None
+        if (
+            self._context_from_pool
+            and self._browser_pool is not None
+            and self._browser_pool.should_recycle(self._context)
+        ):
+            # The new context is opened to the start page
+            await self._recycle_context()
+            assert self._page is not None
+            reset_prior_metadata, reset_last_download = True, True
+        else:
+            reset_prior_metadata, reset_last_download = await self._playwright_controller.visit_page(
+                self._page, self.start_page
+            )
         if reset_last_download and self._last_download is not None:
             self._last_download = None
         if reset_prior_metadata and self._prior_metadata_hash is not None:
@@ -487,13 +555,18 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
         ]:
             history = []
 
-        # Ask the page for interactive elements, then prepare the state-of-mark screenshot
-        rects = await self._playwright_controller.get_interactive_rects(self._page)
-        viewport = await self._playwright_controller.get_visual_viewport(self._page)
-        screenshot = await self._page.screenshot()
-        som_screenshot, visible_rects, rects_above, rects_below = add_set_of_mark(screenshot, rects)
+        # Ask the page for interactive elements and the state-of-mark screenshot
+        perception = await self._perceive_page()
+        rects = perception.rects
+        viewport = perception.viewport
+        visible_rects, rects_above, rects_below = (
+            perception.visible_rects,
+            perception.rects_above,
+            perception.rects_below,
+        )
+        som_screenshot = perception.som_screenshot
 
-        if self.to_save_screenshots:
+        if self.to_save_screenshots and som_screenshot is not None:
             current_timestamp = "_" + int(time.time()).__str__()
             screenshot_png_name = "screenshot_som" + current_timestamp + ".png"
             som_screenshot.save(os.path.join(self.debug_dir, screenshot_png_name))  # type: ignore
@@ -558,7 +631,7 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
         page_title = await self._page.title()
 
         prompt_message = None
-        if self._model_client.model_info["vision"]:
+        if som_screenshot is not None:
             text_prompt = WEB_SURFER_TOOL_PROMPT_MM.format(
                 state_description=state_description,
                 visible_targets=visible_targets,
@@ -569,15 +642,9 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
                 url=self._page.url,
             ).strip()
 
-            # Scale the screenshot for the MLM, and close the original
-            scaled_screenshot = som_screenshot.resize((self.MLM_WIDTH, self.MLM_HEIGHT))
-            som_screenshot.close()
-            if self.to_save_screenshots:
-                scaled_screenshot.save(os.path.join(self.debug_dir, "screenshot_scaled.png"))  # type: ignore
-
             # Create the message
             prompt_message = UserMessage(
-                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), AGImage.from_pil(scaled_screenshot)],
+                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), AGImage.from_pil(som_screenshot)],
                 source=self.name,
             )
         else:
@@ -625,6 +692,49 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
             # Not sure what happened here
             raise AssertionError(f"Unknown response format '{message}'")
 
+    async def _perceive_page(self) -> _PagePerception:
+        """
+        Gets the interactive regions, viewport and set-of-mark screenshot of the page. These are reused from the
+        previous step if the page reports no DOM mutations, events, scrolling or resizing since then.
+        """
+        assert self._page is not None
+        vision = self._model_client.model_info["vision"]
+
+        state = await self._playwright_controller.get_page_state(self._page)
+        viewport = state["viewport"]
+        state_key = (self._page.url, state["documentId"], state["changes"], state["readyState"], *viewport.values())
+        cached = self._page_perception
+        if cached is not None and cached.state_key == state_key and (cached.som_screenshot is not None) == vision:
+            return cached
+
+        rects = await self._playwright_controller.get_interactive_rects(self._page)
+        som_screenshot: Image.Image | None = None
+        if vision:
+            # Decoding, marking and scaling the screenshot are done in a thread, to not block the event loop
+            screenshot = await self._page.screenshot(type="jpeg", quality=self.SCREENSHOT_QUALITY, scale="css")
+            som_screenshot, visible_rects, rects_above, rects_below = await asyncio.to_thread(
+                add_set_of_mark, screenshot, rects, (self.MLM_WIDTH, self.MLM_HEIGHT)
+            )
+        else:
+            viewport_size = self._page.viewport_size or {
+                "width": int(viewport["width"]),
+                "height": int(viewport["height"]),
+            }
+            visible_rects, rects_above, rects_below = classify_rects(
+                rects, (viewport_size["width"], viewport_size["height"])
+            )
+
+        self._page_perception = _PagePerception(
+            state_key=state_key,
+            rects=rects,
+            viewport=viewport,
+            visible_rects=visible_rects,
+            rects_above=rects_above,
+            rects_below=rects_below,
+            som_screenshot=som_screenshot,
+        )
+        return self._page_perception
+
     async def _execute_tool(
         self,
         message: List[FunctionCall],
@@ -10,33 +10,42 @@
 
 
 def add_set_of_mark(
-    screenshot: bytes | Image.Image | io.BufferedIOBase, ROIs: Dict[str, InteractiveRegion]
+    screenshot: bytes | Image.Image | io.BufferedIOBase,
+    ROIs: Dict[str, InteractiveRegion],
+    size: Tuple[int, int] | None = None,
 ) -> Tuple[Image.Image, List[str], List[str], List[str]]:
+    """
+    Draws the visible interactive regions on the screenshot. If a size is given, the screenshot is
+    first resized to it and the regions are drawn scaled, which is faster than resizing afterwards.
+    """
     if isinstance(screenshot, Image.Image):
-        return _add_set_of_mark(screenshot, ROIs)
+        return _add_set_of_mark(screenshot, ROIs, size)
 
     if isinstance(screenshot, bytes):
         screenshot = io.BytesIO(screenshot)
 
     # TODO: Not sure why this cast was needed, but by this point screenshot is a binary file-like object
     image = Image.open(cast(BinaryIO, screenshot))
-    comp, visible_rects, rects_above, rects_below = _add_set_of_mark(image, ROIs)
+    comp, visible_rects, rects_above, rects_below = _add_set_of_mark(image, ROIs, size)
     image.close()
     return comp, visible_rects, rects_above, rects_below
 
 
-def _add_set_of_mark(
-    screenshot: Image.Image, ROIs: Dict[str, InteractiveRegion]
-) -> Tuple[Image.Image, List[str], List[str], List[str]]:
-    visible_rects: List[str] = list()
+def classify_rects(ROIs: Dict[str, InteractiveRegion], size: Tuple[int, int]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Splits the interactive regions into those visible in a viewport of the given size, and those above and below it.
+    """
+    visible, rects_above, rects_below = _classify_rects(ROIs, size)
+    return [r for r, _ in visible], rects_above, rects_below
+
+
+def _classify_rects(
+    ROIs: Dict[str, InteractiveRegion], size: Tuple[int, int]
+) -> Tuple[List[Tuple[str, DOMRectangle]], List[str], List[str]]:
+    visible: List[Tuple[str, DOMRectangle]] = list()
     rects_above: List[str] = list()  # Scroll up to see
     rects_below: List[str] = list()  # Scroll down to see
 
-    fnt = ImageFont.load_default(14)
-    base = screenshot.convert("L").convert("RGBA")
-    overlay = Image.new("RGBA", base.size)
-
-    draw = ImageDraw.Draw(overlay)
     for r in ROIs:
         for rect in ROIs[r]["rects"]:
             # Empty rectangles
@@ -47,18 +56,52 @@ def _add_set_of_mark(
 
             mid = ((rect["right"] + rect["left"]) / 2.0, (rect["top"] + rect["bottom"]) / 2.0)
 
-            if 0 <= mid[0] and mid[0] < base.size[0]:
+            if 0 <= mid[0] and mid[0] < size[0]:
                 if mid[1] < 0:
                     rects_above.append(r)
-                elif mid[1] >= base.size[1]:
+                elif mid[1] >= size[1]:
                     rects_below.append(r)
                 else:
-                    visible_rects.append(r)
-                    _draw_roi(draw, int(r), fnt, rect)
+                    visible.append((r, rect))
+    return visible, rects_above, rects_below
+
+
+def _add_set_of_mark(
+    screenshot: Image.Image, ROIs: Dict[str, InteractiveRegion], size: Tuple[int, int] | None = None
+) -> Tuple[Image.Image, List[str], List[str], List[str]]:
+    visible, rects_above, rects_below = _classify_rects(ROIs, screenshot.size)
+
+    scale_x, scale_y = 1.0, 1.0
+    if size is not None and size != screenshot.size:
+        scale_x, scale_y = size[0] / screenshot.size[0], size[1] / screenshot.size[1]
+        screenshot = screenshot.resize(size)
+
+    fnt = ImageFont.load_default(14 * scale_y)
+    base = screenshot.convert("L").convert("RGBA")
+    overlay = Image.new("RGBA", base.size)
+
+    draw = ImageDraw.Draw(overlay)
+    for r, rect in visible:
+        if scale_x != 1.0 or scale_y != 1.0:
+            rect = _scale_rect(rect, scale_x, scale_y)
+        _draw_roi(draw, int(r), fnt, rect)
 
     comp = Image.alpha_composite(base, overlay)
     overlay.close()
-    return comp, visible_rects, rects_above, rects_below
+    return comp, [r for r, _ in visible], rects_above, rects_below
+
+
+def _scale_rect(rect: DOMRectangle, scale_x: float, scale_y: float) -> DOMRectangle:
+    return DOMRectangle(
+        x=rect["x"] * scale_x,
+        y=rect["y"] * scale_y,
+        width=rect["width"] * scale_x,
+        height=rect["height"] * scale_y,
+        top=rect["top"] * scale_y,
+        right=rect["right"] * scale_x,
+        bottom=rect["bottom"] * scale_y,
+        left=rect["left"] * scale_x,
+    )
 
 
 def _draw_roi(
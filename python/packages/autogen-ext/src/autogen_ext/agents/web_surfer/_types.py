@@ -34,6 +34,13 @@ class VisualViewport(TypedDict):
     scrollHeight: Union[int, float]
 
 
+class PageState(TypedDict):
+    documentId: str
+    changes: Union[int, float]
+    readyState: str
+    viewport: VisualViewport
+
+
 class InteractiveRegion(TypedDict):
     tag_name: str
     role: str
@@ -104,3 +111,12 @@ def visualviewport_from_dict(viewport: Dict[str, Any]) -> VisualViewport:
         scrollWidth=_get_number(viewport, "scrollWidth"),
         scrollHeight=_get_number(viewport, "scrollHeight"),
     )
+
+
+def pagestate_from_dict(state: Dict[str, Any]) -> PageState:
+    return PageState(
+        documentId=_get_str(state, "documentId"),
+        changes=_get_number(state, "changes"),
+        readyState=_get_str(state, "readyState"),
+        viewport=visualviewport_from_dict(state["viewport"]),
+    )
@@ -239,6 +239,47 @@ var MultimodalWebSurfer = MultimodalWebSurfer || (function() {
       };
   };
 
+  // Count the changes that can change how the page looks, so that an unchanged page need not be
+  // captured again. The document id tells apart documents that reached the same count.
+  let documentId = Math.random().toString(36).slice(2);
+  let changeCount = 0;
+  let countChange = function() {
+      changeCount++;
+  };
+
+  new MutationObserver(function(mutations) {
+      for (const mutation of mutations) {
+          // Labelling the interactive elements doesn't change the page.
+          if (mutation.type != "attributes" || mutation.attributeName != "__elementid") {
+              changeCount++;
+              return;
+          }
+      }
+  }).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+
+  // Typed values, focus, hovering, loaded images and animations change the page without mutating the DOM.
+  for (const type of ["input", "change", "focusin", "focusout", "mouseover", "mouseout", "load", "transitionend", "animationend"]) {
+      document.addEventListener(type, countChange, true);
+  }
+
+  let getPageState = function() {
+      // Canvases and playing videos may change at any time.
+      let videos = document.querySelectorAll("video");
+      let playing = false;
+      for (let i=0; i<videos.length; i++) {
+          playing = playing || (!videos[i].paused && !videos[i].ended);
+      }
+      if (playing || document.querySelector("canvas") !== null) {
+          changeCount++;
+      }
+      return {
+          "documentId": documentId,
+          "changes": changeCount,
+          "readyState": document.readyState,
+          "viewport": getVisualViewport()
+      };
+  };
+
   let _getMetaTags = function() {
       let meta = document.querySelectorAll("meta");
       let results = {};
@@ -422,6 +463,7 @@ var MultimodalWebSurfer = MultimodalWebSurfer || (function() {
    return {
        getInteractiveRects: getInteractiveRects,
        getVisualViewport: getVisualViewport,
+       getPageState: getPageState,
        getFocusedElementId: getFocusedElementId,
        getPageMetadata: getPageMetadata,
        getVisibleText: getVisibleText,
@@ -13,8 +13,10 @@
 
 from ._types import (
     InteractiveRegion,
+    PageState,
     VisualViewport,
     interactiveregion_from_dict,
+    pagestate_from_dict,
     visualviewport_from_dict,
 )
 
@@ -85,6 +87,28 @@ async def sleep(self, page: Page, duration: Union[int, float]) -> None:
         assert page is not None
         await page.wait_for_timeout(duration * 1000)
 
+    async def _call_page_script(self, page: Page, expression: str) -> Any:
+        """
+        Evaluate an expression that uses the page script, injecting the script only if the page lacks it.
+
+        Args:
+            page (Page): The Playwright page object.
+            expression (str): The expression to evaluate.
+
+        Returns:
+            Any: The value of the expression.
+        """
+        try:
+            return await page.evaluate(expression)
+        except PlaywrightError:
+            # The script is usually added to each page by an init script, but may be missing,
+            # for example on pages opened before it was added.
+            try:
+                await page.evaluate(self._page_script)
+            except Exception:
+                pass
+            return await page.evaluate(expression)
+
     async def get_interactive_rects(self, page: Page) -> Dict[str, InteractiveRegion]:
         """
         Retrieve interactive regions from the web page.
@@ -97,11 +121,9 @@ async def get_interactive_rects(self, page: Page) -> Dict[str, InteractiveRegion
         """
         assert page is not None
         # Read the regions from the DOM
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = cast(Dict[str, Dict[str, Any]], await page.evaluate("MultimodalWebSurfer.getInteractiveRects();"))
+        result = cast(
+            Dict[str, Dict[str, Any]], await self._call_page_script(page, "MultimodalWebSurfer.getInteractiveRects();")
+        )
 
         # Convert the results into appropriate types
         assert isinstance(result, dict)
@@ -123,11 +145,21 @@ async def get_visual_viewport(self, page: Page) -> VisualViewport:
             VisualViewport: The visual viewport of the page.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        return visualviewport_from_dict(await page.evaluate("MultimodalWebSurfer.getVisualViewport();"))
+        return visualviewport_from_dict(await self._call_page_script(page, "MultimodalWebSurfer.getVisualViewport();"))
+
+    async def get_page_state(self, page: Page) -> PageState:
+        """
+        Retrieve what identifies how the web page looks: the document, a count of its changes and the visual viewport.
+        The page looks the same as before if its state is equal, except for content the page script can't observe.
+
+        Args:
+            page (Page): The Playwright page object.
+
+        Returns:
+            PageState: The state of the page.
+        """
+        assert page is not None
+        return pagestate_from_dict(await self._call_page_script(page, "MultimodalWebSurfer.getPageState();"))
 
     async def get_focused_rect_id(self, page: Page) -> str | None:
         """
@@ -140,11 +172,7 @@ async def get_focused_rect_id(self, page: Page) -> str | None:
             str: The ID of the focused element or None if no control has focus.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getFocusedElementId();")
+        result = await self._call_page_script(page, "MultimodalWebSurfer.getFocusedElementId();")
         return None if result is None else str(result)
 
     async def get_page_metadata(self, page: Page) -> Dict[str, Any]:
@@ -158,11 +186,7 @@ async def get_page_metadata(self, page: Page) -> Dict[str, Any]:
             Dict[str, Any]: A dictionary of page metadata.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getPageMetadata();")
+        result = await self._call_page_script(page, "MultimodalWebSurfer.getPageMetadata();")
         assert isinstance(result, dict)
         return cast(Dict[str, Any], result)
 
@@ -545,11 +569,7 @@ async def get_visible_text(self, page: Page) -> str:
             str: The text content of the page.
         """
         assert page is not None
-        try:
-            await page.evaluate(self._page_script)
-        except Exception:
-            pass
-        result = await page.evaluate("MultimodalWebSurfer.getVisibleText();")
+        result = await self._call_page_script(page, "MultimodalWebSurfer.getVisibleText();")
         assert isinstance(result, str)
         return result
 
@@ -1,12 +1,36 @@
+import asyncio
+import codecs
 import inspect
 import re
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent, indent
-from typing import Any, Callable, Optional, Sequence, Set, TypeVar, Union
-
-from autogen_core.code_executor import Alias, CodeResult, FunctionWithRequirements, FunctionWithRequirementsStr, Import
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from autogen_core import CancellationToken
+from autogen_core.code_executor import (
+    Alias,
+    CodeOutputChunk,
+    CodeResult,
+    FunctionWithRequirements,
+    FunctionWithRequirementsStr,
+    Import,
+)
 from typing_extensions import ParamSpec
 
 
@@ -17,6 +41,232 @@ class CommandLineCodeResult(CodeResult):
     code_file: Optional[str]
 
 
+class OutputBuffer:
+    """Collects the output of a stream in bounded memory.
+
+    Without a limit every byte is kept. With ``max_bytes``, at most ``max_bytes`` are kept:
+    once the stream grows past the limit, the first half of the limit is kept from the start
+    of the stream and the second half from the end, and the bytes in between are replaced
+    with a truncation marker.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        if max_bytes is not None and max_bytes < 2:
+            raise ValueError("max_bytes must be at least 2.")
+        self._max_bytes = max_bytes
+        self._head_limit = max_bytes // 2 if max_bytes is not None else 0
+        self._tail_limit = max_bytes - self._head_limit if max_bytes is not None else 0
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """The number of bytes written, including the dropped ones."""
+        return self._total_bytes
+
+    @property
+    def truncated(self) -> bool:
+        """Whether bytes were dropped."""
+        return self._max_bytes is not None and self._total_bytes > self._max_bytes
+
+    def write(self, data: bytes) -> bytes:
+        """Add data to the buffer.
+
+        Returns:
+            bytes: The part of ``data`` within the first ``max_bytes`` of the stream, which is
+            the part that can be forwarded to a consumer without exceeding the limit.
+        """
+        start = self._total_bytes
+        self._total_bytes += len(data)
+        if self._max_bytes is None:
+            self._head += data
+            return data
+        if start < self._head_limit:
+            self._head += data[: self._head_limit - start]
+            data_for_tail = data[self._head_limit - start :]
+        else:
+            data_for_tail = data
+        self._tail += data_for_tail
+        if len(self._tail) > 2 * self._tail_limit:
+            del self._tail[: -self._tail_limit]
+        return data[: max(0, self._max_bytes - start)]
+
+    def getvalue(self) -> str:
+        """Return the kept output decoded as UTF-8."""
+        if not self._tail:
+            return self._head.decode("utf-8", errors="replace")
+        if not self.truncated:
+            return (self._head + self._tail).decode("utf-8", errors="replace")
+        assert self._max_bytes is not None
+        tail = self._tail[-self._tail_limit :]
+        dropped = self._total_bytes - self._max_bytes
+        return (
+            self._head.decode("utf-8", errors="replace")
+            + f"\n... [{dropped} bytes truncated] ...\n"
+            + tail.decode("utf-8", errors="replace")
+        )
+
+
+class SupportsOutputStreams(Protocol):
+    """A running process whose output can be read as it is produced, like :class:`asyncio.subprocess.Process`."""
+
+    @property
+    def stdout(self) -> Optional[asyncio.StreamReader]: ...
+
+    @property
+    def stderr(self) -> Optional[asyncio.StreamReader]: ...
+
+    async def wait(self) -> int: ...
+
+    def terminate(self) -> None: ...
+
+    def kill(self) -> None: ...
+
+
+@dataclass
+class ProcessOutput:
+    """The output captured by :func:`stream_process_output`."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+    status: Literal["exited", "timeout", "cancelled", "output_limit_exceeded"]
+    """``exited`` if the process exited by itself, otherwise the reason it was terminated."""
+
+
+async def stream_process_output(
+    process: SupportsOutputStreams,
+    *,
+    cancellation_token: CancellationToken,
+    timeout: Optional[float] = None,
+    max_output_bytes: Optional[int] = None,
+    kill_on_output_overflow: bool = False,
+) -> AsyncGenerator[Union[CodeOutputChunk, ProcessOutput], None]:
+    """Read the output of a process as it is produced.
+
+    Yields a :class:`~autogen_core.code_executor.CodeOutputChunk` for every chunk of output
+    within the first ``max_output_bytes`` of each stream, and a :class:`ProcessOutput` as the
+    last item. Each stream is kept in an :class:`OutputBuffer`, so memory use is bounded by
+    ``max_output_bytes`` whatever the process prints. Chunks are queued with a small bound,
+    so a consumer that falls behind throttles the process through the pipe instead of
+    buffering its output.
+
+    The process is terminated if the timeout expires, if the cancellation token is
+    cancelled, if ``kill_on_output_overflow`` is set and a stream exceeds
+    ``max_output_bytes``, or if the generator is closed before the process exits.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    buffers: Dict[Literal["stdout", "stderr"], OutputBuffer] = {
+        "stdout": OutputBuffer(max_output_bytes),
+        "stderr": OutputBuffer(max_output_bytes),
+    }
+    decoders = {name: codecs.getincrementaldecoder("utf-8")(errors="replace") for name in buffers}
+    queue: "asyncio.Queue[Optional[Tuple[Literal['stdout', 'stderr'], bytes]]]" = asyncio.Queue(maxsize=16)
+
+    async def pump(name: Literal["stdout", "stderr"], reader: asyncio.StreamReader) -> None:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            await queue.put((name, data))
+        await queue.put(None)
+
+    pumps: List["asyncio.Task[None]"] = []
+    if process.stdout is not None:
+        pumps.append(asyncio.create_task(pump("stdout", process.stdout)))
+    if process.stderr is not None:
+        pumps.append(asyncio.create_task(pump("stderr", process.stderr)))
+    cancelled: "asyncio.Future[None]" = loop.create_future()
+    cancellation_token.link_future(cancelled)
+
+    async def wait_or_stop(awaitable: "asyncio.Future[Any]") -> Optional[Literal["timeout", "cancelled"]]:
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+        done, _ = await asyncio.wait({awaitable, cancelled}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        if awaitable in done:
+            return None
+        awaitable.cancel()
+        return "cancelled" if cancelled.done() else "timeout"
+
+    status: Literal["exited", "timeout", "cancelled", "output_limit_exceeded"] = "exited"
+    reaped = False
+    try:
+        open_streams = len(pumps)
+        while open_streams > 0:
+            get = asyncio.ensure_future(queue.get())
+            stop = await wait_or_stop(get)
+            if stop is not None:
+                status = stop
+                break
+            item = get.result()
+            if item is None:
+                open_streams -= 1
+                continue
+            name, data = item
+            buffer = buffers[name]
+            forwarded = buffer.write(data)
+            if forwarded:
+                text = decoders[name].decode(forwarded)
+                if text:
+                    yield CodeOutputChunk(output=text, stream=name)
+            if buffer.truncated and kill_on_output_overflow:
+                status = "output_limit_exceeded"
+                break
+        for stream, decoder in decoders.items():
+            text = decoder.decode(b"", final=True)
+            if text and not buffers[stream].truncated:
+                yield CodeOutputChunk(output=text, stream=stream)
+
+        exit_code = 0
+        if status == "exited":
+            wait: "asyncio.Future[int]" = asyncio.ensure_future(process.wait())
+            stop = await wait_or_stop(wait)
+            if stop is None:
+                exit_code = wait.result()
+                reaped = True
+            else:
+                status = stop
+        if not reaped:
+            await _terminate(process)
+            reaped = True
+        for task in pumps:
+            task.cancel()
+        yield ProcessOutput(
+            exit_code=exit_code,
+            stdout=buffers["stdout"].getvalue(),
+            stderr=buffers["stderr"].getvalue(),
+            status=status,
+        )
+    finally:
+        for task in pumps:
+            task.cancel()
+        if not reaped:
+            await _terminate(process)
+
+
+# Seconds a process is given to exit after SIGTERM before it is killed.
+TERMINATE_GRACE_PERIOD = 5.0
+
+
+async def _terminate(process: SupportsOutputStreams) -> None:
+    try:
+        process.terminate()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), TERMINATE_GRACE_PERIOD)
+        return
+    except asyncio.TimeoutError:
+        pass
+    # The process ignores or handles SIGTERM.
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass
+    await process.wait()
+
+
 T = TypeVar("T")
 P = ParamSpec("P")
 
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Awaitable, Callable, List, Optional, Sequence, Union
+
+if sys.platform != "win32":
+    import fcntl
+
+_COMPLETE_MARKER = ".complete"
+
+
+class FunctionSetupCacheEntry:
+    """A complete entry of a :class:`FunctionSetupCache`, in use until :meth:`release` is called.
+
+    While the entry is in use it holds a shared lock, so it is never evicted from under the executor.
+    """
+
+    def __init__(self, key: str, path: Path, lock_fd: int, hit: bool) -> None:
+        self._key = key
+        self._path = path
+        self._lock_fd: Optional[int] = lock_fd
+        self._hit = hit
+
+    @property
+    def key(self) -> str:
+        """The key of the entry."""
+        return self._key
+
+    @property
+    def path(self) -> Path:
+        """The directory of the entry."""
+        return self._path
+
+    @property
+    def packages_dir(self) -> Path:
+        """The directory the packages are installed in, to be added to ``PYTHONPATH``."""
+        return self._path / "site-packages"
+
+    @property
+    def hit(self) -> bool:
+        """Whether the entry was already built, rather than built by this acquisition."""
+        return self._hit
+
+    def release(self) -> None:
+        """Stop using the entry, allowing it to be evicted."""
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+class FunctionSetupCache:
+    """A content-addressed cache of the packages installed for the functions of a code executor.
+
+    Setting up the functions of an executor installs the packages required by every
+    :class:`~autogen_core.code_executor.FunctionWithRequirements` and checks that the functions
+    module loads, which takes seconds to minutes and is repeated by every executor. With a
+    cache, the packages are installed once in a directory keyed by the hash of the
+    requirements, the function sources and the environment, and executors with the same key
+    add that directory to ``PYTHONPATH`` instead of installing again.
+
+    Entries are built under an exclusive file lock, so executors starting concurrently, in the
+    same or in different processes, build each entry once while the others wait for it. When
+    more than ``max_entries`` entries exist, the least recently used entries that are not in use
+    are removed. Only available on POSIX platforms.
+
+    Args:
+        cache_dir (Union[Path, str], optional): The directory of the cache. Defaults to
+            ``~/.cache/autogen/code_executor_setup``.
+        max_entries (int, optional): The number of entries to keep. Defaults to 8.
+    """
+
+    def __init__(self, cache_dir: Union[Path, str, None] = None, max_entries: int = 8) -> None:
+        if sys.platform == "win32":
+            raise ValueError("FunctionSetupCache is not supported on Windows.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than or equal to 1.")
+        if cache_dir is None:
+            cache_dir = Path.home() / ".cache" / "autogen" / "code_executor_setup"
+        self._cache_dir = Path(cache_dir)
+        self._max_entries = max_entries
+
+    @property
+    def cache_dir(self) -> Path:
+        """The directory of the cache."""
+        return self._cache_dir
+
+    @property
+    def max_entries(self) -> int:
+        """The number of entries kept."""
+        return self._max_entries
+
+    @staticmethod
+    def key(functions_source: str, packages: Sequence[str], environment: str) -> str:
+        """Compute the key of an entry.
+
+        Args:
+            functions_source (str): The content of the functions module.
+            packages (Sequence[str]): The required packages, in any order.
+            environment (str): Identifies where the packages are installed, such as the Python
+                interpreter or the Docker image, since packages built for one may not work in another.
+        """
+        content = json.dumps([environment, sorted(set(packages)), functions_source])
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def entries(self) -> List[str]:
+        """The keys of the complete entries, least recently used first."""
+        if not self._cache_dir.exists():
+            return []
+        paths = [path for path in self._cache_dir.iterdir() if (path / _COMPLETE_MARKER).exists()]
+        paths.sort(key=lambda path: path.stat().st_mtime)
+        return [path.name for path in paths]
+
+    async def acquire(self, key: str, build: Callable[[Path], Awaitable[None]]) -> FunctionSetupCacheEntry:
+        """Get the entry of the key, building it if it does not exist.
+
+        Args:
+            key (str): The key returned by :meth:`key`.
+            build (Callable[[Path], Awaitable[None]]): Builds the entry in the directory passed
+                to it. It is only called by one acquisition at a time for a key, and the entry is
+                discarded if it raises.
+
+        Returns:
+            FunctionSetupCacheEntry: The entry, which must be released when no longer used.
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_dir / key
+        # The build lock is held exclusively while an entry is checked, built or evicted. The use lock
+        # is held shared by every executor using the entry, and evicting requires it exclusively.
+        build_fd = self._open_lock(key, "build")
+        try:
+            use_fd = self._open_lock(key, "use")
+            try:
+                await asyncio.to_thread(fcntl.flock, build_fd, fcntl.LOCK_EX)
+                hit = (path / _COMPLETE_MARKER).exists()
+                if not hit:
+                    # A directory without the marker is left by a build that failed or was interrupted.
+                    shutil.rmtree(path, ignore_errors=True)
+                    path.mkdir()
+                    try:
+                        await build(path)
+                    except BaseException:
+                        shutil.rmtree(path, ignore_errors=True)
+                        raise
+                    (path / _COMPLETE_MARKER).touch()
+                # The modification time of the entry records when it was last used.
+                os.utime(path)
+                fcntl.flock(use_fd, fcntl.LOCK_SH)
+            except BaseException:
+                os.close(use_fd)
+                raise
+        finally:
+            os.close(build_fd)
+        entry = FunctionSetupCacheEntry(key, path, use_fd, hit)
+        if not hit:
+            await asyncio.to_thread(self._evict, key)
+        return entry
+
+    def _open_lock(self, key: str, name: str) -> int:
+        return os.open(self._cache_dir / f"{key}.{name}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _evict(self, keep: str) -> None:
+        keys = [key for key in self.entries() if key != keep]
+        excess = len(keys) - self._max_entries + 1
+        for key in keys:
+            if excess <= 0:
+                break
+            lock_fds = [self._open_lock(key, "build"), self._open_lock(key, "use")]
+            try:
+                try:
+                    for fd in lock_fds:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Being built or in use by an executor.
+                    continue
+                path = self._cache_dir / key
+                # Remove the marker first so a partially removed entry is rebuilt rather than used.
+                (path / _COMPLETE_MARKER).unlink(missing_ok=True)
+                shutil.rmtree(path, ignore_errors=True)
+                if path.exists():
+                    logging.error(f"Failed to remove all of the evicted cache entry {path}")
+                excess -= 1
+            finally:
+                for fd in lock_fds:
+                    os.close(fd)
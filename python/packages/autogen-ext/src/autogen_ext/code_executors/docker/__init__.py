@@ -1,3 +1,11 @@
+from .._setup_cache import FunctionSetupCache
+from ._container_pool import DockerContainerLease, DockerContainerPool, DockerContainerPoolStats
 from ._docker_code_executor import DockerCommandLineCodeExecutor
 
-__all__ = ["DockerCommandLineCodeExecutor"]
+__all__ = [
+    "DockerCommandLineCodeExecutor",
+    "DockerContainerPool",
+    "DockerContainerLease",
+    "DockerContainerPoolStats",
+    "FunctionSetupCache",
+]
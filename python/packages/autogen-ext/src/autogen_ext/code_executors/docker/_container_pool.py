@@ -0,0 +1,487 @@
+# mypy: disable-error-code="no-any-unimported"
+from __future__ import annotations
+
+import asyncio
+import logging
+import tempfile
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Type, Union
+
+from typing_extensions import Self
+
+from ._docker_code_executor import _wait_for_ready
+
+try:
+    import docker
+    from docker.errors import DockerException, ImageNotFound, NotFound
+    from docker.types import DeviceRequest
+except ImportError as e:
+    raise RuntimeError(
+        "Missing dependecies for DockerContainerPool. Please ensure the autogen-ext package was installed with the 'docker' extra."
+    ) from e
+
+# Kills every process started by the previous session (kill -1 spares the container init and the calling shell)
+# and empties the workspace from inside the container, where files created by the code have the right owner.
+_RESET_COMMAND = ["sh", "-c", "kill -9 -1 2>/dev/null; find /workspace -mindepth 1 -delete"]
+
+
+@dataclass
+class DockerContainerLease:
+    """A container leased from a :class:`DockerContainerPool`.
+
+    The lease is exclusive until it is returned with :meth:`DockerContainerPool.release`.
+    """
+
+    container: Any
+    """The Docker container."""
+    work_dir: Path
+    """The host directory mounted at ``/workspace`` in the container."""
+
+
+@dataclass
+class DockerContainerPoolStats:
+    """Counters of a :class:`DockerContainerPool`."""
+
+    size: int
+    """Containers currently owned by the pool, idle or leased."""
+    idle: int
+    """Containers ready to be leased."""
+    leased: int
+    """Containers currently leased."""
+    created: int
+    """Containers created since the pool started."""
+    replaced: int
+    """Containers removed because they were unhealthy or failed to reset."""
+
+
+class DockerContainerPool:
+    """A shared pool of pre-warmed containers for :class:`DockerCommandLineCodeExecutor`.
+
+    Starting a container takes seconds, so instead of every executor creating its own,
+    executors created with ``container_pool=pool`` lease a running container from the pool
+    when they start and return it when they stop. The pool starts ``min_size`` containers
+    up front and grows on demand up to ``max_size``; when every container is leased,
+    :meth:`lease` waits for one to be returned. Idle containers are leased least recently
+    used first, which spreads concurrent sessions across the pool.
+
+    When a lease is returned, the processes it started are killed and its workspace is
+    emptied, so the next session starts clean. Containers that fail to reset, or that are
+    found unhealthy when leased or by the periodic health check, are removed and replaced.
+
+    Every container mounts its own subdirectory of ``work_dir`` at ``/workspace``.
+
+    .. note::
+
+        This class requires the :code:`docker` extra for the :code:`autogen-ext` package:
+
+        .. code-block:: bash
+
+            pip install "autogen-ext[docker]"
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core import CancellationToken
+            from autogen_core.code_executor import CodeBlock
+            from autogen_ext.code_executors.docker import DockerCommandLineCodeExecutor, DockerContainerPool
+
+
+            async def session(pool: DockerContainerPool, code: str) -> str:
+                async with DockerCommandLineCodeExecutor(container_pool=pool) as executor:
+                    result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken())
+                    return result.output
+
+
+            async def main() -> None:
+                async with DockerContainerPool(min_size=2, max_size=8) as pool:
+                    outputs = await asyncio.gather(*(session(pool, f"print({i})") for i in range(20)))
+                    print(outputs)
+
+
+            asyncio.run(main())
+
+    Args:
+        image (str, optional): Docker image of the containers. Defaults to "python:3-slim".
+        min_size (int, optional): Containers started by :meth:`start` and kept available. Defaults to 1.
+        max_size (int, optional): The maximum number of containers. Defaults to 4.
+        work_dir (Union[Path, str], optional): The host directory holding the workspace of every container.
+            Defaults to a temporary directory.
+        bind_dir (Union[Path, str], optional): The directory bound to the containers, if it differs from
+            work_dir, for example when the pool runs inside a container. Defaults to work_dir.
+        extra_volumes (Optional[Dict[str, Dict[str, str]]], optional): Extra volumes to mount to every container.
+            Defaults to None.
+        extra_hosts (Optional[Dict[str, str]], optional): Host mappings to add to every container. Defaults to None.
+        init_command (Optional[str], optional): A shell command run when a container starts. Defaults to None.
+        device_requests (Optional[List[DeviceRequest]], optional): Device requests of every container. Defaults to None.
+        health_check_interval (Optional[float], optional): Seconds between health checks of the idle containers.
+            If None, containers are only checked when they are leased. Defaults to 30.
+        container_name_prefix (str, optional): The prefix of the container names. Defaults to "autogen-code-exec-pool".
+        client_factory (Optional[Callable[[], Any]], optional): Creates the Docker client. Defaults to
+            :func:`docker.from_env`.
+    """
+
+    def __init__(
+        self,
+        image: str = "python:3-slim",
+        *,
+        min_size: int = 1,
+        max_size: int = 4,
+        work_dir: Union[Path, str, None] = None,
+        bind_dir: Union[Path, str, None] = None,
+        extra_volumes: Optional[Dict[str, Dict[str, str]]] = None,
+        extra_hosts: Optional[Dict[str, str]] = None,
+        init_command: Optional[str] = None,
+        device_requests: Optional[List[DeviceRequest]] = None,
+        health_check_interval: Optional[float] = 30.0,
+        container_name_prefix: str = "autogen-code-exec-pool",
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        if min_size < 0:
+            raise ValueError("min_size must be greater than or equal to 0.")
+        if max_size < 1 or max_size < min_size:
+            raise ValueError("max_size must be at least 1 and at least min_size.")
+        if health_check_interval is not None and health_check_interval <= 0:
+            raise ValueError("health_check_interval must be greater than 0.")
+
+        self._image = image
+        self._min_size = min_size
+        self._max_size = max_size
+        self._work_dir = Path(work_dir) if work_dir is not None else None
+        self._bind_dir = Path(bind_dir) if bind_dir is not None else None
+        self._extra_volumes = extra_volumes if extra_volumes is not None else {}
+        self._extra_hosts = extra_hosts if extra_hosts is not None else {}
+        self._init_command = init_command
+        self._device_requests = device_requests
+        self._health_check_interval = health_check_interval
+        self._container_name_prefix = container_name_prefix
+        self._client_factory: Callable[[], Any] = client_factory if client_factory is not None else docker.from_env
+
+        self._client: Any = None
+        self._temp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
+        self._idle: Deque[DockerContainerLease] = deque()
+        self._leased: Dict[str, DockerContainerLease] = {}
+        # Containers being created count towards max_size so concurrent leases do not overshoot it.
+        self._creating = 0
+        # Idle containers taken out of the queue by the health check.
+        self._checking = 0
+        self._condition = asyncio.Condition()
+        self._background_tasks: Set[asyncio.Task[None]] = set()
+        self._health_check_task: Optional[asyncio.Task[None]] = None
+        self._running = False
+        self._created = 0
+        self._replaced = 0
+
+    @property
+    def image(self) -> str:
+        """(Experimental) The Docker image of the containers."""
+        return self._image
+
+    @property
+    def min_size(self) -> int:
+        """(Experimental) The number of containers kept available."""
+        return self._min_size
+
+    @property
+    def max_size(self) -> int:
+        """(Experimental) The maximum number of containers."""
+        return self._max_size
+
+    @property
+    def running(self) -> bool:
+        """(Experimental) Whether the pool is started."""
+        return self._running
+
+    @property
+    def stats(self) -> DockerContainerPoolStats:
+        """(Experimental) The current counters of the pool."""
+        return DockerContainerPoolStats(
+            size=len(self._idle) + len(self._leased) + self._checking,
+            idle=len(self._idle),
+            leased=len(self._leased),
+            created=self._created,
+            replaced=self._replaced,
+        )
+
+    async def start(self) -> None:
+        """(Experimental) Connect to Docker and start ``min_size`` containers."""
+        if self._running:
+            return
+        if self._work_dir is None and self._temp_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory()
+
+        try:
+            self._client = await asyncio.to_thread(self._client_factory)
+        except DockerException as e:
+            if "FileNotFoundError" in str(e):
+                raise RuntimeError("Failed to connect to Docker. Please ensure Docker is installed and running.") from e
+            raise
+
+        try:
+            await asyncio.to_thread(self._client.images.get, self._image)
+        except ImageNotFound:
+            logging.info(f"Pulling image {self._image}...")
+            await asyncio.to_thread(self._client.images.pull, self._image)
+
+        self._running = True
+        self._creating += self._min_size
+        results = await asyncio.gather(*(self._create() for _ in range(self._min_size)), return_exceptions=True)
+        async with self._condition:
+            self._idle.extend(result for result in results if isinstance(result, DockerContainerLease))
+            self._condition.notify_all()
+        for result in results:
+            if isinstance(result, BaseException):
+                await self.stop()
+                raise result
+
+        if self._health_check_interval is not None:
+            self._health_check_task = asyncio.create_task(self._health_check_loop(self._health_check_interval))
+
+    async def stop(self) -> None:
+        """(Experimental) Remove every container of the pool, including the leased ones."""
+        if not self._running:
+            return
+        self._running = False
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            await asyncio.gather(self._health_check_task, return_exceptions=True)
+            self._health_check_task = None
+        # Replacement containers being created remove themselves once started, since the pool is no longer
+        # running. Cancelling them instead would leave behind a container created by the Docker thread.
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+        async with self._condition:
+            leases = [*self._idle, *self._leased.values()]
+            self._idle.clear()
+            self._leased.clear()
+            # Wake up waiting leases so they fail instead of waiting forever.
+            self._condition.notify_all()
+        await asyncio.gather(*(self._remove(lease) for lease in leases))
+
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    async def lease(self) -> DockerContainerLease:
+        """(Experimental) Lease a running container, waiting for one to be returned if the pool is at ``max_size``.
+
+        Raises:
+            ValueError: If the pool is not running.
+        """
+        while True:
+            create = False
+            async with self._condition:
+                while True:
+                    if not self._running:
+                        raise ValueError(
+                            "Container pool is not running. Must first be started with either start or a context manager."
+                        )
+                    if self._idle:
+                        lease = self._idle.popleft()
+                        break
+                    if self._size() < self._max_size:
+                        self._creating += 1
+                        create = True
+                        break
+                    await self._condition.wait()
+
+            if create:
+                lease = await self._create()
+                if await self._add_leased(lease):
+                    return lease
+            elif await self._is_running(lease):
+                if await self._add_leased(lease):
+                    return lease
+            else:
+                # The idle container died, replace it and try the next one.
+                await self._replace(lease)
+                continue
+            # The pool was stopped while the container was created or checked.
+            await self._remove(lease)
+            raise ValueError("Container pool was stopped while leasing a container.")
+
+    async def release(self, lease: DockerContainerLease, *, healthy: bool = True) -> None:
+        """(Experimental) Return a leased container to the pool.
+
+        The processes started during the lease are killed and the workspace is emptied. A
+        container that fails to reset, or that is returned with ``healthy=False``, is removed
+        and replaced.
+        """
+        async with self._condition:
+            if self._leased.pop(lease.container.name, None) is None:
+                return
+        if healthy and self._running and await self._reset(lease):
+            async with self._condition:
+                if self._running:
+                    self._idle.append(lease)
+                    self._condition.notify()
+                    return
+        await self._replace(lease)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Optional[bool]:
+        await self.stop()
+        return None
+
+    def _size(self) -> int:
+        return len(self._idle) + len(self._leased) + self._creating + self._checking
+
+    async def _add_leased(self, lease: DockerContainerLease) -> bool:
+        """Record the lease, unless the pool was stopped meanwhile and no longer owns the container."""
+        async with self._condition:
+            if not self._running:
+                return False
+            self._leased[lease.container.name] = lease
+            return True
+
+    def _root_dir(self) -> Path:
+        if self._work_dir is not None:
+            return self._work_dir
+        assert self._temp_dir is not None
+        return Path(self._temp_dir.name)
+
+    async def _create(self) -> DockerContainerLease:
+        """Create and start a container. The caller must have counted it in ``_creating``."""
+        try:
+            name = f"{self._container_name_prefix}-{uuid.uuid4()}"
+            work_dir = self._root_dir() / name
+            work_dir.mkdir(parents=True, exist_ok=True)
+            bind_dir = self._bind_dir / name if self._bind_dir is not None else work_dir
+
+            shell_command = "/bin/sh"
+            command = ["-c", f"{(self._init_command)};exec {shell_command}"] if self._init_command else None
+            container = await asyncio.to_thread(
+                self._client.containers.create,
+                self._image,
+                name=name,
+                entrypoint=shell_command,
+                command=command,
+                tty=True,
+                detach=True,
+                auto_remove=True,
+                volumes={str(bind_dir.resolve()): {"bind": "/workspace", "mode": "rw"}, **self._extra_volumes},
+                working_dir="/workspace",
+                extra_hosts=self._extra_hosts,
+                device_requests=self._device_requests,
+            )
+            await asyncio.to_thread(container.start)
+            await _wait_for_ready(container)
+            self._created += 1
+            return DockerContainerLease(container=container, work_dir=work_dir)
+        finally:
+            async with self._condition:
+                self._creating -= 1
+                self._condition.notify_all()
+
+    async def _remove(self, lease: DockerContainerLease) -> None:
+        try:
+            await asyncio.to_thread(lease.container.remove, force=True)
+        except NotFound:
+            pass
+        except DockerException as e:
+            logging.error(f"Docker error while removing container {lease.container.name}: {e}")
+
+    async def _replace(self, lease: DockerContainerLease) -> None:
+        """Remove the container and start a new one in the background if the pool fell below ``min_size``."""
+        self._replaced += 1
+        logging.info(f"Replacing container {lease.container.name}")
+        await self._remove(lease)
+        async with self._condition:
+            # A lease waiting for a free slot can now create a container itself.
+            self._condition.notify_all()
+            if not self._running or self._size() >= self._min_size:
+                return
+            self._creating += 1
+        task = asyncio.create_task(self._replenish())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _replenish(self) -> None:
+        try:
+            lease = await self._create()
+        except Exception as e:
+            logging.error(f"Failed to start a replacement container: {e}")
+            return
+        async with self._condition:
+            if self._running:
+                self._idle.append(lease)
+                self._condition.notify()
+                return
+        await self._remove(lease)
+
+    async def _is_running(self, lease: DockerContainerLease) -> bool:
+        try:
+            await asyncio.to_thread(lease.container.reload)
+        except DockerException:
+            return False
+        return bool(lease.container.status == "running")
+
+    async def _is_healthy(self, lease: DockerContainerLease) -> bool:
+        if not await self._is_running(lease):
+            return False
+        try:
+            result = await asyncio.to_thread(lease.container.exec_run, ["true"])
+        except DockerException:
+            return False
+        return bool(result.exit_code == 0)
+
+    async def _reset(self, lease: DockerContainerLease) -> bool:
+        try:
+            result = await asyncio.to_thread(lease.container.exec_run, _RESET_COMMAND)
+        except DockerException as e:
+            logging.error(f"Docker error while resetting container {lease.container.name}: {e}")
+            return False
+        if result.exit_code != 0:
+            logging.error(f"Failed to reset container {lease.container.name}: {result.output!r}")
+            return False
+        return True
+
+    async def _health_check_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self._check_idle()
+            except Exception as e:
+                # A failed pass must not stop the checks that follow.
+                logging.error(f"Error during the container health check: {e}")
+
+    async def _check_idle(self) -> None:
+        async with self._condition:
+            # Checked containers are taken out of the idle queue so they cannot be leased meanwhile.
+            checking = list(self._idle)
+            self._idle.clear()
+            self._checking = len(checking)
+        try:
+            results = await asyncio.gather(*(self._is_healthy(lease) for lease in checking), return_exceptions=True)
+        except asyncio.CancelledError:
+            # The pool is stopping and no longer owns the containers being checked.
+            async with self._condition:
+                self._checking = 0
+            await asyncio.gather(*(self._remove(lease) for lease in checking))
+            raise
+        healthy: List[bool] = []
+        for lease, result in zip(checking, results, strict=True):
+            if isinstance(result, BaseException):
+                logging.error(f"Error while checking container {lease.container.name}: {result}")
+            healthy.append(result is True)
+        async with self._condition:
+            self._checking = 0
+            self._idle.extend(lease for lease, ok in zip(checking, healthy, strict=True) if ok)
+            self._condition.notify_all()
+        for lease, ok in zip(checking, healthy, strict=True):
+            if not ok:
+                await self._replace(lease)
@@ -14,12 +14,13 @@
 from concurrent.futures import Future as ConcurrentFuture
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, ParamSpec, Tuple, Union
 
 from autogen_core import CancellationToken, Component
 from autogen_core.code_executor import (
     CodeBlock,
     CodeExecutor,
+    CodeOutputChunk,
     FunctionWithRequirements,
     FunctionWithRequirementsStr,
 )
@@ -30,11 +31,15 @@
 
 from .._common import (
     CommandLineCodeResult,
+    OutputBuffer,
+    ProcessOutput,
     build_python_functions_file,
     get_file_name_from_content,
     lang_to_cmd,
     silence_pip,
+    stream_process_output,
 )
+from .._setup_cache import FunctionSetupCache, FunctionSetupCacheEntry
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -52,6 +57,12 @@
         "Missing dependecies for DockerCommandLineCodeExecutor. Please ensure the autogen-ext package was installed with the 'docker' extra."
     ) from e
 
+# Where the setup cache directory is mounted in the container.
+_SETUP_CACHE_MOUNT = "/autogen-setup-cache"
+
+if TYPE_CHECKING:
+    from ._container_pool import DockerContainerLease, DockerContainerPool
+
 
 async def _wait_for_ready(container: Any, timeout: int = 60, stop_time: float = 0.1) -> None:
     elapsed_time = 0.0
@@ -67,6 +78,65 @@ async def _wait_for_ready(container: Any, timeout: int = 60, stop_time: float =
 A = ParamSpec("A")
 
 
+class _DockerExecProcess:
+    """A command run with the Docker exec API, with the parts of the :class:`asyncio.subprocess.Process`
+    interface used to stream its output.
+
+    The blocking Docker client is read in a worker thread that feeds the stream readers on the event loop.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        container_id: str,
+        command: List[str],
+        terminate: Callable[[], None],
+        kill: Callable[[], None],
+        environment: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self._api = api
+        self._container_id = container_id
+        self._command = command
+        self._environment = environment
+        self._terminate = terminate
+        self._kill = kill
+        self.stdout: Optional[asyncio.StreamReader] = asyncio.StreamReader()
+        self.stderr: Optional[asyncio.StreamReader] = asyncio.StreamReader()
+        self._exec_id: Optional[str] = None
+        self._pump_task: Optional[asyncio.Task[int]] = None
+
+    async def start(self) -> None:
+        exec_info = await asyncio.to_thread(
+            self._api.exec_create, self._container_id, self._command, environment=self._environment
+        )
+        self._exec_id = exec_info["Id"]
+        output = await asyncio.to_thread(self._api.exec_start, self._exec_id, stream=True, demux=True)
+        self._pump_task = asyncio.create_task(asyncio.to_thread(self._pump, output, asyncio.get_running_loop()))
+
+    def _pump(self, output: Any, loop: asyncio.AbstractEventLoop) -> int:
+        assert self.stdout is not None and self.stderr is not None
+        try:
+            for stdout, stderr in output:
+                if stdout:
+                    loop.call_soon_threadsafe(self.stdout.feed_data, stdout)
+                if stderr:
+                    loop.call_soon_threadsafe(self.stderr.feed_data, stderr)
+        finally:
+            loop.call_soon_threadsafe(self.stdout.feed_eof)
+            loop.call_soon_threadsafe(self.stderr.feed_eof)
+        return int(self._api.exec_inspect(self._exec_id)["ExitCode"])
+
+    async def wait(self) -> int:
+        assert self._pump_task is not None
+        return await asyncio.shield(self._pump_task)
+
+    def terminate(self) -> None:
+        self._terminate()
+
+    def kill(self) -> None:
+        self._kill()
+
+
 class DockerCommandLineCodeExecutorConfig(BaseModel):
     """Configuration for DockerCommandLineCodeExecutor"""
 
@@ -82,6 +152,8 @@ class DockerCommandLineCodeExecutorConfig(BaseModel):
     extra_hosts: Dict[str, str] = {}
     init_command: Optional[str] = None
     delete_tmp_files: bool = False
+    max_output_bytes: Optional[int] = None
+    kill_on_output_overflow: bool = False
 
 
 class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCodeExecutorConfig]):
@@ -104,8 +176,8 @@ class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCod
     For shell scripts, use the language "bash", "shell", "sh", "pwsh", "powershell", or "ps1" for the code block.
 
     Args:
-        image (_type_, optional): Docker image to use for code execution.
-            Defaults to "python:3-slim".
+        image (Optional[str], optional): Docker image to use for code execution.
+            Defaults to "python:3-slim", or the image of the `container_pool`.
         container_name (Optional[str], optional): Name of the Docker container
             which is created. If None, will autogenerate a name. Defaults to None.
         timeout (int, optional): The timeout for code execution. Defaults to 60.
@@ -130,6 +202,20 @@ class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCod
         init_command (Optional[str], optional): A shell command to run before each shell operation execution. Defaults to None.
             Example: init_command="kubectl config use-context docker-hub"
         delete_tmp_files (bool, optional): If true, will delete temporary files after execution. Defaults to False.
+        max_output_bytes (Optional[int], optional): The maximum number of bytes of stdout and of stderr kept for each code
+            block. Longer output keeps its beginning and end and drops the middle. If None, all output is kept. Defaults to None.
+        kill_on_output_overflow (bool, optional): If true, a code block is terminated as soon as its output exceeds
+            `max_output_bytes`, and the result has exit code 1. Defaults to False.
+        container_pool (Optional[DockerContainerPool], optional): A started pool to lease the container from instead of
+            creating one. The container is leased by :meth:`start` and returned, with its workspace emptied, by :meth:`stop`.
+            The image, work_dir, bind_dir, extra_volumes, extra_hosts, init_command and device_requests of the pool are used,
+            and an image other than the pool's raises a ValueError.
+            Defaults to None.
+        setup_cache (Optional[FunctionSetupCache], optional): A cache of the packages required by the functions. The cache
+            directory is mounted in the container, and the packages are installed once per combination of requirements,
+            function sources and image into a cached directory added to ``PYTHONPATH``. Files installed by the container
+            may be owned by its user, so the host may be unable to evict them. Cannot be used with `container_pool`.
+            Defaults to None.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
@@ -159,7 +245,7 @@ class DockerCommandLineCodeExecutor(CodeExecutor, Component[DockerCommandLineCod
 
     def __init__(
         self,
-        image: str = "python:3-slim",
+        image: Optional[str] = None,
         container_name: Optional[str] = None,
         *,
         timeout: int = 60,
@@ -180,10 +266,21 @@ def __init__(
         extra_hosts: Optional[Dict[str, str]] = None,
         init_command: Optional[str] = None,
         delete_tmp_files: bool = False,
+        max_output_bytes: Optional[int] = None,
+        kill_on_output_overflow: bool = False,
+        container_pool: Optional[DockerContainerPool] = None,
+        setup_cache: Optional[FunctionSetupCache] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
 
+        if container_pool is not None and (work_dir is not None or bind_dir is not None):
+            raise ValueError("work_dir and bind_dir cannot be set when using a container pool.")
+        if container_pool is not None and setup_cache is not None:
+            raise ValueError("setup_cache cannot be used with a container pool.")
+        if container_pool is not None and image is not None and image != container_pool.image:
+            raise ValueError(f"image {image!r} differs from the image {container_pool.image!r} of the container pool.")
+
         # Handle working directory logic
         if work_dir is None:
             self._work_dir = None
@@ -223,7 +320,11 @@ def __init__(
 
         self._auto_remove = auto_remove
         self._stop_container = stop_container
-        self._image = image
+        # The containers of a pool are started from its image, which is also the one dumped in the config.
+        if container_pool is not None:
+            self._image = container_pool.image
+        else:
+            self._image = image if image is not None else "python:3-slim"
 
         if not functions_module.isidentifier():
             raise ValueError("Module name must be a valid Python identifier")
@@ -236,6 +337,11 @@ def __init__(
         self._delete_tmp_files = delete_tmp_files
         self._device_requests = device_requests
 
+        # Validates the limit.
+        OutputBuffer(max_output_bytes)
+        self._max_output_bytes = max_output_bytes
+        self._kill_on_output_overflow = kill_on_output_overflow
+
         # Setup could take some time so we intentionally wait for the first code block to do it.
         if len(functions) > 0:
             self._setup_functions_complete = False
@@ -244,6 +350,13 @@ def __init__(
 
         self._container: Container | None = None
         self._running = False
+        self._container_pool = container_pool
+        self._lease: Optional[DockerContainerLease] = None
+
+        self._setup_cache = setup_cache
+        self._setup_cache_entry: Optional[FunctionSetupCacheEntry] = None
+        # The directory of cached packages added to PYTHONPATH, as seen from the container.
+        self._packages_dir: Optional[str] = None
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._cancellation_futures: List[ConcurrentFuture[None]] = []
@@ -262,20 +375,65 @@ async def _setup_functions(self, cancellation_token: CancellationToken) -> None:
         lists_of_packages = [x.python_packages for x in self._functions if isinstance(x, FunctionWithRequirements)]
         flattened_packages = [item for sublist in lists_of_packages for item in sublist]
         required_packages = list(set(flattened_packages))
+
+        if self._setup_cache is not None:
+            await self._setup_functions_from_cache(
+                self._setup_cache, func_file_content, required_packages, cancellation_token
+            )
+            self._setup_functions_complete = True
+            return
+
         if len(required_packages) > 0:
-            logging.info("Ensuring packages are installed in executor.")
+            await self._install_packages(required_packages, cancellation_token)
+        await self._check_functions_load(func_file_content, cancellation_token)
 
-            packages = shlex.join(required_packages)
+        self._setup_functions_complete = True
 
-            result = await self._execute_code_dont_check_setup(
-                [CodeBlock(code=f"python -m pip install {packages}", language="sh")], cancellation_token
-            )
+    async def _setup_functions_from_cache(
+        self,
+        setup_cache: FunctionSetupCache,
+        func_file_content: str,
+        required_packages: List[str],
+        cancellation_token: CancellationToken,
+    ) -> None:
+        key = setup_cache.key(func_file_content, required_packages, f"docker:{self._image}")
+        packages_dir = f"{_SETUP_CACHE_MOUNT}/{key}/site-packages"
+
+        async def build(path: Path) -> None:
+            (path / "site-packages").mkdir()
+            if len(required_packages) > 0:
+                await self._install_packages(required_packages, cancellation_token, target=packages_dir)
+            self._packages_dir = packages_dir
+            await self._check_functions_load(func_file_content, cancellation_token)
+
+        if self._setup_cache_entry is not None:
+            self._setup_cache_entry.release()
+            self._setup_cache_entry = None
+        try:
+            self._setup_cache_entry = await setup_cache.acquire(key, build)
+        except BaseException:
+            self._packages_dir = None
+            raise
+        # A hit was checked to load when it was built, so neither pip nor the check runs again.
+        self._packages_dir = packages_dir
+
+    async def _install_packages(
+        self, packages: List[str], cancellation_token: CancellationToken, target: Optional[str] = None
+    ) -> None:
+        logging.info("Ensuring packages are installed in executor.")
+
+        target_args = f"--target {shlex.quote(target)} " if target is not None else ""
+        result = await self._execute_code_dont_check_setup(
+            [CodeBlock(code=f"python -m pip install {target_args}{shlex.join(packages)}", language="sh")],
+            cancellation_token,
+        )
 
-            if result.exit_code != 0:
-                stdout = result.output
-                stderr = result.output
-                raise ValueError(f"Pip install failed. {stdout}, {stderr}")
+        if result.exit_code != 0:
+            stdout = result.output
+            stderr = result.output
+            raise ValueError(f"Pip install failed. {stdout}, {stderr}")
 
+    async def _check_functions_load(self, func_file_content: str, cancellation_token: CancellationToken) -> None:
         # Attempt to load the function file to check for syntax errors, imports etc.
         exec_result = await self._execute_code_dont_check_setup(
             [CodeBlock(code=func_file_content, language="python")], cancellation_token
@@ -284,51 +442,85 @@ async def _setup_functions(self, cancellation_token: CancellationToken) -> None:
         if exec_result.exit_code != 0:
             raise ValueError(f"Functions failed to load: {exec_result.output}")
 
-        self._setup_functions_complete = True
-
-    async def _kill_running_command(self, command: List[str]) -> None:
+    async def _kill_running_command(self, command: List[str], signal: str = "TERM") -> None:
         if self._container is None or not self._running:
             return
-        await asyncio.to_thread(self._container.exec_run, ["pkill", "-f", " ".join(command)])
+        await asyncio.to_thread(self._container.exec_run, ["pkill", f"-{signal}", "-f", " ".join(command)])
+
+    def _schedule_kill_running_command(self, command: List[str], signal: str = "TERM") -> None:
+        # Schedule a task to kill the running command in the background.
+        if self._loop and not self._loop.is_closed():
+            try:
+                logging.debug(f"Scheduling kill command via run_coroutine_threadsafe on loop {self._loop!r}")
+                future: ConcurrentFuture[None] = asyncio.run_coroutine_threadsafe(
+                    self._kill_running_command(command, signal), self._loop
+                )
+                self._cancellation_futures.append(future)
+                logging.debug(f"Kill command scheduled, future: {future!r}")
+            except RuntimeError as e:
+                logging.error(f"Failed to schedule kill command on loop {self._loop!r}: {e}")
+            except Exception as e:
+                logging.exception(f"Unexpected error scheduling kill command: {e}")
+        else:
+            logging.warning(
+                f"Cannot schedule kill command: Executor loop is not available or closed (loop: {self._loop!r})."
+            )
 
-    async def _execute_command(self, command: List[str], cancellation_token: CancellationToken) -> Tuple[str, int]:
+    async def _execute_command_stream(
+        self, command: List[str], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[CodeOutputChunk, Tuple[str, int]], None]:
+        """Run the command in the container, yielding output chunks and then the output and the exit code."""
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
-        exec_task = asyncio.create_task(asyncio.to_thread(self._container.exec_run, command))
-        cancellation_token.link_future(exec_task)
-
-        # Wait for the exec task to finish.
+        api: Any = self._container.client.api
+        process = _DockerExecProcess(
+            api,
+            str(self._container.id),
+            command,
+            terminate=lambda: self._schedule_kill_running_command(command),
+            kill=lambda: self._schedule_kill_running_command(command, "KILL"),
+            environment={"PYTHONPATH": self._packages_dir} if self._packages_dir is not None else None,
+        )
+        start_task = asyncio.create_task(process.start())
+        cancellation_token.link_future(start_task)
         try:
-            result = await exec_task
-            exit_code = result.exit_code
-            output = result.output.decode("utf-8")
-            if exit_code == 124:
-                output += "\n Timeout"
-            return output, exit_code
+            await start_task
         except asyncio.CancelledError:
-            # Schedule a task to kill the running command in the background.
-            if self._loop and not self._loop.is_closed():
-                try:
-                    logging.debug(f"Scheduling kill command via run_coroutine_threadsafe on loop {self._loop!r}")
-                    future: ConcurrentFuture[None] = asyncio.run_coroutine_threadsafe(
-                        self._kill_running_command(command), self._loop
-                    )
-                    self._cancellation_futures.append(future)
-                    logging.debug(f"Kill command scheduled, future: {future!r}")
-                except RuntimeError as e:
-                    logging.error(f"Failed to schedule kill command on loop {self._loop!r}: {e}")
-                except Exception as e:
-                    logging.exception(f"Unexpected error scheduling kill command: {e}")
+            yield "Code execution was cancelled.", 1
+            return
+
+        async for item in stream_process_output(
+            process,
+            cancellation_token=cancellation_token,
+            max_output_bytes=self._max_output_bytes,
+            kill_on_output_overflow=self._kill_on_output_overflow,
+        ):
+            if not isinstance(item, ProcessOutput):
+                yield item
+            elif item.status == "cancelled":
+                yield "Code execution was cancelled.", 1
+            elif item.status == "output_limit_exceeded":
+                yield item.stdout + item.stderr + "\nOutput limit exceeded", 1
             else:
-                logging.warning(
-                    f"Cannot schedule kill command: Executor loop is not available or closed (loop: {self._loop!r})."
-                )
-            return "Code execution was cancelled.", 1
+                output = item.stdout + item.stderr
+                if item.exit_code == 124:
+                    output += "\n Timeout"
+                yield output, item.exit_code
 
     async def _execute_code_dont_check_setup(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
     ) -> CommandLineCodeResult:
+        result: Optional[CommandLineCodeResult] = None
+        async for item in self._execute_code_stream_dont_check_setup(code_blocks, cancellation_token):
+            if isinstance(item, CommandLineCodeResult):
+                result = item
+        assert result is not None
+        return result
+
+    async def _execute_code_stream_dont_check_setup(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[CodeOutputChunk, CommandLineCodeResult], None]:
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
@@ -361,7 +553,12 @@ async def _execute_code_dont_check_setup(
 
                 command = ["timeout", str(self._timeout), lang_to_cmd(lang), filename]
 
-                output, exit_code = await self._execute_command(command, cancellation_token)
+                output, exit_code = "", 0
+                async for item in self._execute_command_stream(command, cancellation_token):
+                    if isinstance(item, CodeOutputChunk):
+                        yield item
+                    else:
+                        output, exit_code = item
                 outputs.append(output)
                 last_exit_code = exit_code
                 if exit_code != 0:
@@ -375,10 +572,13 @@ async def _execute_code_dont_check_setup(
                         pass
 
         code_file = str(files[0]) if files else None
-        return CommandLineCodeResult(exit_code=last_exit_code, output="".join(outputs), code_file=code_file)
+        yield CommandLineCodeResult(exit_code=last_exit_code, output="".join(outputs), code_file=code_file)
 
     @property
     def work_dir(self) -> Path:
+        # A container leased from a pool has its own working directory
+        if self._lease is not None:
+            return self._lease.work_dir
         # If a user specifies a working directory, use that
         if self._work_dir is not None:
             # If a user specifies the current directory, warn them that this is deprecated
@@ -420,11 +620,68 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[CodeOutputChunk, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks and yield their output as it is produced.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+
+        Yields:
+            :class:`~autogen_core.code_executor.CodeOutputChunk` for the output of the code blocks
+            while they run, then the :class:`CommandLineCodeResult` of the execution."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in self._execute_code_stream_dont_check_setup(code_blocks, cancellation_token):
+            yield item
+
+    async def _wait_for_cancellation_futures(self) -> None:
+        if not self._cancellation_futures:
+            return
+        if not self._loop or self._loop.is_closed():
+            logging.warning(
+                f"Executor loop ({self._loop!r}) is closed or unavailable. Cannot reliably wait for "
+                f"{len(self._cancellation_futures)} cancellation futures."
+            )
+            self._cancellation_futures.clear()
+        else:
+            # concurrent.futures.Future -> asyncio.Future
+            asyncio_futures = [asyncio.wrap_future(f, loop=self._loop) for f in self._cancellation_futures]
+
+            if asyncio_futures:
+                logging.debug(
+                    f"Waiting for {len(asyncio_futures)} cancellation futures to complete on loop {self._loop!r}..."
+                )
+                results = await asyncio.gather(*asyncio_futures, return_exceptions=True)
+                for i, result in enumerate(results):
+                    original_future = self._cancellation_futures[i]
+                    if isinstance(result, Exception):
+                        logging.warning(f"Cancellation future {original_future!r} failed: {result}")
+                    else:
+                        logging.debug(f"Cancellation future {original_future!r} completed successfully.")
+            else:
+                logging.debug("No valid cancellation futures to await.")
+
+            self._cancellation_futures.clear()
+
     async def restart(self) -> None:
         """(Experimental) Restart the Docker container code executor."""
         if self._container is None or not self._running:
             raise ValueError("Container is not running. Must first be started with either start or a context manager.")
 
+        if self._container_pool is not None and self._lease is not None:
+            # Replace the leased container with a fresh one from the pool.
+            await self._wait_for_cancellation_futures()
+            lease, self._lease = self._lease, None
+            self._running = False
+            self._setup_functions_complete = len(self._functions) == 0
+            await self._container_pool.release(lease, healthy=False)
+            await self._start_from_pool(self._container_pool)
+            return
+
         await asyncio.to_thread(self._container.restart)  # type: ignore
         if self._container.status != "running":
             self._running = False
@@ -437,10 +694,22 @@ async def stop(self) -> None:
         Stops the Docker container and cleans up any temporary files (if they were created), along with the temporary directory.
         The method first waits for all cancellation tasks to finish before stopping the container. Finally it marks the executor as not running.
         If the container is not running, the method does nothing.
+        A container leased from a pool is returned to the pool instead of being stopped.
         """
         if not self._running:
             return
 
+        if self._container_pool is not None and self._lease is not None:
+            await self._wait_for_cancellation_futures()
+            lease, self._lease = self._lease, None
+            self._container = None
+            self._running = False
+            # The workspace is emptied when the container is returned, so the functions are set up again.
+            self._setup_functions_complete = len(self._functions) == 0
+            self._release_setup_cache_entry()
+            await self._container_pool.release(lease)
+            return
+
         if self._temp_dir is not None:
             self._temp_dir.cleanup()
             self._temp_dir = None
@@ -455,32 +724,7 @@ async def stop(self) -> None:
                 self._cancellation_futures.clear()
                 return
 
-            if self._cancellation_futures:
-                if not self._loop or self._loop.is_closed():
-                    logging.warning(
-                        f"Executor loop ({self._loop!r}) is closed or unavailable. Cannot reliably wait for "
-                        f"{len(self._cancellation_futures)} cancellation futures."
-                    )
-                    self._cancellation_futures.clear()
-                else:
-                    # concurrent.futures.Future -> asyncio.Future
-                    asyncio_futures = [asyncio.wrap_future(f, loop=self._loop) for f in self._cancellation_futures]
-
-                    if asyncio_futures:
-                        logging.debug(
-                            f"Waiting for {len(asyncio_futures)} cancellation futures to complete on loop {self._loop!r}..."
-                        )
-                        results = await asyncio.gather(*asyncio_futures, return_exceptions=True)
-                        for i, result in enumerate(results):
-                            original_future = self._cancellation_futures[i]
-                            if isinstance(result, Exception):
-                                logging.warning(f"Cancellation future {original_future!r} failed: {result}")
-                            else:
-                                logging.debug(f"Cancellation future {original_future!r} completed successfully.")
-                    else:
-                        logging.debug("No valid cancellation futures to await.")
-
-                    self._cancellation_futures.clear()
+            await self._wait_for_cancellation_futures()
 
             logging.debug(f"Stopping container {self.container_name}...")
             await asyncio.to_thread(container.stop)
@@ -493,14 +737,20 @@ async def stop(self) -> None:
         finally:
             self._running = False
             self._cancellation_futures.clear()
+            self._release_setup_cache_entry()
 
     async def start(self) -> None:
         """(Experimental) Start the code executor.
 
         This method sets the working environment variables, connects to Docker and starts the code executor.
         If no working directory was provided to the code executor, it creates a temporary directory and sets it as the code executor working directory.
+        With a container pool, it leases a container from the pool instead.
         """
 
+        if self._container_pool is not None:
+            await self._start_from_pool(self._container_pool)
+            return
+
         if self._work_dir is None and self._temp_dir is None:
             self._temp_dir = tempfile.TemporaryDirectory()
             self._temp_dir_path = Path(self._temp_dir.name)
@@ -529,6 +779,11 @@ async def start(self) -> None:
         shell_command = "/bin/sh"
         command = ["-c", f"{(self._init_command)};exec {shell_command}"] if self._init_command else None
 
+        setup_cache_volume: Dict[str, Dict[str, str]] = {}
+        if self._setup_cache is not None and self._functions:
+            self._setup_cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            setup_cache_volume[str(self._setup_cache.cache_dir.resolve())] = {"bind": _SETUP_CACHE_MOUNT, "mode": "rw"}
+
         # Check if a container with the same name already exists and remove it
         try:
             existing_container = await asyncio.to_thread(client.containers.get, self.container_name)
@@ -545,7 +800,11 @@ async def start(self) -> None:
             tty=True,
             detach=True,
             auto_remove=self._auto_remove,
-            volumes={str(self.bind_dir.resolve()): {"bind": "/workspace", "mode": "rw"}, **self._extra_volumes},
+            volumes={
+                str(self.bind_dir.resolve()): {"bind": "/workspace", "mode": "rw"},
+                **self._extra_volumes,
+                **setup_cache_volume,
+            },
             working_dir="/workspace",
             extra_hosts=self._extra_hosts,
             device_requests=self._device_requests,
@@ -572,10 +831,29 @@ async def cleanup() -> None:
 
         self._running = True
 
+    def _release_setup_cache_entry(self) -> None:
+        if self._setup_cache_entry is not None:
+            # The cached packages may be evicted once released, so the functions are set up again on next use.
+            self._setup_cache_entry.release()
+            self._setup_cache_entry = None
+            self._packages_dir = None
+            self._setup_functions_complete = False
+
+    async def _start_from_pool(self, container_pool: DockerContainerPool) -> None:
+        self._lease = await container_pool.lease()
+        self._container = self._lease.container
+        self._loop = asyncio.get_running_loop()
+        self._cancellation_futures = []
+        self._running = True
+
     def _to_config(self) -> DockerCommandLineCodeExecutorConfig:
         """(Experimental) Convert the component to a config object."""
         if self._functions:
             logging.info("Functions will not be included in serialized configuration")
+        if self._container_pool is not None:
+            logging.info("The container pool will not be included in serialized configuration")
+        if self._setup_cache is not None:
+            logging.info("Setup cache will not be included in serialized configuration")
 
         return DockerCommandLineCodeExecutorConfig(
             image=self._image,
@@ -590,6 +868,8 @@ def _to_config(self) -> DockerCommandLineCodeExecutorConfig:
             extra_hosts=self._extra_hosts,
             init_command=self._init_command,
             delete_tmp_files=self._delete_tmp_files,
+            max_output_bytes=self._max_output_bytes,
+            kill_on_output_overflow=self._kill_on_output_overflow,
         )
 
     @classmethod
@@ -610,4 +890,6 @@ def _from_config(cls, config: DockerCommandLineCodeExecutorConfig) -> Self:
             extra_hosts=config.extra_hosts,
             init_command=config.init_command,
             delete_tmp_files=config.delete_tmp_files,
+            max_output_bytes=config.max_output_bytes,
+            kill_on_output_overflow=config.kill_on_output_overflow,
         )
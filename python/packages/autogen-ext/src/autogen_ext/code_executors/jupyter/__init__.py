@@ -1,6 +1,12 @@
+from ._artifacts import JupyterArtifact
 from ._jupyter_code_executor import JupyterCodeExecutor, JupyterCodeResult
+from ._kernel_pool import JupyterKernelLease, JupyterKernelPool, JupyterKernelPoolStats
 
 __all__ = [
+    "JupyterArtifact",
     "JupyterCodeExecutor",
     "JupyterCodeResult",
+    "JupyterKernelLease",
+    "JupyterKernelPool",
+    "JupyterKernelPoolStats",
 ]
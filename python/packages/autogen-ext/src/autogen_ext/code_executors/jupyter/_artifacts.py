@@ -0,0 +1,66 @@
+import asyncio
+import base64
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass(frozen=True)
+class JupyterArtifact:
+    """A rich output of a code block, such as an image, stored in a file instead of inline in the result.
+
+    Artifacts are named by the hash of their content, so identical outputs share a file. The
+    content is only read when requested.
+    """
+
+    path: Path
+    """The file holding the content."""
+    mime_type: str
+    """The MIME type of the output, for example ``image/png``."""
+    sha256: str
+    """The SHA-256 hash of the content."""
+    size: int
+    """The size of the content in bytes."""
+
+    def read_bytes(self) -> bytes:
+        """Read the content."""
+        return self.path.read_bytes()
+
+    async def aread_bytes(self) -> bytes:
+        """Read the content without blocking the event loop."""
+        return await asyncio.to_thread(self.path.read_bytes)
+
+
+_SUFFIXES = {
+    "image/png": ".png",
+    "image/jpeg": ".jpeg",
+    "image/svg+xml": ".svg",
+    "text/html": ".html",
+}
+
+
+def write_artifact(output_dir: Path, mime_type: str, content: Union[str, bytes]) -> JupyterArtifact:
+    """Decode a notebook output and store it in ``output_dir``, unless a file with the same content exists.
+
+    Binary MIME types are base64 encoded in notebook outputs. This function blocks, so run it in a thread.
+    """
+    if isinstance(content, str):
+        data = base64.b64decode(content) if mime_type in ("image/png", "image/jpeg") else content.encode()
+    else:
+        data = content
+    digest = hashlib.sha256(data).hexdigest()
+    path = output_dir / f"{digest}{_SUFFIXES.get(mime_type, '.json' if mime_type.endswith('json') else '.txt')}"
+    if not path.exists():
+        # Write to a temporary file and rename it, so a concurrent reader never sees a partial file.
+        fd, temp_path = tempfile.mkstemp(dir=output_dir, prefix=".artifact-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    return JupyterArtifact(path=path.absolute(), mime_type=mime_type, sha256=digest, size=len(data))
@@ -1,12 +1,11 @@
 import asyncio
-import base64
 import json
+import logging
 import re
 import sys
 import tempfile
-import uuid
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from autogen_core import Component
@@ -28,6 +27,8 @@
 from typing_extensions import Self
 
 from .._common import silence_pip
+from ._artifacts import JupyterArtifact, write_artifact
+from ._kernel_pool import JupyterKernelLease, JupyterKernelPool
 
 
 @dataclass
@@ -35,6 +36,8 @@ class JupyterCodeResult(CodeResult):
     """A code result class for Jupyter code executor."""
 
     output_files: list[Path]
+    artifacts: list[JupyterArtifact] = field(default_factory=list, compare=False)
+    """The rich outputs written to `output_files`, whose content is read on demand."""
 
 
 class JupyterCodeExecutorConfig(BaseModel):
@@ -43,6 +46,7 @@ class JupyterCodeExecutorConfig(BaseModel):
     kernel_name: str = "python3"
     timeout: int = 60
     output_dir: Optional[str] = None
+    max_inline_output_bytes: Optional[int] = None
 
 
 class JupyterCodeExecutor(CodeExecutor, Component[JupyterCodeExecutorConfig]):
@@ -127,6 +131,16 @@ async def main() -> None:
         kernel_name (str): The kernel name to use. By default, "python3".
         timeout (int): The timeout for code execution, by default 60.
         output_dir (Path): The directory to save output files, by default a temporary directory.
+        kernel_pool (Optional[JupyterKernelPool]): A started pool to lease the kernel from instead of starting one. The
+            kernel is leased by :meth:`start` and returned by :meth:`stop`, and the pool restarts it before leasing it
+            again. The kernel name of the pool is used. By default, None.
+        max_inline_output_bytes (Optional[int]): Outputs of other MIME types than text, images and HTML are included in
+            the output as JSON. Larger outputs are saved to files instead, and the output refers to the file. If None,
+            they are always included. By default, None.
+
+    .. note::
+        Images and HTML are saved to files named by the hash of their content, so identical outputs are stored once.
+        Files are written in a thread, and :attr:`JupyterCodeResult.artifacts` describes them without loading them.
 
 
     .. note::
@@ -141,9 +155,13 @@ def __init__(
         kernel_name: str = "python3",
         timeout: int = 60,
         output_dir: Optional[Union[Path, str]] = None,
+        kernel_pool: Optional[JupyterKernelPool] = None,
+        max_inline_output_bytes: Optional[int] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
+        if max_inline_output_bytes is not None and max_inline_output_bytes < 0:
+            raise ValueError("max_inline_output_bytes must be greater than or equal to 0.")
 
         self._output_dir: Path = Path(tempfile.mkdtemp()) if output_dir is None else Path(output_dir)
         self._output_dir.mkdir(exist_ok=True, parents=True)
@@ -156,6 +174,10 @@ def __init__(
         self._kernel_name = kernel_name
         self._timeout = timeout
 
+        self._max_inline_output_bytes = max_inline_output_bytes
+        self._kernel_pool = kernel_pool
+        self._lease: Optional[JupyterKernelLease] = None
+
         self._client: Optional[NotebookClient] = None
         self.kernel_context: Optional[AbstractAsyncContextManager[None]] = None
 
@@ -172,6 +194,7 @@ async def execute_code_blocks(
         """
         outputs: list[str] = []
         output_files: list[Path] = []
+        artifacts: list[JupyterArtifact] = []
         exit_code = 0
 
         for code_block in code_blocks:
@@ -179,12 +202,15 @@ async def execute_code_blocks(
             exit_code = result.exit_code
             outputs.append(result.output)
             output_files.extend(result.output_files)
+            artifacts.extend(result.artifacts)
 
             # Stop execution if one code block fails
             if exit_code != 0:
                 break
 
-        return JupyterCodeResult(exit_code=exit_code, output="\n".join(outputs), output_files=output_files)
+        return JupyterCodeResult(
+            exit_code=exit_code, output="\n".join(outputs), output_files=output_files, artifacts=artifacts
+        )
 
     async def _execute_code_block(
         self, code_block: CodeBlock, cancellation_token: CancellationToken
@@ -207,7 +233,10 @@ async def _execute_code_block(
         output_cell = await asyncio.wait_for(asyncio.shield(execute_task), timeout=self._timeout)
 
         outputs: list[str] = []
-        output_files: list[Path] = []
+        # Rich outputs to write to files, as MIME type and content.
+        rich_outputs: list[tuple[str, str]] = []
+        # Outputs too large to include inline, as index in outputs and index in rich_outputs.
+        references: list[tuple[int, int]] = []
         exit_code = 0
 
         for output in output_cell.get("outputs", []):
@@ -224,21 +253,42 @@ async def _execute_code_block(
                         match mime:
                             case "text/plain":
                                 outputs.append(content)
-                            case "image/png":
-                                path = self._save_image(content)
-                                output_files.append(path)
+                            case "image/png" | "text/html":
+                                rich_outputs.append((mime, content))
                             case "image/jpeg":
-                                # TODO: Should this also be encoded? Images are encoded as both png and jpg
-                                pass
-                            case "text/html":
-                                path = self._save_html(content)
-                                output_files.append(path)
+                                # Images are often encoded as both PNG and JPEG, so only keep the JPEG without a PNG.
+                                if "image/png" not in data:
+                                    rich_outputs.append((mime, content))
                             case _:
-                                outputs.append(json.dumps(content))
+                                serialized = json.dumps(content)
+                                if (
+                                    self._max_inline_output_bytes is not None
+                                    and len(serialized.encode()) > self._max_inline_output_bytes
+                                ):
+                                    references.append((len(outputs), len(rich_outputs)))
+                                    rich_outputs.append((mime, serialized))
+                                    outputs.append("")
+                                else:
+                                    outputs.append(serialized)
                 case _:
                     pass
 
-        return JupyterCodeResult(exit_code=exit_code, output="\n".join(outputs), output_files=output_files)
+        # Decoding and writing large outputs would block the event loop, so it runs in threads.
+        artifacts = list(
+            await asyncio.gather(
+                *(asyncio.to_thread(write_artifact, self._output_dir, mime, content) for mime, content in rich_outputs)
+            )
+        )
+        for output_index, artifact_index in references:
+            artifact = artifacts[artifact_index]
+            outputs[output_index] = f"[{artifact.mime_type} output of {artifact.size} bytes saved to {artifact.path}]"
+
+        return JupyterCodeResult(
+            exit_code=exit_code,
+            output="\n".join(outputs),
+            output_files=[artifact.path for artifact in artifacts],
+            artifacts=artifacts,
+        )
 
     async def _execute_cell(self, cell: NotebookNode) -> NotebookNode:
         # Temporary push cell to nb as async_execute_cell expects it. But then we want to remove it again as cells can take up significant amount of memory (especially with images)
@@ -252,19 +302,6 @@ async def _execute_cell(self, cell: NotebookNode) -> NotebookNode:
         self._client.nb.cells.pop()
         return output
 
-    def _save_image(self, image_data_base64: str) -> Path:
-        """Save image data to a file."""
-        image_data = base64.b64decode(image_data_base64)
-        path = self._output_dir / f"{uuid.uuid4().hex}.png"
-        path.write_bytes(image_data)
-        return path.absolute()
-
-    def _save_html(self, html_data: str) -> Path:
-        """Save HTML data to a file."""
-        path = self._output_dir / f"{uuid.uuid4().hex}.html"
-        path.write_text(html_data)
-        return path.absolute()
-
     async def restart(self) -> None:
         """Restart the code executor."""
         await self.stop()
@@ -280,6 +317,13 @@ async def start(self) -> None:
         if self._started:
             return
 
+        if self._kernel_pool is not None:
+            self._lease = await self._kernel_pool.lease()
+            self._client = self._lease.client
+            self._client.timeout = self._timeout
+            self._started = True
+            return
+
         notebook: NotebookNode = nbformat.new_notebook()  # type: ignore
 
         self._client = NotebookClient(
@@ -297,10 +341,16 @@ async def start(self) -> None:
     async def stop(self) -> None:
         """(Experimental) Stop the code executor.
 
-        Terminates the Jupyter Notebook execution by exiting the kernel context and cleaning up the associated resources."""
+        Terminates the Jupyter Notebook execution by exiting the kernel context and cleaning up the associated resources.
+        A kernel leased from a pool is returned to the pool instead."""
         if not self._started:
             return
 
+        if self._lease is not None:
+            assert self._kernel_pool is not None
+            lease, self._lease = self._lease, None
+            await self._kernel_pool.release(lease)
+
         if self.kernel_context is not None:
             await self.kernel_context.__aexit__(None, None, None)
             self.kernel_context = None
@@ -310,8 +360,13 @@ async def stop(self) -> None:
 
     def _to_config(self) -> JupyterCodeExecutorConfig:
         """Convert current instance to config object"""
+        if self._kernel_pool is not None:
+            logging.info("The kernel pool will not be included in serialized configuration")
         return JupyterCodeExecutorConfig(
-            kernel_name=self._kernel_name, timeout=self._timeout, output_dir=str(self.output_dir)
+            kernel_name=self._kernel_name,
+            timeout=self._timeout,
+            output_dir=str(self.output_dir),
+            max_inline_output_bytes=self._max_inline_output_bytes,
         )
 
     @property
@@ -332,4 +387,5 @@ def _from_config(cls, config: JupyterCodeExecutorConfig) -> Self:
             kernel_name=config.kernel_name,
             timeout=config.timeout,
             output_dir=Path(config.output_dir) if config.output_dir else None,
+            max_inline_output_bytes=config.max_inline_output_bytes,
         )
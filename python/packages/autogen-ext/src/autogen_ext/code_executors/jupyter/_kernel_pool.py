@@ -0,0 +1,303 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Deque, List, Optional, Set, Type
+
+from jupyter_core.utils import ensure_async
+from nbclient import NotebookClient
+from nbformat import NotebookNode
+from nbformat import v4 as nbformat
+from typing_extensions import Self
+
+
+@dataclass
+class JupyterKernelLease:
+    """A kernel leased from a :class:`JupyterKernelPool`.
+
+    The lease is exclusive until it is returned with :meth:`JupyterKernelPool.release`.
+    """
+
+    client: NotebookClient
+    """The notebook client connected to the kernel."""
+    kernel_context: AbstractAsyncContextManager[None]
+    """The context that owns the kernel, exited to shut it down."""
+
+
+@dataclass
+class JupyterKernelPoolStats:
+    """Counters of a :class:`JupyterKernelPool`."""
+
+    size: int
+    """Kernels currently owned by the pool, idle, leased or restarting."""
+    idle: int
+    """Kernels ready to be leased."""
+    leased: int
+    """Kernels currently leased."""
+    created: int
+    """Kernels started since the pool started."""
+    restarted: int
+    """Kernels restarted after being returned."""
+    replaced: int
+    """Kernels shut down because they failed to restart."""
+
+
+class JupyterKernelPool:
+    """A shared pool of pre-started Jupyter kernels for :class:`JupyterCodeExecutor`.
+
+    Starting a kernel takes about a second, so instead of every executor starting its own,
+    executors created with ``kernel_pool=pool`` lease a running kernel when they start and
+    return it when they stop. The pool starts ``min_size`` kernels up front and grows on
+    demand up to ``max_size``; when every kernel is leased, :meth:`lease` waits for one to be
+    returned.
+
+    A returned kernel is restarted in the background before it can be leased again, so each
+    session starts with a fresh interpreter state. Kernels that fail to restart are shut down
+    and replaced.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core import CancellationToken
+            from autogen_core.code_executor import CodeBlock
+            from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterKernelPool
+
+
+            async def main() -> None:
+                async with JupyterKernelPool(min_size=2, max_size=4) as pool:
+                    async with JupyterCodeExecutor(kernel_pool=pool) as executor:
+                        result = await executor.execute_code_blocks(
+                            [CodeBlock(code="print('hello world!')", language="python")], CancellationToken()
+                        )
+                        print(result)
+
+
+            asyncio.run(main())
+
+    Args:
+        kernel_name (str): The kernel name to use. By default, "python3".
+        min_size (int): Kernels started by :meth:`start` and kept available. By default, 1.
+        max_size (int): The maximum number of kernels. By default, 4.
+        startup_timeout (int): The timeout for starting or restarting a kernel, by default 60.
+    """
+
+    def __init__(
+        self,
+        kernel_name: str = "python3",
+        *,
+        min_size: int = 1,
+        max_size: int = 4,
+        startup_timeout: int = 60,
+    ) -> None:
+        if min_size < 0:
+            raise ValueError("min_size must be greater than or equal to 0.")
+        if max_size < 1 or max_size < min_size:
+            raise ValueError("max_size must be at least 1 and at least min_size.")
+        if startup_timeout < 1:
+            raise ValueError("startup_timeout must be greater than or equal to 1.")
+
+        self._kernel_name = kernel_name
+        self._min_size = min_size
+        self._max_size = max_size
+        self._startup_timeout = startup_timeout
+
+        self._idle: Deque[JupyterKernelLease] = deque()
+        self._leased: List[JupyterKernelLease] = []
+        # Kernels being started or restarted count towards max_size so concurrent leases do not overshoot it.
+        self._pending = 0
+        self._condition = asyncio.Condition()
+        self._background_tasks: Set[asyncio.Task[None]] = set()
+        self._running = False
+        self._created = 0
+        self._restarted = 0
+        self._replaced = 0
+
+    @property
+    def kernel_name(self) -> str:
+        """(Experimental) The kernel name of the kernels."""
+        return self._kernel_name
+
+    @property
+    def running(self) -> bool:
+        """(Experimental) Whether the pool is started."""
+        return self._running
+
+    @property
+    def stats(self) -> JupyterKernelPoolStats:
+        """(Experimental) The current counters of the pool."""
+        return JupyterKernelPoolStats(
+            size=self._size(),
+            idle=len(self._idle),
+            leased=len(self._leased),
+            created=self._created,
+            restarted=self._restarted,
+            replaced=self._replaced,
+        )
+
+    async def start(self) -> None:
+        """(Experimental) Start ``min_size`` kernels."""
+        if self._running:
+            return
+        self._running = True
+        self._pending += self._min_size
+        results = await asyncio.gather(*(self._create() for _ in range(self._min_size)), return_exceptions=True)
+        async with self._condition:
+            self._idle.extend(result for result in results if isinstance(result, JupyterKernelLease))
+            self._condition.notify_all()
+        for result in results:
+            if isinstance(result, BaseException):
+                await self.stop()
+                raise result
+
+    async def stop(self) -> None:
+        """(Experimental) Shut down every kernel of the pool, including the leased ones."""
+        if not self._running:
+            return
+        self._running = False
+        # Kernels being restarted or replaced shut themselves down once ready, since the pool is no longer running.
+        # Cancelling them instead could interrupt the kernel manager and leave the kernel behind.
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+        async with self._condition:
+            leases = [*self._idle, *self._leased]
+            self._idle.clear()
+            self._leased.clear()
+            # Wake up waiting leases so they fail instead of waiting forever.
+            self._condition.notify_all()
+        await asyncio.gather(*(self._shutdown(lease) for lease in leases))
+
+    async def lease(self) -> JupyterKernelLease:
+        """(Experimental) Lease a running kernel, waiting for one if the pool is at ``max_size``.
+
+        Raises:
+            ValueError: If the pool is not running.
+        """
+        async with self._condition:
+            while True:
+                if not self._running:
+                    raise ValueError(
+                        "Kernel pool is not running. Must first be started with either start or a context manager."
+                    )
+                if self._idle:
+                    lease = self._idle.popleft()
+                    self._leased.append(lease)
+                    return lease
+                if self._size() < self._max_size:
+                    self._pending += 1
+                    break
+                await self._condition.wait()
+        lease = await self._create()
+        async with self._condition:
+            if self._running:
+                self._leased.append(lease)
+                return lease
+        # The pool was stopped while the kernel was starting, so it no longer owns it.
+        await self._shutdown(lease)
+        raise ValueError("Kernel pool was stopped while leasing a kernel.")
+
+    async def release(self, lease: JupyterKernelLease) -> None:
+        """(Experimental) Return a leased kernel to the pool.
+
+        The kernel is restarted in the background and becomes available once it is ready.
+        """
+        async with self._condition:
+            if lease not in self._leased:
+                return
+            self._leased.remove(lease)
+            running = self._running
+            if running:
+                self._pending += 1
+        if not running:
+            await self._shutdown(lease)
+            return
+        task = asyncio.create_task(self._restart(lease))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> Optional[bool]:
+        await self.stop()
+        return None
+
+    def _size(self) -> int:
+        return len(self._idle) + len(self._leased) + self._pending
+
+    async def _create(self) -> JupyterKernelLease:
+        """Start a kernel. The caller must have counted it in ``_pending``."""
+        try:
+            notebook: NotebookNode = nbformat.new_notebook()  # type: ignore
+            client = NotebookClient(
+                nb=notebook,
+                kernel_name=self._kernel_name,
+                startup_timeout=self._startup_timeout,
+                allow_errors=True,
+            )
+            kernel_context = client.async_setup_kernel()
+            await kernel_context.__aenter__()
+            self._created += 1
+            return JupyterKernelLease(client=client, kernel_context=kernel_context)
+        finally:
+            async with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+
+    async def _restart(self, lease: JupyterKernelLease) -> None:
+        """Restart a returned kernel. The caller must have counted it in ``_pending``."""
+        restarted = False
+        try:
+            assert lease.client.km is not None and lease.client.kc is not None
+            await ensure_async(lease.client.km.restart_kernel(now=True))
+            await ensure_async(lease.client.kc.wait_for_ready(timeout=self._startup_timeout))  # type: ignore[attr-defined]
+            lease.client.nb.cells.clear()
+            restarted = True
+            self._restarted += 1
+        except Exception as e:
+            logging.error(f"Failed to restart kernel, replacing it: {e}")
+        finally:
+            async with self._condition:
+                self._pending -= 1
+                keep = restarted and self._running
+                if keep:
+                    self._idle.append(lease)
+                self._condition.notify_all()
+            if not keep:
+                await self._shutdown(lease)
+        if not restarted and self._running:
+            self._replaced += 1
+            await self._replenish()
+
+    async def _replenish(self) -> None:
+        async with self._condition:
+            if not self._running or self._size() >= self._min_size:
+                return
+            self._pending += 1
+        try:
+            lease = await self._create()
+        except Exception as e:
+            logging.error(f"Failed to start a replacement kernel: {e}")
+            return
+        async with self._condition:
+            if self._running:
+                self._idle.append(lease)
+                self._condition.notify()
+                return
+        await self._shutdown(lease)
+
+    async def _shutdown(self, lease: JupyterKernelLease) -> None:
+        try:
+            await lease.kernel_context.__aexit__(None, None, None)
+        except Exception as e:
+            logging.error(f"Error while shutting down kernel: {e}")
@@ -11,24 +11,35 @@
 from pathlib import Path
 from string import Template
 from types import SimpleNamespace
-from typing import Any, Callable, ClassVar, List, Optional, Sequence, Union
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional, Sequence, Union
 
 from autogen_core import CancellationToken, Component
-from autogen_core.code_executor import CodeBlock, CodeExecutor, FunctionWithRequirements, FunctionWithRequirementsStr
+from autogen_core.code_executor import (
+    CodeBlock,
+    CodeExecutor,
+    CodeOutputChunk,
+    FunctionWithRequirements,
+    FunctionWithRequirementsStr,
+)
 from pydantic import BaseModel
 from typing_extensions import ParamSpec, Self
 
 from .._common import (
     PYTHON_VARIANTS,
     CommandLineCodeResult,
+    OutputBuffer,
+    ProcessOutput,
     build_python_functions_file,
     get_file_name_from_content,
     lang_to_cmd,
     silence_pip,
+    stream_process_output,
     to_stub,
 )
+from .._setup_cache import FunctionSetupCache, FunctionSetupCacheEntry
+from ._forkserver import ForkServerProcess, PythonForkServer
 
-__all__ = ("LocalCommandLineCodeExecutor",)
+__all__ = ("LocalCommandLineCodeExecutor", "FunctionSetupCache")
 
 A = ParamSpec("A")
 
@@ -40,6 +51,10 @@ class LocalCommandLineCodeExecutorConfig(BaseModel):
     work_dir: Optional[str] = None
     functions_module: str = "functions"
     cleanup_temp_files: bool = True
+    use_forkserver: bool = False
+    preload_modules: List[str] = []
+    max_output_bytes: Optional[int] = None
+    kill_on_output_overflow: bool = False
 
 
 class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeExecutorConfig]):
@@ -81,10 +96,34 @@ class LocalCommandLineCodeExecutor(CodeExecutor, Component[LocalCommandLineCodeE
         functions_module (str, optional): The name of the module that will be created to store the functions. Defaults to "functions".
         cleanup_temp_files (bool, optional): Whether to automatically clean up temporary files after execution. Defaults to True.
         virtual_env_context (Optional[SimpleNamespace], optional): The virtual environment context. Defaults to None.
+        use_forkserver (bool, optional): Whether to run Python code blocks in children forked from a warm interpreter
+            instead of starting a new interpreter for every block. Not supported on Windows. Defaults to False.
+        preload_modules (Sequence[str], optional): The modules the warm interpreter imports before forking, for example
+            ``["numpy", "pandas"]``. The functions module is always preloaded. Only used with `use_forkserver`. Defaults to [].
+        max_output_bytes (Optional[int], optional): The maximum number of bytes of stdout and of stderr kept for each code
+            block. Longer output keeps its beginning and end and drops the middle. If None, all output is kept. Defaults to None.
+        kill_on_output_overflow (bool, optional): Whether to terminate a code block as soon as its output exceeds
+            `max_output_bytes`. The result then has exit code 1. Defaults to False.
+        setup_cache (Optional[FunctionSetupCache], optional): A cache of the packages required by the functions. With a
+            cache, the packages are installed once per combination of requirements, function sources and interpreter into
+            a cached directory added to ``PYTHONPATH``, instead of into the interpreter by every executor. Defaults to None.
 
     .. note::
         Using the current directory (".") as working directory is deprecated. Using it will raise a deprecation warning.
 
+    .. note::
+        With `use_forkserver`, a server interpreter is started on the first Python code block, after the functions
+        are set up. It imports `preload_modules` and the functions module once and forks a fresh child for every
+        block, so interpreter start up and imports are not paid again. Each child runs in the working directory with
+        its own process state, and the timeout and cancellation terminate the child as before. Shell code blocks are
+        not affected. The server keeps the environment variables it was started with; call :meth:`stop` to pick up
+        changes to the environment or to modules installed after the server started.
+
+    .. note::
+        Use :meth:`execute_code_blocks_stream` to receive the output of the code blocks while they run. Output is read
+        incrementally in both methods, so with `max_output_bytes` set, memory use stays bounded even when the code
+        prints without end.
+
 
     Example:
 
@@ -158,6 +197,11 @@ def __init__(
         functions_module: str = "functions",
         cleanup_temp_files: bool = True,
         virtual_env_context: Optional[SimpleNamespace] = None,
+        use_forkserver: bool = False,
+        preload_modules: Sequence[str] = (),
+        max_output_bytes: Optional[int] = None,
+        kill_on_output_overflow: bool = False,
+        setup_cache: Optional[FunctionSetupCache] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
@@ -192,6 +236,25 @@ def __init__(
         self._cleanup_temp_files = cleanup_temp_files
         self._virtual_env_context: Optional[SimpleNamespace] = virtual_env_context
 
+        if use_forkserver and sys.platform == "win32":
+            raise ValueError("use_forkserver is not supported on Windows.")
+        for module in preload_modules:
+            if not all(part.isidentifier() for part in module.split(".")):
+                raise ValueError(f"Preload module name must be a valid Python module name: {module}")
+        self._use_forkserver = use_forkserver
+        self._preload_modules = list(preload_modules)
+        self._forkserver: Optional[PythonForkServer] = None
+
+        # Validates the limit.
+        OutputBuffer(max_output_bytes)
+        self._max_output_bytes = max_output_bytes
+        self._kill_on_output_overflow = kill_on_output_overflow
+
+        self._setup_cache = setup_cache
+        self._setup_cache_entry: Optional[FunctionSetupCacheEntry] = None
+        # The directory of cached packages added to PYTHONPATH.
+        self._packages_dir: Optional[Path] = None
+
         self._temp_dir: Optional[tempfile.TemporaryDirectory[str]] = None
         self._started = False
 
@@ -247,6 +310,26 @@ def work_dir(self) -> Path:
                 self._started = True
             return Path(self._temp_dir.name)
 
+    @property
+    def use_forkserver(self) -> bool:
+        """(Experimental) Whether Python code blocks are run in children forked from a warm interpreter."""
+        return self._use_forkserver
+
+    @property
+    def preload_modules(self) -> List[str]:
+        """(Experimental) The modules imported by the warm interpreter before forking."""
+        return self._preload_modules
+
+    @property
+    def max_output_bytes(self) -> Optional[int]:
+        """(Experimental) The maximum number of bytes of stdout and of stderr kept for each code block."""
+        return self._max_output_bytes
+
+    @property
+    def setup_cache(self) -> Optional[FunctionSetupCache]:
+        """(Experimental) The cache of the packages required by the functions."""
+        return self._setup_cache
+
     @property
     def functions(self) -> List[str]:
         raise NotImplementedError
@@ -270,38 +353,81 @@ async def _setup_functions(self, cancellation_token: CancellationToken) -> None:
         lists_of_packages = [x.python_packages for x in self._functions if isinstance(x, FunctionWithRequirements)]
         flattened_packages = [item for sublist in lists_of_packages for item in sublist]
         required_packages = list(set(flattened_packages))
+
+        if self._setup_cache is not None:
+            await self._setup_functions_from_cache(
+                self._setup_cache, func_file_content, required_packages, cancellation_token
+            )
+            self._setup_functions_complete = True
+            return
+
         if len(required_packages) > 0:
-            logging.info("Ensuring packages are installed in executor.")
+            await self._install_packages(required_packages, cancellation_token)
+        await self._check_functions_load(func_file_content, cancellation_token)
 
-            cmd_args = ["-m", "pip", "install"]
-            cmd_args.extend(required_packages)
+        self._setup_functions_complete = True
 
-            if self._virtual_env_context:
-                py_executable = self._virtual_env_context.env_exe
-            else:
-                py_executable = sys.executable
-
-            task = asyncio.create_task(
-                asyncio.create_subprocess_exec(
-                    py_executable,
-                    *cmd_args,
-                    cwd=self.work_dir,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
+    async def _setup_functions_from_cache(
+        self,
+        setup_cache: FunctionSetupCache,
+        func_file_content: str,
+        required_packages: List[str],
+        cancellation_token: CancellationToken,
+    ) -> None:
+        key = setup_cache.key(func_file_content, required_packages, os.path.realpath(self._python_executable()))
+
+        async def build(path: Path) -> None:
+            packages_dir = path / "site-packages"
+            packages_dir.mkdir()
+            if len(required_packages) > 0:
+                await self._install_packages(required_packages, cancellation_token, target=packages_dir)
+            self._packages_dir = packages_dir
+            await self._check_functions_load(func_file_content, cancellation_token)
+
+        if self._setup_cache_entry is not None:
+            self._setup_cache_entry.release()
+            self._setup_cache_entry = None
+        try:
+            entry = await setup_cache.acquire(key, build)
+        except BaseException:
+            self._packages_dir = None
+            raise
+        # A hit was checked to load when it was built, so neither pip nor the check runs again.
+        self._setup_cache_entry = entry
+        self._packages_dir = entry.packages_dir
+
+    async def _install_packages(
+        self, packages: List[str], cancellation_token: CancellationToken, target: Optional[Path] = None
+    ) -> None:
+        logging.info("Ensuring packages are installed in executor.")
+
+        cmd_args = ["-m", "pip", "install"]
+        if target is not None:
+            cmd_args.extend(["--target", str(target)])
+        cmd_args.extend(packages)
+
+        task = asyncio.create_task(
+            asyncio.create_subprocess_exec(
+                self._python_executable(),
+                *cmd_args,
+                cwd=self.work_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            cancellation_token.link_future(task)
-            try:
-                proc = await task
-                stdout, stderr = await asyncio.wait_for(proc.communicate(), self._timeout)
-            except asyncio.TimeoutError as e:
-                raise ValueError("Pip install timed out") from e
-            except asyncio.CancelledError as e:
-                raise ValueError("Pip install was cancelled") from e
-
-            if proc.returncode is not None and proc.returncode != 0:
-                raise ValueError(f"Pip install failed. {stdout.decode()}, {stderr.decode()}")
-
+        )
+        cancellation_token.link_future(task)
+        try:
+            proc = await task
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), self._timeout)
+        except asyncio.TimeoutError as e:
+            raise ValueError("Pip install timed out") from e
+        except asyncio.CancelledError as e:
+            raise ValueError("Pip install was cancelled") from e
+
+        if proc.returncode is not None and proc.returncode != 0:
+            raise ValueError(f"Pip install failed. {stdout.decode()}, {stderr.decode()}")
+
+    async def _check_functions_load(self, func_file_content: str, cancellation_token: CancellationToken) -> None:
         # Attempt to load the function file to check for syntax errors, imports etc.
         exec_result = await self._execute_code_dont_check_setup(
             [CodeBlock(code=func_file_content, language="python")], cancellation_token
@@ -310,7 +436,41 @@ async def _setup_functions(self, cancellation_token: CancellationToken) -> None:
         if exec_result.exit_code != 0:
             raise ValueError(f"Functions failed to load: {exec_result.output}")
 
-        self._setup_functions_complete = True
+    def _python_executable(self) -> str:
+        if self._virtual_env_context:
+            return str(self._virtual_env_context.env_exe)
+        return sys.executable
+
+    def _subprocess_env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        if self._virtual_env_context:
+            virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
+            env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
+        if self._packages_dir is not None:
+            python_path = env.get("PYTHONPATH")
+            env["PYTHONPATH"] = (
+                f"{self._packages_dir}{os.pathsep}{python_path}" if python_path else str(self._packages_dir)
+            )
+        return env
+
+    async def _get_forkserver(self) -> PythonForkServer:
+        if self._forkserver is not None and self._forkserver.running:
+            return self._forkserver
+        if self._forkserver is not None:
+            logging.warning("Fork server is no longer running. Starting a new one.")
+            await self._forkserver.stop()
+        preload_modules = list(self._preload_modules)
+        if self._functions:
+            preload_modules.append(self._functions_module)
+        forkserver = PythonForkServer(
+            os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable,
+            self.work_dir,
+            preload_modules,
+            self._subprocess_env(),
+        )
+        await forkserver.start(self._timeout)
+        self._forkserver = forkserver
+        return forkserver
 
     async def execute_code_blocks(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
@@ -329,6 +489,25 @@ async def execute_code_blocks(
 
         return await self._execute_code_dont_check_setup(code_blocks, cancellation_token)
 
+    async def execute_code_blocks_stream(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[CodeOutputChunk, CommandLineCodeResult], None]:
+        """(Experimental) Execute the code blocks and yield their output as it is produced.
+
+        Args:
+            code_blocks (List[CodeBlock]): The code blocks to execute.
+            cancellation_token (CancellationToken): a token to cancel the operation
+
+        Yields:
+            :class:`~autogen_core.code_executor.CodeOutputChunk` for the output of the code blocks
+            while they run, then the :class:`CommandLineCodeResult` of the execution."""
+
+        if not self._setup_functions_complete:
+            await self._setup_functions(cancellation_token)
+
+        async for item in self._execute_code_stream_dont_check_setup(code_blocks, cancellation_token):
+            yield item
+
     async def _execute_code_dont_check_setup(
         self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
     ) -> CommandLineCodeResult:
@@ -336,133 +515,167 @@ async def _execute_code_dont_check_setup(
         Execute the provided code blocks in the local command line without re-checking setup.
         Returns a CommandLineCodeResult indicating success or failure.
         """
+        result: Optional[CommandLineCodeResult] = None
+        async for item in self._execute_code_stream_dont_check_setup(code_blocks, cancellation_token):
+            if isinstance(item, CommandLineCodeResult):
+                result = item
+        assert result is not None
+        return result
+
+    async def _start_process(
+        self, lang: str, written_file: Path
+    ) -> Union[asyncio.subprocess.Process, ForkServerProcess]:
+        # The functions module is only preloaded once setup has loaded it successfully.
+        if lang == "python" and self._use_forkserver and self._setup_functions_complete:
+            forkserver = await self._get_forkserver()
+            return await forkserver.spawn(written_file)
+
+        # Decide how to invoke the script
+        if lang == "python":
+            program = (
+                os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
+            )
+            extra_args = [str(written_file.absolute())]
+        else:
+            # Get the appropriate command for the language
+            program = lang_to_cmd(lang)
+
+            # Special handling for PowerShell
+            if program == "pwsh":
+                extra_args = [
+                    "-NoProfile",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-File",
+                    str(written_file.absolute()),
+                ]
+            else:
+                # Shell commands (bash, sh, etc.)
+                extra_args = [str(written_file.absolute())]
+
+        return await asyncio.create_subprocess_exec(
+            program,
+            *extra_args,
+            cwd=self.work_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._subprocess_env(),
+        )
+
+    async def _execute_code_stream_dont_check_setup(
+        self, code_blocks: List[CodeBlock], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[Union[CodeOutputChunk, CommandLineCodeResult], None]:
+        """
+        Execute the provided code blocks in the local command line without re-checking setup.
+        Yields the output chunks as they are produced, then a CommandLineCodeResult indicating success or failure.
+        """
         logs_all: str = ""
         file_names: List[Path] = []
         exitcode = 0
 
-        for code_block in code_blocks:
-            lang, code = code_block.language, code_block.code
-            lang = lang.lower()
-
-            # Remove pip output where possible
-            code = silence_pip(code, lang)
-
-            # Normalize python variants to "python"
-            if lang in PYTHON_VARIANTS:
-                lang = "python"
-
-            # Abort if not supported
-            if lang not in self.SUPPORTED_LANGUAGES:
-                exitcode = 1
-                logs_all += "\n" + f"unknown language {lang}"
-                break
-
-            # Try extracting a filename (if present)
-            try:
-                filename = get_file_name_from_content(code, self.work_dir)
-            except ValueError:
-                return CommandLineCodeResult(
-                    exit_code=1,
-                    output="Filename is not in the workspace",
-                    code_file=None,
-                )
+        try:
+            for code_block in code_blocks:
+                lang, code = code_block.language, code_block.code
+                lang = lang.lower()
 
-            # If no filename is found, create one
-            if filename is None:
-                code_hash = sha256(code.encode()).hexdigest()
-                if lang.startswith("python"):
-                    ext = "py"
-                elif lang in ["pwsh", "powershell", "ps1"]:
-                    ext = "ps1"
-                else:
-                    ext = lang
-
-                filename = f"tmp_code_{code_hash}.{ext}"
-
-            written_file = (self.work_dir / filename).resolve()
-            with written_file.open("w", encoding="utf-8") as f:
-                f.write(code)
-            file_names.append(written_file)
-
-            # Build environment
-            env = os.environ.copy()
-            if self._virtual_env_context:
-                virtual_env_bin_abs_path = os.path.abspath(self._virtual_env_context.bin_path)
-                env["PATH"] = f"{virtual_env_bin_abs_path}{os.pathsep}{env['PATH']}"
-
-            # Decide how to invoke the script
-            if lang == "python":
-                program = (
-                    os.path.abspath(self._virtual_env_context.env_exe) if self._virtual_env_context else sys.executable
-                )
-                extra_args = [str(written_file.absolute())]
-            else:
-                # Get the appropriate command for the language
-                program = lang_to_cmd(lang)
-
-                # Special handling for PowerShell
-                if program == "pwsh":
-                    extra_args = [
-                        "-NoProfile",
-                        "-ExecutionPolicy",
-                        "Bypass",
-                        "-File",
-                        str(written_file.absolute()),
-                    ]
-                else:
-                    # Shell commands (bash, sh, etc.)
-                    extra_args = [str(written_file.absolute())]
-
-            # Create a subprocess and run
-            task = asyncio.create_task(
-                asyncio.create_subprocess_exec(
-                    program,
-                    *extra_args,
-                    cwd=self.work_dir,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=env,
-                )
-            )
-            cancellation_token.link_future(task)
-
-            proc = None  # Track the process
-            try:
-                proc = await task
-                stdout, stderr = await asyncio.wait_for(proc.communicate(), self._timeout)
-                exitcode = proc.returncode or 0
-            except asyncio.TimeoutError:
-                logs_all += "\nTimeout"
-                exitcode = 124
-                if proc:
-                    proc.terminate()
-                    await proc.wait()  # Ensure process is fully dead
-                break
-            except asyncio.CancelledError:
-                logs_all += "\nCancelled"
-                exitcode = 125
-                if proc:
-                    proc.terminate()
-                    await proc.wait()
-                break
-
-            logs_all += stderr.decode()
-            logs_all += stdout.decode()
-
-            if exitcode != 0:
-                break
-
-        code_file = str(file_names[0]) if file_names else None
-        code_result = CommandLineCodeResult(exit_code=exitcode, output=logs_all, code_file=code_file)
-
-        if self._cleanup_temp_files:
-            for file in file_names:
-                try:
-                    file.unlink(missing_ok=True)
-                except OSError as error:
-                    logging.error(f"Failed to delete temporary file {file}: {error}")
+                # Remove pip output where possible
+                code = silence_pip(code, lang)
+
+                # Normalize python variants to "python"
+                if lang in PYTHON_VARIANTS:
+                    lang = "python"
+
+                # Abort if not supported
+                if lang not in self.SUPPORTED_LANGUAGES:
+                    exitcode = 1
+                    logs_all += "\n" + f"unknown language {lang}"
+                    break
 
-        return code_result
+                # Try extracting a filename (if present)
+                try:
+                    filename = get_file_name_from_content(code, self.work_dir)
+                except ValueError:
+                    yield CommandLineCodeResult(
+                        exit_code=1,
+                        output="Filename is not in the workspace",
+                        code_file=None,
+                    )
+                    return
+
+                # If no filename is found, create one
+                if filename is None:
+                    code_hash = sha256(code.encode()).hexdigest()
+                    if lang.startswith("python"):
+                        ext = "py"
+                    elif lang in ["pwsh", "powershell", "ps1"]:
+                        ext = "ps1"
+                    else:
+                        ext = lang
+
+                    filename = f"tmp_code_{code_hash}.{ext}"
+
+                written_file = (self.work_dir / filename).resolve()
+                with written_file.open("w", encoding="utf-8") as f:
+                    f.write(code)
+                file_names.append(written_file)
+
+                # Start the process
+                task = asyncio.create_task(self._start_process(lang, written_file))
+                cancellation_token.link_future(task)
+                try:
+                    proc = await task
+                except asyncio.CancelledError:
+                    logs_all += "\nCancelled"
+                    exitcode = 125
+                    break
+
+                # Read the output as it is produced
+                output: Optional[ProcessOutput] = None
+                try:
+                    async for item in stream_process_output(
+                        proc,
+                        cancellation_token=cancellation_token,
+                        timeout=self._timeout,
+                        max_output_bytes=self._max_output_bytes,
+                        kill_on_output_overflow=self._kill_on_output_overflow,
+                    ):
+                        if isinstance(item, ProcessOutput):
+                            output = item
+                        else:
+                            yield item
+                except RuntimeError as error:
+                    # The fork server exited while the code was running.
+                    logs_all += f"\n{error}"
+                    exitcode = 1
+                    break
+                assert output is not None
+
+                logs_all += output.stderr
+                logs_all += output.stdout
+                exitcode = output.exit_code
+
+                if output.status == "timeout":
+                    logs_all += "\nTimeout"
+                    exitcode = 124
+                elif output.status == "cancelled":
+                    logs_all += "\nCancelled"
+                    exitcode = 125
+                elif output.status == "output_limit_exceeded":
+                    logs_all += "\nOutput limit exceeded"
+                    exitcode = 1
+
+                if exitcode != 0:
+                    break
+
+            code_file = str(file_names[0]) if file_names else None
+            yield CommandLineCodeResult(exit_code=exitcode, output=logs_all, code_file=code_file)
+        finally:
+            if self._cleanup_temp_files:
+                for file in file_names:
+                    try:
+                        file.unlink(missing_ok=True)
+                    except OSError as error:
+                        logging.error(f"Failed to delete temporary file {file}: {error}")
 
     async def restart(self) -> None:
         """(Experimental) Restart the code executor."""
@@ -488,6 +701,15 @@ async def stop(self) -> None:
         Stops the local code executor and performs the cleanup of the temporary working directory (if it was created).
         The executor's internal state is markes as no longer started.
         """
+        if self._forkserver is not None:
+            await self._forkserver.stop()
+            self._forkserver = None
+        if self._setup_cache_entry is not None:
+            # The cached packages may be evicted once released, so the functions are set up again on next use.
+            self._setup_cache_entry.release()
+            self._setup_cache_entry = None
+            self._packages_dir = None
+            self._setup_functions_complete = False
         if self._temp_dir is not None:
             self._temp_dir.cleanup()
             self._temp_dir = None
@@ -499,12 +721,18 @@ def _to_config(self) -> LocalCommandLineCodeExecutorConfig:
             logging.info("Functions will not be included in serialized configuration")
         if self._virtual_env_context:
             logging.info("Virtual environment context will not be included in serialized configuration")
+        if self._setup_cache:
+            logging.info("Setup cache will not be included in serialized configuration")
 
         return LocalCommandLineCodeExecutorConfig(
             timeout=self._timeout,
             work_dir=str(self.work_dir),
             functions_module=self._functions_module,
             cleanup_temp_files=self._cleanup_temp_files,
+            use_forkserver=self._use_forkserver,
+            preload_modules=self._preload_modules,
+            max_output_bytes=self._max_output_bytes,
+            kill_on_output_overflow=self._kill_on_output_overflow,
         )
 
     @classmethod
@@ -514,4 +742,8 @@ def _from_config(cls, config: LocalCommandLineCodeExecutorConfig) -> Self:
             work_dir=Path(config.work_dir) if config.work_dir is not None else None,
             functions_module=config.functions_module,
             cleanup_temp_files=config.cleanup_temp_files,
+            use_forkserver=config.use_forkserver,
+            preload_modules=config.preload_modules,
+            max_output_bytes=config.max_output_bytes,
+            kill_on_output_overflow=config.kill_on_output_overflow,
         )
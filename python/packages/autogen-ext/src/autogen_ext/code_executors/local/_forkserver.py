@@ -0,0 +1,235 @@
+import asyncio
+import functools
+import json
+import os
+import shutil
+import signal
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+_FORKSERVER_MAIN = Path(__file__).with_name("_forkserver_main.py")
+
+
+@dataclass
+class _PendingRun:
+    pid: "asyncio.Future[int]" = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+    exit_code: "asyncio.Future[int]" = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class PythonForkServer:
+    """A warm Python interpreter that forks a fresh child process for every script.
+
+    The server process imports ``preload_modules`` once at start up. Each call to
+    :meth:`spawn` forks a child from the warm server, so the script starts with the modules
+    already imported but cannot affect the server or later scripts. Only available on
+    POSIX platforms.
+
+    Args:
+        python_executable (str): The interpreter used to run the server.
+        work_dir (Path): The working directory of the server and of every child.
+        preload_modules (Sequence[str]): The modules to import before forking.
+        env (Mapping[str, str]): The environment of the server, inherited by every child.
+    """
+
+    def __init__(
+        self, python_executable: str, work_dir: Path, preload_modules: Sequence[str], env: Mapping[str, str]
+    ) -> None:
+        self._python_executable = python_executable
+        self._work_dir = work_dir
+        self._preload_modules = list(preload_modules)
+        self._env = dict(env)
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._pending: Dict[int, _PendingRun] = {}
+        self._next_id = 0
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the server is started and can accept scripts."""
+        return (
+            self._process is not None
+            and self._process.returncode is None
+            and self._reader_task is not None
+            and not self._reader_task.done()
+        )
+
+    async def start(self, timeout: float) -> None:
+        """Start the server and wait for the preloaded modules to be imported.
+
+        Raises:
+            ValueError: If a preloaded module fails to import or the server does not become ready in time.
+        """
+        self._process = await asyncio.create_subprocess_exec(
+            self._python_executable,
+            str(_FORKSERVER_MAIN),
+            str(self._work_dir.resolve()),
+            ",".join(self._preload_modules),
+            cwd=self._work_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=self._env,
+        )
+        assert self._process.stdout is not None
+        try:
+            line = await asyncio.wait_for(self._process.stdout.readline(), timeout)
+        except asyncio.TimeoutError as e:
+            await self.stop()
+            raise ValueError("Fork server did not start in time") from e
+        message: Dict[str, Any] = json.loads(line) if line else {"error": "Fork server exited during start up"}
+        if "error" in message:
+            await self.stop()
+            raise ValueError(f"Fork server failed to preload modules: {message['error']}")
+        self._reader_task = asyncio.create_task(self._read_replies())
+
+    async def spawn(self, file: Path) -> "ForkServerProcess":
+        """Run the script in a child forked from the server.
+
+        The output of the child is streamed through named pipes, so it can be read while
+        the child runs.
+        """
+        if not self.running:
+            raise RuntimeError("Fork server is not running")
+        assert self._process is not None and self._process.stdin is not None
+        self._next_id += 1
+        request_id = self._next_id
+        pending = _PendingRun()
+        self._pending[request_id] = pending
+        fifo_dir = tempfile.mkdtemp(prefix="forkserver_")
+        paths = {name: os.path.join(fifo_dir, name) for name in ("stdout", "stderr")}
+        readers: Dict[str, asyncio.StreamReader] = {}
+        write_fds: List[int] = []
+        loop = asyncio.get_running_loop()
+        for name, path in paths.items():
+            os.mkfifo(path, 0o600)
+            read_fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            # Holding a write end keeps the reader from seeing EOF before the child opens the pipe.
+            write_fds.append(os.open(path, os.O_WRONLY | os.O_NONBLOCK))
+            reader = asyncio.StreamReader()
+            await loop.connect_read_pipe(
+                functools.partial(asyncio.StreamReaderProtocol, reader), os.fdopen(read_fd, "rb", 0)
+            )
+            readers[name] = reader
+        process = ForkServerProcess(pending, readers["stdout"], readers["stderr"], write_fds, fifo_dir)
+        pending.exit_code.add_done_callback(lambda _: self._pending.pop(request_id, None))
+        request = {"id": request_id, "file": str(file.resolve()), "stdout": paths["stdout"], "stderr": paths["stderr"]}
+        async with self._write_lock:
+            self._process.stdin.write((json.dumps(request) + "\n").encode())
+            await self._process.stdin.drain()
+        return process
+
+    async def stop(self) -> None:
+        """Stop the server. Children that are still running are terminated."""
+        process = self._process
+        self._process = None
+        if process is not None and process.returncode is None:
+            assert process.stdin is not None
+            process.stdin.close()
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        self._fail_pending(RuntimeError("Fork server stopped"))
+
+    async def _read_replies(self) -> None:
+        assert self._process is not None and self._process.stdout is not None
+        stdout = self._process.stdout
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                pending = self._pending.get(message["id"])
+                if pending is None:
+                    continue
+                if "pid" in message and not pending.pid.done():
+                    pending.pid.set_result(message["pid"])
+                if "exit_code" in message and not pending.exit_code.done():
+                    pending.exit_code.set_result(message["exit_code"])
+        finally:
+            self._fail_pending(RuntimeError("Fork server exited"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        for pending in self._pending.values():
+            for future in (pending.pid, pending.exit_code):
+                if not future.done():
+                    future.set_exception(error)
+                    # Mark retrieved so an unawaited pid future does not log a warning.
+                    future.exception()
+
+
+class ForkServerProcess:
+    """A script running in a child of :class:`PythonForkServer`.
+
+    It provides the parts of the :class:`asyncio.subprocess.Process` interface used by the
+    code executor.
+    """
+
+    def __init__(
+        self,
+        pending: _PendingRun,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+        write_fds: List[int],
+        fifo_dir: str,
+    ) -> None:
+        self._pending = pending
+        self.stdout: Optional[asyncio.StreamReader] = stdout
+        self.stderr: Optional[asyncio.StreamReader] = stderr
+        self._write_fds = write_fds
+        self._fifo_dir = fifo_dir
+        # Once the child has exited, release the write ends so the readers see EOF after draining the pipes.
+        pending.exit_code.add_done_callback(lambda _: self._close_write_fds())
+
+    async def wait(self) -> int:
+        """Wait for the child to exit and return its exit code.
+
+        Raises:
+            RuntimeError: If the fork server exited before reporting the exit code.
+        """
+        try:
+            return await asyncio.shield(self._pending.exit_code)
+        finally:
+            if self._pending.exit_code.done():
+                shutil.rmtree(self._fifo_dir, ignore_errors=True)
+
+    def terminate(self) -> None:
+        """Terminate the child with SIGTERM, as soon as its pid is known."""
+        self._send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        """Kill the child with SIGKILL, as soon as its pid is known."""
+        self._send_signal(signal.SIGKILL)
+
+    def _send_signal(self, signum: int) -> None:
+        if self._pending.exit_code.done():
+            return
+        if self._pending.pid.done():
+            self._signal(self._pending.pid, signum)
+        else:
+            self._pending.pid.add_done_callback(lambda pid: self._signal(pid, signum))
+
+    @staticmethod
+    def _signal(pid: "asyncio.Future[int]", signum: int) -> None:
+        if pid.cancelled() or pid.exception() is not None:
+            return
+        try:
+            os.kill(pid.result(), signum)
+        except ProcessLookupError:
+            pass
+
+    def _close_write_fds(self) -> None:
+        for fd in self._write_fds:
+            os.close(fd)
+        self._write_fds = []
@@ -0,0 +1,145 @@
+"""Fork server used by :class:`LocalCommandLineCodeExecutor` in warm interpreter mode.
+
+This file is executed as a script by the interpreter that runs the code blocks, which may
+be a virtual environment without autogen installed, so it must only use the standard library.
+
+The server imports the preloaded modules once and then forks a fresh child for every
+code block. Requests and replies are JSON lines on stdin and stdout:
+
+- server -> executor: ``{"ready": true}`` or ``{"error": "..."}`` after preloading.
+- executor -> server: ``{"id": 1, "file": "...", "stdout": "...", "stderr": "..."}``.
+- server -> executor: ``{"id": 1, "pid": 123}`` once forked, and ``{"id": 1, "exit_code": 0}`` on exit.
+"""
+
+import json
+import os
+import runpy
+import selectors
+import signal
+import sys
+import traceback
+from typing import Any, Dict, List
+
+
+def _send(message: Dict[str, Any]) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def _run_child(request: Dict[str, Any], server_fds: List[int]) -> None:
+    # Runs in the forked child, never returns.
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.set_wakeup_fd(-1)
+        for fd in server_fds:
+            os.close(fd)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        stdout = os.open(request["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        stderr = os.open(request["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(stdout, 1)
+        os.dup2(stderr, 2)
+        os.close(devnull)
+        os.close(stdout)
+        os.close(stderr)
+        # The inherited text wrappers point at the protocol pipe, so rebuild them on the new descriptors.
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+        sys.argv = [request["file"]]
+        sys.path[0] = os.path.dirname(request["file"])
+        runpy.run_path(request["file"], run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            sys.stderr.write(f"{e.code}\n")
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def main() -> None:
+    work_dir = sys.argv[1]
+    preload = [module for module in sys.argv[2].split(",") if module]
+    os.chdir(work_dir)
+    # Replace this script's directory so modules in the work_dir resolve as they do for a cold interpreter.
+    sys.path[0] = work_dir
+
+    try:
+        for module in preload:
+            __import__(module)
+    except BaseException:
+        _send({"error": traceback.format_exc()})
+        return
+    _send({"ready": True})
+
+    # Child exits are delivered through the wakeup pipe so the server can stay single threaded.
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_write, False)
+    os.set_blocking(wakeup_read, False)
+    signal.set_wakeup_fd(wakeup_write)
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    children: Dict[int, int] = {}
+    selector = selectors.DefaultSelector()
+    # Requests are read from the raw descriptor: a buffered reader could hold lines the selector never reports.
+    selector.register(0, selectors.EVENT_READ, "request")
+    selector.register(wakeup_read, selectors.EVENT_READ, "child")
+    server_fds = [wakeup_read, wakeup_write, selector.fileno()]
+
+    buffer = b""
+    running = True
+    while running or children:
+        for key, _ in selector.select():
+            if key.data == "request":
+                chunk = os.read(0, 65536)
+                if not chunk:
+                    # The executor closed the pipe: stop accepting work and terminate running children.
+                    running = False
+                    selector.unregister(0)
+                    for pid in children:
+                        try:
+                            os.kill(pid, signal.SIGTERM)
+                        except ProcessLookupError:
+                            pass
+                    continue
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    request = json.loads(line)
+                    pid = os.fork()
+                    if pid == 0:
+                        _run_child(request, server_fds)
+                    children[pid] = request["id"]
+                    _send({"id": request["id"], "pid": pid})
+            else:
+                try:
+                    while os.read(wakeup_read, 512):
+                        pass
+                except BlockingIOError:
+                    pass
+        while children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            request_id = children.pop(pid, None)
+            if request_id is not None:
+                _send({"id": request_id, "exit_code": os.waitstatus_to_exitcode(status)})
+
+
+if __name__ == "__main__":
+    main()
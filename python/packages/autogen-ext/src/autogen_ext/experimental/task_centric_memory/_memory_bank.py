@@ -1,8 +1,9 @@
 import os
-import pickle
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, TypedDict
 
+from ...memory.embedding_cache import EmbeddingCache
+from ._sqlite_dict import SqliteDict
 from ._string_similarity_map import StringSimilarityMap
 from .utils.page_logger import PageLogger
 
@@ -24,6 +25,7 @@ class MemoryBankConfig(TypedDict, total=False):
     relevance_conversion_threshold: float
     n_results: int
     distance_threshold: int
+    embedding_cache: EmbeddingCache
 
 
 class MemoryBank:
@@ -38,6 +40,7 @@ class MemoryBank:
             - relevance_conversion_threshold: The threshold used to normalize relevance.
             - n_results: The maximum number of most relevant results to return for any given topic.
             - distance_threshold: The maximum string-pair distance for a memo to be retrieved.
+            - embedding_cache: An optional cache of the topic embeddings, which can be shared with other memories.
 
         logger: An optional logger. If None, no logging will be performed.
     """
@@ -58,6 +61,7 @@ def __init__(
         self.relevance_conversion_threshold = 1.7
         self.n_results = 25
         self.distance_threshold = 100
+        embedding_cache = None
         if config is not None:
             memory_dir_path = config.get("path", memory_dir_path)
             self.relevance_conversion_threshold = config.get(
@@ -65,23 +69,33 @@ def __init__(
             )
             self.n_results = config.get("n_results", self.n_results)
             self.distance_threshold = config.get("distance_threshold", self.distance_threshold)
+            embedding_cache = config.get("embedding_cache", embedding_cache)
 
         memory_dir_path = os.path.expanduser(memory_dir_path)
         self.logger.info("\nMEMORY BANK DIRECTORY  {}".format(memory_dir_path))
         path_to_db_dir = os.path.join(memory_dir_path, "string_map")
-        self.path_to_dict = os.path.join(memory_dir_path, "uid_memo_dict.pkl")
-
-        self.string_map = StringSimilarityMap(reset=reset, path_to_db_dir=path_to_db_dir, logger=self.logger)
-
-        # Load or create the associated memo dict on disk.
-        self.uid_memo_dict: Dict[str, Memo] = {}
-        self.last_memo_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.info("\nLOADING MEMOS FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_memo_dict = pickle.load(f)
-                self.last_memo_id = len(self.uid_memo_dict)
-                self.logger.info("\n{} MEMOS LOADED".format(len(self.uid_memo_dict)))
+        self.path_to_dict = os.path.join(memory_dir_path, "uid_memo_dict.sqlite3")
+
+        self.string_map = StringSimilarityMap(
+            reset=reset, path_to_db_dir=path_to_db_dir, logger=self.logger, embedding_cache=embedding_cache
+        )
+
+        # Open or create the associated memo dict on disk. Memos are read from disk as they are needed.
+        os.makedirs(memory_dir_path, exist_ok=True)
+        self.logger.info("\nOPENING MEMOS ON DISK  at {}".format(self.path_to_dict))
+        self.uid_memo_dict: SqliteDict[Memo] = SqliteDict(self.path_to_dict)
+
+        # Migrate the memos pickled by earlier versions.
+        path_to_pickle = os.path.join(memory_dir_path, "uid_memo_dict.pkl")
+        if os.path.exists(path_to_pickle):
+            if reset:
+                # Retire the pickle unread, so that a later open does not bring back the cleared memos.
+                os.replace(path_to_pickle, path_to_pickle + ".migrated")
+            else:
+                self.logger.info("\nMIGRATING MEMOS FROM  {}".format(path_to_pickle))
+                self.uid_memo_dict.import_pickle(path_to_pickle)
+        self.last_memo_id = len(self.uid_memo_dict)
+        self.logger.info("\n{} MEMOS FOUND".format(len(self.uid_memo_dict)))
 
         # Clear the DB if requested.
         if reset:
@@ -101,17 +115,16 @@ def _reset_memos(self) -> None:
         Forces immediate deletion of the memos, in memory and on disk.
         """
         self.logger.info("\nCLEARING MEMOS")
-        self.uid_memo_dict = {}
+        self.uid_memo_dict.clear()
         self.save_memos()
 
     def save_memos(self) -> None:
         """
-        Saves the current memo structures (possibly empty) to disk.
+        Saves the changes to the memo structures since the last save to disk.
         """
         self.string_map.save_string_pairs()
-        with open(self.path_to_dict, "wb") as file:
-            self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
-            pickle.dump(self.uid_memo_dict, file)
+        self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
+        self.uid_memo_dict.commit()
 
     def contains_memos(self) -> bool:
         """
@@ -164,9 +177,12 @@ def get_relevant_memos(self, topics: List[str]) -> List[Memo]:
         self.logger.enter_function()
 
         # Retrieve all topic matches, and gather them into a single list.
+        # All topics are looked up in a single query to the vector DB.
         matches: List[Tuple[str, str, float]] = []  # Each match is a tuple: (topic, memo_id, distance)
-        for topic in topics:
-            matches.extend(self.string_map.get_related_string_pairs(topic, self.n_results, self.distance_threshold))
+        for topic_matches in self.string_map.get_related_string_pairs_for_queries(
+            topics, self.n_results, self.distance_threshold
+        ):
+            matches.extend(topic_matches)
 
         # Build a dict of memo-relevance pairs from the matches.
         memo_relevance_dict: Dict[str, float] = {}
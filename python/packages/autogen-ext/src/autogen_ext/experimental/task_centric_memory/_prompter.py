@@ -244,10 +244,12 @@ async def validate_insight(self, insight: str, task_description: str) -> bool:
         user_message.append("\n# Possibly useful insight")
         user_message.append(insight)
         self._clear_history()
+        # The messages aren't kept, since several validations may run concurrently.
         response = await self.call_model(
             summary="Ask the model to validate the insight",
             system_message_content=sys_message,
             user_content=user_message,
+            keep_these_messages=False,
         )
         return response == "1"
 
@@ -0,0 +1,139 @@
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, MutableMapping, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# Freeing unused pages is only worthwhile once the file has this many pages (of 4 KiB by default).
+_MIN_PAGES_TO_COMPACT = 1024
+
+
+class SqliteDict(MutableMapping[str, V]):
+    """
+    A dict with string keys that is stored in a SQLite file, one row per entry, with pickled values.
+    Entries are read from disk when accessed, so opening even a very large dict is fast.
+    Changes are written as they are made, and made durable by commit(), so each save costs
+    only as much as the changes since the previous one.
+    When deletions leave more than half of the file unused, commit() frees the unused pages with an incremental
+    vacuum, which is cheap. compact() rewrites the whole file, which also enables incremental vacuums for files
+    created by earlier versions.
+
+    Args:
+        - path: Path to the SQLite file, which is created if it doesn't exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        # Only takes effect for a new file, or on the next compact() of an existing one.
+        self._connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        self._connection.commit()
+        self._len: int = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __getitem__(self, key: str) -> V:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        value: V = pickle.loads(row[0])
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self.set_many([(key, value)])
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if self._connection.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount == 0:
+                raise KeyError(key)
+            self._len -= 1
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        # The keys are fetched up front, so the dict can be changed during the iteration.
+        with self._lock:
+            keys = [row[0] for row in self._connection.execute("SELECT key FROM entries ORDER BY rowid")]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def set_many(self, items: Iterable[Tuple[str, V]]) -> None:
+        """
+        Adds or replaces many entries at once.
+        """
+        rows = [(key, pickle.dumps(value)) for key, value in items]
+        with self._lock:
+            if len(rows) == 1:
+                if self._connection.execute("SELECT 1 FROM entries WHERE key = ?", (rows[0][0],)).fetchone() is None:
+                    self._len += 1
+            # Updating in place keeps the insertion order of existing keys, as in a dict.
+            self._connection.executemany(
+                "INSERT INTO entries (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                rows,
+            )
+            if len(rows) > 1:
+                self._len = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM entries")
+            self._len = 0
+
+    def commit(self) -> None:
+        """
+        Makes all changes durable, then frees the unused pages if the file is mostly unused.
+        """
+        with self._lock:
+            self._connection.commit()
+            page_count: int = self._connection.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count: int = self._connection.execute("PRAGMA freelist_count").fetchone()[0]
+            if page_count < _MIN_PAGES_TO_COMPACT or freelist_count * 2 <= page_count:
+                return
+            try:
+                # The pragma frees one page per step, so it's run by executescript(), which steps it to the end.
+                self._connection.executescript("PRAGMA incremental_vacuum")
+            except sqlite3.OperationalError as e:
+                logger.warning("Failed to free the unused pages of %s: %s", self.path, e)
+
+    def compact(self) -> None:
+        """
+        Rewrites the file without its unused pages. This locks the file until it's done, so it's never run
+        automatically. Failures are logged, not raised.
+        """
+        with self._lock:
+            self._connection.commit()
+            try:
+                self._connection.execute("VACUUM")
+                self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.OperationalError as e:
+                logger.warning("Failed to compact %s: %s", self.path, e)
+
+    def import_pickle(self, path: str) -> None:
+        """
+        Adds the entries of a dict pickled by an earlier version, then renames the pickle file so it's only imported once.
+        """
+        with open(path, "rb") as f:
+            entries: Dict[str, Any] = pickle.load(f)
+        self.set_many(entries.items())
+        self.commit()
+        os.replace(path, path + ".migrated")
+
+    def close(self) -> None:
+        """
+        Commits any changes and closes the file.
+        """
+        self.commit()
+        with self._lock:
+            self._connection.close()
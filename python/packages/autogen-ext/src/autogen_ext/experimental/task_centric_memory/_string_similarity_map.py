@@ -1,13 +1,19 @@
 import os
-import pickle
-from typing import Dict, List, Tuple, Union
+from typing import List, Tuple, Union, cast
 
 import chromadb
 from chromadb.api.types import (
+    Documents,
+    Embeddable,
+    EmbeddingFunction,
     QueryResult,
 )
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
+from ...memory.chromadb import CachedEmbeddingFunction
+from ...memory.embedding_cache import EmbeddingCache
+from ._sqlite_dict import SqliteDict
 from .utils.page_logger import PageLogger
 
 
@@ -23,33 +29,53 @@ class StringSimilarityMap:
         - reset: True to clear the DB immediately after creation.
         - path_to_db_dir: Path to the directory where the DB is stored.
         - logger: An optional logger. If None, no logging will be performed.
+        - embedding_cache: An optional cache of the input string embeddings.
     """
 
-    def __init__(self, reset: bool, path_to_db_dir: str, logger: PageLogger | None = None) -> None:
+    def __init__(
+        self,
+        reset: bool,
+        path_to_db_dir: str,
+        logger: PageLogger | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
         if logger is None:
             logger = PageLogger()  # Nothing will be logged by this object.
         self.logger = logger
         self.path_to_db_dir = path_to_db_dir
+        embedding_function: EmbeddingFunction[Documents] = DefaultEmbeddingFunction()
+        if embedding_cache is not None:
+            # Cached under the same name as ChromaDBVectorMemory's default embeddings, so the two can share entries.
+            embedding_function = CachedEmbeddingFunction(embedding_function, embedding_cache, "chromadb:default")
+        self.embedding_function = cast(EmbeddingFunction[Embeddable], embedding_function)
 
         # Load or create the vector DB on disk.
         chromadb_settings = Settings(
             anonymized_telemetry=False, allow_reset=True, is_persistent=True, persist_directory=path_to_db_dir
         )
         self.db_client = chromadb.Client(chromadb_settings)
-        self.vec_db = self.db_client.create_collection("string-pairs", get_or_create=True)  # The collection is the DB.
-
-        # Load or create the associated string-pair dict on disk.
-        self.path_to_dict = os.path.join(path_to_db_dir, "uid_text_dict.pkl")
-        self.uid_text_dict: Dict[str, Tuple[str, str]] = {}
-        self.last_string_pair_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.debug("\nLOADING STRING SIMILARITY MAP FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_text_dict = pickle.load(f)
-                self.last_string_pair_id = len(self.uid_text_dict)
-                if len(self.uid_text_dict) > 0:
-                    self.logger.debug("\n{} STRING PAIRS LOADED".format(len(self.uid_text_dict)))
-                    self._log_string_pairs()
+        self.vec_db = self.db_client.create_collection(
+            "string-pairs", embedding_function=self.embedding_function, get_or_create=True
+        )  # The collection is the DB.
+
+        # Open or create the associated string-pair dict on disk. Pairs are read from disk as they are needed.
+        self.path_to_dict = os.path.join(path_to_db_dir, "uid_text_dict.sqlite3")
+        self.logger.debug("\nOPENING STRING SIMILARITY MAP ON DISK  at {}".format(self.path_to_dict))
+        self.uid_text_dict: SqliteDict[Tuple[str, str]] = SqliteDict(self.path_to_dict)
+
+        # Migrate the string pairs pickled by earlier versions.
+        path_to_pickle = os.path.join(path_to_db_dir, "uid_text_dict.pkl")
+        if os.path.exists(path_to_pickle):
+            if reset:
+                # Retire the pickle unread, so that a later open does not bring back the cleared string pairs.
+                os.replace(path_to_pickle, path_to_pickle + ".migrated")
+            else:
+                self.logger.debug("\nMIGRATING STRING PAIRS FROM  {}".format(path_to_pickle))
+                self.uid_text_dict.import_pickle(path_to_pickle)
+        self.last_string_pair_id = len(self.uid_text_dict)
+        if len(self.uid_text_dict) > 0:
+            # The pairs themselves aren't logged here, since reading them all would slow down startup.
+            self.logger.debug("\n{} STRING PAIRS FOUND".format(len(self.uid_text_dict)))
 
         # Clear the DB if requested.
         if reset:
@@ -66,11 +92,10 @@ def _log_string_pairs(self) -> None:
 
     def save_string_pairs(self) -> None:
         """
-        Saves the string-pair dict (self.uid_text_dict) to disk.
+        Saves the changes to the string-pair dict (self.uid_text_dict) since the last save to disk.
         """
         self.logger.debug("\nSAVING STRING SIMILARITY MAP TO DISK  at {}".format(self.path_to_dict))
-        with open(self.path_to_dict, "wb") as file:
-            pickle.dump(self.uid_text_dict, file)
+        self.uid_text_dict.commit()
 
     def reset_db(self) -> None:
         """
@@ -78,8 +103,8 @@ def reset_db(self) -> None:
         """
         self.logger.debug("\nCLEARING STRING-PAIR MAP")
         self.db_client.delete_collection("string-pairs")
-        self.vec_db = self.db_client.create_collection("string-pairs")
-        self.uid_text_dict = {}
+        self.vec_db = self.db_client.create_collection("string-pairs", embedding_function=self.embedding_function)
+        self.uid_text_dict.clear()
         self.save_string_pairs()
 
     def add_input_output_pair(self, input_text: str, output_text: str) -> None:
@@ -102,23 +127,33 @@ def get_related_string_pairs(
         """
         Retrieves up to n string pairs that are related to the given query text within the specified distance threshold.
         """
-        string_pairs_with_distances: List[Tuple[str, str, float]] = []
+        return self.get_related_string_pairs_for_queries([query_text], n_results, threshold)[0]
+
+    def get_related_string_pairs_for_queries(
+        self, query_texts: List[str], n_results: int, threshold: Union[int, float]
+    ) -> List[List[Tuple[str, str, float]]]:
+        """
+        Retrieves up to n string pairs for each of the given query texts within the specified distance threshold,
+        using a single query to the vector DB.
+        """
+        string_pairs_per_query: List[List[Tuple[str, str, float]]] = [[] for _ in query_texts]
         if n_results > len(self.uid_text_dict):
             n_results = len(self.uid_text_dict)
-        if n_results > 0:
-            results: QueryResult = self.vec_db.query(query_texts=[query_text], n_results=n_results)
-            num_results = len(results["ids"][0])
-            for i in range(num_results):
-                uid = results["ids"][0][i]
-                input_text = results["documents"][0][i] if results["documents"] else ""
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                if distance < threshold:
-                    input_text_2, output_text = self.uid_text_dict[uid]
-                    assert input_text == input_text_2
-                    self.logger.debug(
-                        "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
-                            input_text, output_text, distance
+        if n_results > 0 and len(query_texts) > 0:
+            results: QueryResult = self.vec_db.query(query_texts=query_texts, n_results=n_results)
+            for query_index, string_pairs_with_distances in enumerate(string_pairs_per_query):
+                num_results = len(results["ids"][query_index])
+                for i in range(num_results):
+                    uid = results["ids"][query_index][i]
+                    input_text = results["documents"][query_index][i] if results["documents"] else ""
+                    distance = results["distances"][query_index][i] if results["distances"] else 0.0
+                    if distance < threshold:
+                        input_text_2, output_text = self.uid_text_dict[uid]
+                        assert input_text == input_text_2
+                        self.logger.debug(
+                            "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
+                                input_text, output_text, distance
+                            )
                         )
-                    )
-                    string_pairs_with_distances.append((input_text, output_text, distance))
-        return string_pairs_with_distances
+                        string_pairs_with_distances.append((input_text, output_text, distance))
+        return string_pairs_per_query
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Awaitable, Callable, List, Tuple, TypedDict
+import asyncio
+import hashlib
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Tuple, TypedDict
 
 from autogen_core.models import (
     ChatCompletionClient,
@@ -21,6 +23,8 @@ class MemoryControllerConfig(TypedDict, total=False):
     generate_topics: bool
     validate_memos: bool
     max_memos_to_retrieve: int
+    max_concurrent_validations: int
+    cache_validations: bool
     max_train_trials: int
     max_test_trials: int
     MemoryBank: "MemoryBankConfig"
@@ -43,6 +47,8 @@ class MemoryController:
             - generate_topics: Whether to base retrieval directly on tasks, or on topics extracted from tasks.
             - validate_memos: Whether to apply a final validation stage to retrieved memos.
             - max_memos_to_retrieve: The maximum number of memos to return from retrieve_relevant_memos().
+            - max_concurrent_validations: The maximum number of memo validations sent to the model client at once.
+            - cache_validations: Whether to remember the validation verdict for each memo and task, instead of asking again.
             - max_train_trials: The maximum number of learning iterations to attempt when training on a task.
             - max_test_trials: The total number of attempts made when testing for failure on a task.
             - MemoryBank: A config dict passed to MemoryBank.
@@ -106,6 +112,8 @@ def __init__(
         self.generate_topics = True
         self.validate_memos = True
         self.max_memos_to_retrieve = 10
+        self.max_concurrent_validations = 8
+        self.cache_validations = True
         self.max_train_trials = 10
         self.max_test_trials = 3
         memory_bank_config = None
@@ -115,6 +123,8 @@ def __init__(
             self.generate_topics = config.get("generate_topics", self.generate_topics)
             self.validate_memos = config.get("validate_memos", self.validate_memos)
             self.max_memos_to_retrieve = config.get("max_memos_to_retrieve", self.max_memos_to_retrieve)
+            self.max_concurrent_validations = config.get("max_concurrent_validations", self.max_concurrent_validations)
+            self.cache_validations = config.get("cache_validations", self.cache_validations)
             self.max_train_trials = config.get("max_train_trials", self.max_train_trials)
             self.max_test_trials = config.get("max_test_trials", self.max_test_trials)
             memory_bank_config = config.get("MemoryBank", memory_bank_config)
@@ -124,6 +134,7 @@ def __init__(
         self.prompter = Prompter(client, logger)
         self.memory_bank = MemoryBank(reset=reset, config=memory_bank_config, logger=logger)
         self.grader = Grader(client, logger)
+        self._validation_verdicts: Dict[str, bool] = {}  # Maps a hash of each (memo, task) pair to its verdict.
         self.logger.leave_function()
 
     def reset_memory(self) -> None:
@@ -131,6 +142,7 @@ def reset_memory(self) -> None:
         Empties the memory bank in RAM and on disk.
         """
         self.memory_bank.reset()
+        self._validation_verdicts = {}
 
     async def train_on_task(self, task: str, expected_answer: str) -> None:
         """
@@ -282,12 +294,10 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
             memo_list = self.memory_bank.get_relevant_memos(topics=task_topics)
 
             # Apply a final validation stage to keep only the memos that the LLM concludes are sufficiently relevant.
-            validated_memos: List[Memo] = []
-            for memo in memo_list:
-                if len(validated_memos) >= self.max_memos_to_retrieve:
-                    break
-                if (not self.validate_memos) or await self.prompter.validate_insight(memo.insight, task):
-                    validated_memos.append(memo)
+            if self.validate_memos:
+                validated_memos = await self._validate_memos(memo_list, task)
+            else:
+                validated_memos = memo_list[: self.max_memos_to_retrieve]
 
             self.logger.info("\n{} VALIDATED MEMOS".format(len(validated_memos)))
             for memo in validated_memos:
@@ -301,6 +311,33 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
         self.logger.leave_function()
         return validated_memos
 
+    async def _validate_memos(self, memo_list: List[Memo], task: str) -> List[Memo]:
+        """
+        Returns the memos, in their given order and up to max_memos_to_retrieve, that the LLM concludes could help solve the task.
+        Validations run concurrently, in rounds no larger than the number of memos still needed,
+        so no memo is validated that a one-by-one pass would have skipped.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_validations)
+
+        async def validate(memo: Memo) -> bool:
+            key = hashlib.sha256("\0".join([memo.task or "", memo.insight, task]).encode("utf-8")).hexdigest()
+            if key in self._validation_verdicts:
+                return self._validation_verdicts[key]
+            async with semaphore:
+                verdict = await self.prompter.validate_insight(memo.insight, task)
+            if self.cache_validations:
+                self._validation_verdicts[key] = verdict
+            return verdict
+
+        validated_memos: List[Memo] = []
+        remaining_memos = memo_list
+        while len(remaining_memos) > 0 and len(validated_memos) < self.max_memos_to_retrieve:
+            memos_to_validate = remaining_memos[: self.max_memos_to_retrieve - len(validated_memos)]
+            remaining_memos = remaining_memos[len(memos_to_validate) :]
+            verdicts = await asyncio.gather(*(validate(memo) for memo in memos_to_validate))
+            validated_memos.extend(memo for memo, verdict in zip(memos_to_validate, verdicts, strict=True) if verdict)
+        return validated_memos
+
     def _format_memory_section(self, memories: List[str]) -> str:
         """
         Formats a list of memories as a section for appending to a task description.
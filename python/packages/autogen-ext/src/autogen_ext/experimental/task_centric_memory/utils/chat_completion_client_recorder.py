@@ -94,22 +94,28 @@ async def create(
     ) -> CreateResult:
         current_messages: List[Mapping[str, Any]] = [msg.model_dump() for msg in messages]
         if self.mode == "record":
-            response = await self.base_client.create(
-                messages,
-                tools=tools,
-                json_output=json_output,
-                tool_choice=tool_choice,
-                extra_create_args=extra_create_args,
-                cancellation_token=cancellation_token,
-            )
-
+            # The record is appended before awaiting the response, so that concurrent calls
+            # are recorded in the order they were made, which is the order replay expects.
             rec: RecordDict = {
                 "mode": "create",
                 "messages": current_messages,
-                "response": response.model_dump(),
+                "response": {},
                 "stream": [],
             }
             self.records.append(rec)
+            try:
+                response = await self.base_client.create(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    tool_choice=tool_choice,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                )
+            except BaseException:
+                self.records.remove(rec)
+                raise
+            rec["response"] = response.model_dump()
             return response
         elif self.mode == "replay":
             if self._record_index >= len(self.records):
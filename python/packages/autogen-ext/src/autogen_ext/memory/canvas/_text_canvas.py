@@ -1,5 +1,6 @@
 import difflib
-from typing import Any, Dict, List, Union
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:  # pragma: no cover
     from unidiff import PatchSet
@@ -8,15 +9,55 @@
 
 from ._canvas import BaseCanvas
 
+# A line delta from one revision to the next: each (start, end, lines) replaces
+# ``old_lines[start:end]`` with ``lines``, in ascending order of ``start``.
+Delta = Tuple[Tuple[int, int, Tuple[str, ...]], ...]
+
 
 class FileRevision:
-    """Tracks the history of one file's content."""
+    """Tracks one revision of a file, stored either in full (a snapshot) or as a
+    delta from the previous revision."""
 
-    __slots__ = ("content", "revision")
+    __slots__ = ("revision", "snapshot", "delta", "diff")
 
-    def __init__(self, content: str, revision: int) -> None:
-        self.content: str = content
+    def __init__(self, revision: int, snapshot: Optional[str] = None, delta: Optional[Delta] = None) -> None:
         self.revision: int = revision  # e.g. an integer, a timestamp, or git hash
+        self.snapshot: Optional[str] = snapshot
+        self.delta: Optional[Delta] = delta
+        self.diff: Optional[str] = None  # Cached unified diff from the previous revision.
+
+
+def _make_delta(old_lines: List[str], new_lines: List[str]) -> Delta:
+    """Return the line delta that turns *old_lines* into *new_lines*."""
+    # Trim the common prefix and suffix first, so the matcher only sees the edited region.
+    prefix = 0
+    max_prefix = min(len(old_lines), len(new_lines))
+    while prefix < max_prefix and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    max_suffix = max_prefix - prefix
+    while suffix < max_suffix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    old_middle = old_lines[prefix : len(old_lines) - suffix]
+    new_middle = new_lines[prefix : len(new_lines) - suffix]
+    matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    return tuple(
+        (prefix + i1, prefix + i2, tuple(new_middle[j1:j2]))
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    )
+
+
+def _apply_delta(old_lines: List[str], delta: Delta) -> List[str]:
+    """Return the lines obtained by applying *delta* to *old_lines*."""
+    new_lines: List[str] = []
+    position = 0
+    for start, end, lines in delta:
+        new_lines.extend(old_lines[position:start])
+        new_lines.extend(lines)
+        position = end
+    new_lines.extend(old_lines[position:])
+    return new_lines
 
 
 class TextCanvas(BaseCanvas):
@@ -34,17 +75,37 @@ class TextCanvas(BaseCanvas):
     * **get_revision_diffs** – obtain the list of diffs applied between every
       consecutive pair of revisions so that a caller can replay or audit the
       full change history.
+
+    To keep long editing sessions small, only every *snapshot_interval*-th
+    revision of a file is stored in full; the others are stored as line deltas
+    from the previous revision, and older revisions are rebuilt from the nearest
+    snapshot when requested.  Diffs are cached once computed, and
+    :meth:`get_all_contents_for_context` only re-renders the files that changed.
+
+    Args:
+        snapshot_interval (int): Store every *n*-th revision of a file in full. Defaults to 32.
+        max_cached_diffs (int): The number of :meth:`get_diff` results to keep. Defaults to 64.
     """
 
     # ----------------------------------------------------------------------------------
     # Construction helpers
     # ----------------------------------------------------------------------------------
 
-    def __init__(self) -> None:
+    def __init__(self, snapshot_interval: int = 32, max_cached_diffs: int = 64) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1.")
+        self._snapshot_interval = snapshot_interval
+        self._max_cached_diffs = max_cached_diffs
         # For each file we keep an *ordered* list of FileRevision where the last
         # element is the most recent.  Using a list keeps the memory footprint
         # small and preserves order without any extra bookkeeping.
         self._files: Dict[str, List[FileRevision]] = {}
+        # The latest content of each file, kept in full since it's read the most.
+        self._latest: Dict[str, str] = {}
+        self._diff_cache: OrderedDict[Tuple[str, int, int], str] = OrderedDict()
+        # The rendered section of each file for get_all_contents_for_context, with its revision.
+        self._context_sections: Dict[str, Tuple[int, str]] = {}
+        self._context: Optional[Tuple[Tuple[Tuple[str, int], ...], str]] = None
 
     # ----------------------------------------------------------------------------------
     # Internal utilities
@@ -58,6 +119,41 @@ def _ensure_file(self, filename: str) -> None:
         if filename not in self._files:
             raise ValueError(f"File '{filename}' does not exist on the canvas; create it first.")
 
+    def _revision_idx(self, filename: str, revision: int) -> int:
+        """Return the index of *revision*, or -1 if the file has no such revision."""
+        revisions = self._files.get(filename, [])
+        # Revisions are numbered consecutively from 1.
+        if 1 <= revision <= len(revisions) and revisions[revision - 1].revision == revision:
+            return revision - 1
+        return -1
+
+    def _iter_lines(self, filename: str, start_idx: int = 0) -> Iterator[Tuple[FileRevision, List[str]]]:
+        """Yield every revision of *filename* from *start_idx* on, with its lines."""
+        revisions = self._files.get(filename, [])
+        lines: List[str] = []
+        # Deltas are applied from the closest snapshot at or before start_idx, at most snapshot_interval back.
+        snapshot_idx = start_idx
+        while revisions[snapshot_idx].snapshot is None:
+            snapshot_idx -= 1
+        for idx in range(snapshot_idx, len(revisions)):
+            rev = revisions[idx]
+            if rev.snapshot is not None:
+                lines = rev.snapshot.splitlines(keepends=True)
+            else:
+                assert rev.delta is not None
+                lines = _apply_delta(lines, rev.delta)
+            if idx >= start_idx:
+                yield rev, lines
+
+    def _unified_diff(self, filename: str, old: List[str], new: List[str], from_rev: int, to_rev: int) -> str:
+        diff = difflib.unified_diff(
+            old,
+            new,
+            fromfile=f"{filename}@r{from_rev}",
+            tofile=f"{filename}@r{to_rev}",
+        )
+        return "".join(diff)
+
     # ----------------------------------------------------------------------------------
     # Revision inspection helpers
     # ----------------------------------------------------------------------------------
@@ -68,10 +164,16 @@ def get_revision_content(self, filename: str, revision: int) -> str:  # NEW 🚀
         If the revision does not exist an empty string is returned so that
         downstream code can handle the "not found" case without exceptions.
         """
-        for rev in self._files.get(filename, []):
-            if rev.revision == revision:
-                return rev.content
-        return ""
+        idx = self._revision_idx(filename, revision)
+        if idx < 0:
+            return ""
+        if idx == self._latest_idx(filename):
+            return self._latest[filename]
+        snapshot = self._files[filename][idx].snapshot
+        if snapshot is not None:
+            return snapshot
+        _, lines = next(self._iter_lines(filename, idx))
+        return "".join(lines)
 
     def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         """Return a *chronological* list of unified‑diffs for *filename*.
@@ -80,17 +182,17 @@ def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         revision *n* into revision *n+1* (starting at revision 1 → 2).
         """
         revisions = self._files.get(filename, [])
-        diffs: List[str] = []
-        for i in range(1, len(revisions)):
-            older, newer = revisions[i - 1], revisions[i]
-            diff = difflib.unified_diff(
-                older.content.splitlines(keepends=True),
-                newer.content.splitlines(keepends=True),
-                fromfile=f"{filename}@r{older.revision}",
-                tofile=f"{filename}@r{newer.revision}",
-            )
-            diffs.append("".join(diff))
-        return diffs
+        # Rebuild the revisions in one pass from the first one whose diff isn't cached yet.
+        first_uncached = next((i for i in range(1, len(revisions)) if revisions[i].diff is None), None)
+        if first_uncached is not None:
+            older: Optional[Tuple[FileRevision, List[str]]] = None
+            for newer in self._iter_lines(filename, first_uncached - 1):
+                if older is not None and newer[0].diff is None:
+                    newer[0].diff = self._unified_diff(
+                        filename, older[1], newer[1], older[0].revision, newer[0].revision
+                    )
+                older = newer
+        return [rev.diff for rev in revisions[1:] if rev.diff is not None]
 
     # ----------------------------------------------------------------------------------
     # BaseCanvas interface implementation
@@ -102,8 +204,7 @@ def list_files(self) -> Dict[str, int]:
 
     def get_latest_content(self, filename: str) -> str:  # noqa: D401 – keep API identical
         """Return the most recent content or an empty string if the file is new."""
-        revs = self._files.get(filename, [])
-        return revs[-1].content if revs else ""
+        return self._latest.get(filename, "")
 
     def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any]) -> None:
         """Create *filename* or append a new revision containing *new_content*."""
@@ -112,28 +213,55 @@ def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any])
         if not isinstance(new_content, str):
             raise ValueError(f"Expected str or bytes, got {type(new_content)}")
         if filename not in self._files:
-            self._files[filename] = [FileRevision(new_content, 1)]
+            self._files[filename] = [FileRevision(1, snapshot=new_content)]
         else:
-            last_rev_num = self._files[filename][-1].revision
-            self._files[filename].append(FileRevision(new_content, last_rev_num + 1))
+            revisions = self._files[filename]
+            last_rev_num = revisions[-1].revision
+            new_revision = FileRevision(last_rev_num + 1, snapshot=new_content)
+            if len(revisions) % self._snapshot_interval != 0:
+                delta = _make_delta(
+                    self._latest[filename].splitlines(keepends=True), new_content.splitlines(keepends=True)
+                )
+                # A delta larger than half of the content saves little, so the revision is kept in full.
+                if sum(len(line) for _, _, lines in delta for line in lines) * 2 < len(new_content):
+                    new_revision = FileRevision(last_rev_num + 1, delta=delta)
+            revisions.append(new_revision)
+        self._latest[filename] = new_content
 
     def get_diff(self, filename: str, from_revision: int, to_revision: int) -> str:
         """Return a unified diff between *from_revision* and *to_revision*."""
         revisions = self._files.get(filename, [])
         if not revisions:
             return ""
+        # Revisions never change, so neither do their diffs.
+        key = (filename, from_revision, to_revision)
+        if key in self._diff_cache:
+            self._diff_cache.move_to_end(key)
+            return self._diff_cache[key]
+        to_idx = self._revision_idx(filename, to_revision)
+        if to_idx > 0 and self._revision_idx(filename, from_revision) == to_idx - 1:
+            # Consecutive revisions share the diffs cached by get_revision_diffs.
+            if revisions[to_idx].diff is None:
+                revision_lines = self._iter_lines(filename, to_idx - 1)
+                older, newer = next(revision_lines), next(revision_lines)
+                revisions[to_idx].diff = self._unified_diff(filename, older[1], newer[1], from_revision, to_revision)
+            return revisions[to_idx].diff or ""
         # Fetch the contents for the requested revisions.
         from_content = self.get_revision_content(filename, from_revision)
         to_content = self.get_revision_content(filename, to_revision)
         if from_content == "" and to_content == "":  # one (or both) revision ids not found
             return ""
-        diff = difflib.unified_diff(
+        diff = self._unified_diff(
+            filename,
             from_content.splitlines(keepends=True),
             to_content.splitlines(keepends=True),
-            fromfile=f"{filename}@r{from_revision}",
-            tofile=f"{filename}@r{to_revision}",
+            from_revision,
+            to_revision,
         )
-        return "".join(diff)
+        self._diff_cache[key] = diff
+        if len(self._diff_cache) > self._max_cached_diffs:
+            self._diff_cache.popitem(last=False)
+        return diff
 
     def apply_patch(self, filename: str, patch_data: Union[str, bytes, Any]) -> None:
         """Apply *patch_text* (unified diff) to the latest revision and save a new revision.
@@ -184,9 +312,18 @@ def apply_patch(self, filename: str, patch_data: Union[str, bytes, Any]) -> None
 
     def get_all_contents_for_context(self) -> str:  # noqa: D401 – keep public API stable
         """Return a summarised view of every file and its *latest* revision."""
+        versions = tuple((fname, revs[-1].revision) for fname, revs in self._files.items())
+        if self._context is not None and self._context[0] == versions:
+            return self._context[1]
         out: List[str] = ["=== CANVAS FILES ==="]
-        for fname, revs in self._files.items():
-            latest = revs[-1]
-            out.append(f"File: {fname} (rev {latest.revision}):\n{latest.content}\n")
+        for fname, revision in versions:
+            # Only files that changed since the last call are rendered again.
+            section = self._context_sections.get(fname)
+            if section is None or section[0] != revision:
+                section = (revision, f"File: {fname} (rev {revision}):\n{self._latest[fname]}\n")
+                self._context_sections[fname] = section
+            out.append(section[1])
         out.append("=== END OF CANVAS ===")
-        return "\n".join(out)
+        rendered = "\n".join(out)
+        self._context = (versions, rendered)
+        return rendered
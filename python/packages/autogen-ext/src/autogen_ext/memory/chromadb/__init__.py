@@ -1,3 +1,4 @@
+from ._cached_embedding_function import CachedEmbeddingFunction
 from ._chroma_configs import (
     ChromaDBVectorMemoryConfig,
     CustomEmbeddingFunctionConfig,
@@ -18,4 +19,5 @@
     "SentenceTransformerEmbeddingFunctionConfig",
     "OpenAIEmbeddingFunctionConfig",
     "CustomEmbeddingFunctionConfig",
+    "CachedEmbeddingFunction",
 ]
@@ -0,0 +1,56 @@
+from typing import Any, Dict, List
+
+import numpy as np
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings, Space
+
+from ..embedding_cache import EmbeddingCache
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """A ChromaDB embedding function that looks up embeddings in an :class:`~autogen_ext.memory.embedding_cache.EmbeddingCache`
+    and only calls the wrapped function for the texts not cached.
+
+    The wrapper reports the name and configuration of the wrapped function, so ChromaDB treats
+    collections created with and without the cache alike.
+
+    Args:
+        embedding_function (EmbeddingFunction[Documents]): The embedding function to wrap.
+        embedding_cache (EmbeddingCache): The cache to use.
+        model_name (str): The name of the embedding model, which the cache entries are keyed by.
+    """
+
+    def __init__(
+        self, embedding_function: EmbeddingFunction[Documents], embedding_cache: EmbeddingCache, model_name: str
+    ) -> None:
+        self._embedding_function = embedding_function
+        self._embedding_cache = embedding_cache
+        self._model_name = model_name
+
+    def __call__(self, input: Documents) -> Embeddings:
+        embeddings = self._embedding_cache.embed(self._model_name, list(input), self._embedding_function)
+        return [np.array(embedding, dtype=np.float32) for embedding in embeddings]
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        # Some models embed queries differently from documents, so queries get their own entries.
+        embeddings = self._embedding_cache.embed(
+            f"{self._model_name}#query", list(input), self._embedding_function.embed_query
+        )
+        return [np.array(embedding, dtype=np.float32) for embedding in embeddings]
+
+    def name(self) -> str:  # type: ignore[override]
+        return self._embedding_function.name()
+
+    def default_space(self) -> Space:
+        return self._embedding_function.default_space()
+
+    def supported_spaces(self) -> List[Space]:
+        return self._embedding_function.supported_spaces()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self._embedding_function.get_config()
+
+    def validate_config_update(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        self._embedding_function.validate_config_update(old_config, new_config)
+
+    def is_legacy(self) -> bool:
+        return self._embedding_function.is_legacy()
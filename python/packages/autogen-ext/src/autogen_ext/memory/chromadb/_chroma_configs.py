@@ -2,9 +2,12 @@
 
 from typing import Any, Callable, Dict, Literal, Union
 
-from pydantic import BaseModel, Field
+from autogen_core import ComponentModel
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from typing_extensions import Annotated
 
+from ..embedding_cache import EmbeddingCache
+
 
 class DefaultEmbeddingFunctionConfig(BaseModel):
     """Configuration for the default ChromaDB embedding function.
@@ -107,6 +110,8 @@ class ChromaDBVectorMemoryConfig(BaseModel):
        Added support for custom embedding functions via embedding_function_config.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     client_type: Literal["persistent", "http"]
     collection_name: str = Field(default="memory_store", description="Name of the ChromaDB collection")
     distance_metric: str = Field(default="cosine", description="Distance metric for similarity search")
@@ -118,6 +123,33 @@ class ChromaDBVectorMemoryConfig(BaseModel):
     embedding_function_config: EmbeddingFunctionConfig = Field(
         default_factory=DefaultEmbeddingFunctionConfig, description="Configuration for the embedding function"
     )
+    batch_size: int = Field(
+        default=100,
+        gt=0,
+        description="Maximum number of memories embedded and inserted, or queries run, per ChromaDB request",
+    )
+    write_buffer_size: int = Field(
+        default=0,
+        ge=0,
+        description="Number of added memories buffered before they are written. 0 writes every add immediately",
+    )
+    write_buffer_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds after which buffered memories are written even if the buffer is not full",
+    )
+    embedding_cache: EmbeddingCache | ComponentModel | None = Field(
+        default=None,
+        description="Cache of the embeddings of documents and queries. Pass the same instance to several memories to share it",
+    )
+
+    @field_serializer("embedding_cache")
+    def _serialize_embedding_cache(
+        self, embedding_cache: EmbeddingCache | ComponentModel | None
+    ) -> Dict[str, Any] | None:
+        if isinstance(embedding_cache, EmbeddingCache):
+            embedding_cache = embedding_cache.dump_component()
+        return embedding_cache.model_dump() if embedding_cache is not None else None
 
 
 class PersistentChromaDBVectorMemoryConfig(ChromaDBVectorMemoryConfig):
@@ -1,16 +1,21 @@
+import asyncio
+import functools
 import logging
 import uuid
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple, TypeVar
 
-from autogen_core import CancellationToken, Component, Image
+from autogen_core import CancellationToken, Component, ComponentModel, Image
 from autogen_core.memory import Memory, MemoryContent, MemoryMimeType, MemoryQueryResult, UpdateContextResult
 from autogen_core.model_context import ChatCompletionContext
 from autogen_core.models import SystemMessage
 from chromadb import HttpClient, PersistentClient
 from chromadb.api.models.Collection import Collection
-from chromadb.api.types import Document, Metadata
+from chromadb.api.types import Document, Metadata, QueryResult
 from typing_extensions import Self
 
+from ..embedding_cache import EmbeddingCache
+from ._cached_embedding_function import CachedEmbeddingFunction
 from ._chroma_configs import (
     ChromaDBVectorMemoryConfig,
     CustomEmbeddingFunctionConfig,
@@ -23,6 +28,8 @@
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 try:
     from chromadb.api import ClientAPI
@@ -45,6 +52,13 @@ class ChromaDBVectorMemory(Memory, Component[ChromaDBVectorMemoryConfig]):
     For advanced use cases requiring specialized formatting of retrieved content, users should extend
     this class and override the `update_context()` method.
 
+    The ChromaDB client is synchronous, so every call to it, including embedding, runs on a dedicated
+    worker thread instead of the event loop. :meth:`add_many` embeds and inserts memories in batches
+    of ``batch_size``. With ``write_buffer_size`` set, added memories are buffered and written once the
+    buffer is full or ``write_buffer_interval`` seconds have passed; queries write the buffer first, so
+    they always see earlier additions. Concurrent queries without extra arguments are combined into a
+    single multi-query request.
+
     This implementation requires the ChromaDB extra to be installed. Install with:
 
     .. code-block:: bash
@@ -178,14 +192,35 @@ async def main() -> None:
 
     def __init__(self, config: ChromaDBVectorMemoryConfig | None = None) -> None:
         self._config = config or PersistentChromaDBVectorMemoryConfig()
+        embedding_cache = self._config.embedding_cache
+        self._embedding_cache = (
+            EmbeddingCache.load_component(embedding_cache)
+            if isinstance(embedding_cache, ComponentModel)
+            else embedding_cache
+        )
         self._client: ClientAPI | None = None
         self._collection: Collection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Records of (id, document, metadata) added but not yet written.
+        self._write_buffer: List[Tuple[str, str, Metadata]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Flushes run one at a time, so a query that flushes waits for a flush already writing its memories.
+        self._flush_lock = asyncio.Lock()
+        # The error of the last failed background write, whose memories are still buffered.
+        self._flush_error: Exception | None = None
+        self._pending_queries: List[Tuple[str, asyncio.Future[MemoryQueryResult]]] = []
+        self._query_task: asyncio.Task[None] | None = None
 
     @property
     def collection_name(self) -> str:
         """Get the name of the ChromaDB collection."""
         return self._config.collection_name
 
+    @property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        """(Experimental) The embedding cache of the memory, if any."""
+        return self._embedding_cache
+
     def _create_embedding_function(self) -> Any:
         """Create an embedding function based on the configuration.
 
@@ -235,6 +270,15 @@ def _create_embedding_function(self) -> Any:
         else:
             raise ValueError(f"Unsupported embedding function config type: {type(config)}")
 
+    def _embedding_model_name(self) -> str:
+        """The name the embeddings of the configured embedding function are cached under."""
+        config = self._config.embedding_function_config
+        if isinstance(config, DefaultEmbeddingFunctionConfig):
+            return "chromadb:default"
+        if isinstance(config, (SentenceTransformerEmbeddingFunctionConfig, OpenAIEmbeddingFunctionConfig)):
+            return f"{config.function_type}:{config.model_name}"
+        return f"custom:{config.function.__module__}.{config.function.__qualname__}"
+
     def _ensure_initialized(self) -> None:
         """Ensure ChromaDB client and collection are initialized."""
         if self._client is None:
@@ -270,6 +314,10 @@ def _ensure_initialized(self) -> None:
             try:
                 # Create embedding function
                 embedding_function = self._create_embedding_function()
+                if self._embedding_cache is not None:
+                    embedding_function = CachedEmbeddingFunction(
+                        embedding_function, self._embedding_cache, self._embedding_model_name()
+                    )
 
                 # Create or get collection with embedding function
                 self._collection = self._client.get_or_create_collection(
@@ -281,6 +329,23 @@ def _ensure_initialized(self) -> None:
                 logger.error(f"Failed to get/create collection: {e}")
                 raise
 
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking ChromaDB call on the worker thread."""
+        if self._executor is None:
+            # A single thread keeps the calls in order and never uses the client concurrently.
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chromadb")
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _get_collection(self) -> Collection:
+        """Initialize the client and collection on the worker thread if needed."""
+        if self._collection is None:
+            await self._run(self._ensure_initialized)
+        if self._collection is None:
+            raise RuntimeError("Failed to initialize ChromaDB")
+        return self._collection
+
     def _extract_text(self, content_item: str | MemoryContent) -> str:
         """Extract searchable text from content."""
         if isinstance(content_item, str):
@@ -307,6 +372,47 @@ def _calculate_score(self, distance: float) -> float:
             return 1.0 - (distance / 2.0)
         return 1.0 / (1.0 + distance)
 
+    def _to_record(self, content: MemoryContent) -> Tuple[str, str, Metadata]:
+        """Convert content to the id, document and metadata stored in ChromaDB."""
+        text = self._extract_text(content)
+        metadata_dict = dict(content.metadata or {})
+        metadata_dict["mime_type"] = str(content.mime_type)
+        return str(uuid.uuid4()), text, metadata_dict
+
+    def _to_query_result(self, results: QueryResult, index: int) -> MemoryQueryResult:
+        """Convert the results of the query at ``index`` of a ChromaDB request to memory contents."""
+        memory_results: List[MemoryContent] = []
+
+        if not results or not results.get("documents") or not results.get("metadatas") or not results.get("distances"):
+            return MemoryQueryResult(results=memory_results)
+
+        documents: List[Document] = results["documents"][index] if results["documents"] else []
+        metadatas: List[Metadata] = results["metadatas"][index] if results["metadatas"] else []
+        distances: List[float] = results["distances"][index] if results["distances"] else []
+        ids: List[str] = results["ids"][index] if results["ids"] else []
+
+        for doc, metadata_dict, distance, doc_id in zip(documents, metadatas, distances, ids, strict=False):
+            # Calculate score
+            score = self._calculate_score(distance)
+            metadata = dict(metadata_dict)
+            metadata["score"] = score
+            metadata["id"] = doc_id
+            if self._config.score_threshold is not None and score < self._config.score_threshold:
+                continue
+
+            # Extract mime_type from metadata
+            mime_type = str(metadata_dict.get("mime_type", MemoryMimeType.TEXT.value))
+
+            # Create MemoryContent
+            content = MemoryContent(
+                content=doc,
+                mime_type=mime_type,
+                metadata=metadata,
+            )
+            memory_results.append(content)
+
+        return MemoryQueryResult(results=memory_results)
+
     async def update_context(
         self,
         model_context: ChatCompletionContext,
@@ -333,21 +439,79 @@ async def update_context(
         return UpdateContextResult(memories=query_results)
 
     async def add(self, content: MemoryContent, cancellation_token: CancellationToken | None = None) -> None:
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
-
-        try:
-            # Extract text from content
-            text = self._extract_text(content)
-
-            # Use metadata directly from content
-            metadata_dict = content.metadata or {}
-            metadata_dict["mime_type"] = str(content.mime_type)
+        await self.add_many([content], cancellation_token)
 
-            # Add to ChromaDB
-            self._collection.add(documents=[text], metadatas=[metadata_dict], ids=[str(uuid.uuid4())])
+    async def add_many(
+        self, contents: Sequence[MemoryContent], cancellation_token: CancellationToken | None = None
+    ) -> None:
+        """Add several memories, embedding and inserting them in batches of ``batch_size``.
 
+        If ``write_buffer_size`` is set, the memories are buffered and written in the background
+        once the buffer is full or ``write_buffer_interval`` seconds have passed. If a background
+        write failed, the buffered memories are written first, and the error is raised if they
+        still cannot be written.
+        """
+        records = [self._to_record(content) for content in contents]
+        await self._get_collection()
+        if self._flush_error is not None:
+            await self.flush()
+        if self._config.write_buffer_size == 0:
+            await self._write(records)
+            return
+
+        self._write_buffer.extend(records)
+        if len(self._write_buffer) >= self._config.write_buffer_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write the memories buffered by :meth:`add` and :meth:`add_many`.
+
+        Memories that fail to be written, or whose write is cancelled, stay buffered for the next flush,
+        and the error is raised.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        async with self._flush_lock:
+            buffer = self._write_buffer
+            remaining = len(buffer)
+            # A buffer discarded by clear or reset is replaced, and is not written further.
+            while remaining > 0 and buffer is self._write_buffer:
+                batch = buffer[: min(remaining, self._config.batch_size)]
+                await self._write(batch)
+                # Take the batch off the buffer only once it is written.
+                del buffer[: len(batch)]
+                remaining -= len(batch)
+            # The memories of a failed background write are now written.
+            self._flush_error = None
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._config.write_buffer_interval)
+        # Clear the task first, so a flush started meanwhile does not cancel this write.
+        self._flush_task = None
+        count = len(self._write_buffer)
+        try:
+            await self.flush()
+        except Exception as e:
+            # The memories stay buffered, and the error is raised by the next add, flush or close.
+            logger.error(f"Failed to write {count} buffered memories to ChromaDB: {e}")
+            self._flush_error = e
+
+    async def _write(self, records: List[Tuple[str, str, Metadata]]) -> None:
+        if not records:
+            return
+        collection = await self._get_collection()
+        try:
+            for start in range(0, len(records), self._config.batch_size):
+                batch = records[start : start + self._config.batch_size]
+                await self._run(
+                    collection.add,
+                    ids=[record[0] for record in batch],
+                    documents=[record[1] for record in batch],
+                    metadatas=[record[2] for record in batch],
+                )
         except Exception as e:
             logger.error(f"Failed to add content to ChromaDB: {e}")
             raise
@@ -358,90 +522,103 @@ async def query(
         cancellation_token: CancellationToken | None = None,
         **kwargs: Any,
     ) -> MemoryQueryResult:
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
-
-        try:
-            # Extract text for query
-            query_text = self._extract_text(query)
-
-            # Query ChromaDB
-            results = self._collection.query(
-                query_texts=[query_text],
-                n_results=self._config.k,
-                include=["documents", "metadatas", "distances"],
-                **kwargs,
-            )
-
-            # Convert results to MemoryContent list
-            memory_results: List[MemoryContent] = []
-
-            if (
-                not results
-                or not results.get("documents")
-                or not results.get("metadatas")
-                or not results.get("distances")
-            ):
-                return MemoryQueryResult(results=memory_results)
-
-            documents: List[Document] = results["documents"][0] if results["documents"] else []
-            metadatas: List[Metadata] = results["metadatas"][0] if results["metadatas"] else []
-            distances: List[float] = results["distances"][0] if results["distances"] else []
-            ids: List[str] = results["ids"][0] if results["ids"] else []
-
-            for doc, metadata_dict, distance, doc_id in zip(documents, metadatas, distances, ids, strict=False):
-                # Calculate score
-                score = self._calculate_score(distance)
-                metadata = dict(metadata_dict)
-                metadata["score"] = score
-                metadata["id"] = doc_id
-                if self._config.score_threshold is not None and score < self._config.score_threshold:
-                    continue
-
-                # Extract mime_type from metadata
-                mime_type = str(metadata_dict.get("mime_type", MemoryMimeType.TEXT.value))
+        # Extract text for query
+        query_text = self._extract_text(query)
+        collection = await self._get_collection()
+        await self.flush()
 
-                # Create MemoryContent
-                content = MemoryContent(
-                    content=doc,
-                    mime_type=mime_type,
-                    metadata=metadata,
+        if kwargs:
+            # Queries with extra arguments, such as filters, cannot share a request with others.
+            try:
+                results = await self._run(
+                    collection.query,
+                    query_texts=[query_text],
+                    n_results=self._config.k,
+                    include=["documents", "metadatas", "distances"],
+                    **kwargs,
                 )
-                memory_results.append(content)
+                return self._to_query_result(results, 0)
+            except Exception as e:
+                logger.error(f"Failed to query ChromaDB: {e}")
+                raise
 
-            return MemoryQueryResult(results=memory_results)
+        future: asyncio.Future[MemoryQueryResult] = asyncio.get_running_loop().create_future()
+        self._pending_queries.append((query_text, future))
+        if self._query_task is None:
+            self._query_task = asyncio.create_task(self._run_pending_queries())
+        return await future
 
-        except Exception as e:
-            logger.error(f"Failed to query ChromaDB: {e}")
-            raise
+    async def _run_pending_queries(self) -> None:
+        """Run the queries pending when the task starts, and those added while a request is in flight, in batches."""
+        try:
+            while self._pending_queries:
+                batch = self._pending_queries[: self._config.batch_size]
+                del self._pending_queries[: len(batch)]
+                try:
+                    collection = await self._get_collection()
+                    results = await self._run(
+                        collection.query,
+                        query_texts=[query_text for query_text, _ in batch],
+                        n_results=self._config.k,
+                        include=["documents", "metadatas", "distances"],
+                    )
+                    query_results = [self._to_query_result(results, index) for index in range(len(batch))]
+                except Exception as e:
+                    logger.error(f"Failed to query ChromaDB: {e}")
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                for (_, future), query_result in zip(batch, query_results, strict=True):
+                    if not future.done():
+                        future.set_result(query_result)
+        finally:
+            self._query_task = None
+
+    def _discard_write_buffer(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._write_buffer = []
+        self._flush_error = None
 
     async def clear(self) -> None:
-        self._ensure_initialized()
-        if self._collection is None:
-            raise RuntimeError("Failed to initialize ChromaDB")
+        collection = await self._get_collection()
+        self._discard_write_buffer()
 
         try:
-            results = self._collection.get()
+            results = await self._run(collection.get)
             if results and results["ids"]:
-                self._collection.delete(ids=results["ids"])
+                await self._run(collection.delete, ids=results["ids"])
         except Exception as e:
             logger.error(f"Failed to clear ChromaDB collection: {e}")
             raise
 
     async def close(self) -> None:
-        """Clean up ChromaDB client and resources."""
-        self._collection = None
-        self._client = None
+        """Write buffered memories, then clean up ChromaDB client and resources."""
+        try:
+            if self._collection is not None:
+                await self.flush()
+            if self._query_task is not None:
+                await self._query_task
+        finally:
+            self._discard_write_buffer()
+            self._collection = None
+            self._client = None
+            if self._executor is not None:
+                # Pending calls have been awaited above, so the worker thread is idle.
+                self._executor.shutdown(wait=False)
+                self._executor = None
 
     async def reset(self) -> None:
-        self._ensure_initialized()
+        await self._get_collection()
         if not self._config.allow_reset:
             raise RuntimeError("Reset not allowed. Set allow_reset=True in config to enable.")
 
+        self._discard_write_buffer()
         if self._client is not None:
             try:
-                self._client.reset()
+                await self._run(self._client.reset)
             except Exception as e:
                 logger.error(f"Error during ChromaDB reset: {e}")
             finally:
@@ -0,0 +1,3 @@
+from ._embedding_cache import EmbeddingCache, EmbeddingCacheConfig, EmbeddingCacheStats
+
+__all__ = ["EmbeddingCache", "EmbeddingCacheConfig", "EmbeddingCacheStats"]
@@ -0,0 +1,198 @@
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from autogen_core import CacheStore, Component, ComponentBase, ComponentModel
+from pydantic import BaseModel, Field
+from typing_extensions import Self
+
+
+class EmbeddingCacheConfig(BaseModel):
+    """Configuration for :class:`EmbeddingCache`."""
+
+    max_entries: int = Field(default=10_000, gt=0, description="Embeddings kept in the in-memory tier")
+    store: Optional[ComponentModel] = Field(default=None, description="Cache store of the second tier")
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters of an :class:`EmbeddingCache`."""
+
+    hits: int
+    """Lookups answered by the in-memory tier."""
+    store_hits: int
+    """Lookups answered by the store tier."""
+    misses: int
+    """Lookups that had to be embedded."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups answered by either tier."""
+        lookups = self.hits + self.store_hits + self.misses
+        return (self.hits + self.store_hits) / lookups if lookups else 0.0
+
+
+class EmbeddingCache(ComponentBase[BaseModel], Component[EmbeddingCacheConfig]):
+    """A cache of text embeddings that memory backends can share.
+
+    Embeddings are keyed by the name of the embedding model and a hash of the text, so
+    backends that use the same model share entries, while different models never do. The
+    most recently used ``max_entries`` embeddings are kept in memory; with a ``store``, such
+    as a :class:`~autogen_ext.cache_store.diskcache.DiskCacheStore` or a
+    :class:`~autogen_ext.cache_store.redis.RedisStore`, every embedding is also written to
+    it, and in-memory misses are looked up there before embedding, so entries survive
+    restarts or are shared between processes. Embeddings are stored as float32.
+
+    The cache can be set on :class:`~autogen_ext.memory.chromadb.ChromaDBVectorMemoryConfig`,
+    :class:`~autogen_ext.memory.redis.RedisMemoryConfig` and the task-centric memory's
+    ``MemoryBankConfig``. Passing the same instance to several backends shares it between
+    them. The cache is thread-safe.
+
+    Example:
+
+        .. code-block:: python
+
+            import tempfile
+
+            from autogen_ext.cache_store.diskcache import DiskCacheStore
+            from autogen_ext.memory.chromadb import ChromaDBVectorMemory, PersistentChromaDBVectorMemoryConfig
+            from autogen_ext.memory.embedding_cache import EmbeddingCache
+            from diskcache import Cache
+
+            with tempfile.TemporaryDirectory() as tmpdir:
+                embedding_cache = EmbeddingCache(max_entries=50_000, store=DiskCacheStore[bytes](Cache(tmpdir)))
+                memory = ChromaDBVectorMemory(
+                    config=PersistentChromaDBVectorMemoryConfig(embedding_cache=embedding_cache),
+                )
+                # ... use the memory ...
+                print(embedding_cache.stats.hit_rate)
+
+    Args:
+        max_entries (int): The number of embeddings kept in memory. Defaults to 10000.
+        store (CacheStore[bytes] | None): An optional second tier that holds every embedding.
+            The user is responsible for managing the store's lifecycle.
+    """
+
+    component_type = "embedding_cache"
+    component_config_schema = EmbeddingCacheConfig
+    component_provider_override = "autogen_ext.memory.embedding_cache.EmbeddingCache"
+
+    def __init__(self, max_entries: int = 10_000, store: Optional[CacheStore[bytes]] = None) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be greater than 0.")
+        self._max_entries = max_entries
+        self._store = store
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._store_hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> EmbeddingCacheStats:
+        """(Experimental) The hit and miss counters since the cache was created or :meth:`reset_stats` was called."""
+        with self._lock:
+            return EmbeddingCacheStats(hits=self._hits, store_hits=self._store_hits, misses=self._misses)
+
+    def reset_stats(self) -> None:
+        """(Experimental) Reset the hit and miss counters."""
+        with self._lock:
+            self._hits = self._store_hits = self._misses = 0
+
+    @staticmethod
+    def key(model_name: str, text: str) -> str:
+        """The cache key of the embedding of ``text`` by ``model_name``."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"embedding:{hashlib.sha256(model_name.encode('utf-8')).hexdigest()[:16]}:{digest}"
+
+    def get_many(self, model_name: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """(Experimental) Look up the embeddings of ``texts``, with ``None`` for the ones not cached."""
+        keys = [self.key(model_name, text) for text in texts]
+        values: List[Optional[bytes]] = []
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                values.append(value)
+
+        if self._store is not None:
+            found: Dict[str, bytes] = {}
+            store_hits = 0
+            for index, key in enumerate(keys):
+                if values[index] is None:
+                    value = found.get(key) or self._store.get(key)
+                    if value is not None:
+                        values[index] = found[key] = value
+                        store_hits += 1
+            if found:
+                with self._lock:
+                    self._store_hits += store_hits
+                    self._insert(found)
+
+        with self._lock:
+            self._misses += len([value for value in values if value is None])
+        return [_decode(value) if value is not None else None for value in values]
+
+    def set_many(self, model_name: str, texts: Sequence[str], embeddings: Sequence[Iterable[float]]) -> None:
+        """(Experimental) Store the embeddings of ``texts``."""
+        values = {
+            self.key(model_name, text): _encode(embedding) for text, embedding in zip(texts, embeddings, strict=True)
+        }
+        with self._lock:
+            self._insert(values)
+        if self._store is not None:
+            for key, value in values.items():
+                self._store.set(key, value)
+
+    def embed(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        embed: Callable[[List[str]], Sequence[Iterable[float]]],
+    ) -> List[List[float]]:
+        """(Experimental) Return the embeddings of ``texts``, calling ``embed`` once with the distinct texts not cached."""
+        cached = self.get_many(model_name, texts)
+        missing = list(dict.fromkeys(text for text, embedding in zip(texts, cached, strict=True) if embedding is None))
+        if not missing:
+            return [embedding for embedding in cached if embedding is not None]
+
+        new_embeddings = embed(missing)
+        self.set_many(model_name, missing, new_embeddings)
+        by_text = {text: _decode(_encode(embedding)) for text, embedding in zip(missing, new_embeddings, strict=True)}
+        return [
+            embedding if embedding is not None else by_text[text] for text, embedding in zip(texts, cached, strict=True)
+        ]
+
+    def _insert(self, values: Dict[str, bytes]) -> None:
+        """Insert into the in-memory tier, evicting the least recently used entries. Requires the lock."""
+        for key, value in values.items():
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _to_config(self) -> EmbeddingCacheConfig:
+        return EmbeddingCacheConfig(
+            max_entries=self._max_entries,
+            store=self._store.dump_component() if self._store is not None else None,
+        )
+
+    @classmethod
+    def _from_config(cls, config: EmbeddingCacheConfig) -> Self:
+        store: Optional[CacheStore[bytes]] = CacheStore.load_component(config.store) if config.store else None
+        return cls(max_entries=config.max_entries, store=store)
+
+
+def _encode(embedding: Iterable[float]) -> bytes:
+    return array("f", embedding).tobytes()
+
+
+def _decode(value: bytes) -> List[float]:
+    embedding = array("f")
+    embedding.frombytes(value)
+    return embedding.tolist()
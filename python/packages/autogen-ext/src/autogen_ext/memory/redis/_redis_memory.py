@@ -1,11 +1,13 @@
 import logging
-from typing import Any, Literal
+from typing import Any, Dict, List, Literal
 
-from autogen_core import CancellationToken, Component
+from autogen_core import CancellationToken, Component, ComponentModel
 from autogen_core.memory import Memory, MemoryContent, MemoryMimeType, MemoryQueryResult, UpdateContextResult
 from autogen_core.model_context import ChatCompletionContext
 from autogen_core.models import SystemMessage
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+from ..embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +15,7 @@
     from redis import Redis
     from redisvl.extensions.message_history import SemanticMessageHistory
     from redisvl.utils.utils import deserialize, serialize
+    from redisvl.utils.vectorize import BaseVectorizer, CustomTextVectorizer, HFTextVectorizer
 except ImportError as e:
     raise ImportError("To use Redis Memory RedisVL must be installed. Run `pip install autogen-ext[redisvl]`") from e
 
@@ -26,6 +29,8 @@ class RedisMemoryConfig(BaseModel):
     similarity search parameters, and embedding model.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     redis_url: str = Field(default="redis://localhost:6379", description="url of the Redis instance")
     index_name: str = Field(default="chat_history", description="Name of the Redis collection")
     prefix: str = Field(default="memory", description="prefix of the Redis collection")
@@ -37,6 +42,18 @@ class RedisMemoryConfig(BaseModel):
     model_name: str | None = Field(
         default="sentence-transformers/all-mpnet-base-v2", description="Embedding model name"
     )
+    embedding_cache: EmbeddingCache | ComponentModel | None = Field(
+        default=None,
+        description="Cache of the embeddings of memories and queries. Pass the same instance to several memories to share it",
+    )
+
+    @field_serializer("embedding_cache")
+    def _serialize_embedding_cache(
+        self, embedding_cache: EmbeddingCache | ComponentModel | None
+    ) -> Dict[str, Any] | None:
+        if isinstance(embedding_cache, EmbeddingCache):
+            embedding_cache = embedding_cache.dump_component()
+        return embedding_cache.model_dump() if embedding_cache is not None else None
 
 
 class RedisMemory(Memory, Component[RedisMemoryConfig]):
@@ -175,7 +192,25 @@ def __init__(self, config: RedisMemoryConfig | None = None) -> None:
         self.config = config or RedisMemoryConfig()
         client = Redis.from_url(url=self.config.redis_url)  # type: ignore[reportUknownMemberType]
 
-        self.message_history = SemanticMessageHistory(name=self.config.index_name, redis_client=client)
+        embedding_cache = self.config.embedding_cache
+        self._embedding_cache = (
+            EmbeddingCache.load_component(embedding_cache)
+            if isinstance(embedding_cache, ComponentModel)
+            else embedding_cache
+        )
+        if self._embedding_cache is None:
+            self.message_history = SemanticMessageHistory(name=self.config.index_name, redis_client=client)
+        else:
+            self.message_history = SemanticMessageHistory(
+                name=self.config.index_name,
+                redis_client=client,
+                vectorizer=_cached_vectorizer(self.config.model_name, self._embedding_cache),
+            )
+
+    @property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        """(Experimental) The embedding cache of the memory, if any."""
+        return self._embedding_cache
 
     async def update_context(
         self,
@@ -297,3 +332,20 @@ async def clear(self) -> None:
     async def close(self) -> None:
         """Clears all entries from memory, and cleans up Redis client, index and resources."""
         self.message_history.delete()
+
+
+def _cached_vectorizer(model_name: str | None, embedding_cache: EmbeddingCache) -> BaseVectorizer:  # type: ignore[no-any-unimported]
+    """Wrap the Hugging Face vectorizer for ``model_name`` so it only embeds texts that are not cached."""
+    vectorizer = HFTextVectorizer(model=model_name) if model_name else HFTextVectorizer()
+
+    def embed_many(texts: List[str], **kwargs: Any) -> List[List[float]]:
+        return embedding_cache.embed(
+            vectorizer.model,
+            texts,
+            lambda missing: vectorizer.embed_many(missing, **kwargs),
+        )
+
+    def embed(text: str, **kwargs: Any) -> List[float]:
+        return embed_many([text], **kwargs)[0]
+
+    return CustomTextVectorizer(embed=embed, embed_many=embed_many, dtype=vectorizer.dtype)
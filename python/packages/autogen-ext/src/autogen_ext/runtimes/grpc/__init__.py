@@ -1,3 +1,4 @@
+from ._flow_control import ConnectionMetrics, FlowControlConfig, SheddingPolicy
 from ._worker_runtime import GrpcWorkerAgentRuntime
 from ._worker_runtime_host import GrpcWorkerAgentRuntimeHost
 from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
@@ -10,6 +11,9 @@
     ) from e
 
 __all__ = [
+    "ConnectionMetrics",
+    "FlowControlConfig",
+    "SheddingPolicy",
     "GrpcWorkerAgentRuntime",
     "GrpcWorkerAgentRuntimeHost",
     "GrpcWorkerAgentRuntimeHostServicer",
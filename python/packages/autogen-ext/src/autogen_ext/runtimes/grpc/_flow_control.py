@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Literal
+
+logger = logging.getLogger("autogen_core")
+
+SheddingPolicy = Literal["block", "drop_newest", "drop_oldest", "disconnect"]
+"""What the host does once a client has been detected as a slow consumer.
+
+- ``"block"``: keep waiting for queue space or credit (pure backpressure).
+- ``"drop_newest"``: drop the message that could not be enqueued.
+- ``"drop_oldest"``: evict the oldest queued message to make room for the new one.
+- ``"disconnect"``: close the connection to the client and drop everything queued for it.
+"""
+
+
+@dataclass
+class FlowControlConfig:
+    """Credit-based flow control settings for a gRPC channel connection.
+
+    The defaults keep queues unbounded and the outstanding window unlimited, which
+    matches the behavior of the runtime without flow control.
+
+    Args:
+        max_queue_size (int): Maximum number of messages buffered in each send and receive queue.
+            ``0`` means unbounded.
+        window_size (int): Maximum number of RPC requests that may be outstanding (sent but
+            not yet answered) for a single client. Each request consumes one credit and
+            the credit is returned when the response arrives. ``0`` means unlimited.
+        max_inflight_messages (int): Worker side only. Maximum number of requests and events
+            handled concurrently. When reached, the worker stops reading from the channel so
+            that backpressure propagates to the host. Responses are never limited. ``0`` means
+            unlimited.
+        slow_consumer_timeout (float): Seconds a send may wait for queue space or credit before the
+            receiving client is flagged as a slow consumer and the shedding policy applies.
+        shedding_policy (SheddingPolicy): Host side action taken for slow consumers.
+    """
+
+    max_queue_size: int = 0
+    window_size: int = 0
+    max_inflight_messages: int = 0
+    slow_consumer_timeout: float = 5.0
+    shedding_policy: SheddingPolicy = "block"
+
+    def __post_init__(self) -> None:
+        if self.max_queue_size < 0:
+            raise ValueError("max_queue_size must be non-negative.")
+        if self.window_size < 0:
+            raise ValueError("window_size must be non-negative.")
+        if self.max_inflight_messages < 0:
+            raise ValueError("max_inflight_messages must be non-negative.")
+        if self.slow_consumer_timeout <= 0:
+            raise ValueError("slow_consumer_timeout must be positive.")
+
+
+@dataclass
+class ConnectionMetrics:
+    """A point-in-time snapshot of the queues and credits of a single client connection."""
+
+    client_id: str
+    send_queue_depth: int
+    send_queue_capacity: int
+    recv_queue_depth: int
+    recv_queue_capacity: int
+    window_size: int
+    outstanding: int
+    messages_sent: int
+    messages_received: int
+    messages_shed: int
+    slow_consumer_events: int
+    is_slow_consumer: bool
+
+    @property
+    def credits_available(self) -> int | None:
+        """Remaining credits, or ``None`` if the window is unlimited."""
+        if self.window_size == 0:
+            return None
+        return self.window_size - self.outstanding
+
+
+class CreditWindow:
+    """Counts outstanding requests against a fixed window of credits.
+
+    A window size of ``0`` disables the limit; credits are still counted so that
+    the number of outstanding requests shows up in the metrics. Waiters are served
+    in FIFO order.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._outstanding = 0
+        self._waiters: Deque[asyncio.Future[None]] = deque()
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def outstanding(self) -> int:
+        return self._outstanding
+
+    def try_acquire(self) -> bool:
+        if self._closed or self._waiters or (self._size != 0 and self._outstanding >= self._size):
+            return False
+        self._outstanding += 1
+        return True
+
+    async def acquire(self, timeout: float | None = None) -> bool:
+        """Acquire one credit. Returns ``False`` if no credit became available within ``timeout``."""
+        if self.try_acquire():
+            return True
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # A credit handed over just before the timeout or cancellation is passed on.
+            if waiter.done() and not waiter.cancelled() and not self._closed:
+                self.release()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        return not self._closed
+
+    def release(self) -> None:
+        # Hand the credit directly to the next waiter, if any, so the outstanding count is unchanged.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        if self._outstanding == 0:
+            logger.warning("Credit released without a matching acquire.")
+            return
+        self._outstanding -= 1
+
+    def close(self) -> None:
+        """Wake up every waiter without granting a credit. Later acquires fail immediately."""
+        self._closed = True
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
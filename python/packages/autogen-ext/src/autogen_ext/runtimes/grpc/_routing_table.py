@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set
+
+from autogen_core import AgentId, Subscription, TopicId, TypePrefixSubscription, TypeSubscription
+
+logger = logging.getLogger("autogen_core")
+
+ClientConnectionId = str
+
+_EMPTY: FrozenSet[ClientConnectionId] = frozenset()
+
+
+def _increment(index: Dict[str, Dict[str, int]], key: str, agent_type: str) -> None:
+    counts = index.setdefault(key, {})
+    counts[agent_type] = counts.get(agent_type, 0) + 1
+
+
+def _decrement(index: Dict[str, Dict[str, int]], key: str, agent_type: str) -> None:
+    counts = index[key]
+    counts[agent_type] -= 1
+    if counts[agent_type] == 0:
+        del counts[agent_type]
+    if not counts:
+        del index[key]
+
+
+class HostRoutingTable:
+    """Routes topics and agent types to client connections for the gRPC host.
+
+    Topic types are mapped straight to a precomputed set of client ids. The mapping is
+    indexed by exact topic type for :class:`~autogen_core.TypeSubscription` and by prefix
+    for :class:`~autogen_core.TypePrefixSubscription`, and it is updated incrementally when
+    agent types are registered, subscriptions are added or removed, and clients disconnect:
+    only the topic types affected by a change are recomputed.
+
+    Readers never take a lock. The route and agent type maps are published as snapshots
+    and every write builds new maps and swaps the reference (copy-on-write), so a reader
+    holding a snapshot keeps seeing a consistent view. The only in-place changes to a
+    published route map are memoizing the route of a topic type seen for the first time,
+    which is computed from the same state as the snapshot, and keeping it in LRU order.
+    Routes to no client are not memoized, and at most ``max_routes`` routes are kept, so
+    that topic types published once, like per-session topics, do not accumulate.
+
+    Subscriptions of any other type cannot be indexed by topic type, so they are matched
+    against every topic on lookup.
+
+    Args:
+        max_routes: Maximum number of memoized routes.
+    """
+
+    def __init__(self, max_routes: int = 10000) -> None:
+        self._max_routes = max_routes
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._subscription_owner: Dict[str, ClientConnectionId] = {}
+        # topic type -> agent type -> number of subscriptions.
+        self._exact_index: Dict[str, Dict[str, int]] = {}
+        # topic type prefix -> agent type -> number of subscriptions.
+        self._prefix_index: Dict[str, Dict[str, int]] = {}
+        # agent type -> topic types and prefixes it is subscribed to, used to find affected routes.
+        self._agent_topic_types: Dict[str, Set[str]] = {}
+        self._agent_prefixes: Dict[str, Set[str]] = {}
+        self._unindexed: Dict[str, Subscription] = {}
+        # Published snapshots.
+        self._agent_type_to_client_id: Mapping[str, ClientConnectionId] = {}
+        self._routes: OrderedDict[str, FrozenSet[ClientConnectionId]] = OrderedDict()
+
+    @property
+    def subscriptions(self) -> Sequence[Subscription]:
+        return list(self._subscriptions.values())
+
+    def get_client_id(self, agent_type: str) -> ClientConnectionId | None:
+        """Return the client that registered the agent type, if any."""
+        return self._agent_type_to_client_id.get(agent_type)
+
+    def get_client_ids(self, topic_id: TopicId) -> FrozenSet[ClientConnectionId]:
+        """Return the clients that host at least one agent subscribed to the topic."""
+        routes = self._routes
+        client_ids = routes.get(topic_id.type)
+        if client_ids is not None:
+            routes.move_to_end(topic_id.type)
+        else:
+            client_ids = self._compute_route(topic_id.type, self._agent_type_to_client_id)
+            if client_ids:
+                routes[topic_id.type] = client_ids
+                if len(routes) > self._max_routes:
+                    routes.popitem(last=False)
+        if not self._unindexed:
+            return client_ids
+        agent_type_to_client_id = self._agent_type_to_client_id
+        extra: Set[ClientConnectionId] = set()
+        for subscription in self._unindexed.values():
+            if subscription.is_match(topic_id):
+                client_id = agent_type_to_client_id.get(subscription.map_to_agent(topic_id).type)
+                if client_id is not None:
+                    extra.add(client_id)
+        return client_ids | extra if extra else client_ids
+
+    def get_subscribed_recipients(self, topic_id: TopicId) -> List[AgentId]:
+        """Return the agents subscribed to the topic. Intended for introspection, not for routing."""
+        return [
+            subscription.map_to_agent(topic_id)
+            for subscription in self._subscriptions.values()
+            if subscription.is_match(topic_id)
+        ]
+
+    def register_agent_type(self, agent_type: str, client_id: ClientConnectionId) -> None:
+        """Register the agent type to the client.
+
+        Raises:
+            ValueError: If the agent type is already registered.
+        """
+        existing_client_id = self._agent_type_to_client_id.get(agent_type)
+        if existing_client_id is not None:
+            raise ValueError(f"Agent type {agent_type} already registered with client {existing_client_id}.")
+        agent_type_to_client_id = dict(self._agent_type_to_client_id)
+        agent_type_to_client_id[agent_type] = client_id
+        self._publish(agent_type_to_client_id, self._affected_topic_types([agent_type]))
+
+    def add_subscription(self, subscription: Subscription, client_id: ClientConnectionId) -> None:
+        """Add a subscription owned by the client.
+
+        Raises:
+            ValueError: If the subscription already exists.
+        """
+        if self._is_duplicate(subscription):
+            raise ValueError("Subscription already exists")
+        self._subscriptions[subscription.id] = subscription
+        self._subscription_owner[subscription.id] = client_id
+        self._index(subscription)
+        self._publish(self._agent_type_to_client_id, self._affected_by_subscription(subscription))
+
+    def remove_subscription(self, id: str) -> None:
+        """Remove a subscription.
+
+        Raises:
+            ValueError: If the subscription does not exist.
+        """
+        subscription = self._subscriptions.pop(id, None)
+        if subscription is None:
+            raise ValueError("Subscription does not exist")
+        del self._subscription_owner[id]
+        self._unindex(subscription)
+        self._publish(self._agent_type_to_client_id, self._affected_by_subscription(subscription))
+
+    def remove_client(self, client_id: ClientConnectionId) -> None:
+        """Remove every agent type registered by the client and every subscription it added."""
+        agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
+        for agent_type in agent_types:
+            logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
+        subscription_ids = [sub_id for sub_id, owner in self._subscription_owner.items() if owner == client_id]
+        affected = self._affected_topic_types(agent_types)
+        for sub_id in subscription_ids:
+            logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {sub_id}")
+            subscription = self._subscriptions.pop(sub_id)
+            del self._subscription_owner[sub_id]
+            self._unindex(subscription)
+            affected |= self._affected_by_subscription(subscription)
+        agent_type_to_client_id = {
+            agent_type: id_ for agent_type, id_ in self._agent_type_to_client_id.items() if id_ != client_id
+        }
+        self._publish(agent_type_to_client_id, affected)
+
+    def _is_duplicate(self, subscription: Subscription) -> bool:
+        if subscription.id in self._subscriptions:
+            return True
+        match subscription:
+            case TypeSubscription(topic_type=topic_type, agent_type=agent_type):
+                return agent_type in self._exact_index.get(topic_type, {})
+            case TypePrefixSubscription(topic_type_prefix=prefix, agent_type=agent_type):
+                return agent_type in self._prefix_index.get(prefix, {})
+            case _:
+                return any(existing == subscription for existing in self._unindexed.values())
+
+    def _index(self, subscription: Subscription) -> None:
+        match subscription:
+            case TypeSubscription(topic_type=topic_type, agent_type=agent_type):
+                _increment(self._exact_index, topic_type, agent_type)
+                self._agent_topic_types.setdefault(agent_type, set()).add(topic_type)
+            case TypePrefixSubscription(topic_type_prefix=prefix, agent_type=agent_type):
+                _increment(self._prefix_index, prefix, agent_type)
+                self._agent_prefixes.setdefault(agent_type, set()).add(prefix)
+            case _:
+                self._unindexed[subscription.id] = subscription
+
+    def _unindex(self, subscription: Subscription) -> None:
+        match subscription:
+            case TypeSubscription(topic_type=topic_type, agent_type=agent_type):
+                _decrement(self._exact_index, topic_type, agent_type)
+                if agent_type not in self._exact_index.get(topic_type, {}):
+                    self._agent_topic_types[agent_type].discard(topic_type)
+            case TypePrefixSubscription(topic_type_prefix=prefix, agent_type=agent_type):
+                _decrement(self._prefix_index, prefix, agent_type)
+                if agent_type not in self._prefix_index.get(prefix, {}):
+                    self._agent_prefixes[agent_type].discard(prefix)
+            case _:
+                del self._unindexed[subscription.id]
+
+    def _affected_by_subscription(self, subscription: Subscription) -> Set[str]:
+        """Topic types whose cached route may change with the subscription."""
+        match subscription:
+            case TypeSubscription(topic_type=topic_type):
+                return {topic_type}
+            case TypePrefixSubscription(topic_type_prefix=prefix):
+                return {topic_type for topic_type in self._routes if topic_type.startswith(prefix)}
+            case _:
+                # Unindexed subscriptions are resolved on lookup and never cached.
+                return set()
+
+    def _affected_topic_types(self, agent_types: Iterable[str]) -> Set[str]:
+        affected: Set[str] = set()
+        for agent_type in agent_types:
+            affected.update(self._agent_topic_types.get(agent_type, ()))
+            prefixes = self._agent_prefixes.get(agent_type)
+            if prefixes:
+                affected.update(
+                    topic_type for topic_type in self._routes if any(topic_type.startswith(p) for p in prefixes)
+                )
+        return affected
+
+    def _compute_route(
+        self, topic_type: str, agent_type_to_client_id: Mapping[str, ClientConnectionId]
+    ) -> FrozenSet[ClientConnectionId]:
+        agent_types: Set[str] = set(self._exact_index.get(topic_type, ()))
+        for prefix, counts in self._prefix_index.items():
+            if topic_type.startswith(prefix):
+                agent_types.update(counts)
+        if not agent_types:
+            return _EMPTY
+        client_ids: Set[ClientConnectionId] = set()
+        for agent_type in agent_types:
+            client_id = agent_type_to_client_id.get(agent_type)
+            if client_id is not None:
+                client_ids.add(client_id)
+            else:
+                logger.error(f"Agent {agent_type} and its client not found for topic type {topic_type}.")
+        return frozenset(client_ids)
+
+    def _publish(self, agent_type_to_client_id: Mapping[str, ClientConnectionId], affected: Set[str]) -> None:
+        routes = OrderedDict(self._routes)
+        for topic_type in affected:
+            client_ids = self._compute_route(topic_type, agent_type_to_client_id)
+            if client_ids:
+                routes[topic_type] = client_ids
+            else:
+                routes.pop(topic_type, None)
+        while len(routes) > self._max_routes:
+            routes.popitem(last=False)
+        self._agent_type_to_client_id = agent_type_to_client_id
+        self._routes = routes
@@ -60,6 +60,7 @@
 
 from . import _constants
 from ._constants import GRPC_IMPORT_ERROR_STR
+from ._flow_control import ConnectionMetrics, CreditWindow, FlowControlConfig
 from ._type_helpers import ChannelArgumentType
 from .protos import agent_worker_pb2, agent_worker_pb2_grpc, cloudevent_pb2
 
@@ -115,10 +116,14 @@ class HostConnection:
         )
     ]
 
-    def __init__(self, channel: grpc.aio.Channel, stub: Any) -> None:  # type: ignore
+    def __init__(self, channel: grpc.aio.Channel, stub: Any, flow_control: FlowControlConfig | None = None) -> None:  # type: ignore
         self._channel = channel
-        self._send_queue = asyncio.Queue[agent_worker_pb2.Message]()
-        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message]()
+        self._flow_control = flow_control or FlowControlConfig()
+        self._send_queue = asyncio.Queue[agent_worker_pb2.Message](maxsize=self._flow_control.max_queue_size)
+        self._recv_queue = asyncio.Queue[agent_worker_pb2.Message](maxsize=self._flow_control.max_queue_size)
+        self._credits = CreditWindow(self._flow_control.window_size)
+        self._messages_sent = 0
+        self._messages_received = 0
         self._connection_task: Task[None] | None = None
         self._stub: AgentRpcAsyncStub = stub
         self._client_id = str(uuid.uuid4())
@@ -133,7 +138,10 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
 
     @classmethod
     async def from_host_address(
-        cls, host_address: str, extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG
+        cls,
+        host_address: str,
+        extra_grpc_config: ChannelArgumentType = DEFAULT_GRPC_CONFIG,
+        flow_control: FlowControlConfig | None = None,
     ) -> Self:
         logger.info("Connecting to %s", host_address)
         #  Always use DEFAULT_GRPC_CONFIG and override it with provided grpc_config
@@ -146,7 +154,7 @@ async def from_host_address(
             options=merged_options,
         )
         stub: AgentRpcAsyncStub = agent_worker_pb2_grpc.AgentRpcStub(channel)  # type: ignore
-        instance = cls(channel, stub)
+        instance = cls(channel, stub, flow_control=flow_control)
 
         instance._connection_task = await instance._connect(
             stub, instance._send_queue, instance._recv_queue, instance._client_id
@@ -184,6 +192,8 @@ async def read_loop() -> None:
                     logger.info("EOF")
                     break
                 logger.info(f"Received a message from host: {message}")
+                # Blocks when the receive queue is full, which stops reading from the stream
+                # and lets gRPC flow control push back on the host.
                 await receive_queue.put(message)
                 logger.info("Put message in receive queue")
 
@@ -192,11 +202,39 @@ async def read_loop() -> None:
     async def send(self, message: agent_worker_pb2.Message) -> None:
         logger.info(f"Send message to host: {message}")
         await self._send_queue.put(message)
+        self._messages_sent += 1
         logger.info("Put message in send queue")
 
     async def recv(self) -> agent_worker_pb2.Message:
         logger.info("Getting message from queue")
-        return await self._recv_queue.get()
+        message = await self._recv_queue.get()
+        self._messages_received += 1
+        return message
+
+    async def acquire_credit(self) -> bool:
+        """Wait until the outstanding request window has room for one more request.
+        Returns ``False`` if the connection was closed without granting a credit."""
+        return await self._credits.acquire()
+
+    def release_credit(self) -> None:
+        self._credits.release()
+
+    def metrics(self) -> ConnectionMetrics:
+        return ConnectionMetrics(
+            client_id=self._client_id,
+            send_queue_depth=self._send_queue.qsize(),
+            send_queue_capacity=self._send_queue.maxsize,
+            recv_queue_depth=self._recv_queue.qsize(),
+            recv_queue_capacity=self._recv_queue.maxsize,
+            window_size=self._credits.size,
+            outstanding=self._credits.outstanding,
+            messages_sent=self._messages_sent,
+            messages_received=self._messages_received,
+            # Shedding and slow consumer detection happen on the host.
+            messages_shed=0,
+            slow_consumer_events=0,
+            is_slow_consumer=False,
+        )
 
 
 # TODO: Lots of types need to have protobuf equivalents:
@@ -219,6 +257,10 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     Cross-language agents will additionally require all agents use shared protobuf schemas for any message types that are sent between agents.
 
+    Pass a :class:`~autogen_ext.runtimes.grpc.FlowControlConfig` as ``flow_control`` to bound the
+    send and receive queues, limit the number of outstanding RPC requests and the number of
+    messages handled concurrently. Use :meth:`get_connection_metrics` to inspect queue depths and credits.
+
     .. _agent_worker.proto: https://github.com/microsoft/autogen/blob/main/protos/agent_worker.proto
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
@@ -232,8 +274,15 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        flow_control: FlowControlConfig | None = None,
     ) -> None:
         self._host_address = host_address
+        self._flow_control = flow_control or FlowControlConfig()
+        self._inflight_semaphore: asyncio.Semaphore | None = (
+            asyncio.Semaphore(self._flow_control.max_inflight_messages)
+            if self._flow_control.max_inflight_messages > 0
+            else None
+        )
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
         self._per_type_subscribers: DefaultDict[tuple[str, str], Set[AgentId]] = defaultdict(set)
         self._agent_factories: Dict[
@@ -264,7 +313,7 @@ async def start(self) -> None:
             raise ValueError("Runtime is already running.")
         logger.info(f"Connecting to host: {self._host_address}")
         self._host_connection = await HostConnection.from_host_address(
-            self._host_address, extra_grpc_config=self._extra_grpc_config
+            self._host_address, extra_grpc_config=self._extra_grpc_config, flow_control=self._flow_control
         )
         logger.info("Connection established")
         if self._read_task is None:
@@ -276,6 +325,21 @@ def _raise_on_exception(self, task: Task[Any]) -> None:
         if exception is not None:
             raise exception
 
+    def get_connection_metrics(self) -> ConnectionMetrics:
+        """Return queue depth and credit metrics of the connection to the host."""
+        if self._host_connection is None:
+            raise RuntimeError("Host connection is not set.")
+        return self._host_connection.metrics()
+
+    async def _run_with_inflight_slot(self, process: Callable[[Any], Awaitable[None]], message: Any) -> None:
+        # The slot is taken by the task rather than the read loop, so that the read loop keeps reading
+        # responses, which handlers waiting on their own requests need to finish and free their slots.
+        if self._inflight_semaphore is None:
+            await process(message)
+            return
+        async with self._inflight_semaphore:
+            await process(message)
+
     async def _run_read_loop(self) -> None:
         logger.info("Starting read loop")
         assert self._host_connection is not None
@@ -286,7 +350,7 @@ async def _run_read_loop(self) -> None:
                 oneofcase = agent_worker_pb2.Message.WhichOneof(message, "message")
                 match oneofcase:
                     case "request":
-                        task = asyncio.create_task(self._process_request(message.request))
+                        task = asyncio.create_task(self._run_with_inflight_slot(self._process_request, message.request))
                         self._background_tasks.add(task)
                         task.add_done_callback(self._raise_on_exception)
                         task.add_done_callback(self._background_tasks.discard)
@@ -296,7 +360,9 @@ async def _run_read_loop(self) -> None:
                         task.add_done_callback(self._raise_on_exception)
                         task.add_done_callback(self._background_tasks.discard)
                     case "cloudEvent":
-                        task = asyncio.create_task(self._process_event(message.cloudEvent))
+                        task = asyncio.create_task(
+                            self._run_with_inflight_slot(self._process_event, message.cloudEvent)
+                        )
                         self._background_tasks.add(task)
                         task.add_done_callback(self._raise_on_exception)
                         task.add_done_callback(self._background_tasks.discard)
@@ -381,34 +447,54 @@ async def send_message(
         with self._trace_helper.trace_block(
             "create", recipient, parent=None, extraAttributes={"message_type": data_type}
         ):
-            # create a new future for the result
-            future = asyncio.get_event_loop().create_future()
             request_id = await self._get_new_request_id()
+            # Wait for room in the outstanding request window. The credit is returned when the request is
+            # done: answered, failed or cancelled.
+            host_connection = self._host_connection
+            acquired = await host_connection.acquire_credit()
+            # create a new future for the result
+            future: Future[Any] = asyncio.get_event_loop().create_future()
+            if acquired:
+                future.add_done_callback(lambda _: host_connection.release_credit())
             self._pending_requests[request_id] = future
-            serialized_message = self._serialization_registry.serialize(
-                message, type_name=data_type, data_content_type=JSON_DATA_CONTENT_TYPE
-            )
-            telemetry_metadata = get_telemetry_grpc_metadata()
-            runtime_message = agent_worker_pb2.Message(
-                request=agent_worker_pb2.RpcRequest(
-                    request_id=request_id,
-                    target=agent_worker_pb2.AgentId(type=recipient.type, key=recipient.key),
-                    source=agent_worker_pb2.AgentId(type=sender.type, key=sender.key) if sender is not None else None,
-                    metadata=telemetry_metadata,
-                    payload=agent_worker_pb2.Payload(
-                        data_type=data_type,
-                        data=serialized_message,
-                        data_content_type=JSON_DATA_CONTENT_TYPE,
-                    ),
+            try:
+                serialized_message = self._serialization_registry.serialize(
+                    message, type_name=data_type, data_content_type=JSON_DATA_CONTENT_TYPE
+                )
+                telemetry_metadata = get_telemetry_grpc_metadata()
+                runtime_message = agent_worker_pb2.Message(
+                    request=agent_worker_pb2.RpcRequest(
+                        request_id=request_id,
+                        target=agent_worker_pb2.AgentId(type=recipient.type, key=recipient.key),
+                        source=agent_worker_pb2.AgentId(type=sender.type, key=sender.key)
+                        if sender is not None
+                        else None,
+                        metadata=telemetry_metadata,
+                        payload=agent_worker_pb2.Payload(
+                            data_type=data_type,
+                            data=serialized_message,
+                            data_content_type=JSON_DATA_CONTENT_TYPE,
+                        ),
+                    )
                 )
-            )
 
-            # TODO: Find a way to handle timeouts/errors
-            task = asyncio.create_task(self._send_message(runtime_message, "send", recipient, telemetry_metadata))
-            self._background_tasks.add(task)
-            task.add_done_callback(self._raise_on_exception)
-            task.add_done_callback(self._background_tasks.discard)
-            return await future
+                # TODO: Find a way to handle timeouts/errors
+                task = asyncio.create_task(self._send_message(runtime_message, "send", recipient, telemetry_metadata))
+
+                def fail_request(task: Task[None]) -> None:
+                    if not task.cancelled() and task.exception() is not None and not future.done():
+                        future.set_exception(task.exception())  # type: ignore[arg-type]
+
+                task.add_done_callback(fail_request)
+                self._background_tasks.add(task)
+                task.add_done_callback(self._raise_on_exception)
+                task.add_done_callback(self._background_tasks.discard)
+                return await future
+            finally:
+                # A request that was cancelled or failed to send is no longer pending.
+                self._pending_requests.pop(request_id, None)
+                if not future.done():
+                    future.cancel()
 
     async def publish_message(
         self,
@@ -589,18 +675,24 @@ async def _process_response(self, response: agent_worker_pb2.RpcResponse) -> Non
             attributes={"request_id": response.request_id},
             extraAttributes={"message_type": response.payload.data_type},
         ):
-            # Deserialize the result.
-            result = self._serialization_registry.deserialize(
-                response.payload.data,
-                type_name=response.payload.data_type,
-                data_content_type=response.payload.data_content_type,
-            )
-            # Get the future and set the result.
-            future = self._pending_requests.pop(response.request_id)
+            # Get the future first, so that the request is done (and its credit returned) even if the
+            # result does not deserialize. A request that was cancelled is no longer pending.
+            future = self._pending_requests.pop(response.request_id, None)
+            if future is None or future.done():
+                return
             if len(response.error) > 0:
                 future.set_exception(Exception(response.error))
-            else:
-                future.set_result(result)
+                return
+            try:
+                result = self._serialization_registry.deserialize(
+                    response.payload.data,
+                    type_name=response.payload.data_type,
+                    data_content_type=response.payload.data_content_type,
+                )
+            except Exception as e:
+                future.set_exception(e)
+                return
+            future.set_result(result)
 
     async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         event_attributes = event.attributes
@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import signal
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence
 
 from ._constants import GRPC_IMPORT_ERROR_STR
+from ._flow_control import ConnectionMetrics, FlowControlConfig
 from ._type_helpers import ChannelArgumentType
 from ._worker_runtime_host_servicer import GrpcWorkerAgentRuntimeHostServicer
 
@@ -17,9 +18,14 @@
 
 
 class GrpcWorkerAgentRuntimeHost:
-    def __init__(self, address: str, extra_grpc_config: Optional[ChannelArgumentType] = None) -> None:
+    def __init__(
+        self,
+        address: str,
+        extra_grpc_config: Optional[ChannelArgumentType] = None,
+        flow_control: Optional[FlowControlConfig] = None,
+    ) -> None:
         self._server = grpc.aio.server(options=extra_grpc_config)
-        self._servicer = GrpcWorkerAgentRuntimeHostServicer()
+        self._servicer = GrpcWorkerAgentRuntimeHostServicer(flow_control=flow_control)
         agent_worker_pb2_grpc.add_AgentRpcServicer_to_server(self._servicer, self._server)
         self._server.add_insecure_port(address)
         self._address = address
@@ -36,6 +42,10 @@ def start(self) -> None:
             raise RuntimeError("Host runtime is already started.")
         self._serve_task = asyncio.create_task(self._serve())
 
+    def get_client_metrics(self) -> Dict[str, ConnectionMetrics]:
+        """Return queue depth and credit metrics for each connected client, keyed by client id."""
+        return self._servicer.get_client_metrics()
+
     async def stop(self, grace: int = 5) -> None:
         """Stop the server."""
         if self._serve_task is None:
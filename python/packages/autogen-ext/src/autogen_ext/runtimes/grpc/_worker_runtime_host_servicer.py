@@ -4,13 +4,14 @@
 import logging
 from abc import ABC, abstractmethod
 from asyncio import Future, Task
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Sequence, Set, Tuple, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, List, Sequence, Set, Tuple, TypeVar
 
 from autogen_core import TopicId
 from autogen_core._agent_id import AgentId
-from autogen_core._runtime_impl_helpers import SubscriptionManager
 
 from ._constants import GRPC_IMPORT_ERROR_STR
+from ._flow_control import ConnectionMetrics, CreditWindow, FlowControlConfig
+from ._routing_table import HostRoutingTable
 from ._utils import subscription_from_proto, subscription_to_proto
 
 try:
@@ -46,16 +47,33 @@ async def get_client_id_or_abort(context: grpc.aio.ServicerContext[Any, Any]) ->
 
 
 class ChannelConnection(ABC, Generic[SendT, ReceiveT]):
-    def __init__(self, request_iterator: AsyncIterator[ReceiveT], client_id: str) -> None:
+    def __init__(
+        self,
+        request_iterator: AsyncIterator[ReceiveT],
+        client_id: str,
+        flow_control: FlowControlConfig | None = None,
+        on_shed: Callable[[SendT], Awaitable[None]] | None = None,
+    ) -> None:
         self._request_iterator = request_iterator
         self._client_id = client_id
-        self._send_queue: asyncio.Queue[SendT] = asyncio.Queue()
+        self._flow_control = flow_control or FlowControlConfig()
+        self._on_shed = on_shed
+        # None is used as the sentinel that ends the outgoing stream when the connection is closed.
+        self._send_queue: asyncio.Queue[SendT | None] = asyncio.Queue(maxsize=self._flow_control.max_queue_size)
+        self._credits = CreditWindow(self._flow_control.window_size)
+        self._closed = False
+        self._is_slow_consumer = False
+        self._messages_sent = 0
+        self._messages_received = 0
+        self._messages_shed = 0
+        self._slow_consumer_events = 0
         self._receiving_task = asyncio.create_task(self._receive_messages(client_id, request_iterator))
 
     async def _receive_messages(self, client_id: ClientConnectionId, request_iterator: AsyncIterator[ReceiveT]) -> None:
         # Receive messages from the client and process them.
         async for message in request_iterator:
             logger.info(f"Received message from client {client_id}: {message}")
+            self._messages_received += 1
             await self._handle_message(message)
 
     def __aiter__(self) -> AsyncIterator[SendT]:
@@ -63,7 +81,7 @@ def __aiter__(self) -> AsyncIterator[SendT]:
 
     async def __anext__(self) -> SendT:
         try:
-            return await self._send_queue.get()
+            message = await self._send_queue.get()
         except StopAsyncIteration:
             await self._receiving_task
             raise
@@ -71,13 +89,128 @@ async def __anext__(self) -> SendT:
             logger.error(f"Failed to get message from send queue: {e}", exc_info=True)
             await self._receiving_task
             raise
+        if message is None:
+            raise StopAsyncIteration
+        # The consumer made progress, so it is no longer considered slow.
+        self._is_slow_consumer = False
+        self._messages_sent += 1
+        return message
 
     @abstractmethod
     async def _handle_message(self, message: ReceiveT) -> None:
         pass
 
-    async def send(self, message: SendT) -> None:
-        await self._send_queue.put(message)
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def send(self, message: SendT) -> bool:
+        """Queue a message for the client.
+
+        Returns ``False`` if the message was shed by the flow control policy instead of being queued."""
+        if self._closed:
+            return False
+        try:
+            self._send_queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+        try:
+            await asyncio.wait_for(self._send_queue.put(message), self._flow_control.slow_consumer_timeout)
+            return True
+        except asyncio.TimeoutError:
+            pass
+        if self._closed:
+            return False
+        self._mark_slow_consumer("send queue is full")
+        match self._flow_control.shedding_policy:
+            case "block":
+                await self._send_queue.put(message)
+                return True
+            case "drop_newest":
+                await self._shed(message)
+                return False
+            case "drop_oldest":
+                oldest = self._send_queue.get_nowait()
+                self._send_queue.put_nowait(message)
+                if oldest is not None:
+                    await self._shed(oldest)
+                return True
+            case "disconnect":
+                await self._shed(message)
+                await self.close()
+                return False
+
+    async def acquire_credit(self) -> bool:
+        """Take one credit from the client's outstanding window.
+
+        Returns ``False`` if the credit was refused by the flow control policy."""
+        if await self._credits.acquire(self._flow_control.slow_consumer_timeout):
+            return True
+        if self._closed:
+            return False
+        self._mark_slow_consumer("outstanding window is exhausted")
+        match self._flow_control.shedding_policy:
+            case "block":
+                return await self._credits.acquire()
+            case "drop_newest" | "drop_oldest":
+                # Outstanding requests cannot be recalled, so there is nothing older to shed.
+                return False
+            case "disconnect":
+                await self.close()
+                return False
+
+    def release_credit(self) -> None:
+        self._credits.release()
+
+    async def close(self) -> None:
+        """Close the connection, shedding everything still queued for the client."""
+        if self._closed:
+            return
+        self._closed = True
+        self._credits.close()
+        if self._receiving_task is not asyncio.current_task():
+            self._receiving_task.cancel()
+        # Drain synchronously so that the sentinel is guaranteed to fit in the queue.
+        dropped: List[SendT] = []
+        while not self._send_queue.empty():
+            message = self._send_queue.get_nowait()
+            if message is not None:
+                dropped.append(message)
+        self._send_queue.put_nowait(None)
+        for message in dropped:
+            await self._shed(message)
+
+    def metrics(self) -> ConnectionMetrics:
+        return ConnectionMetrics(
+            client_id=self._client_id,
+            send_queue_depth=self._send_queue.qsize(),
+            send_queue_capacity=self._send_queue.maxsize,
+            # Received messages are dispatched as they arrive, the host does not buffer them.
+            recv_queue_depth=0,
+            recv_queue_capacity=0,
+            window_size=self._credits.size,
+            outstanding=self._credits.outstanding,
+            messages_sent=self._messages_sent,
+            messages_received=self._messages_received,
+            messages_shed=self._messages_shed,
+            slow_consumer_events=self._slow_consumer_events,
+            is_slow_consumer=self._is_slow_consumer,
+        )
+
+    def _mark_slow_consumer(self, reason: str) -> None:
+        if not self._is_slow_consumer:
+            self._slow_consumer_events += 1
+            logger.warning(
+                f"Client {self._client_id} is a slow consumer ({reason}), "
+                f"applying shedding policy '{self._flow_control.shedding_policy}'."
+            )
+        self._is_slow_consumer = True
+
+    async def _shed(self, message: SendT) -> None:
+        self._messages_shed += 1
+        if self._on_shed is not None:
+            await self._on_shed(message)
 
 
 class CallbackChannelConnection(ChannelConnection[SendT, ReceiveT]):
@@ -86,30 +219,35 @@ def __init__(
         request_iterator: AsyncIterator[ReceiveT],
         client_id: str,
         handle_callback: Callable[[ReceiveT], Awaitable[None]],
+        flow_control: FlowControlConfig | None = None,
+        on_shed: Callable[[SendT], Awaitable[None]] | None = None,
     ) -> None:
         self._handle_callback = handle_callback
-        super().__init__(request_iterator, client_id)
+        super().__init__(request_iterator, client_id, flow_control=flow_control, on_shed=on_shed)
 
     async def _handle_message(self, message: ReceiveT) -> None:
         await self._handle_callback(message)
 
 
 class GrpcWorkerAgentRuntimeHostServicer(agent_worker_pb2_grpc.AgentRpcServicer):
-    """A gRPC servicer that hosts message delivery service for agents."""
+    """A gRPC servicer that hosts message delivery service for agents.
+
+    Args:
+        flow_control (FlowControlConfig | None): Flow control settings applied to every client
+            connection. Defaults to unbounded queues and an unlimited outstanding window.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, flow_control: FlowControlConfig | None = None) -> None:
+        self._flow_control = flow_control or FlowControlConfig()
         self._data_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message]
         ] = {}
         self._control_connections: Dict[
             ClientConnectionId, ChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage]
         ] = {}
-        self._agent_type_to_client_id_lock = asyncio.Lock()
-        self._agent_type_to_client_id: Dict[str, ClientConnectionId] = {}
         self._pending_responses: Dict[ClientConnectionId, Dict[str, Future[Any]]] = {}
         self._background_tasks: Set[Task[Any]] = set()
-        self._subscription_manager = SubscriptionManager()
-        self._client_id_to_subscription_id_mapping: Dict[ClientConnectionId, set[str]] = {}
+        self._routing_table = HostRoutingTable()
 
     async def OpenChannel(  # type: ignore
         self,
@@ -121,8 +259,15 @@ async def OpenChannel(  # type: ignore
         async def handle_callback(message: agent_worker_pb2.Message) -> None:
             await self._receive_message(client_id, message)
 
+        async def on_shed(message: agent_worker_pb2.Message) -> None:
+            await self._on_message_shed(client_id, message)
+
         connection = CallbackChannelConnection[agent_worker_pb2.Message, agent_worker_pb2.Message](
-            request_iterator, client_id, handle_callback=handle_callback
+            request_iterator,
+            client_id,
+            handle_callback=handle_callback,
+            flow_control=self._flow_control,
+            on_shed=on_shed,
         )
         self._data_connections[client_id] = connection
         logger.info(f"Client {client_id} connected.")
@@ -150,7 +295,7 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
             await self._receive_control_message(client_id, message)
 
         connection = CallbackChannelConnection[agent_worker_pb2.ControlMessage, agent_worker_pb2.ControlMessage](
-            request_iterator, client_id, handle_callback=handle_callback
+            request_iterator, client_id, handle_callback=handle_callback, flow_control=self._flow_control
         )
         self._control_connections[client_id] = connection
         logger.info(f"Client {client_id} connected.")
@@ -163,20 +308,31 @@ async def handle_callback(message: agent_worker_pb2.ControlMessage) -> None:
             del self._control_connections[client_id]
 
     async def _on_client_disconnect(self, client_id: ClientConnectionId) -> None:
-        async with self._agent_type_to_client_id_lock:
-            agent_types = [agent_type for agent_type, id_ in self._agent_type_to_client_id.items() if id_ == client_id]
-            for agent_type in agent_types:
-                logger.info(f"Removing agent type {agent_type} from agent type to client id mapping")
-                del self._agent_type_to_client_id[agent_type]
-            for sub_id in self._client_id_to_subscription_id_mapping.get(client_id, set()):
-                logger.info(f"Client id {client_id} disconnected. Removing corresponding subscription with id {id}")
-                try:
-                    await self._subscription_manager.remove_subscription(sub_id)
-                # Catch and ignore if the subscription does not exist.
-                except ValueError:
-                    continue
+        self._routing_table.remove_client(client_id)
         logger.info(f"Client {client_id} disconnected successfully")
 
+    def get_client_metrics(self) -> Dict[ClientConnectionId, ConnectionMetrics]:
+        """Return a snapshot of the queue depth and credit metrics of every connected client's data channel."""
+        return {client_id: connection.metrics() for client_id, connection in self._data_connections.items()}
+
+    async def _on_message_shed(self, client_id: ClientConnectionId, message: agent_worker_pb2.Message) -> None:
+        logger.warning(f"Shed message {message.WhichOneof('message')} to slow consumer {client_id}.")
+        if message.WhichOneof("message") != "request":
+            return
+        # Fail the request so that the sender does not wait for a response that will never come.
+        future = self._pending_responses.get(client_id, {}).pop(message.request.request_id, None)
+        if future is None or future.done():
+            return
+        connection = self._data_connections.get(client_id)
+        if connection is not None:
+            connection.release_credit()
+        future.set_result(
+            agent_worker_pb2.RpcResponse(
+                request_id=message.request.request_id,
+                error=f"Request dropped by the host because client {client_id} is a slow consumer.",
+            )
+        )
+
     def _raise_on_exception(self, task: Task[Any]) -> None:
         exception = task.exception()
         if exception is not None:
@@ -213,7 +369,7 @@ async def _receive_control_message(
         destination = message.destination
         if destination.startswith("agentid="):
             agent_id = AgentId.from_str(destination[len("agentid=") :])
-            target_client_id = self._agent_type_to_client_id.get(agent_id.type)
+            target_client_id = self._routing_table.get_client_id(agent_id.type)
             if target_client_id is None:
                 logger.error(f"Agent client id not found for agent type {agent_id.type}.")
                 return
@@ -231,31 +387,57 @@ async def _receive_control_message(
 
     async def _process_request(self, request: agent_worker_pb2.RpcRequest, client_id: ClientConnectionId) -> None:
         # Deliver the message to a client given the target agent type.
-        async with self._agent_type_to_client_id_lock:
-            target_client_id = self._agent_type_to_client_id.get(request.target.type)
+        # A dropped request is answered with an error, so that the sender's request and credit are released.
+        target_client_id = self._routing_table.get_client_id(request.target.type)
         if target_client_id is None:
             logger.error(f"Agent {request.target.type} not found, failed to deliver message.")
+            await self._send_error_response(client_id, request.request_id, f"Agent {request.target.type} not found.")
             return
         target_send_queue = self._data_connections.get(target_client_id)
         if target_send_queue is None:
             logger.error(f"Client {target_client_id} not found, failed to deliver message.")
+            await self._send_error_response(client_id, request.request_id, f"Client {target_client_id} not found.")
+            return
+        # Each outstanding request consumes one credit of the target's window until its response arrives.
+        if not await target_send_queue.acquire_credit():
+            logger.error(f"Client {target_client_id} has no credit left, failed to deliver message.")
+            await self._send_error_response(
+                client_id,
+                request.request_id,
+                f"Request dropped by the host because client {target_client_id} is a slow consumer.",
+            )
             return
-        await target_send_queue.send(agent_worker_pb2.Message(request=request))
+
+        # Request ids are only unique per sending client, so the request is forwarded
+        # under an id that is unique on the host and the original id is restored on the response.
+        forwarded_request = agent_worker_pb2.RpcRequest()
+        forwarded_request.CopyFrom(request)
+        forwarded_request.request_id = f"{client_id}:{request.request_id}"
 
         # Create a future to wait for the response from the target.
+        # It is registered before sending so that a shed request can fail it.
         future = asyncio.get_event_loop().create_future()
-        self._pending_responses.setdefault(target_client_id, {})[request.request_id] = future
+        self._pending_responses.setdefault(target_client_id, {})[forwarded_request.request_id] = future
 
         # Create a task to wait for the response and send it back to the client.
-        send_response_task = asyncio.create_task(self._wait_and_send_response(future, client_id))
+        send_response_task = asyncio.create_task(self._wait_and_send_response(future, client_id, request.request_id))
         self._background_tasks.add(send_response_task)
         send_response_task.add_done_callback(self._raise_on_exception)
         send_response_task.add_done_callback(self._background_tasks.discard)
 
+        await target_send_queue.send(agent_worker_pb2.Message(request=forwarded_request))
+
+    async def _send_error_response(self, client_id: ClientConnectionId, request_id: str, error: str) -> None:
+        sender_send_queue = self._data_connections.get(client_id)
+        if sender_send_queue is not None:
+            error_response = agent_worker_pb2.RpcResponse(request_id=request_id, error=error)
+            await sender_send_queue.send(agent_worker_pb2.Message(response=error_response))
+
     async def _wait_and_send_response(
-        self, future: Future[agent_worker_pb2.RpcResponse], client_id: ClientConnectionId
+        self, future: Future[agent_worker_pb2.RpcResponse], client_id: ClientConnectionId, request_id: str
     ) -> None:
         response = await future
+        response.request_id = request_id
         message = agent_worker_pb2.Message(response=response)
         send_queue = self._data_connections.get(client_id)
         if send_queue is None:
@@ -266,23 +448,22 @@ async def _wait_and_send_response(
     async def _process_response(self, response: agent_worker_pb2.RpcResponse, client_id: ClientConnectionId) -> None:
         # Setting the result of the future will send the response back to the original sender.
         future = self._pending_responses[client_id].pop(response.request_id)
+        connection = self._data_connections.get(client_id)
+        if connection is not None:
+            connection.release_credit()
         future.set_result(response)
 
     async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         topic_id = TopicId(type=event.type, source=event.source)
-        recipients = await self._subscription_manager.get_subscribed_recipients(topic_id)
-        # Get the client ids of the recipients.
-        async with self._agent_type_to_client_id_lock:
-            client_ids: Set[ClientConnectionId] = set()
-            for recipient in recipients:
-                client_id = self._agent_type_to_client_id.get(recipient.type)
-                if client_id is not None:
-                    client_ids.add(client_id)
-                else:
-                    logger.error(f"Agent {recipient.type} and its client not found for topic {topic_id}.")
+        # The routing table resolves the topic to the client ids of its recipients without a lock.
+        client_ids = self._routing_table.get_client_ids(topic_id)
         # Deliver the event to clients.
         for client_id in client_ids:
-            await self._data_connections[client_id].send(agent_worker_pb2.Message(cloudEvent=event))
+            connection = self._data_connections.get(client_id)
+            if connection is None:
+                logger.error(f"Client {client_id} not found, failed to deliver event for topic {topic_id}.")
+                continue
+            await connection.send(agent_worker_pb2.Message(cloudEvent=event))
 
     async def RegisterAgent(  # type: ignore
         self,
@@ -293,15 +474,10 @@ async def RegisterAgent(  # type: ignore
     ) -> agent_worker_pb2.RegisterAgentTypeResponse:
         client_id = await get_client_id_or_abort(context)
 
-        async with self._agent_type_to_client_id_lock:
-            if request.type in self._agent_type_to_client_id:
-                existing_client_id = self._agent_type_to_client_id[request.type]
-                await context.abort(
-                    grpc.StatusCode.INVALID_ARGUMENT,
-                    f"Agent type {request.type} already registered with client {existing_client_id}.",
-                )
-            else:
-                self._agent_type_to_client_id[request.type] = client_id
+        try:
+            self._routing_table.register_agent_type(request.type, client_id)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
 
         return agent_worker_pb2.RegisterAgentTypeResponse()
 
@@ -316,9 +492,7 @@ async def AddSubscription(  # type: ignore
 
         subscription = subscription_from_proto(request.subscription)
         try:
-            await self._subscription_manager.add_subscription(subscription)
-            subscription_ids = self._client_id_to_subscription_id_mapping.setdefault(client_id, set())
-            subscription_ids.add(subscription.id)
+            self._routing_table.add_subscription(subscription, client_id)
         except ValueError as e:
             await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         return agent_worker_pb2.AddSubscriptionResponse()
@@ -331,7 +505,10 @@ async def RemoveSubscription(  # type: ignore
         ],
     ) -> agent_worker_pb2.RemoveSubscriptionResponse:
         _client_id = await get_client_id_or_abort(context)
-        await self._subscription_manager.remove_subscription(request.id)
+        try:
+            self._routing_table.remove_subscription(request.id)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         return agent_worker_pb2.RemoveSubscriptionResponse()
 
     async def GetSubscriptions(  # type: ignore
@@ -342,7 +519,7 @@ async def GetSubscriptions(  # type: ignore
         ],
     ) -> agent_worker_pb2.GetSubscriptionsResponse:
         _client_id = await get_client_id_or_abort(context)
-        subscriptions = self._subscription_manager.subscriptions
+        subscriptions = self._routing_table.subscriptions
         return agent_worker_pb2.GetSubscriptionsResponse(
             subscriptions=[subscription_to_proto(sub) for sub in subscriptions]
         )
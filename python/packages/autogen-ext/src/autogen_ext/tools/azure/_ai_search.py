@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import time
 from abc import ABC, abstractmethod
 from contextvars import ContextVar
 from typing import (
@@ -25,6 +24,7 @@
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 from azure.search.documents.aio import SearchClient
 
+from ._cache import _AsyncLRUCache, _EmbeddingBatcher
 from ._config import (
     DEFAULT_API_VERSION,
     AzureAISearchConfig,
@@ -129,14 +129,25 @@ async def _get_embedding(self, query: str) -> List[float]:
         """Generate embedding vector for the query text."""
         ...
 
+    async def _get_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Generate embedding vectors for several query texts, in order."""
+        ...
+
 
 class EmbeddingProviderMixin:
-    """Mixin class providing embedding generation functionality."""
+    """Mixin class providing embedding generation functionality.
+
+    The OpenAI or Azure OpenAI client is created on first use and reused for later embeddings."""
 
     search_config: AzureAISearchConfig
+    _embedding_client: Any = None
 
     async def _get_embedding(self, query: str) -> List[float]:
         """Generate embedding vector for the query text."""
+        return (await self._get_embeddings([query]))[0]
+
+    async def _get_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Generate embedding vectors for several query texts, in order, with one request."""
         if not hasattr(self, "search_config"):
             raise ValueError("Host class must have a search_config attribute")
 
@@ -149,7 +160,22 @@ async def _get_embedding(self, query: str) -> List[float]:
                 "Client-side embedding is not configured. `embedding_provider` and `embedding_model` must be set."
             ) from None
 
-        if embedding_provider.lower() == "azure_openai":
+        if self._embedding_client is None:
+            self._embedding_client = self._create_embedding_client(embedding_provider.lower())
+        provider_name = "Azure OpenAI" if embedding_provider.lower() == "azure_openai" else "OpenAI"
+
+        try:
+            response = await self._embedding_client.embeddings.create(
+                model=embedding_model, input=queries[0] if len(queries) == 1 else queries
+            )
+            return [data.embedding for data in response.data]
+        except Exception as e:
+            raise ValueError(f"Failed to generate embeddings with {provider_name}: {str(e)}") from e
+
+    def _create_embedding_client(self, embedding_provider: str) -> Any:
+        search_config = self.search_config
+
+        if embedding_provider == "azure_openai":
             try:
                 from openai import AsyncAzureOpenAI
 
@@ -170,27 +196,21 @@ async def _get_embedding(self, query: str) -> List[float]:
                 ) from None
 
             if api_key:
-                azure_client = AsyncAzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
-            else:
+                return AsyncAzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
 
-                def get_token() -> str:
-                    credential = DefaultAzureCredential()
-                    token = credential.get_token("https://cognitiveservices.azure.com/.default")
-                    if not token or not token.token:
-                        raise ValueError("Failed to acquire token using DefaultAzureCredential for Azure OpenAI.")
-                    return token.token
+            credentials: List[DefaultAzureCredential] = []
 
-                azure_client = AsyncAzureOpenAI(
-                    azure_ad_token_provider=get_token, api_version=api_version, azure_endpoint=endpoint
-                )
+            def get_token() -> str:
+                if not credentials:
+                    credentials.append(DefaultAzureCredential())
+                token = credentials[0].get_token("https://cognitiveservices.azure.com/.default")
+                if not token or not token.token:
+                    raise ValueError("Failed to acquire token using DefaultAzureCredential for Azure OpenAI.")
+                return token.token
 
-            try:
-                response = await azure_client.embeddings.create(model=embedding_model, input=query)
-                return response.data[0].embedding
-            except Exception as e:
-                raise ValueError(f"Failed to generate embeddings with Azure OpenAI: {str(e)}") from e
+            return AsyncAzureOpenAI(azure_ad_token_provider=get_token, api_version=api_version, azure_endpoint=endpoint)
 
-        elif embedding_provider.lower() == "openai":
+        elif embedding_provider == "openai":
             try:
                 from openai import AsyncOpenAI
             except ImportError:
@@ -200,16 +220,10 @@ def get_token() -> str:
                 ) from None
 
             api_key = getattr(search_config, "openai_api_key", None)
-            openai_client = AsyncOpenAI(api_key=api_key)
-
-            try:
-                response = await openai_client.embeddings.create(model=embedding_model, input=query)
-                return response.data[0].embedding
-            except Exception as e:
-                raise ValueError(f"Failed to generate embeddings with OpenAI: {str(e)}") from e
+            return AsyncOpenAI(api_key=api_key)
         else:
             raise ValueError(
-                f"Unsupported client-side embedding provider: {embedding_provider}. "
+                f"Unsupported client-side embedding provider: {search_config.embedding_provider}. "
                 "Currently supported providers are 'azure_openai' and 'openai'."
             )
 
@@ -251,11 +265,13 @@ def __init__(
         semantic_config_name: Optional[str] = None,
         enable_caching: bool = False,
         cache_ttl_seconds: int = 300,
+        cache_max_entries: int = 1000,
         embedding_provider: Optional[str] = None,
         embedding_model: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_batch_size: int = 16,
     ):
         """Initialize the Azure AI Search tool.
 
@@ -275,11 +291,13 @@ def __init__(
             semantic_config_name (Optional[str]): Semantic configuration name for enhanced results
             enable_caching (bool): Whether to cache search results
             cache_ttl_seconds (int): How long to cache results in seconds
+            cache_max_entries (int): Maximum number of search results and query embeddings to cache
             embedding_provider (Optional[str]): Name of embedding provider for client-side embeddings
             embedding_model (Optional[str]): Model name for client-side embeddings
             openai_api_key (Optional[str]): API key for OpenAI/Azure OpenAI embeddings
             openai_api_version (Optional[str]): API version for Azure OpenAI embeddings
             openai_endpoint (Optional[str]): Endpoint URL for Azure OpenAI embeddings
+            embedding_batch_size (int): Maximum number of concurrent queries to embed with one embedding request
         """
         if not has_azure_search:
             raise ImportError(
@@ -318,11 +336,13 @@ def __init__(
             semantic_config_name=semantic_config_name,
             enable_caching=enable_caching,
             cache_ttl_seconds=cache_ttl_seconds,
+            cache_max_entries=cache_max_entries,
             embedding_provider=embedding_provider,
             embedding_model=embedding_model,
             openai_api_key=openai_api_key,
             openai_api_version=openai_api_version,
             openai_endpoint=openai_endpoint,
+            embedding_batch_size=embedding_batch_size,
         )
 
         self._endpoint = endpoint
@@ -331,7 +351,10 @@ def __init__(
         self._api_version = api_version
 
         self._client: Optional[SearchClient] = None
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # Search results by query and search settings, and query embeddings by query
+        self._cache: _AsyncLRUCache[List[SearchResult]] = _AsyncLRUCache(cache_max_entries, cache_ttl_seconds)
+        self._embedding_cache: _AsyncLRUCache[List[float]] = _AsyncLRUCache(cache_max_entries)
+        self._embedding_batcher = _EmbeddingBatcher(self._embed_batch, embedding_batch_size)
 
         if self.search_config.api_version == "2023-11-01" and self.search_config.vector_fields:
             warning_message = (
@@ -344,7 +367,7 @@ def __init__(
             logger.warning(warning_message)
 
     async def close(self) -> None:
-        """Explicitly close the Azure SearchClient if needed (for cleanup)."""
+        """Explicitly close the Azure SearchClient and the embedding client if needed (for cleanup)."""
         if self._client is not None:
             try:
                 await self._client.close()
@@ -352,6 +375,13 @@ async def close(self) -> None:
                 pass
             finally:
                 self._client = None
+        embedding_client = getattr(self, "_embedding_client", None)
+        if embedding_client is not None:
+            self._embedding_client = None
+            try:
+                await embedding_client.close()
+            except Exception:
+                pass
 
     def _process_credential(
         self, credential: Union[AzureKeyCredential, AsyncTokenCredential, Dict[str, str]]
@@ -443,31 +473,36 @@ async def run(
         if cancellation_token is not None and cancellation_token.is_cancelled():
             raise asyncio.CancelledError("Operation cancelled")
 
-        cache_key = ""
-        if self.search_config.enable_caching:
-            cache_key_parts = [
-                search_query.query,
-                str(self.search_config.top),
-                self.search_config.query_type,
-                ",".join(sorted(self.search_config.search_fields or [])),
-                ",".join(sorted(self.search_config.select_fields or [])),
-                ",".join(sorted(self.search_config.vector_fields or [])),
-                str(self.search_config.filter or ""),
-                str(self.search_config.semantic_config_name or ""),
-            ]
-            cache_key = ":".join(filter(None, cache_key_parts))
-            if cache_key in self._cache:
-                cache_entry = self._cache[cache_key]
-                cache_age = time.time() - cache_entry["timestamp"]
-                if cache_age < self.search_config.cache_ttl_seconds:
-                    logger.debug(f"Using cached results for query: {search_query.query}")
-                    return SearchResults(
-                        results=[
-                            SearchResult(score=r.score, content=r.content, metadata=r.metadata)
-                            for r in cache_entry["results"]
-                        ]
-                    )
+        if not self.search_config.enable_caching:
+            return SearchResults(results=await self._search(search_query, cancellation_token))
+
+        cache_key_parts = [
+            search_query.query,
+            str(self.search_config.top),
+            self.search_config.query_type,
+            ",".join(sorted(self.search_config.search_fields or [])),
+            ",".join(sorted(self.search_config.select_fields or [])),
+            ",".join(sorted(self.search_config.vector_fields or [])),
+            str(self.search_config.filter or ""),
+            str(self.search_config.semantic_config_name or ""),
+        ]
+        cache_key = ":".join(filter(None, cache_key_parts))
+        # Concurrent runs of the same query share one search, which runs without the token of any one of them.
+        # A cancelled caller only stops waiting, and the search continues for the others.
+        shared_search = asyncio.ensure_future(
+            self._cache.get_or_create(cache_key, lambda: self._search(search_query, None))
+        )
+        if cancellation_token is not None:
+            cancellation_token.link_future(shared_search)
+        results = await shared_search
+        return SearchResults(
+            results=[SearchResult(score=r.score, content=r.content, metadata=r.metadata) for r in results]
+        )
 
+    async def _search(
+        self, search_query: SearchQuery, cancellation_token: Optional[CancellationToken]
+    ) -> List[SearchResult]:
+        """Run a search against the Azure AI Search index, without the result cache."""
         try:
             search_kwargs: Dict[str, Any] = {}
 
@@ -500,7 +535,7 @@ async def run(
                 if use_client_side_embeddings:
                     from azure.search.documents.models import VectorizedQuery
 
-                    embedding_vector: List[float] = await self._get_embedding(search_query.query)
+                    embedding_vector: List[float] = await self._embed_query(search_query.query)
                     for field_spec in self.search_config.vector_fields:
                         fields = field_spec if isinstance(field_spec, str) else ",".join(field_spec)
                         vector_queries.append(
@@ -562,10 +597,7 @@ def is_cancelled() -> bool:
                     logger.warning(f"Error processing search document: {e}")
                     continue
 
-            if self.search_config.enable_caching:
-                self._cache[cache_key] = {"results": results, "timestamp": time.time()}
-
-            return SearchResults(results=results)
+            return results
 
         except asyncio.CancelledError:
             raise
@@ -582,6 +614,23 @@ def is_cancelled() -> bool:
             else:
                 raise ValueError(f"Error from Azure AI Search: {error_msg}") from e
 
+    async def _embed_query(self, query: str) -> List[float]:
+        """Embed the query text, from the embedding cache if enabled, batched with concurrent queries."""
+        if not self.search_config.enable_caching:
+            return await self._embedding_batcher.embed(query)
+        return await self._embedding_cache.get_or_create(query, lambda: self._embedding_batcher.embed(query))
+
+    async def _embed_batch(self, queries: List[str]) -> List[List[float]]:
+        if len(queries) == 1:
+            return [await self._get_embedding(queries[0])]
+        return await self._get_embeddings(queries)
+
+    async def _get_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Generate embedding vectors for several query texts, in order.
+
+        Subclasses that can embed several texts with one request should override this method."""
+        return list(await asyncio.gather(*(self._get_embedding(query) for query in queries)))
+
     def _to_config(self) -> AzureAISearchConfig:
         """Convert the current instance to a configuration object."""
         return self.search_config
@@ -726,11 +775,13 @@ def _from_config(cls, config: AzureAISearchConfig) -> "AzureAISearchTool":
                 semantic_config_name=config.semantic_config_name,
                 enable_caching=config.enable_caching,
                 cache_ttl_seconds=config.cache_ttl_seconds,
+                cache_max_entries=config.cache_max_entries,
                 embedding_provider=config.embedding_provider,
                 embedding_model=config.embedding_model,
                 openai_api_key=config.openai_api_key,
                 openai_api_version=config.openai_api_version,
                 openai_endpoint=config.openai_endpoint,
+                embedding_batch_size=config.embedding_batch_size,
             )
             return instance
         finally:
@@ -774,6 +825,7 @@ def create_full_text_search(
         semantic_config_name: Optional[str] = None,
         enable_caching: bool = False,
         cache_ttl_seconds: int = 300,
+        cache_max_entries: int = 1000,
     ) -> "AzureAISearchTool":
         """Create a tool for traditional text-based searches.
 
@@ -799,6 +851,7 @@ def create_full_text_search(
             semantic_config_name: Semantic configuration name (required for semantic query_type)
             enable_caching: Whether to cache search results
             cache_ttl_seconds: How long to cache results in seconds
+            cache_max_entries: Maximum number of search results and query embeddings to cache
 
         Returns:
             An initialized AzureAISearchTool for full-text search
@@ -868,6 +921,7 @@ def create_full_text_search(
             "semantic_config_name": semantic_config_name,
             "enable_caching": enable_caching,
             "cache_ttl_seconds": cache_ttl_seconds,
+            "cache_max_entries": cache_max_entries,
         }
 
         return cls._create_from_params(config_dict, "full_text")
@@ -887,11 +941,13 @@ def create_vector_search(
         filter: Optional[str] = None,
         enable_caching: bool = False,
         cache_ttl_seconds: int = 300,
+        cache_max_entries: int = 1000,
         embedding_provider: Optional[str] = None,
         embedding_model: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_batch_size: int = 16,
     ) -> "AzureAISearchTool":
         """Create a tool for pure vector/similarity search.
 
@@ -911,11 +967,13 @@ def create_vector_search(
             filter: OData filter expression to refine search results
             enable_caching: Whether to cache search results
             cache_ttl_seconds: How long to cache results in seconds
+            cache_max_entries: Maximum number of search results and query embeddings to cache
             embedding_provider: Provider for client-side embeddings (e.g., 'azure_openai', 'openai')
             embedding_model: Model for client-side embeddings (e.g., 'text-embedding-ada-002')
             openai_api_key: API key for OpenAI/Azure OpenAI embeddings
             openai_api_version: API version for Azure OpenAI embeddings
             openai_endpoint: Endpoint URL for Azure OpenAI embeddings
+            embedding_batch_size: Maximum number of concurrent queries to embed with one embedding request
 
         Returns:
             An initialized AzureAISearchTool for vector search
@@ -992,11 +1050,13 @@ def create_vector_search(
             "filter": filter,
             "enable_caching": enable_caching,
             "cache_ttl_seconds": cache_ttl_seconds,
+            "cache_max_entries": cache_max_entries,
             "embedding_provider": embedding_provider,
             "embedding_model": embedding_model,
             "openai_api_key": openai_api_key,
             "openai_api_version": openai_api_version,
             "openai_endpoint": openai_endpoint,
+            "embedding_batch_size": embedding_batch_size,
         }
 
         return cls._create_from_params(config_dict, "vector")
@@ -1019,11 +1079,13 @@ def create_hybrid_search(
         semantic_config_name: Optional[str] = None,
         enable_caching: bool = False,
         cache_ttl_seconds: int = 300,
+        cache_max_entries: int = 1000,
         embedding_provider: Optional[str] = None,
         embedding_model: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_batch_size: int = 16,
     ) -> "AzureAISearchTool":
         """Create a tool that combines vector and text search capabilities.
 
@@ -1050,11 +1112,13 @@ def create_hybrid_search(
             semantic_config_name: Semantic configuration name (required if query_type="semantic")
             enable_caching: Whether to cache search results
             cache_ttl_seconds: How long to cache results in seconds
+            cache_max_entries: Maximum number of search results and query embeddings to cache
             embedding_provider: Provider for client-side embeddings (e.g., 'azure_openai', 'openai')
             embedding_model: Model for client-side embeddings (e.g., 'text-embedding-ada-002')
             openai_api_key: API key for OpenAI/Azure OpenAI embeddings
             openai_api_version: API version for Azure OpenAI embeddings
             openai_endpoint: Endpoint URL for Azure OpenAI embeddings
+            embedding_batch_size: Maximum number of concurrent queries to embed with one embedding request
 
         Returns:
             An initialized AzureAISearchTool for hybrid search
@@ -1127,11 +1191,13 @@ def create_hybrid_search(
             "semantic_config_name": semantic_config_name,
             "enable_caching": enable_caching,
             "cache_ttl_seconds": cache_ttl_seconds,
+            "cache_max_entries": cache_max_entries,
             "embedding_provider": embedding_provider,
             "embedding_model": embedding_model,
             "openai_api_key": openai_api_key,
             "openai_api_version": openai_api_version,
             "openai_endpoint": openai_endpoint,
+            "embedding_batch_size": embedding_batch_size,
         }
 
         return cls._create_from_params(config_dict, "hybrid")
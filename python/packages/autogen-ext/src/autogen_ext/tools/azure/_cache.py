@@ -0,0 +1,114 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _AsyncLRUCache(Generic[T]):
+    """A bounded LRU cache whose entries expire after a TTL, and which runs the factory of a missing key once.
+
+    Concurrent lookups of a missing key share one run of its factory, which continues for the
+    other callers if the caller that started it is cancelled. Errors are not cached.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._pending: Dict[Hashable, "asyncio.Task[T]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[T]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: T) -> None:
+        if self._max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self._ttl_seconds if self._ttl_seconds is not None else float("inf")
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_create(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        task = self._pending.get(key)
+        if task is None:
+            self.misses += 1
+
+            async def create() -> T:
+                try:
+                    created = await factory()
+                    self.set(key, created)
+                    return created
+                finally:
+                    del self._pending[key]
+
+            task = asyncio.ensure_future(create())
+            self._pending[key] = task
+        else:
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _EmbeddingBatcher:
+    """Embeds the queries that arrive in the same event loop iteration together, with one call of ``embed`` per
+    ``max_batch_size`` queries."""
+
+    def __init__(self, embed: Callable[[List[str]], Awaitable[List[List[float]]]], max_batch_size: int) -> None:
+        self._embed = embed
+        self._max_batch_size = max(max_batch_size, 1)
+        self._queue: List[Tuple[str, "asyncio.Future[List[float]]"]] = []
+        self._flush_tasks: Set["asyncio.Task[None]"] = set()
+
+    async def embed(self, query: str) -> List[float]:
+        future: "asyncio.Future[List[float]]" = asyncio.get_running_loop().create_future()
+        self._queue.append((query, future))
+        if len(self._queue) == 1:
+            task = asyncio.ensure_future(self._flush())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        return await future
+
+    async def _flush(self) -> None:
+        # Let the other queries of this event loop iteration join the batch
+        await asyncio.sleep(0)
+        queue, self._queue = self._queue, []
+        size = self._max_batch_size
+        await asyncio.gather(*(self._embed_batch(queue[i : i + size]) for i in range(0, len(queue), size)))
+
+    async def _embed_batch(self, batch: List[Tuple[str, "asyncio.Future[List[float]]"]]) -> None:
+        # The same query may be waited for more than once
+        queries = list(dict.fromkeys(query for query, _ in batch))
+        try:
+            embeddings = dict(zip(queries, await self._embed(queries), strict=True))
+        except BaseException as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return
+        for query, future in batch:
+            if not future.done():
+                future.set_result(embeddings[query])
@@ -130,6 +130,9 @@ class AzureAISearchConfig(BaseModel):
 
     enable_caching: bool = Field(default=False, description="Whether to cache search results")
     cache_ttl_seconds: int = Field(default=300, description="How long to cache results in seconds")
+    cache_max_entries: int = Field(
+        default=1000, description="Maximum number of search results and query embeddings to cache"
+    )
 
     embedding_provider: Optional[str] = Field(
         default=None, description="Name of embedding provider for client-side embeddings"
@@ -138,6 +141,9 @@ class AzureAISearchConfig(BaseModel):
     openai_api_key: Optional[str] = Field(default=None, description="API key for OpenAI/Azure OpenAI embeddings")
     openai_api_version: Optional[str] = Field(default=None, description="API version for Azure OpenAI embeddings")
     openai_endpoint: Optional[str] = Field(default=None, description="Endpoint URL for Azure OpenAI embeddings")
+    embedding_batch_size: int = Field(
+        default=16, description="Maximum number of concurrent queries to embed with one embedding request"
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
@@ -7,6 +7,7 @@
     SearchConfig,
 )
 from ._global_search import GlobalSearchTool, GlobalSearchToolArgs, GlobalSearchToolReturn
+from ._index_store import GraphRAGIndexStore, GraphRAGIndexStoreStats
 from ._local_search import LocalSearchTool, LocalSearchToolArgs, LocalSearchToolReturn
 
 __all__ = [
@@ -17,6 +18,8 @@
     "GlobalContextConfig",
     "GlobalSearchToolArgs",
     "GlobalSearchToolReturn",
+    "GraphRAGIndexStore",
+    "GraphRAGIndexStoreStats",
     "LocalContextConfig",
     "LocalSearchToolArgs",
     "LocalSearchToolReturn",
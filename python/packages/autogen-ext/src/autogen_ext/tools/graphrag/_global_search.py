@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import pandas as pd
 import tiktoken
 from autogen_core import CancellationToken
 from autogen_core.tools import BaseTool
@@ -10,17 +9,13 @@
 from graphrag.config.load_config import load_config
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol import ChatModel
-from graphrag.query.indexer_adapters import (
-    read_indexer_communities,
-    read_indexer_entities,
-    read_indexer_reports,
-)
 from graphrag.query.structured_search.global_search.community_context import GlobalCommunityContext
 from graphrag.query.structured_search.global_search.search import GlobalSearch
 
 from ._config import GlobalContextConfig as ContextConfig
 from ._config import GlobalDataConfig as DataConfig
 from ._config import MapReduceConfig
+from ._index_store import GraphRAGIndexStore
 
 _default_context_config = ContextConfig()
 _default_mapreduce_config = MapReduceConfig()
@@ -100,6 +95,15 @@ async def main():
 
         if __name__ == "__main__":
             asyncio.run(main())
+
+    Args:
+        token_encoder (tiktoken.Encoding): The tokenizer used for text encoding
+        model: The chat model to use for search (GraphRAG ChatModel)
+        data_config (DataConfig): Configuration for data source locations and settings
+        context_config (ContextConfig, optional): Configuration for context building. Defaults to default config.
+        mapreduce_config (MapReduceConfig, optional): Configuration for map-reduce operations. Defaults to default config.
+        index_store (GraphRAGIndexStore, optional): The store to read the index tables from.
+            Defaults to the shared store of the process for the input directory of the data config.
     """
 
     def __init__(
@@ -109,6 +113,7 @@ def __init__(
         data_config: DataConfig,
         context_config: ContextConfig = _default_context_config,
         mapreduce_config: MapReduceConfig = _default_mapreduce_config,
+        index_store: GraphRAGIndexStore | None = None,
     ):
         super().__init__(
             args_type=GlobalSearchToolArgs,
@@ -119,17 +124,13 @@ def __init__(
         # Use the provided model
         self._model = model
 
-        # Load parquet files
-        community_df: pd.DataFrame = pd.read_parquet(f"{data_config.input_dir}/{data_config.community_table}.parquet")  # type: ignore
-        entity_df: pd.DataFrame = pd.read_parquet(f"{data_config.input_dir}/{data_config.entity_table}.parquet")  # type: ignore
-        report_df: pd.DataFrame = pd.read_parquet(  # type: ignore
-            f"{data_config.input_dir}/{data_config.community_report_table}.parquet"
+        # Read data from the index tables, shared with other tools using the same index
+        store = index_store or GraphRAGIndexStore.shared(data_config.input_dir)
+        communities = store.communities(data_config.community_table, data_config.community_report_table)
+        reports = store.reports(
+            data_config.community_report_table, data_config.community_table, data_config.community_level
         )
-
-        # Fix: Use correct argument order and types for GraphRAG API
-        communities = read_indexer_communities(community_df, report_df)
-        reports = read_indexer_reports(report_df, community_df, data_config.community_level)
-        entities = read_indexer_entities(entity_df, community_df, data_config.community_level)
+        entities = store.entities(data_config.entity_table, data_config.community_table, data_config.community_level)
 
         context_builder = GlobalCommunityContext(
             community_reports=reports,
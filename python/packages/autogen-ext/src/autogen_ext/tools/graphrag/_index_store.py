@@ -0,0 +1,297 @@
+# mypy: disable-error-code="no-any-unimported,misc"
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from graphrag.data_model.community import Community
+from graphrag.data_model.community_report import CommunityReport
+from graphrag.data_model.entity import Entity
+from graphrag.data_model.relationship import Relationship
+from graphrag.data_model.text_unit import TextUnit
+from graphrag.query.indexer_adapters import (
+    read_indexer_communities,
+    read_indexer_entities,
+    read_indexer_relationships,
+    read_indexer_reports,
+    read_indexer_text_units,
+)
+
+T = TypeVar("T")
+
+# The columns read by the GraphRAG indexer adapters for local and global search. The embedding columns
+# are left out, as local search looks up entities in the vector store and global search does not use them.
+ENTITY_COLUMNS = ("id", "human_readable_id", "title", "type", "description", "text_unit_ids", "degree")
+RELATIONSHIP_COLUMNS = (
+    "id",
+    "human_readable_id",
+    "source",
+    "target",
+    "description",
+    "combined_degree",
+    "weight",
+    "text_unit_ids",
+)
+TEXT_UNIT_COLUMNS = ("id", "text", "entity_ids", "relationship_ids", "n_tokens", "document_ids")
+COMMUNITY_COLUMNS = ("id", "community", "title", "level", "parent", "children", "entity_ids", "text_unit_ids")
+COMMUNITY_REPORT_COLUMNS = ("id", "community", "level", "title", "summary", "full_content", "rank")
+
+_SIGNATURE_KEY = b"autogen.source_signature"
+
+_shared_stores: Dict[Tuple[str, str], "GraphRAGIndexStore"] = {}
+_shared_stores_lock = threading.Lock()
+
+
+@dataclass
+class GraphRAGIndexStoreStats:
+    """Counters of a :class:`GraphRAGIndexStore`."""
+
+    tables_opened: int = 0
+    """Tables opened from their Arrow or Parquet files."""
+    arrow_files_written: int = 0
+    """Tables converted from Parquet to Arrow files, which happens once per table and change of its file."""
+    objects_loaded: int = 0
+    """Lists of entities, relationships, text units, communities or reports read from the tables."""
+    object_cache_hits: int = 0
+    """Lists of objects served from the store without reading the tables."""
+
+
+class GraphRAGIndexStore:
+    """(Experimental) The tables of a GraphRAG index, loaded once per process and shared by the GraphRAG tools.
+
+    :class:`LocalSearchTool` and :class:`GlobalSearchTool` read the entity, relationship, text unit,
+    community and community report tables of the index through a store, by default the one returned
+    by :meth:`shared` for their input directory. The store:
+
+    - Converts each Parquet table once to an uncompressed Arrow file in ``cache_dir``, and memory-maps it.
+      The pages of the mapped files are shared by all processes that use the index, such as the workers
+      of a server, and are only read from disk as they are used. An Arrow file is converted again when
+      its Parquet file changes. With ``memory_map=False``, the Parquet files are read directly.
+    - Reads only the columns that the search tools use, leaving out large unused columns such as
+      the embedding columns.
+    - Keeps the entities, relationships, text units, communities and reports read from the tables,
+      so that tools with the same index and community level share them instead of reading them again.
+    - Keeps lookup indexes from a key column, such as ``id``, to rows, for :meth:`rows`.
+
+    The lists of objects are shared, and so must not be modified by the caller.
+
+    Args:
+        input_dir (str | Path): The directory of the Parquet files of the index.
+        cache_dir (str | Path, optional): The directory for the Arrow files. Defaults to a directory
+            for the input directory in the system temporary directory.
+        memory_map (bool): Whether to memory-map Arrow files of the tables. Defaults to True.
+
+    Example:
+
+        .. code-block:: python
+
+            from autogen_ext.tools.graphrag import GlobalSearchTool, GraphRAGIndexStore, LocalSearchTool
+
+            store = GraphRAGIndexStore.shared("./output")
+            local_tool = LocalSearchTool(..., index_store=store)
+            global_tool = GlobalSearchTool(..., index_store=store)
+    """
+
+    def __init__(self, input_dir: str | Path, cache_dir: str | Path | None = None, memory_map: bool = True) -> None:
+        self._input_dir = os.path.realpath(input_dir)
+        if cache_dir is None:
+            digest = hashlib.sha256(self._input_dir.encode()).hexdigest()[:16]
+            cache_dir = os.path.join(tempfile.gettempdir(), "autogen_graphrag_index", digest)
+        self._cache_dir = str(cache_dir)
+        self._memory_map = memory_map
+        self._lock = threading.RLock()
+        self._tables: Dict[Hashable, Tuple[str, pa.Table]] = {}
+        self._objects: Dict[Hashable, Tuple[Tuple[str, ...], Any]] = {}
+        self._row_indexes: Dict[Hashable, Tuple[str, Dict[Any, int]]] = {}
+        self._stats = GraphRAGIndexStoreStats()
+
+    @classmethod
+    def shared(cls, input_dir: str | Path, cache_dir: str | Path | None = None) -> "GraphRAGIndexStore":
+        """Returns the store of this process for the input directory, creating it if needed."""
+        key = (os.path.realpath(input_dir), str(cache_dir or ""))
+        with _shared_stores_lock:
+            store = _shared_stores.get(key)
+            if store is None:
+                store = cls(input_dir, cache_dir=cache_dir)
+                _shared_stores[key] = store
+            return store
+
+    @property
+    def input_dir(self) -> str:
+        return self._input_dir
+
+    @property
+    def stats(self) -> GraphRAGIndexStoreStats:
+        return self._stats
+
+    def _parquet_path(self, name: str) -> str:
+        return os.path.join(self._input_dir, f"{name}.parquet")
+
+    def _signature(self, name: str) -> str:
+        stat = os.stat(self._parquet_path(name))
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def _open_arrow_file(self, path: str, signature: str) -> Optional[pa.Table]:
+        try:
+            reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+        except (OSError, pa.ArrowInvalid):
+            return None
+        metadata = reader.schema.metadata or {}
+        if metadata.get(_SIGNATURE_KEY) != signature.encode():
+            return None
+        # Reading from a memory map doesn't copy the data
+        return reader.read_all()
+
+    def _write_arrow_file(self, name: str, path: str, signature: str) -> None:
+        table = pq.read_table(self._parquet_path(name))
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SIGNATURE_KEY: signature.encode()})
+        os.makedirs(self._cache_dir, exist_ok=True)
+        # Written to a temporary file first, so that other processes never map a partly written file
+        fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".arrow.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._stats.arrow_files_written += 1
+
+    def table(self, name: str, columns: Optional[Sequence[str]] = None) -> pa.Table:
+        """Returns a table of the index, with the given columns that it has, or all of its columns.
+
+        Args:
+            name (str): The name of the table, which is its file name without the ``.parquet`` extension.
+            columns (Sequence[str], optional): The columns to return. Columns the table doesn't have are ignored.
+        """
+        with self._lock:
+            signature = self._signature(name)
+            if self._memory_map:
+                cached = self._tables.get(name)
+                if cached is None or cached[0] != signature:
+                    path = os.path.join(self._cache_dir, f"{name}.arrow")
+                    table = self._open_arrow_file(path, signature)
+                    if table is None:
+                        self._write_arrow_file(name, path, signature)
+                        table = self._open_arrow_file(path, signature)
+                        assert table is not None
+                    self._tables[name] = (signature, table)
+                    self._stats.tables_opened += 1
+                table = self._tables[name][1]
+                if columns is None:
+                    return table
+                return table.select([column for column in columns if column in table.column_names])
+
+            # Without memory mapping, only the columns are read from the Parquet file
+            key = (name, tuple(columns) if columns is not None else None)
+            cached = self._tables.get(key)
+            if cached is None or cached[0] != signature:
+                parquet_file = pq.ParquetFile(self._parquet_path(name))
+                names = parquet_file.schema_arrow.names
+                selected = [column for column in columns if column in names] if columns is not None else None
+                self._tables[key] = (signature, parquet_file.read(columns=selected, use_pandas_metadata=True))
+                self._stats.tables_opened += 1
+            return self._tables[key][1]
+
+    def dataframe(self, name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Returns a table of the index as a new DataFrame, as :meth:`table`."""
+        return self.table(name, columns).to_pandas()
+
+    def row_index(self, name: str, column: str = "id") -> Dict[Any, int]:
+        """Returns the index from the values of a key column of a table to their first row."""
+        with self._lock:
+            signature = self._signature(name)
+            cached = self._row_indexes.get((name, column))
+            if cached is None or cached[0] != signature:
+                index: Dict[Any, int] = {}
+                for row, value in enumerate(self.table(name, [column]).column(column).to_pylist()):
+                    index.setdefault(value, row)
+                self._row_indexes[(name, column)] = (signature, index)
+            return self._row_indexes[(name, column)][1]
+
+    def rows(
+        self, name: str, keys: Iterable[Any], column: str = "id", columns: Optional[Sequence[str]] = None
+    ) -> pa.Table:
+        """Returns the rows of a table whose key column has the given values, in their order, skipping missing keys."""
+        index = self.row_index(name, column)
+        positions = [index[key] for key in keys if key in index]
+        return self.table(name, columns).take(pa.array(positions, type=pa.int64()))
+
+    def _objects_for(self, key: Hashable, tables: Sequence[str], load: Callable[[], T]) -> T:
+        with self._lock:
+            signatures = tuple(self._signature(table) for table in tables)
+            cached = self._objects.get(key)
+            if cached is not None and cached[0] == signatures:
+                self._stats.object_cache_hits += 1
+                return cached[1]  # type: ignore[no-any-return]
+            objects = load()
+            self._objects[key] = (signatures, objects)
+            self._stats.objects_loaded += 1
+            return objects
+
+    def entities(self, entity_table: str, community_table: str, community_level: int | None) -> List[Entity]:
+        """Returns the entities of the index, with their communities up to the community level."""
+        return self._objects_for(
+            ("entities", entity_table, community_table, community_level),
+            [entity_table, community_table],
+            lambda: read_indexer_entities(
+                self.dataframe(entity_table, ENTITY_COLUMNS),
+                self.dataframe(community_table, COMMUNITY_COLUMNS),
+                community_level,
+            ),
+        )
+
+    def relationships(self, relationship_table: str) -> List[Relationship]:
+        """Returns the relationships of the index."""
+        return self._objects_for(
+            ("relationships", relationship_table),
+            [relationship_table],
+            lambda: read_indexer_relationships(self.dataframe(relationship_table, RELATIONSHIP_COLUMNS)),
+        )
+
+    def text_units(self, text_unit_table: str) -> List[TextUnit]:
+        """Returns the text units of the index."""
+        return self._objects_for(
+            ("text_units", text_unit_table),
+            [text_unit_table],
+            lambda: read_indexer_text_units(self.dataframe(text_unit_table, TEXT_UNIT_COLUMNS)),
+        )
+
+    def communities(self, community_table: str, community_report_table: str) -> List[Community]:
+        """Returns the communities of the index that have reports."""
+        return self._objects_for(
+            ("communities", community_table, community_report_table),
+            [community_table, community_report_table],
+            lambda: read_indexer_communities(
+                self.dataframe(community_table, COMMUNITY_COLUMNS),
+                self.dataframe(community_report_table, COMMUNITY_REPORT_COLUMNS),
+            ),
+        )
+
+    def reports(
+        self, community_report_table: str, community_table: str, community_level: int | None
+    ) -> List[CommunityReport]:
+        """Returns the community reports of the index, of the communities up to the community level."""
+        return self._objects_for(
+            ("reports", community_report_table, community_table, community_level),
+            [community_report_table, community_table],
+            lambda: read_indexer_reports(
+                self.dataframe(community_report_table, COMMUNITY_REPORT_COLUMNS),
+                self.dataframe(community_table, COMMUNITY_COLUMNS),
+                community_level,
+            ),
+        )
+
+    def clear(self) -> None:
+        """Drops the tables, objects and lookup indexes kept by the store. The Arrow files are kept."""
+        with self._lock:
+            self._tables.clear()
+            self._objects.clear()
+            self._row_indexes.clear()
@@ -1,7 +1,6 @@
 # mypy: disable-error-code="no-any-unimported,misc"
 from pathlib import Path
 
-import pandas as pd
 import tiktoken
 from autogen_core import CancellationToken
 from autogen_core.tools import BaseTool
@@ -11,17 +10,13 @@
 from graphrag.config.load_config import load_config
 from graphrag.language_model.manager import ModelManager
 from graphrag.language_model.protocol import ChatModel, EmbeddingModel
-from graphrag.query.indexer_adapters import (
-    read_indexer_entities,
-    read_indexer_relationships,
-    read_indexer_text_units,
-)
 from graphrag.query.structured_search.local_search.mixed_context import LocalSearchMixedContext
 from graphrag.query.structured_search.local_search.search import LocalSearch
 from graphrag.vector_stores.lancedb import LanceDBVectorStore
 
 from ._config import LocalContextConfig, SearchConfig
 from ._config import LocalDataConfig as DataConfig
+from ._index_store import GraphRAGIndexStore
 
 _default_context_config = LocalContextConfig()
 _default_search_config = SearchConfig()
@@ -109,6 +104,8 @@ async def main():
         data_config (DataConfig): Configuration for data source locations and settings
         context_config (LocalContextConfig, optional): Configuration for context building. Defaults to default config.
         search_config (SearchConfig, optional): Configuration for search operations. Defaults to default config.
+        index_store (GraphRAGIndexStore, optional): The store to read the index tables from.
+            Defaults to the shared store of the process for the input directory of the data config.
     """
 
     def __init__(
@@ -119,6 +116,7 @@ def __init__(
         data_config: DataConfig,
         context_config: LocalContextConfig = _default_context_config,
         search_config: SearchConfig = _default_search_config,
+        index_store: GraphRAGIndexStore | None = None,
     ):
         super().__init__(
             args_type=LocalSearchToolArgs,
@@ -130,18 +128,11 @@ def __init__(
         self._model = model
         self._embedder = embedder
 
-        # Load parquet files
-        entity_df: pd.DataFrame = pd.read_parquet(f"{data_config.input_dir}/{data_config.entity_table}.parquet")  # type: ignore
-        relationship_df: pd.DataFrame = pd.read_parquet(  # type: ignore
-            f"{data_config.input_dir}/{data_config.relationship_table}.parquet"
-        )
-        text_unit_df: pd.DataFrame = pd.read_parquet(f"{data_config.input_dir}/{data_config.text_unit_table}.parquet")  # type: ignore
-        community_df: pd.DataFrame = pd.read_parquet(f"{data_config.input_dir}/{data_config.community_table}.parquet")  # type: ignore
-
-        # Read data using indexer adapters
-        entities = read_indexer_entities(entity_df, community_df, data_config.community_level)
-        relationships = read_indexer_relationships(relationship_df)
-        text_units = read_indexer_text_units(text_unit_df)
+        # Read data from the index tables, shared with other tools using the same index
+        store = index_store or GraphRAGIndexStore.shared(data_config.input_dir)
+        entities = store.entities(data_config.entity_table, data_config.community_table, data_config.community_level)
+        relationships = store.relationships(data_config.relationship_table)
+        text_units = store.text_units(data_config.text_unit_table)
         # Set up vector store for entity embeddings
         description_embedding_store = LanceDBVectorStore(
             collection_name="default-entity-description",
@@ -1,3 +1,4 @@
+from ._client_pool import HttpClientPool, HttpClientPoolStats
 from ._http_tool import HttpTool
 
-__all__ = ["HttpTool"]
+__all__ = ["HttpTool", "HttpClientPool", "HttpClientPoolStats"]
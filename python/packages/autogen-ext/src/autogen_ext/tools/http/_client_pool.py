@@ -0,0 +1,317 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import httpx
+from typing_extensions import Self
+
+# Request headers that identify the caller, so that clients and cached responses are not shared across them.
+_AUTH_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie", "x-api-key", "api-key"})
+
+# Response headers that a 304 Not Modified response updates in the cached response.
+_REVALIDATION_HEADERS = ("cache-control", "expires", "etag", "last-modified", "date", "age")
+
+_ClientKey = Tuple[str, str, int, str]
+
+
+@dataclass
+class HttpClientPoolStats:
+    """Counters of an :class:`HttpClientPool`."""
+
+    clients_created: int = 0
+    cache_hits: int = 0
+    """Responses served from the cache without a request."""
+    cache_revalidations: int = 0
+    """Cached responses served after the server answered a conditional request with 304 Not Modified."""
+    cache_misses: int = 0
+    """GET requests sent to the server for which the cache had no usable response."""
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _freshness_lifetime(headers: httpx.Headers) -> float:
+    """Seconds the response is fresh for, from its Cache-Control or Expires headers, less its Age."""
+    directives = _parse_cache_control(headers.get("cache-control"))
+    if "no-cache" in directives:
+        return 0.0
+    lifetime = 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            lifetime = float(max_age)
+        except ValueError:
+            return 0.0
+    elif "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"])
+            date = parsedate_to_datetime(headers["date"]) if "date" in headers else None
+            lifetime = (expires - date).total_seconds() if date is not None else expires.timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    try:
+        lifetime -= float(headers.get("age", 0))
+    except ValueError:
+        pass
+    return max(lifetime, 0.0)
+
+
+@dataclass
+class _CachedResponse:
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    vary: Dict[str, Optional[str]]
+    fresh_until: float = field(default=0.0)
+
+    def refresh(self) -> None:
+        self.fresh_until = time.monotonic() + _freshness_lifetime(self.headers)
+
+    def matches(self, request: httpx.Request) -> bool:
+        return all(request.headers.get(name) == value for name, value in self.vary.items())
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Sends requests over a pooled transport, answering GET requests from the cache of the pool if it has one."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        client_key: _ClientKey,
+        cache: "OrderedDict[Tuple[_ClientKey, str], _CachedResponse] | None",
+        cache_size: int,
+        stats: HttpClientPoolStats,
+    ) -> None:
+        self._transport = transport
+        self._client_key = client_key
+        self._cache = cache
+        self._cache_size = cache_size
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request_directives = _parse_cache_control(request.headers.get("cache-control"))
+        if (
+            self._cache is None
+            or request.method != "GET"
+            or "no-store" in request_directives
+            # Conditional requests of the caller are answered by the server
+            or "if-none-match" in request.headers
+            or "if-modified-since" in request.headers
+        ):
+            return await self._transport.handle_async_request(request)
+
+        key = (self._client_key, str(request.url))
+        cached = self._cache.get(key)
+        if cached is not None and not cached.matches(request):
+            cached = None
+        if cached is not None:
+            self._cache.move_to_end(key)
+            if "no-cache" not in request_directives and time.monotonic() < cached.fresh_until:
+                self._stats.cache_hits += 1
+                return cached.to_response(request)
+            # Revalidate the stale response, if it has validators
+            if "etag" in cached.headers:
+                request.headers["if-none-match"] = cached.headers["etag"]
+            if "last-modified" in cached.headers:
+                request.headers["if-modified-since"] = cached.headers["last-modified"]
+
+        response = await self._transport.handle_async_request(request)
+        if cached is not None and response.status_code == 304:
+            await response.aclose()
+            for name in _REVALIDATION_HEADERS:
+                if name in response.headers:
+                    cached.headers[name] = response.headers[name]
+            cached.refresh()
+            self._stats.cache_revalidations += 1
+            return cached.to_response(request)
+
+        self._stats.cache_misses += 1
+        response_directives = _parse_cache_control(response.headers.get("cache-control"))
+        vary = [name.strip().lower() for name in response.headers.get("vary", "").split(",") if name.strip()]
+        if response.status_code != 200 or "no-store" in response_directives or "*" in vary:
+            return response
+        entry = _CachedResponse(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=b"",
+            vary={name: request.headers.get(name) for name in vary},
+        )
+        entry.refresh()
+        if (
+            entry.fresh_until <= time.monotonic()
+            and "etag" not in entry.headers
+            and "last-modified" not in entry.headers
+        ):
+            # Neither fresh nor revalidatable, so not worth keeping
+            return response
+
+        # Keep the body as received, with any content encoding, for the client to decode as usual
+        try:
+            entry.content = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        self._cache[key] = entry
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return entry.to_response(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientPool:
+    """(Experimental) A pool of HTTP clients shared by any number of :class:`HttpTool` instances.
+
+    Without a pool, an :class:`HttpTool` creates a client for every call, so every call sets up
+    a new connection, including a TLS handshake for HTTPS. The pool keeps one client per scheme,
+    host, port and credentials (the ``Authorization``, ``Proxy-Authorization``, ``Cookie``,
+    ``X-API-Key`` and ``API-Key`` headers of the tool), whose connections are kept alive and
+    reused across calls and tools. With ``http2``, requests to HTTPS servers that support
+    HTTP/2 are multiplexed over a connection. This requires the ``h2`` package, installed with
+    ``pip install "httpx[http2]"``.
+
+    With ``cache_size`` greater than zero, responses to GET requests are cached as by a
+    private HTTP cache: a response is reused while it is fresh according to its
+    ``Cache-Control: max-age`` or ``Expires`` headers, and once stale, revalidated with
+    ``If-None-Match`` or ``If-Modified-Since`` when it has an ``ETag`` or ``Last-Modified``
+    header. Responses with ``Cache-Control: no-store`` or ``Vary: *`` are not cached, and
+    requests with ``Cache-Control: no-cache`` always revalidate.
+
+    The pool is used from one event loop, and should be closed with :meth:`aclose`, or used
+    as an async context manager, for the lifetime of the workbench or runtime its tools are used in.
+
+    Args:
+        max_connections (int): The most connections per client. Defaults to 100.
+        max_keepalive_connections (int): The most idle connections kept alive per client. Defaults to 20.
+        keepalive_expiry (float): Seconds an idle connection is kept alive. Defaults to 30.
+        http2 (bool): Whether to use HTTP/2 with servers that support it. Defaults to False.
+        cache_size (int): The most responses to cache. Defaults to 0, which disables caching.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_core import CancellationToken
+            from autogen_ext.tools.http import HttpClientPool, HttpTool
+
+            schema = {
+                "type": "object",
+                "properties": {"value": {"type": "string", "description": "The base64 value to decode"}},
+                "required": ["value"],
+            }
+
+
+            async def main() -> None:
+                async with HttpClientPool(http2=True, cache_size=256) as pool:
+                    tool = HttpTool(
+                        name="base64_decode",
+                        description="base64 decode a value",
+                        scheme="https",
+                        host="httpbin.org",
+                        port=443,
+                        path="/base64/{value}",
+                        method="GET",
+                        json_schema=schema,
+                        client_pool=pool,
+                    )
+                    for value in ["YWJjZGU=", "ZmdoaWo="]:
+                        print(await tool.run_json({"value": value}, CancellationToken()))
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        cache_size: int = 0,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[_ClientKey, str], _CachedResponse] | None" = (
+            OrderedDict() if cache_size > 0 else None
+        )
+        self._clients: Dict[_ClientKey, httpx.AsyncClient] = {}
+        self._closed = False
+        self._stats = HttpClientPoolStats()
+
+    @property
+    def stats(self) -> HttpClientPoolStats:
+        return self._stats
+
+    @staticmethod
+    def _client_key(scheme: str, host: str, port: int, headers: Optional[Mapping[str, Any]]) -> _ClientKey:
+        credentials = sorted(
+            (name.lower(), str(value)) for name, value in (headers or {}).items() if name.lower() in _AUTH_HEADERS
+        )
+        # Hashed, so that the key doesn't hold the credentials
+        digest = hashlib.sha256(repr(credentials).encode()).hexdigest() if credentials else ""
+        return (scheme, host.lower(), port, digest)
+
+    def client(
+        self, scheme: str, host: str, port: int, headers: Optional[Mapping[str, Any]] = None
+    ) -> httpx.AsyncClient:
+        """Returns the client for a server and the credentials in the request headers, creating it if needed.
+
+        The client is shared, so it must not be closed or configured by the caller."""
+        if self._closed:
+            raise RuntimeError("The HTTP client pool is closed.")
+        key = self._client_key(scheme, host, port, headers)
+        client = self._clients.get(key)
+        if client is None:
+            transport = _PooledTransport(
+                httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2),
+                client_key=key,
+                cache=self._cache,
+                cache_size=self._cache_size,
+                stats=self._stats,
+            )
+            client = httpx.AsyncClient(transport=transport)
+            self._clients[key] = client
+            self._stats.clients_created += 1
+        return client
+
+    def clear_cache(self) -> None:
+        """Drops all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def aclose(self) -> None:
+        """Closes all clients and their connections."""
+        self._closed = True
+        clients: List[httpx.AsyncClient] = list(self._clients.values())
+        self._clients.clear()
+        self.clear_cache()
+        for client in clients:
+            await client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.aclose()
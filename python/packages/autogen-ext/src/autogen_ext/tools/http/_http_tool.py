@@ -8,6 +8,8 @@
 from pydantic import BaseModel, Field
 from typing_extensions import Self
 
+from ._client_pool import HttpClientPool
+
 DEFAULT_TIMEOUT_CONFIG = 5.0
 
 
@@ -81,6 +83,9 @@ class HttpTool(BaseTool[BaseModel, Any], Component[HttpToolConfig]):
             Defaults to "text".
         timeout (float, optional): The timeout for HTTP requests in seconds.
             Defaults to 5.0.
+        client_pool (HttpClientPool, optional): A pool of HTTP clients to send requests with, which keeps
+            connections alive across calls and can be shared by any number of tools. It is not part of the
+            component config. Defaults to None, which creates a client for every call.
 
     .. note::
         This tool requires the :code:`http-tool` extra for the :code:`autogen-ext` package.
@@ -157,6 +162,7 @@ def __init__(
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "POST",
         return_type: Literal["text", "json"] = "text",
         timeout: float = DEFAULT_TIMEOUT_CONFIG,
+        client_pool: HttpClientPool | None = None,
     ) -> None:
         self.server_params = HttpToolConfig(
             name=name,
@@ -175,6 +181,7 @@ def __init__(
         # Use regex to find all path parameters, we will need those later to template the path
         path_params = {match.group(1) for match in re.finditer(r"{([^}]*)}", path)}
         self._path_params = path_params
+        self._client_pool = client_pool
 
         # Create the input model from the modified schema
         input_model = create_model(json_schema)
@@ -222,18 +229,14 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             path=path,
         )
         timeout_config = httpx.Timeout(timeout=self.server_params.timeout)
-        async with httpx.AsyncClient(timeout=timeout_config) as client:
-            match self.server_params.method:
-                case "GET":
-                    response = await client.get(url, headers=self.server_params.headers, params=model_dump)
-                case "PUT":
-                    response = await client.put(url, headers=self.server_params.headers, json=model_dump)
-                case "DELETE":
-                    response = await client.delete(url, headers=self.server_params.headers, params=model_dump)
-                case "PATCH":
-                    response = await client.patch(url, headers=self.server_params.headers, json=model_dump)
-                case _:  # Default case POST
-                    response = await client.post(url, headers=self.server_params.headers, json=model_dump)
+        if self._client_pool is not None:
+            client = self._client_pool.client(
+                self.server_params.scheme, self.server_params.host, self.server_params.port, self.server_params.headers
+            )
+            response = await self._send(client, url, model_dump, timeout_config)
+        else:
+            async with httpx.AsyncClient(timeout=timeout_config) as client:
+                response = await self._send(client, url, model_dump, timeout_config)
 
         match self.server_params.return_type:
             case "text":
@@ -242,3 +245,19 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
                 return response.json()
             case _:
                 raise ValueError(f"Invalid return type: {self.server_params.return_type}")
+
+    async def _send(
+        self, client: httpx.AsyncClient, url: httpx.URL, model_dump: dict[str, Any], timeout: httpx.Timeout
+    ) -> httpx.Response:
+        headers = self.server_params.headers
+        match self.server_params.method:
+            case "GET":
+                return await client.get(url, headers=headers, params=model_dump, timeout=timeout)
+            case "PUT":
+                return await client.put(url, headers=headers, json=model_dump, timeout=timeout)
+            case "DELETE":
+                return await client.delete(url, headers=headers, params=model_dump, timeout=timeout)
+            case "PATCH":
+                return await client.patch(url, headers=headers, json=model_dump, timeout=timeout)
+            case _:  # Default case POST
+                return await client.post(url, headers=headers, json=model_dump, timeout=timeout)
@@ -21,6 +21,7 @@
 from mcp import types as mcp_types
 from mcp.client.session import ClientSession
 from mcp.shared.context import RequestContext
+from mcp.shared.session import RequestResponder
 
 from ._config import McpServerParams
 from ._session import create_mcp_server_session
@@ -103,12 +104,18 @@ def __init__(self, server_params: McpServerParams, model_client: ChatCompletionC
         self._shutdown_future: asyncio.Future[Any] | None = None
         self._active = False
         self._initialize_result: mcp_types.InitializeResult | None = None
+        self._tool_list_version = 0
         atexit.register(self._sync_shutdown)
 
     @property
     def initialize_result(self) -> mcp_types.InitializeResult | None:
         return self._initialize_result
 
+    @property
+    def tool_list_version(self) -> int:
+        """A counter increased each time the server notifies that its list of tools has changed."""
+        return self._tool_list_version
+
     async def initialize(self) -> None:
         if not self._active:
             self._active = True
@@ -206,11 +213,23 @@ async def _sampling_callback(
                 data=f"{type(e).__name__}: {e}",
             )
 
+    async def _message_handler(
+        self,
+        message: RequestResponder[mcp_types.ServerRequest, mcp_types.ClientResult]
+        | mcp_types.ServerNotification
+        | Exception,
+    ) -> None:
+        """Handle messages from the server that are not responses to requests."""
+        if isinstance(message, mcp_types.ServerNotification) and isinstance(
+            message.root, mcp_types.ToolListChangedNotification
+        ):
+            self._tool_list_version += 1
+
     async def _run_actor(self) -> None:
         result: McpResult
         try:
             async with create_mcp_server_session(
-                self.server_params, sampling_callback=self._sampling_callback
+                self.server_params, sampling_callback=self._sampling_callback, message_handler=self._message_handler
             ) as session:
                 # Save the initialize result
                 self._initialize_result = await session.initialize()
@@ -14,6 +14,7 @@
 from mcp.types import AudioContent, ContentBlock, EmbeddedResource, ImageContent, ResourceLink, TextContent
 
 from ._config import McpServerParams
+from ._pool import McpSessionPool
 from ._session import create_mcp_server_session
 
 TServerParams = TypeVar("TServerParams", bound=McpServerParams)
@@ -26,14 +27,24 @@ class McpToolAdapter(BaseTool[BaseModel, Any], ABC, Generic[TServerParams]):
     Args:
         server_params (TServerParams): Parameters for the MCP server connection.
         tool (Tool): The MCP tool to wrap.
+        session (ClientSession, optional): The MCP client session to use.
+        session_pool (McpSessionPool, optional): (Experimental) A pool to take a session from
+            for each call, when no session is given, instead of starting a new session.
     """
 
     component_type = "tool"
 
-    def __init__(self, server_params: TServerParams, tool: Tool, session: ClientSession | None = None) -> None:
+    def __init__(
+        self,
+        server_params: TServerParams,
+        tool: Tool,
+        session: ClientSession | None = None,
+        session_pool: McpSessionPool | None = None,
+    ) -> None:
         self._tool = tool
         self._server_params = server_params
         self._session = session
+        self._session_pool = session_pool
 
         # Extract name and description
         name = tool.name
@@ -71,6 +82,10 @@ async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> A
             session = self._session
             return await self._run(args=kwargs, cancellation_token=cancellation_token, session=session)
 
+        if self._session_pool is not None:
+            async with self._session_pool.session(self._server_params) as session:
+                return await self._run(args=kwargs, cancellation_token=cancellation_token, session=session)
+
         async with create_mcp_server_session(self._server_params) as session:
             await session.initialize()
             return await self._run(args=kwargs, cancellation_token=cancellation_token, session=session)
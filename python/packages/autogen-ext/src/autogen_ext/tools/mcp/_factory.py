@@ -1,6 +1,7 @@
 from mcp import ClientSession
 
 from ._config import McpServerParams, SseServerParams, StdioServerParams, StreamableHttpServerParams
+from ._pool import McpSessionPool
 from ._session import create_mcp_server_session
 from ._sse import SseMcpToolAdapter
 from ._stdio import StdioMcpToolAdapter
@@ -10,6 +11,7 @@
 async def mcp_server_tools(
     server_params: McpServerParams,
     session: ClientSession | None = None,
+    session_pool: McpSessionPool | None = None,
 ) -> list[StdioMcpToolAdapter | SseMcpToolAdapter | StreamableHttpMcpToolAdapter]:
     """Creates a list of MCP tool adapters that can be used with AutoGen agents.
 
@@ -31,6 +33,9 @@ async def mcp_server_tools(
         session (ClientSession | None): Optional existing session to use. This is used
             when you want to reuse an existing connection to the MCP server. The session
             will be reused when creating the MCP tool adapters.
+        session_pool (McpSessionPool | None): (Experimental) Optional pool of sessions. If no
+            session is given, the tools are listed over a session from the pool, and each
+            tool call takes a session from the pool instead of starting a new one.
 
     Returns:
         list[StdioMcpToolAdapter | SseMcpToolAdapter | StreamableHttpMcpToolAdapter]:
@@ -189,7 +194,10 @@ async def main() -> None:
 
     For more examples and detailed usage, see the samples directory in the package repository.
     """
-    if session is None:
+    if session is None and session_pool is not None:
+        async with session_pool.session(server_params) as pooled_session:
+            tools = await pooled_session.list_tools()
+    elif session is None:
         async with create_mcp_server_session(server_params) as temp_session:
             await temp_session.initialize()
 
@@ -198,12 +206,20 @@ async def main() -> None:
         tools = await session.list_tools()
 
     if isinstance(server_params, StdioServerParams):
-        return [StdioMcpToolAdapter(server_params=server_params, tool=tool, session=session) for tool in tools.tools]
+        return [
+            StdioMcpToolAdapter(server_params=server_params, tool=tool, session=session, session_pool=session_pool)
+            for tool in tools.tools
+        ]
     elif isinstance(server_params, SseServerParams):
-        return [SseMcpToolAdapter(server_params=server_params, tool=tool, session=session) for tool in tools.tools]
+        return [
+            SseMcpToolAdapter(server_params=server_params, tool=tool, session=session, session_pool=session_pool)
+            for tool in tools.tools
+        ]
     elif isinstance(server_params, StreamableHttpServerParams):
         return [
-            StreamableHttpMcpToolAdapter(server_params=server_params, tool=tool, session=session)
+            StreamableHttpMcpToolAdapter(
+                server_params=server_params, tool=tool, session=session, session_pool=session_pool
+            )
             for tool in tools.tools
         ]
     raise ValueError(f"Unsupported server params type: {type(server_params)}")
@@ -0,0 +1,320 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from types import TracebackType
+from typing import AsyncGenerator, Dict, List, Set
+
+import anyio
+from typing_extensions import Self
+
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from ._config import McpServerParams
+from ._session import create_mcp_server_session
+
+logger = logging.getLogger(__name__)
+
+# Errors after which a session can no longer send requests.
+_BROKEN_SESSION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+# The shortest time between background checks of the sessions, in seconds.
+_MIN_CHECK_INTERVAL = 1.0
+
+
+@dataclass
+class McpSessionPoolStats:
+    """Counters of an :class:`McpSessionPool`, over all servers."""
+
+    leases: int = 0
+    """Sessions handed out by :meth:`McpSessionPool.session`."""
+    sessions_started: int = 0
+    sessions_failed: int = 0
+    """Sessions that failed to start, failed a health check or broke during a call."""
+    sessions_reaped: int = 0
+    """Sessions closed after being idle for longer than the idle timeout."""
+
+
+class _PooledSession:
+    """A session kept open by a background task, so that any task can send requests on it."""
+
+    def __init__(self, server_params: McpServerParams) -> None:
+        self.server_params = server_params
+        self.session: ClientSession | None = None
+        self.in_flight = 0
+        self.last_used = time.monotonic()
+        self.closed = False
+        self._ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        # Retrieve a failure to start even if nobody waits for the session, as for a warm session.
+        self._ready.add_done_callback(lambda future: future.cancelled() or future.exception())
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def usable(self) -> bool:
+        return not self.closed and not self._task.done()
+
+    async def _run(self) -> None:
+        # The session is entered and exited in this task, as its transport requires.
+        try:
+            async with create_mcp_server_session(self.server_params) as session:
+                await session.initialize()
+                self.session = session
+                self._ready.set_result(None)
+                await self._closing.wait()
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            elif not self.closed:
+                logger.warning("Pooled MCP session ended with an error: %s", e)
+        finally:
+            self.session = None
+            if not self._ready.done():
+                self._ready.set_exception(RuntimeError("MCP session closed before it started."))
+
+    async def wait_ready(self) -> ClientSession:
+        # Shielded, so that a cancelled caller doesn't cancel the start for other callers.
+        await asyncio.shield(self._ready)
+        if self.session is None:
+            raise RuntimeError("MCP session closed.")
+        return self.session
+
+    async def ping(self, timeout: float) -> bool:
+        if self.session is None:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        self.closed = True
+        self._closing.set()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class McpSessionPool:
+    """(Experimental) A pool of warm MCP client sessions, shared by any number of
+    :class:`McpWorkbench` instances and MCP tool adapters.
+
+    Sessions are kept per server, where servers with equal parameters share their sessions.
+    A session serves any number of concurrent calls. When all of a server's sessions are busy,
+    another is started, up to ``max_sessions_per_server``, after which calls are spread over
+    the least busy sessions. For a stdio server, each session is a separate server process, so
+    calls that a server handles one at a time run in parallel across its sessions.
+
+    In the background, idle sessions are checked with a ping and replaced if they don't answer,
+    sessions idle for longer than ``idle_timeout`` are closed down to ``min_sessions_per_server``,
+    and a session that breaks during a call is replaced on the next call.
+
+    The pool is used from one event loop, and should be closed with :meth:`close`, or used as
+    an async context manager.
+
+    Args:
+        max_sessions_per_server (int): The most sessions kept open for one server. Defaults to 4.
+        min_sessions_per_server (int): The sessions started by :meth:`start` and kept open while
+            idle. Defaults to 1.
+        idle_timeout (float | None): Seconds after which an idle session is closed, if the
+            server has more than ``min_sessions_per_server`` sessions. ``None`` keeps idle
+            sessions open. Defaults to 300.
+        health_check_interval (float | None): Seconds between pings of idle sessions.
+            ``None`` disables health checks. Defaults to 30.
+        health_check_timeout (float): Seconds to wait for the answer to a ping. Defaults to 10.
+
+    Example:
+
+        .. code-block:: python
+
+            import asyncio
+
+            from autogen_ext.tools.mcp import McpSessionPool, McpWorkbench, StdioServerParams
+
+
+            async def main() -> None:
+                params = StdioServerParams(command="uvx", args=["mcp-server-fetch"], read_timeout_seconds=60)
+                async with McpSessionPool(max_sessions_per_server=4) as pool:
+                    async with McpWorkbench(params, session_pool=pool) as workbench:
+                        urls = ["https://github.com/", "https://www.python.org/"]
+                        results = await asyncio.gather(*(workbench.call_tool("fetch", {"url": url}) for url in urls))
+                        print(results)
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        max_sessions_per_server: int = 4,
+        min_sessions_per_server: int = 1,
+        idle_timeout: float | None = 300.0,
+        health_check_interval: float | None = 30.0,
+        health_check_timeout: float = 10.0,
+    ) -> None:
+        if max_sessions_per_server < 1:
+            raise ValueError("max_sessions_per_server must be at least 1.")
+        if not 0 <= min_sessions_per_server <= max_sessions_per_server:
+            raise ValueError("min_sessions_per_server must be between 0 and max_sessions_per_server.")
+        self._max_sessions = max_sessions_per_server
+        self._min_sessions = min_sessions_per_server
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._sessions: Dict[str, List[_PooledSession]] = {}
+        # Servers to keep min_sessions_per_server sessions open for, once started.
+        self._warm_servers: Dict[str, McpServerParams] = {}
+        self._closing_tasks: Set[asyncio.Task[None]] = set()
+        self._maintenance_task: asyncio.Task[None] | None = None
+        self._stats = McpSessionPoolStats()
+
+    @property
+    def stats(self) -> McpSessionPoolStats:
+        return self._stats
+
+    def num_sessions(self, server_params: McpServerParams) -> int:
+        """Returns the number of open or starting sessions for a server."""
+        return sum(1 for pooled in self._sessions.get(self._key(server_params), []) if pooled.usable)
+
+    @staticmethod
+    def _key(server_params: McpServerParams) -> str:
+        return server_params.model_dump_json()
+
+    async def start(self, server_params: McpServerParams) -> None:
+        """Starts ``min_sessions_per_server`` sessions for a server, and keeps them open until :meth:`close`."""
+        key = self._key(server_params)
+        self._warm_servers[key] = server_params
+        starting = [
+            self._start_session(server_params) for _ in range(self._min_sessions - self.num_sessions(server_params))
+        ]
+        self._ensure_maintenance()
+        results = await asyncio.gather(*(pooled.wait_ready() for pooled in starting), return_exceptions=True)
+        for pooled, result in zip(starting, results, strict=True):
+            if isinstance(result, BaseException):
+                self._discard(pooled, failed=True)
+        if self.num_sessions(server_params) == 0:
+            error = next((result for result in results if isinstance(result, BaseException)), None)
+            raise error or RuntimeError("No MCP session could be started.")
+
+    @asynccontextmanager
+    async def session(self, server_params: McpServerParams) -> AsyncGenerator[ClientSession, None]:
+        """Leases a session for a server, starting one if needed.
+
+        The session may be used by other callers at the same time, so it must not be closed.
+        """
+        pooled = self._lease(server_params)
+        try:
+            try:
+                session = await pooled.wait_ready()
+            except Exception:
+                self._discard(pooled, failed=True)
+                raise
+            try:
+                yield session
+            except _BROKEN_SESSION_ERRORS:
+                self._discard(pooled, failed=True)
+                raise
+            except McpError as e:
+                if e.error.code == CONNECTION_CLOSED:
+                    self._discard(pooled, failed=True)
+                raise
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+
+    def _lease(self, server_params: McpServerParams) -> _PooledSession:
+        self._ensure_maintenance()
+        sessions = self._sessions.setdefault(self._key(server_params), [])
+        for pooled in [pooled for pooled in sessions if not pooled.usable]:
+            self._discard(pooled, failed=True)
+        least_busy = min(sessions, key=lambda pooled: pooled.in_flight, default=None)
+        if least_busy is None or (least_busy.in_flight > 0 and len(sessions) < self._max_sessions):
+            least_busy = self._start_session(server_params)
+        least_busy.in_flight += 1
+        least_busy.last_used = time.monotonic()
+        self._stats.leases += 1
+        return least_busy
+
+    def _start_session(self, server_params: McpServerParams) -> _PooledSession:
+        pooled = _PooledSession(server_params)
+        self._sessions.setdefault(self._key(server_params), []).append(pooled)
+        self._stats.sessions_started += 1
+        return pooled
+
+    def _discard(self, pooled: _PooledSession, failed: bool = False, reaped: bool = False) -> None:
+        """Removes a session from the pool and closes it in the background."""
+        sessions = self._sessions.get(self._key(pooled.server_params), [])
+        if pooled not in sessions:
+            return
+        sessions.remove(pooled)
+        if failed:
+            self._stats.sessions_failed += 1
+        if reaped:
+            self._stats.sessions_reaped += 1
+        task = asyncio.create_task(pooled.close())
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+    def _ensure_maintenance(self) -> None:
+        intervals = [interval for interval in (self._health_check_interval, self._idle_timeout) if interval is not None]
+        if intervals and (self._maintenance_task is None or self._maintenance_task.done()):
+            self._maintenance_task = asyncio.create_task(self._maintain(max(min(intervals), _MIN_CHECK_INTERVAL)))
+
+    async def _maintain(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.check_sessions()
+            except Exception:
+                logger.exception("Error while checking pooled MCP sessions")
+
+    async def check_sessions(self) -> None:
+        """Closes sessions that have been idle too long, pings the other idle sessions and
+        replaces those that don't answer. This is run periodically in the background."""
+        now = time.monotonic()
+        to_ping: List[_PooledSession] = []
+        for key, sessions in list(self._sessions.items()):
+            for pooled in [pooled for pooled in sessions if not pooled.usable]:
+                self._discard(pooled, failed=True)
+            idle = sorted(
+                (pooled for pooled in sessions if pooled.in_flight == 0 and pooled.session is not None),
+                key=lambda pooled: pooled.last_used,
+            )
+            for pooled in idle:
+                expired = self._idle_timeout is not None and now - pooled.last_used >= self._idle_timeout
+                min_sessions = self._min_sessions if key in self._warm_servers else 0
+                if expired and len(sessions) > min_sessions:
+                    self._discard(pooled, reaped=True)
+                elif self._health_check_interval is not None:
+                    to_ping.append(pooled)
+        results = await asyncio.gather(*(pooled.ping(self._health_check_timeout) for pooled in to_ping))
+        for pooled, healthy in zip(to_ping, results, strict=True):
+            if not healthy and pooled.in_flight == 0:
+                self._discard(pooled, failed=True)
+        # Replace the sessions of started servers that were closed.
+        for server_params in self._warm_servers.values():
+            for _ in range(self._min_sessions - self.num_sessions(server_params)):
+                self._start_session(server_params)
+
+    async def close(self) -> None:
+        """Closes all sessions."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            await asyncio.gather(self._maintenance_task, return_exceptions=True)
+            self._maintenance_task = None
+        self._warm_servers.clear()
+        for sessions in self._sessions.values():
+            for pooled in list(sessions):
+                self._discard(pooled)
+        self._sessions.clear()
+        await asyncio.gather(*self._closing_tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        await self.close()
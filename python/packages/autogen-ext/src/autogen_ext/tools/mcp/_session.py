@@ -3,7 +3,7 @@
 from typing import AsyncGenerator
 
 from mcp import ClientSession
-from mcp.client.session import SamplingFnT
+from mcp.client.session import MessageHandlerFnT, SamplingFnT
 from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
@@ -13,7 +13,9 @@
 
 @asynccontextmanager
 async def create_mcp_server_session(
-    server_params: McpServerParams, sampling_callback: SamplingFnT | None = None
+    server_params: McpServerParams,
+    sampling_callback: SamplingFnT | None = None,
+    message_handler: MessageHandlerFnT | None = None,
 ) -> AsyncGenerator[ClientSession, None]:
     """Create an MCP client session for the given server parameters."""
     if isinstance(server_params, StdioServerParams):
@@ -23,6 +25,7 @@ async def create_mcp_server_session(
                 write_stream=write,
                 read_timeout_seconds=timedelta(seconds=server_params.read_timeout_seconds),
                 sampling_callback=sampling_callback,
+                message_handler=message_handler,
             ) as session:
                 yield session
     elif isinstance(server_params, SseServerParams):
@@ -32,6 +35,7 @@ async def create_mcp_server_session(
                 write_stream=write,
                 read_timeout_seconds=timedelta(seconds=server_params.sse_read_timeout),
                 sampling_callback=sampling_callback,
+                message_handler=message_handler,
             ) as session:
                 yield session
     elif isinstance(server_params, StreamableHttpServerParams):
@@ -51,5 +55,6 @@ async def create_mcp_server_session(
                 write_stream=write,
                 read_timeout_seconds=timedelta(seconds=server_params.sse_read_timeout),
                 sampling_callback=sampling_callback,
+                message_handler=message_handler,
             ) as session:
                 yield session
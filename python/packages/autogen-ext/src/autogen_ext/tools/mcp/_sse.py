@@ -6,6 +6,7 @@
 
 from ._base import McpToolAdapter
 from ._config import SseServerParams
+from ._pool import McpSessionPool
 
 
 class SseMcpToolAdapterConfig(BaseModel):
@@ -41,6 +42,8 @@ class SseMcpToolAdapter(
         session (ClientSession, optional): The MCP client session to use. If not provided,
             it will create a new session. This is useful for testing or when you want to
             manage the session lifecycle yourself.
+        session_pool (McpSessionPool, optional): (Experimental) A pool to take a session from
+            for each call, when no session is given, instead of creating a new session.
 
     Examples:
         Use a remote translation service that implements MCP over SSE to create tools
@@ -90,8 +93,14 @@ async def main() -> None:
     component_config_schema = SseMcpToolAdapterConfig
     component_provider_override = "autogen_ext.tools.mcp.SseMcpToolAdapter"
 
-    def __init__(self, server_params: SseServerParams, tool: Tool, session: ClientSession | None = None) -> None:
-        super().__init__(server_params=server_params, tool=tool, session=session)
+    def __init__(
+        self,
+        server_params: SseServerParams,
+        tool: Tool,
+        session: ClientSession | None = None,
+        session_pool: McpSessionPool | None = None,
+    ) -> None:
+        super().__init__(server_params=server_params, tool=tool, session=session, session_pool=session_pool)
 
     def _to_config(self) -> SseMcpToolAdapterConfig:
         """
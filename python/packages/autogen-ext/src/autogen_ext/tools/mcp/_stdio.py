@@ -6,6 +6,7 @@
 
 from ._base import McpToolAdapter
 from ._config import StdioServerParams
+from ._pool import McpSessionPool
 
 
 class StdioMcpToolAdapterConfig(BaseModel):
@@ -41,6 +42,8 @@ class StdioMcpToolAdapter(
         session (ClientSession, optional): The MCP client session to use. If not provided,
             a new session will be created. This is useful for testing or when you want to
             manage the session lifecycle yourself.
+        session_pool (McpSessionPool, optional): (Experimental) A pool to take a session from
+            for each call, when no session is given, instead of creating a new session.
 
     See :func:`~autogen_ext.tools.mcp.mcp_server_tools` for examples.
     """
@@ -48,8 +51,14 @@ class StdioMcpToolAdapter(
     component_config_schema = StdioMcpToolAdapterConfig
     component_provider_override = "autogen_ext.tools.mcp.StdioMcpToolAdapter"
 
-    def __init__(self, server_params: StdioServerParams, tool: Tool, session: ClientSession | None = None) -> None:
-        super().__init__(server_params=server_params, tool=tool, session=session)
+    def __init__(
+        self,
+        server_params: StdioServerParams,
+        tool: Tool,
+        session: ClientSession | None = None,
+        session_pool: McpSessionPool | None = None,
+    ) -> None:
+        super().__init__(server_params=server_params, tool=tool, session=session, session_pool=session_pool)
 
     def _to_config(self) -> StdioMcpToolAdapterConfig:
         """
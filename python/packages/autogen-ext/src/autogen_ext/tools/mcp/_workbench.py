@@ -1,5 +1,6 @@
 import asyncio
 import builtins
+import time
 import warnings
 from typing import Any, Dict, List, Literal, Mapping, Optional
 
@@ -32,12 +33,14 @@
 
 from ._actor import McpSessionActor
 from ._config import McpServerParams, SseServerParams, StdioServerParams, StreamableHttpServerParams
+from ._pool import McpSessionPool
 
 
 class McpWorkbenchConfig(BaseModel):
     server_params: McpServerParams
     tool_overrides: Dict[str, ToolOverride] = Field(default_factory=dict)
     model_client: ComponentModel | Dict[str, Any] | None = None
+    tools_cache_ttl: float | None = None
 
 
 class McpWorkbenchState(BaseModel):
@@ -83,6 +86,18 @@ class McpWorkbench(Workbench, Component[McpWorkbenchConfig]):
             from MCP servers that support the sampling capability. This allows MCP
             servers to request text generation from a language model during tool
             execution. If not provided, sampling requests will return an error.
+        tools_cache_ttl (Optional[float]): (Experimental) The tool schemas returned by
+            :meth:`list_tools` are cached for the session, with the overrides applied,
+            until the server sends a ``notifications/tools/list_changed`` notification.
+            If set, the cache also expires after this many seconds, for servers that
+            change their tools without notifying. Set to ``0`` to list the tools from
+            the server on every call. Defaults to ``None``.
+        session_pool (Optional[McpSessionPool]): (Experimental) A pool of sessions, which can be
+            shared with other workbenches and tool adapters, to send tool calls over. Concurrent
+            tool calls are then spread over several warm sessions of the server, instead of
+            all going over the workbench's own session. Tool calls still go over the workbench's
+            own session if a ``model_client`` is set, since sampling requests are answered there.
+            The pool is not part of the component config. Defaults to ``None``.
 
     Raises:
         ValueError: If there are conflicts in tool override names.
@@ -236,10 +251,14 @@ def __init__(
         server_params: McpServerParams,
         tool_overrides: Optional[Dict[str, ToolOverride]] = None,
         model_client: ChatCompletionClient | None = None,
+        tools_cache_ttl: float | None = None,
+        session_pool: McpSessionPool | None = None,
     ) -> None:
         self._server_params = server_params
         self._tool_overrides = tool_overrides or {}
         self._model_client = model_client
+        self._tools_cache_ttl = tools_cache_ttl
+        self._session_pool = session_pool
 
         # Build reverse mapping from override names to original names for call_tool
         self._override_name_to_original: Dict[str, str] = {}
@@ -261,6 +280,12 @@ def __init__(
         self._read = None
         self._write = None
 
+        # The tool schemas from the last listing, with the actor and tool list version they were listed at.
+        self._tools_cache: List[ToolSchema] | None = None
+        self._tools_cache_key: tuple[McpSessionActor, int] | None = None
+        self._tools_cache_time = 0.0
+        self._tools_cache_lock = asyncio.Lock()
+
     @property
     def server_params(self) -> McpServerParams:
         return self._server_params
@@ -272,7 +297,28 @@ async def list_tools(self) -> List[ToolSchema]:
             # raise RuntimeError("Actor is not initialized. Call start() first.")
         if self._actor is None:
             raise RuntimeError("Actor is not initialized. Please check the server connection.")
-        result_future = await self._actor.call("list_tools", None)
+        # Only one listing is in flight at a time, so concurrent callers share it.
+        async with self._tools_cache_lock:
+            actor = self._actor
+            # The version is read before listing, so a change notified during the listing invalidates it.
+            key = (actor, actor.tool_list_version)
+            if (
+                self._tools_cache is not None
+                and self._tools_cache_key is not None
+                and self._tools_cache_key[0] is key[0]
+                and self._tools_cache_key[1] == key[1]
+                and (self._tools_cache_ttl is None or time.monotonic() - self._tools_cache_time < self._tools_cache_ttl)
+            ):
+                return list(self._tools_cache)
+            schema = await self._list_tools_from_server(actor)
+            if self._tools_cache_ttl != 0:
+                self._tools_cache = schema
+                self._tools_cache_key = key
+                self._tools_cache_time = time.monotonic()
+            return list(schema)
+
+    async def _list_tools_from_server(self, actor: McpSessionActor) -> List[ToolSchema]:
+        result_future = await actor.call("list_tools", None)
         list_tool_result = await result_future
         assert isinstance(
             list_tool_result, ListToolsResult
@@ -312,11 +358,12 @@ async def call_tool(
         cancellation_token: CancellationToken | None = None,
         call_id: str | None = None,
     ) -> ToolResult:
-        if not self._actor:
+        use_pool = self._session_pool is not None and self._model_client is None
+        if not self._actor and not use_pool:
             await self.start()  # fallback to start the actor if not initialized instead of raising an error
             # Why? Because when deserializing the workbench, the actor might not be initialized yet.
             # raise RuntimeError("Actor is not initialized. Call start() first.")
-        if self._actor is None:
+        if self._actor is None and not use_pool:
             raise RuntimeError("Actor is not initialized. Please check the server connection.")
         if not cancellation_token:
             cancellation_token = CancellationToken()
@@ -331,9 +378,20 @@ async def call_tool(
             tool_call_id=call_id,
         ):
             try:
-                result_future = await self._actor.call("call_tool", {"name": original_name, "kargs": arguments})
-                cancellation_token.link_future(result_future)
-                result = await result_future
+                result: object
+                if use_pool:
+                    assert self._session_pool is not None
+                    async with self._session_pool.session(self._server_params) as session:
+                        pooled_future = asyncio.ensure_future(
+                            session.call_tool(name=original_name, arguments=dict(arguments))
+                        )
+                        cancellation_token.link_future(pooled_future)
+                        result = await pooled_future
+                else:
+                    assert self._actor is not None
+                    result_future = await self._actor.call("call_tool", {"name": original_name, "kargs": arguments})
+                    cancellation_token.link_future(result_future)
+                    result = await result_future
                 assert isinstance(
                     result, CallToolResult
                 ), f"call_tool must return a CallToolResult, instead of : {str(type(result))}"
@@ -464,6 +522,8 @@ async def start(self) -> None:
             self._actor = McpSessionActor(self._server_params, model_client=self._model_client)
             await self._actor.initialize()
             self._actor_loop = asyncio.get_event_loop()
+            if self._session_pool is not None and self._model_client is None:
+                await self._session_pool.start(self._server_params)
         else:
             raise ValueError(f"Unsupported server params type: {type(self._server_params)}")
 
@@ -472,6 +532,8 @@ async def stop(self) -> None:
             # Close the actor
             await self._actor.close()
             self._actor = None
+            self._tools_cache = None
+            self._tools_cache_key = None
         else:
             raise RuntimeError("McpWorkbench is not started. Call start() first.")
 
@@ -489,7 +551,10 @@ def _to_config(self) -> McpWorkbenchConfig:
         if self._model_client is not None:
             model_client_config = self._model_client.dump_component()
         return McpWorkbenchConfig(
-            server_params=self._server_params, tool_overrides=self._tool_overrides, model_client=model_client_config
+            server_params=self._server_params,
+            tool_overrides=self._tool_overrides,
+            model_client=model_client_config,
+            tools_cache_ttl=self._tools_cache_ttl,
         )
 
     @classmethod
@@ -497,7 +562,12 @@ def _from_config(cls, config: McpWorkbenchConfig) -> Self:
         model_client = None
         if config.model_client is not None:
             model_client = ChatCompletionClient.load_component(config.model_client)
-        return cls(server_params=config.server_params, tool_overrides=config.tool_overrides, model_client=model_client)
+        return cls(
+            server_params=config.server_params,
+            tool_overrides=config.tool_overrides,
+            model_client=model_client,
+            tools_cache_ttl=config.tools_cache_ttl,
+        )
 
     def __del__(self) -> None:
         # Ensure the actor is stopped when the workbench is deleted
@@ -18,7 +18,8 @@
 import pytest_asyncio
 from aiofiles import open
 from autogen_core import CancellationToken
-from autogen_core.code_executor import CodeBlock
+from autogen_core.code_executor import CodeBlock, CodeOutputChunk
+from autogen_ext.code_executors._common import CommandLineCodeResult, OutputBuffer
 from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
 
 HAS_POWERSHELL: bool = platform.system() == "Windows" and (
@@ -445,3 +446,217 @@ async def test_cleanup_temp_files_oserror(caplog: pytest.LogCaptureFixture) -> N
                 # The code file should have been attempted to be deleted and failed
                 assert any("Failed to delete temporary file" in record.message for record in caplog.records)
                 assert any("Mocked OSError" in record.message for record in caplog.records)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows.")
+async def test_forkserver_execute_code() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        (Path(temp_dir) / "helper_module.py").write_text("VALUE = 42\n")
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, use_forkserver=True, preload_modules=["json", "helper_module"]
+        )
+        await executor.start()
+        cancellation_token = CancellationToken()
+
+        code = "import os, sys, helper_module\nprint(helper_module.VALUE, os.getcwd())\nprint('oops', file=sys.stderr)"
+        result = await executor.execute_code_blocks([CodeBlock(code=code, language="python")], cancellation_token)
+        assert result.exit_code == 0
+        assert f"42 {Path(temp_dir).resolve()}" in result.output
+        assert result.output.index("oops") < result.output.index("42")
+
+        # Every block runs in a fresh child, so state does not leak between blocks.
+        code_blocks = [
+            CodeBlock(
+                code="import helper_module; helper_module.VALUE = 0; import os; print(os.getpid())", language="python"
+            ),
+            CodeBlock(code="import helper_module; print('value', helper_module.VALUE)", language="python"),
+        ]
+        result = await executor.execute_code_blocks(code_blocks, cancellation_token)
+        assert result.exit_code == 0 and "value 42" in result.output
+
+        # Exit codes and exceptions are reported like a cold interpreter.
+        result = await executor.execute_code_blocks(
+            [CodeBlock(code="import sys; sys.exit(3)", language="python")], cancellation_token
+        )
+        assert result.exit_code == 3
+        result = await executor.execute_code_blocks(
+            [CodeBlock(code="raise ValueError('boom')", language="python")], cancellation_token
+        )
+        assert result.exit_code == 1 and "ValueError: boom" in result.output
+
+        # Shell blocks are not affected.
+        result = await executor.execute_code_blocks([CodeBlock(code="echo shell", language="sh")], cancellation_token)
+        assert result.exit_code == 0 and "shell" in result.output
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows.")
+async def test_forkserver_timeout_and_cancellation() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(timeout=1, work_dir=temp_dir, use_forkserver=True)
+        await executor.start()
+        code_blocks = [CodeBlock(code="import time; time.sleep(10); print('hello world!')", language="python")]
+        result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+        assert result.exit_code == 124 and "Timeout" in result.output
+
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, use_forkserver=True)
+        await executor.start()
+        code = 'import time\ntime.sleep(10)\nwith open("hello.txt", "w") as f:\n    f.write("hello world!")\n'
+        cancellation_token = CancellationToken()
+        task = asyncio.create_task(
+            executor.execute_code_blocks([CodeBlock(code=code, language="python")], cancellation_token)
+        )
+        await asyncio.sleep(1)
+        cancellation_token.cancel()
+        result = await task
+        assert result.exit_code == 125 and "Cancelled" in result.output
+        await asyncio.sleep(0.5)
+        assert not (Path(temp_dir) / "hello.txt").exists()
+
+        # The server is still usable after a child was terminated.
+        result = await executor.execute_code_blocks(
+            [CodeBlock(code="print('after')", language="python")], CancellationToken()
+        )
+        assert result.exit_code == 0 and "after" in result.output
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows.")
+async def test_forkserver_preload_failure() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, use_forkserver=True, preload_modules=["module_that_does_not_exist"]
+        )
+        with pytest.raises(ValueError, match="module_that_does_not_exist"):
+            await executor.execute_code_blocks([CodeBlock(code="print(1)", language="python")], CancellationToken())
+        await executor.stop()
+
+    with pytest.raises(ValueError):
+        LocalCommandLineCodeExecutor(use_forkserver=True, preload_modules=["not a module"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows.")
+async def test_forkserver_serialize_deserialize() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, use_forkserver=True, preload_modules=["json"])
+        loaded_executor = LocalCommandLineCodeExecutor.load_component(executor.dump_component())
+        assert loaded_executor.use_forkserver
+        assert loaded_executor.preload_modules == ["json"]
+
+
+def test_output_buffer() -> None:
+    buffer = OutputBuffer(10)
+    assert buffer.write(b"abcd") == b"abcd"
+    assert buffer.write(b"efgh") == b"efgh"
+    assert not buffer.truncated
+    assert buffer.getvalue() == "abcdefgh"
+    assert buffer.write(b"ijklmnopqrstuvwxyz") == b"ij"
+    assert buffer.truncated
+    assert buffer.total_bytes == 26
+    assert buffer.getvalue() == "abcde\n... [16 bytes truncated] ...\nvwxyz"
+
+    unlimited = OutputBuffer()
+    unlimited.write(b"x" * 1000)
+    assert unlimited.getvalue() == "x" * 1000
+
+    with pytest.raises(ValueError):
+        OutputBuffer(1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "use_forkserver",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows."),
+        ),
+    ],
+)
+async def test_execute_code_blocks_stream(use_forkserver: bool) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, use_forkserver=use_forkserver)
+        await executor.start()
+        code = "import sys, time\nprint('one', flush=True)\ntime.sleep(0.5)\nprint('two', file=sys.stderr)"
+        chunks: list[CodeOutputChunk] = []
+        result = None
+        async for item in executor.execute_code_blocks_stream(
+            [CodeBlock(code=code, language="python")], CancellationToken()
+        ):
+            if isinstance(item, CodeOutputChunk):
+                chunks.append(item)
+            else:
+                result = item
+        # The stdout chunk is received while the code is still sleeping, before the stderr chunk.
+        assert chunks[0].stream == "stdout"
+        assert "".join(c.output for c in chunks if c.stream == "stdout") == "one\n"
+        assert "".join(c.output for c in chunks if c.stream == "stderr") == "two\n"
+        assert isinstance(result, CommandLineCodeResult)
+        assert result.exit_code == 0 and result.output == "two\none\n"
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "use_forkserver",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(sys.platform == "win32", reason="The fork server is not supported on Windows."),
+        ),
+    ],
+)
+async def test_output_limit(use_forkserver: bool) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        flood = "import sys\nfor i in range(200000):\n    print('line', i)\nprint('done')"
+        executor = LocalCommandLineCodeExecutor(work_dir=temp_dir, use_forkserver=use_forkserver, max_output_bytes=1000)
+        await executor.start()
+        result = await executor.execute_code_blocks([CodeBlock(code=flood, language="python")], CancellationToken())
+        assert result.exit_code == 0
+        assert result.output.startswith("line 0\n")
+        assert result.output.endswith("line 199999\ndone\n")
+        assert "bytes truncated" in result.output
+        assert len(result.output) < 1100
+
+        streamed = 0
+        async for item in executor.execute_code_blocks_stream(
+            [CodeBlock(code=flood, language="python")], CancellationToken()
+        ):
+            if isinstance(item, CodeOutputChunk):
+                streamed += len(item.output)
+        assert streamed == 1000
+        await executor.stop()
+
+        executor = LocalCommandLineCodeExecutor(
+            work_dir=temp_dir, use_forkserver=use_forkserver, max_output_bytes=1000, kill_on_output_overflow=True
+        )
+        await executor.start()
+        forever = "while True:\n    print('x' * 100)"
+        result = await executor.execute_code_blocks([CodeBlock(code=forever, language="python")], CancellationToken())
+        assert result.exit_code == 1
+        assert "Output limit exceeded" in result.output
+        await executor.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="SIGTERM cannot be ignored on Windows.")
+@pytest.mark.parametrize("use_forkserver", [False, True])
+async def test_timeout_kills_code_ignoring_sigterm(use_forkserver: bool) -> None:
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        patch("autogen_ext.code_executors._common.TERMINATE_GRACE_PERIOD", 0.5),
+    ):
+        executor = LocalCommandLineCodeExecutor(timeout=1, work_dir=temp_dir, use_forkserver=use_forkserver)
+        await executor.start()
+        code = "import signal, time\nsignal.signal(signal.SIGTERM, signal.SIG_IGN)\ntime.sleep(30)"
+        result = await asyncio.wait_for(
+            executor.execute_code_blocks([CodeBlock(code=code, language="python")], CancellationToken()), 10
+        )
+        assert result.exit_code and "Timeout" in result.output
+        await executor.stop()
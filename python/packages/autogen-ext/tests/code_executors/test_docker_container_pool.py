@@ -0,0 +1,242 @@
+import asyncio
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple
+
+import pytest
+from autogen_ext.code_executors.docker import (
+    DockerCommandLineCodeExecutor,
+    DockerContainerPool,
+)
+
+
+class _ExecResult(NamedTuple):
+    exit_code: int
+    output: bytes
+
+
+class _FakeContainer:
+    def __init__(self, name: str, kwargs: Dict[str, Any]) -> None:
+        self.name = name
+        self.id = name
+        self.kwargs = kwargs
+        self.status = "created"
+        self.removed = False
+        self.commands: List[List[str]] = []
+        self.exec_exit_code = 0
+        # Raised by the next reload, to simulate an unexpected error.
+        self.reload_error: Exception | None = None
+
+    def start(self) -> None:
+        self.status = "running"
+
+    def reload(self) -> None:
+        error, self.reload_error = self.reload_error, None
+        if error is not None:
+            raise error
+
+    def exec_run(self, command: List[str]) -> _ExecResult:
+        self.commands.append(command)
+        return _ExecResult(self.exec_exit_code, b"")
+
+    def remove(self, force: bool = False) -> None:
+        self.removed = True
+        self.status = "removed"
+
+
+class _FakeContainers:
+    def __init__(self) -> None:
+        self.created: List[_FakeContainer] = []
+        # Set to block the creation of containers until it is released.
+        self.gate: threading.Event | None = None
+
+    def create(self, image: str, *, name: str, **kwargs: Any) -> _FakeContainer:
+        if self.gate is not None:
+            self.gate.wait()
+        container = _FakeContainer(name, {"image": image, **kwargs})
+        self.created.append(container)
+        return container
+
+
+class _FakeImages:
+    def get(self, image: str) -> None:
+        pass
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.containers = _FakeContainers()
+        self.images = _FakeImages()
+
+
+@pytest.mark.asyncio
+async def test_container_pool_lease_and_release() -> None:
+    client = _FakeClient()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        async with DockerContainerPool(
+            min_size=2, max_size=3, work_dir=temp_dir, health_check_interval=None, client_factory=lambda: client
+        ) as pool:
+            # The pool is pre-warmed.
+            assert len(client.containers.created) == 2
+            assert pool.stats.idle == 2
+
+            leases = [await pool.lease() for _ in range(3)]
+            assert len({lease.container.name for lease in leases}) == 3
+            assert len(client.containers.created) == 3
+            for lease in leases:
+                assert lease.work_dir.parent == Path(temp_dir)
+                assert lease.container.kwargs["volumes"][str(lease.work_dir.resolve())]["bind"] == "/workspace"
+
+            # The pool is full, so the next lease waits for a container to be returned.
+            waiting = asyncio.create_task(pool.lease())
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            await pool.release(leases[0])
+            reused = await asyncio.wait_for(waiting, 1)
+            assert reused.container is leases[0].container
+            # The workspace was reset when the container was returned.
+            assert leases[0].container.commands[-1][0] == "sh"
+
+            await pool.release(leases[1])
+            await pool.release(leases[2])
+            await pool.release(reused)
+            assert pool.stats.leased == 0
+            assert pool.stats.idle == 3
+
+            # Idle containers are leased least recently returned first.
+            assert (await pool.lease()).container is leases[1].container
+
+        assert all(container.removed for container in client.containers.created)
+
+
+@pytest.mark.asyncio
+async def test_container_pool_replaces_unhealthy_containers() -> None:
+    client = _FakeClient()
+    async with DockerContainerPool(
+        min_size=1, max_size=2, health_check_interval=None, client_factory=lambda: client
+    ) as pool:
+        # A container that died while idle is replaced when leased.
+        dead = client.containers.created[0]
+        dead.status = "exited"
+        lease = await pool.lease()
+        assert lease.container is not dead
+        assert dead.removed
+
+        # A container that fails to reset is replaced when returned.
+        lease.container.exec_exit_code = 1
+        await pool.release(lease)
+        assert lease.container.removed
+        assert pool.stats.replaced == 2
+
+        # The pool is topped back up to min_size in the background.
+        for _ in range(100):
+            if pool.stats.idle == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.stats.idle == 1
+        assert pool.stats.created == 3
+
+
+@pytest.mark.asyncio
+async def test_container_pool_health_check() -> None:
+    client = _FakeClient()
+    async with DockerContainerPool(
+        min_size=2, max_size=2, health_check_interval=0.01, client_factory=lambda: client
+    ) as pool:
+        unhealthy = client.containers.created[0]
+        unhealthy.exec_exit_code = 1
+        for _ in range(100):
+            if unhealthy.removed and pool.stats.idle == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert unhealthy.removed
+        assert pool.stats.idle == 2
+        assert pool.stats.replaced == 1
+
+
+@pytest.mark.asyncio
+async def test_container_pool_health_check_survives_errors() -> None:
+    client = _FakeClient()
+    async with DockerContainerPool(
+        min_size=1, max_size=1, health_check_interval=0.01, client_factory=lambda: client
+    ) as pool:
+        failing = client.containers.created[0]
+        failing.reload_error = RuntimeError("Unexpected error")
+        for _ in range(100):
+            if failing.removed and pool.stats.idle == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert failing.removed
+        assert pool.stats.idle == 1
+
+        # Later passes still run.
+        unhealthy = client.containers.created[1]
+        unhealthy.exec_exit_code = 1
+        for _ in range(100):
+            if unhealthy.removed and pool.stats.idle == 1:
+                break
+            await asyncio.sleep(0.01)
+        assert unhealthy.removed
+        assert pool.stats.replaced == 2
+
+
+@pytest.mark.asyncio
+async def test_executor_leases_from_container_pool() -> None:
+    client = _FakeClient()
+    async with DockerContainerPool(
+        min_size=1, max_size=2, health_check_interval=None, client_factory=lambda: client
+    ) as pool:
+        with pytest.raises(ValueError):
+            DockerCommandLineCodeExecutor(container_pool=pool, work_dir=".")
+
+        executors = [DockerCommandLineCodeExecutor(container_pool=pool) for _ in range(2)]
+        for executor in executors:
+            await executor.start()
+        assert pool.stats.leased == 2
+        # Concurrent sessions run in different containers with separate workspaces.
+        assert executors[0].work_dir != executors[1].work_dir
+        assert isinstance(executors[0].work_dir, Path)
+
+        await executors[0].restart()
+        assert pool.stats.replaced == 1
+        assert pool.stats.leased == 2
+
+        for executor in executors:
+            await executor.stop()
+        assert pool.stats.leased == 0
+        assert pool.stats.idle == 2
+
+
+@pytest.mark.asyncio
+async def test_container_pool_stop_during_create() -> None:
+    client = _FakeClient()
+    pool = DockerContainerPool(min_size=0, max_size=2, health_check_interval=None, client_factory=lambda: client)
+    await pool.start()
+    client.containers.gate = threading.Event()
+    leasing = asyncio.create_task(pool.lease())
+    await asyncio.sleep(0.05)
+
+    stopping = asyncio.create_task(pool.stop())
+    await asyncio.sleep(0.05)
+    client.containers.gate.set()
+    await stopping
+    with pytest.raises(ValueError):
+        await leasing
+    # The container created after the pool stopped is not leaked.
+    assert len(client.containers.created) == 1
+    assert client.containers.created[0].removed
+
+
+@pytest.mark.asyncio
+async def test_executor_image_must_match_container_pool() -> None:
+    client = _FakeClient()
+    async with DockerContainerPool(
+        "python:3.12-slim", min_size=0, health_check_interval=None, client_factory=lambda: client
+    ) as pool:
+        with pytest.raises(ValueError):
+            DockerCommandLineCodeExecutor("python:3-slim", container_pool=pool)
+
+        executor = DockerCommandLineCodeExecutor(container_pool=pool)
+        assert executor.dump_component().config["image"] == "python:3.12-slim"
+        assert DockerCommandLineCodeExecutor("python:3.12-slim", container_pool=pool)
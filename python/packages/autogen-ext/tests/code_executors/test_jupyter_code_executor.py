@@ -1,11 +1,17 @@
 import asyncio
 import inspect
 from pathlib import Path
+from typing import List
 
 import pytest
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
-from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterCodeResult
+from autogen_ext.code_executors.jupyter import (
+    JupyterCodeExecutor,
+    JupyterCodeResult,
+    JupyterKernelLease,
+    JupyterKernelPool,
+)
 
 
 @pytest.mark.asyncio
@@ -225,3 +231,91 @@ async def test_runtime_error_not_started() -> None:
     code_blocks = [CodeBlock(code="print('hello world!')", language="python")]
     with pytest.raises(RuntimeError, match="Executor must be started before executing cells"):
         await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+
+@pytest.mark.asyncio
+async def test_execute_code_with_deduplicated_artifacts(tmp_path: Path) -> None:
+    async with JupyterCodeExecutor(output_dir=tmp_path, max_inline_output_bytes=100) as executor:
+        code_blocks = [
+            CodeBlock(
+                code=inspect.cleandoc("""
+                    from IPython.display import JSON
+                    from PIL import Image
+                    img = Image.new("RGB", (10, 10), color="white")
+                    display(img)
+                    display(img)
+                    display(JSON({"values": list(range(100))}))
+                """),
+                language="python",
+            )
+        ]
+
+        code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+        assert code_result.exit_code == 0
+        assert [artifact.mime_type for artifact in code_result.artifacts] == [
+            "image/png",
+            "image/png",
+            "application/json",
+        ]
+        # Identical images are stored once.
+        assert code_result.output_files[0] == code_result.output_files[1]
+        assert len(list(tmp_path.iterdir())) == 2
+        assert (await code_result.artifacts[0].aread_bytes()).startswith(b"\x89PNG")
+        # The large JSON output is referenced instead of included.
+        assert f"saved to {code_result.artifacts[2].path}" in code_result.output
+        assert '"values"' not in code_result.output
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool(tmp_path: Path) -> None:
+    async with JupyterKernelPool(min_size=1, max_size=2) as pool:
+        assert pool.stats.idle == 1
+        first = JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool)
+        second = JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool)
+        await first.start()
+        await second.start()
+        assert pool.stats.leased == 2
+
+        # Sessions have separate kernels.
+        await first.execute_code_blocks([CodeBlock(code="x = 1", language="python")], CancellationToken())
+        result = await second.execute_code_blocks([CodeBlock(code="print(x)", language="python")], CancellationToken())
+        assert result.exit_code == 1
+
+        await first.stop()
+        await second.stop()
+        for _ in range(300):
+            if pool.stats.idle == 2:
+                break
+            await asyncio.sleep(0.1)
+        assert pool.stats.idle == 2
+        assert pool.stats.restarted == 2
+
+        # A returned kernel is restarted, so the next session does not see the previous state.
+        async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool) as executor:
+            result = await executor.execute_code_blocks(
+                [CodeBlock(code="print('x' in globals())", language="python")], CancellationToken()
+            )
+            assert result.output.strip() == "False"
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool_stop_during_lease() -> None:
+    pool = JupyterKernelPool(min_size=0, max_size=1)
+    await pool.start()
+    shutdown: List[JupyterKernelLease] = []
+    shutdown_kernel = pool._shutdown  # type: ignore[reportPrivateUsage]
+
+    async def record_shutdown(lease: JupyterKernelLease) -> None:
+        shutdown.append(lease)
+        await shutdown_kernel(lease)
+
+    pool._shutdown = record_shutdown  # type: ignore[method-assign]
+    leasing = asyncio.create_task(pool.lease())
+    await asyncio.sleep(0)
+    await pool.stop()
+    with pytest.raises(ValueError):
+        await leasing
+    # The kernel started after the pool stopped is shut down instead of leaked.
+    assert len(shutdown) == 1
+    assert pool.stats.size == 0
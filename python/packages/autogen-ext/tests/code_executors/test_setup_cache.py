@@ -0,0 +1,70 @@
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+if sys.platform == "win32":
+    pytest.skip("The setup cache is not supported on Windows.", allow_module_level=True)
+
+from autogen_ext.code_executors.local import FunctionSetupCache
+
+
+def test_setup_cache_key() -> None:
+    key = FunctionSetupCache.key("def f(): pass", ["b", "a"], "python")
+    assert key == FunctionSetupCache.key("def f(): pass", ["a", "b", "a"], "python")
+    assert key != FunctionSetupCache.key("def f(): pass", ["a", "b"], "other python")
+    assert key != FunctionSetupCache.key("def g(): pass", ["a", "b"], "python")
+
+
+@pytest.mark.asyncio
+async def test_setup_cache_builds_once() -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = FunctionSetupCache(cache_dir)
+        builds: List[Path] = []
+
+        async def build(path: Path) -> None:
+            builds.append(path)
+            await asyncio.sleep(0.05)
+            (path / "site-packages").mkdir()
+
+        entries = await asyncio.gather(*(cache.acquire("key", build) for _ in range(4)))
+        assert len(builds) == 1
+        assert [entry.hit for entry in entries].count(False) == 1
+        assert all(entry.packages_dir.is_dir() for entry in entries)
+        for entry in entries:
+            entry.release()
+
+        async def failing_build(path: Path) -> None:
+            raise RuntimeError("pip failed")
+
+        # A failed build leaves nothing behind and is retried by the next acquisition.
+        with pytest.raises(RuntimeError):
+            await cache.acquire("other", failing_build)
+        assert not (Path(cache_dir) / "other").exists()
+        entry = await cache.acquire("other", build)
+        assert not entry.hit
+        entry.release()
+
+
+@pytest.mark.asyncio
+async def test_setup_cache_evicts_least_recently_used() -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = FunctionSetupCache(cache_dir, max_entries=2)
+
+        async def build(path: Path) -> None:
+            pass
+
+        in_use = await cache.acquire("a", build)
+        for key in ("b", "c"):
+            (await cache.acquire(key, build)).release()
+        # "a" is the least recently used but is in use, so "b" is evicted instead.
+        assert sorted(cache.entries()) == ["a", "c"]
+
+        in_use.release()
+        os.utime(Path(cache_dir) / "c", (0, 0))
+        (await cache.acquire("d", build)).release()
+        assert sorted(cache.entries()) == ["a", "d"]
@@ -2,6 +2,7 @@
 # Credit to original authors
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 
@@ -13,7 +14,7 @@
     FunctionWithRequirements,
     with_requirements,
 )
-from autogen_ext.code_executors.local import LocalCommandLineCodeExecutor
+from autogen_ext.code_executors.local import FunctionSetupCache, LocalCommandLineCodeExecutor
 
 ENVIRON_KEY_AZURE_POOL_ENDPOINT = "AZURE_POOL_ENDPOINT"
 
@@ -55,6 +56,12 @@ def function_missing_reqs() -> "polars.DataFrame":
     return polars.DataFrame()
 
 
+@with_requirements(python_packages=["six"])
+def six_module_file() -> str:
+    """Return the file six is imported from."""
+    return str(__import__("six").__file__)
+
+
 @pytest.mark.asyncio
 async def test_can_load_function_with_reqs() -> None:
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -80,6 +87,34 @@ async def test_can_load_function_with_reqs() -> None:
         await executor.stop()
 
 
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="The setup cache is not supported on Windows.")
+async def test_setup_cache_reuses_installed_packages() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryDirectory() as cache_dir:
+        cancellation_token = CancellationToken()
+        setup_cache = FunctionSetupCache(cache_dir)
+        code = """from functions import six_module_file
+print(six_module_file())"""
+
+        outputs = []
+        for _ in range(2):
+            executor = LocalCommandLineCodeExecutor(
+                work_dir=temp_dir, functions=[six_module_file], setup_cache=setup_cache
+            )
+            await executor.start()
+            result = await executor.execute_code_blocks(
+                code_blocks=[CodeBlock(language="python", code=code)], cancellation_token=cancellation_token
+            )
+            assert result.exit_code == 0, result.output
+            outputs.append(result.output.strip())
+            await executor.stop()
+
+        # Both executors import the package installed once in the cache.
+        assert len(setup_cache.entries()) == 1
+        packages_dir = Path(cache_dir) / setup_cache.entries()[0] / "site-packages"
+        assert outputs[0] == outputs[1] == str(packages_dir / "six.py")
+
+
 async def test_local_formatted_prompt() -> None:
     assert_str = '''def add_two_numbers(a: int, b: int) -> int:
     """Add two numbers together."""
@@ -1,5 +1,9 @@
+import asyncio
+import hashlib
+import threading
 from pathlib import Path
 
+import numpy as np
 import pytest
 from autogen_core.memory import MemoryContent, MemoryMimeType
 from autogen_core.model_context import BufferedChatCompletionContext
@@ -13,6 +17,7 @@
     PersistentChromaDBVectorMemoryConfig,
     SentenceTransformerEmbeddingFunctionConfig,
 )
+from autogen_ext.memory.embedding_cache import EmbeddingCache
 
 # Skip all tests if ChromaDB is not available
 try:
@@ -440,3 +445,202 @@ def dummy_function() -> None:
     assert custom_config.function_type == "custom"
     assert custom_config.function == dummy_function
     assert custom_config.params == {"test": "value"}
+
+
+class RecordingEmbeddingFunction(chromadb.EmbeddingFunction[chromadb.Documents]):
+    """Deterministic embeddings that record the size of every embedding call."""
+
+    def __init__(self, calls: list[int]) -> None:
+        self._calls = calls
+
+    def __call__(self, input: chromadb.Documents) -> chromadb.Embeddings:
+        self._calls.append(len(input))
+        return [
+            np.frombuffer(hashlib.sha256(text.encode()).digest(), dtype=np.uint8).astype(np.float32) for text in input
+        ]
+
+
+@pytest.mark.asyncio
+async def test_add_many_and_coalesced_queries(tmp_path: Path) -> None:
+    """Test that additions are embedded in batches and concurrent queries share one request."""
+    calls: list[int] = []
+    config = PersistentChromaDBVectorMemoryConfig(
+        collection_name="test_batching",
+        persistence_path=str(tmp_path / "chroma_db_batching"),
+        embedding_function_config=CustomEmbeddingFunctionConfig(
+            function=RecordingEmbeddingFunction, params={"calls": calls}
+        ),
+        k=1,
+        batch_size=100,
+    )
+    memory = ChromaDBVectorMemory(config=config)
+    await memory.add_many([MemoryContent(content=f"memory {i:03d}", mime_type=MemoryMimeType.TEXT) for i in range(250)])
+    assert calls == [100, 100, 50]
+
+    calls.clear()
+    results = await asyncio.gather(*(memory.query(f"memory {i:03d}") for i in range(5)))
+    assert calls == [5]
+    assert [result.results[0].content for result in results] == [f"memory {i:03d}" for i in range(5)]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_write_buffer(tmp_path: Path) -> None:
+    """Test that buffered additions are written on size, on time and before queries."""
+    calls: list[int] = []
+    config = PersistentChromaDBVectorMemoryConfig(
+        collection_name="test_write_buffer",
+        persistence_path=str(tmp_path / "chroma_db_write_buffer"),
+        embedding_function_config=CustomEmbeddingFunctionConfig(
+            function=RecordingEmbeddingFunction, params={"calls": calls}
+        ),
+        k=1,
+        write_buffer_size=4,
+        write_buffer_interval=0.05,
+    )
+    memory = ChromaDBVectorMemory(config=config)
+
+    for i in range(5):
+        await memory.add(MemoryContent(content=f"memory {i}", mime_type=MemoryMimeType.TEXT))
+    # The fourth addition filled the buffer, the fifth is still buffered.
+    assert calls == [4]
+    await asyncio.sleep(0.2)
+    assert calls == [4, 1]
+
+    await memory.add(MemoryContent(content="latest memory", mime_type=MemoryMimeType.TEXT))
+    results = await memory.query("latest memory")
+    assert calls == [4, 1, 1, 1]
+    assert results.results[0].content == "latest memory"
+    await memory.close()
+
+
+class FailingEmbeddingFunction(RecordingEmbeddingFunction):
+    """Recording embeddings that fail while ``failing`` holds True."""
+
+    def __init__(self, calls: list[int], failing: list[bool]) -> None:
+        super().__init__(calls)
+        self._failing = failing
+
+    def __call__(self, input: chromadb.Documents) -> chromadb.Embeddings:
+        if self._failing[0]:
+            raise RuntimeError("embedding service unavailable")
+        return super().__call__(input)
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_keeps_failed_writes(tmp_path: Path) -> None:
+    """Test that memories of a failed background write are kept and the error is reported."""
+    calls: list[int] = []
+    failing = [True]
+    config = PersistentChromaDBVectorMemoryConfig(
+        collection_name="test_write_buffer_failure",
+        persistence_path=str(tmp_path / "chroma_db_write_buffer_failure"),
+        embedding_function_config=CustomEmbeddingFunctionConfig(
+            function=FailingEmbeddingFunction, params={"calls": calls, "failing": failing}
+        ),
+        k=5,
+        write_buffer_size=10,
+        write_buffer_interval=0.05,
+    )
+    memory = ChromaDBVectorMemory(config=config)
+
+    for i in range(3):
+        await memory.add(MemoryContent(content=f"memory {i}", mime_type=MemoryMimeType.TEXT))
+    await asyncio.sleep(0.2)
+    # The background write failed, so the next addition retries it and reports the error.
+    with pytest.raises(Exception, match="embedding service unavailable"):
+        await memory.add(MemoryContent(content="rejected memory", mime_type=MemoryMimeType.TEXT))
+    with pytest.raises(Exception, match="embedding service unavailable"):
+        await memory.flush()
+
+    failing[0] = False
+    await memory.flush()
+    assert calls == [3]
+    results = await memory.query("memory 1")
+    assert sorted(str(result.content) for result in results.results) == [f"memory {i}" for i in range(3)]
+    await memory.close()
+
+
+class GatedEmbeddingFunction(RecordingEmbeddingFunction):
+    """Recording embeddings that wait for ``gate`` to be set."""
+
+    def __init__(self, calls: list[int], gate: threading.Event) -> None:
+        super().__init__(calls)
+        self._gate = gate
+
+    def __call__(self, input: chromadb.Documents) -> chromadb.Embeddings:
+        self._gate.wait(10)
+        return super().__call__(input)
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_keeps_cancelled_writes(tmp_path: Path) -> None:
+    """Test that a cancelled flush keeps its memories, and a query waits for a running flush."""
+    calls: list[int] = []
+    gate = threading.Event()
+    config = PersistentChromaDBVectorMemoryConfig(
+        collection_name="test_write_buffer_cancel",
+        persistence_path=str(tmp_path / "chroma_db_write_buffer_cancel"),
+        embedding_function_config=CustomEmbeddingFunctionConfig(
+            function=GatedEmbeddingFunction, params={"calls": calls, "gate": gate}
+        ),
+        k=5,
+        write_buffer_size=10,
+        write_buffer_interval=10,
+    )
+    memory = ChromaDBVectorMemory(config=config)
+    for i in range(3):
+        await memory.add(MemoryContent(content=f"memory {i}", mime_type=MemoryMimeType.TEXT))
+
+    flush = asyncio.create_task(memory.flush())
+    await asyncio.sleep(0.1)
+    query = asyncio.create_task(memory.query("memory 1"))
+    await asyncio.sleep(0.1)
+    flush.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await flush
+    assert len(memory._write_buffer) == 3  # type: ignore[reportPrivateUsage]
+
+    gate.set()
+    results = await query
+    assert sorted(str(result.content) for result in results.results) == [f"memory {i}" for i in range(3)]
+    await memory.close()
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache(tmp_path: Path) -> None:
+    """Test that a shared embedding cache avoids re-embedding documents and queries."""
+    calls: list[int] = []
+    embedding_cache = EmbeddingCache()
+
+    def config(name: str) -> PersistentChromaDBVectorMemoryConfig:
+        return PersistentChromaDBVectorMemoryConfig(
+            collection_name=name,
+            persistence_path=str(tmp_path / "chroma_db_embedding_cache"),
+            embedding_function_config=CustomEmbeddingFunctionConfig(
+                function=RecordingEmbeddingFunction, params={"calls": calls}
+            ),
+            embedding_cache=embedding_cache,
+        )
+
+    first = ChromaDBVectorMemory(config=config("first_memory"))
+    second = ChromaDBVectorMemory(config=config("second_memory"))
+    assert first.embedding_cache is embedding_cache
+    contents = [MemoryContent(content=f"memory {i}", mime_type=MemoryMimeType.TEXT) for i in range(3)]
+
+    await first.add_many(contents)
+    await second.add_many(contents)
+    assert calls == [3]
+
+    for memory in (first, second):
+        results = await memory.query("memory 1")
+        assert results.results[0].content == "memory 1"
+    assert calls == [3, 1]
+    assert embedding_cache.stats.hits == 4
+
+    # The cache is serialized with the memory.
+    loaded = ChromaDBVectorMemory.load_component(first.dump_component())
+    assert isinstance(loaded.embedding_cache, EmbeddingCache)
+
+    await first.close()
+    await second.close()
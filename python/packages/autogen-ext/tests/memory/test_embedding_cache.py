@@ -0,0 +1,72 @@
+import tempfile
+from typing import List
+
+import pytest
+from autogen_core import InMemoryStore
+from autogen_ext.memory.embedding_cache import EmbeddingCache
+
+
+class CountingEmbedder:
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(texts)
+        return [[float(len(text)), float(ord(text[0]))] for text in texts]
+
+
+def test_embed_only_embeds_missing_texts() -> None:
+    cache = EmbeddingCache(max_entries=10)
+    embedder = CountingEmbedder()
+
+    assert cache.embed("model", ["a", "bb", "a"], embedder) == [[1.0, 97.0], [2.0, 98.0], [1.0, 97.0]]
+    assert embedder.calls == [["a", "bb"]]
+
+    assert cache.embed("model", ["bb", "ccc"], embedder) == [[2.0, 98.0], [3.0, 99.0]]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+
+    # Entries are keyed by model.
+    cache.embed("other-model", ["a"], embedder)
+    assert embedder.calls[-1] == ["a"]
+
+    stats = cache.stats
+    assert (stats.hits, stats.store_hits, stats.misses) == (1, 0, 5)
+    assert stats.hit_rate == pytest.approx(1 / 6)
+
+
+def test_lru_eviction() -> None:
+    cache = EmbeddingCache(max_entries=2)
+    embedder = CountingEmbedder()
+    cache.embed("model", ["a", "b"], embedder)
+    cache.embed("model", ["a"], embedder)  # "b" becomes the least recently used.
+    cache.embed("model", ["c"], embedder)
+
+    assert cache.get_many("model", ["a", "b", "c"]) == [[1.0, 97.0], None, [1.0, 99.0]]
+
+
+def test_store_tier() -> None:
+    store = InMemoryStore[bytes]()
+    embedder = CountingEmbedder()
+    EmbeddingCache(max_entries=1, store=store).embed("model", ["a", "b"], embedder)
+
+    # A new cache, as after a restart, finds the embeddings in the store.
+    cache = EmbeddingCache(max_entries=1, store=store)
+    assert cache.embed("model", ["a", "b"], embedder) == [[1.0, 97.0], [1.0, 98.0]]
+    assert len(embedder.calls) == 1
+    assert cache.stats.store_hits == 2
+    assert cache.stats.hit_rate == 1.0
+
+
+def test_component_config() -> None:
+    diskcache = pytest.importorskip("diskcache")
+    from autogen_ext.cache_store.diskcache import DiskCacheStore
+
+    with tempfile.TemporaryDirectory() as temp_dir, diskcache.Cache(temp_dir) as disk_cache:
+        cache = EmbeddingCache(max_entries=5, store=DiskCacheStore[bytes](disk_cache))
+        cache.embed("model", ["a"], CountingEmbedder())
+
+        loaded = EmbeddingCache.load_component(cache.dump_component())
+        assert loaded.dump_component().config == cache.dump_component().config
+        embedder = CountingEmbedder()
+        assert loaded.embed("model", ["a"], embedder) == [[1.0, 97.0]]
+        assert embedder.calls == []
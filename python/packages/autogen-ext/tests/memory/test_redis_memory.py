@@ -6,6 +6,7 @@
 from autogen_core.memory import MemoryContent, MemoryMimeType
 from autogen_core.model_context import BufferedChatCompletionContext
 from autogen_core.models import UserMessage
+from autogen_ext.memory.embedding_cache import EmbeddingCache
 from autogen_ext.memory.redis import RedisMemory, RedisMemoryConfig
 from pydantic import ValidationError
 from redis import Redis
@@ -69,6 +70,33 @@ async def test_redis_memory_close_with_mock() -> None:
         mock_history.delete.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_redis_memory_embedding_cache_with_mock() -> None:
+    with (
+        patch("autogen_ext.memory.redis._redis_memory.SemanticMessageHistory") as MockHistory,
+        patch("autogen_ext.memory.redis._redis_memory.HFTextVectorizer") as MockVectorizer,
+    ):
+        vectorizer = MagicMock()
+        vectorizer.model = "test-model"
+        vectorizer.dtype = "float32"
+        vectorizer.embed_many.side_effect = lambda texts, **kwargs: [[float(len(text)), 1.0] for text in texts]  # type: ignore[reportUnknownLambdaType]
+        MockVectorizer.return_value = vectorizer
+
+        embedding_cache = EmbeddingCache()
+        memory = RedisMemory(config=RedisMemoryConfig(model_name="test-model", embedding_cache=embedding_cache))
+        assert memory.embedding_cache is embedding_cache
+        MockVectorizer.assert_called_once_with(model="test-model")
+
+        cached_vectorizer = MockHistory.call_args.kwargs["vectorizer"]
+        assert cached_vectorizer.embed_many(["first", "second"]) == [[5.0, 1.0], [6.0, 1.0]]
+        assert cached_vectorizer.embed("first") == [5.0, 1.0]
+        # One call when the vectorizer checks its dimensions, one for the texts it had not embedded.
+        assert [call.args[0] for call in vectorizer.embed_many.call_args_list][-1] == ["first", "second"]
+        calls = vectorizer.embed_many.call_count
+        cached_vectorizer.embed_many(["second", "first"])
+        assert vectorizer.embed_many.call_count == calls
+
+
 def redis_available() -> bool:
     try:
         client = Redis.from_url("redis://localhost:6379")  # type: ignore[reportUnkownMemberType]
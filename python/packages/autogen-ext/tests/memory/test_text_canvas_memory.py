@@ -1,9 +1,10 @@
 import difflib
+from typing import List
 
 import pytest
 from autogen_core import CancellationToken
 from autogen_core.model_context import UnboundedChatCompletionContext
-from autogen_ext.memory.canvas import TextCanvasMemory
+from autogen_ext.memory.canvas import TextCanvas, TextCanvasMemory
 from autogen_ext.memory.canvas._canvas_writer import (
     ApplyPatchArgs,
     UpdateFileArgs,
@@ -119,3 +120,55 @@ async def test_update_context_injects_snapshot(
     assert result.memories.results
     assert isinstance(result.memories.results[0].content, str)
     assert story_v2.strip() in result.memories.results[0].content
+
+
+def test_delta_revisions_round_trip() -> None:
+    canvas = TextCanvas(snapshot_interval=4)
+    lines = [f"line {i}\n" for i in range(50)]
+    contents: List[str] = []
+    for revision in range(10):
+        lines[revision * 3 % len(lines)] = f"changed in revision {revision}\n"
+        lines.insert(revision, "inserted\n")
+        if revision == 6:
+            lines = ["rewritten\n"] * 20  # Too different for a delta, so it's stored in full.
+        contents.append("".join(lines))
+        canvas.add_or_update_file("file.txt", contents[-1])
+
+    for revision, content in enumerate(contents, start=1):
+        assert canvas.get_revision_content("file.txt", revision) == content
+    assert canvas.get_revision_content("file.txt", 11) == ""
+
+    expected_diffs = [
+        "".join(
+            difflib.unified_diff(
+                older.splitlines(keepends=True),
+                newer.splitlines(keepends=True),
+                fromfile=f"file.txt@r{revision}",
+                tofile=f"file.txt@r{revision + 1}",
+            )
+        )
+        for revision, (older, newer) in enumerate(zip(contents, contents[1:], strict=False), start=1)
+    ]
+    assert canvas.get_revision_diffs("file.txt") == expected_diffs
+    assert canvas.get_diff("file.txt", 3, 4) == expected_diffs[2]
+    assert canvas.get_diff("file.txt", 2, 9) == "".join(
+        difflib.unified_diff(
+            contents[1].splitlines(keepends=True),
+            contents[8].splitlines(keepends=True),
+            fromfile="file.txt@r2",
+            tofile="file.txt@r9",
+        )
+    )
+
+
+def test_context_is_rendered_again_only_after_changes() -> None:
+    canvas = TextCanvas()
+    canvas.add_or_update_file("a.txt", "a")
+    snapshot = canvas.get_all_contents_for_context()
+    assert canvas.get_all_contents_for_context() is snapshot
+
+    canvas.add_or_update_file("b.txt", "b")
+    canvas.add_or_update_file("a.txt", "a2")
+    assert canvas.get_all_contents_for_context() == (
+        "=== CANVAS FILES ===\nFile: a.txt (rev 2):\na2\n\nFile: b.txt (rev 1):\nb\n\n=== END OF CANVAS ==="
+    )
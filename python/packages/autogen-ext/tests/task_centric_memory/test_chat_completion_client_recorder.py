@@ -1,8 +1,12 @@
 import asyncio
+import os
+import tempfile
+from typing import Any, Sequence
 
 import pytest
 from autogen_core.models import (
     CreateResult,
+    LLMMessage,
     UserMessage,
 )
 from autogen_ext.experimental.task_centric_memory.utils import PageLogger
@@ -65,6 +69,36 @@ async def test_replay() -> None:
     logger.leave_function()
 
 
+class SlowFirstCallClient(ReplayChatCompletionClient):
+    async def create(self, messages: Sequence[LLMMessage], *args: Any, **kwargs: Any) -> CreateResult:
+        # The first message is answered after the others.
+        await asyncio.sleep(0.1 if messages[0].content == "Message 1" else 0.0)
+        return await super().create(messages, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay_concurrent_calls() -> None:
+    """Test that concurrent calls are recorded in the order they were made, so they replay in that order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "session.json")
+        recorder = ChatCompletionClientRecorder(
+            SlowFirstCallClient(["First response", "Second response"]), mode="record", session_file_path=path
+        )
+        await asyncio.gather(
+            recorder.create([UserMessage(content="Message 1", source="User")]),
+            recorder.create([UserMessage(content="Message 2", source="User")]),
+        )
+        recorder.finalize()
+
+        replayer = ChatCompletionClientRecorder(ReplayChatCompletionClient([]), mode="replay", session_file_path=path)
+        responses = await asyncio.gather(
+            replayer.create([UserMessage(content="Message 1", source="User")]),
+            replayer.create([UserMessage(content="Message 2", source="User")]),
+        )
+        assert [response.content for response in responses] == ["Second response", "First response"]
+        replayer.finalize()
+
+
 if __name__ == "__main__":
     asyncio.run(test_record())
     asyncio.run(test_replay())
@@ -0,0 +1,39 @@
+import tempfile
+from typing import List
+
+import pytest
+from autogen_ext.experimental.task_centric_memory import MemoryController
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo
+from autogen_ext.experimental.task_centric_memory.utils import PageLogger
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+def create_memory_controller(
+    client: ReplayChatCompletionClient, path: str, max_memos_to_retrieve: int
+) -> MemoryController:
+    return MemoryController(
+        reset=True,
+        client=client,
+        config={"max_memos_to_retrieve": max_memos_to_retrieve, "MemoryBank": {"path": path}},
+        logger=PageLogger(),  # Nothing will be logged.
+    )
+
+
+@pytest.mark.asyncio
+async def test_validate_memos_concurrently() -> None:
+    """Test that memos are validated concurrently, without validating more memos than a one-by-one pass would."""
+    memos: List[Memo] = [Memo(task=None, insight="Insight {}".format(i)) for i in range(6)]
+    client = ReplayChatCompletionClient(["1", "0", "1", "1", "0", "1"])
+    with tempfile.TemporaryDirectory() as temp_dir:
+        memory_controller = create_memory_controller(client, temp_dir, max_memos_to_retrieve=3)
+
+        # Validates memos 0-2, then memo 3, which completes the list.
+        validated_memos = await memory_controller._validate_memos(memos, "The task")  # pyright: ignore[reportPrivateUsage]
+        assert validated_memos == [memos[0], memos[2], memos[3]]
+        assert memory_controller.prompter.num_model_calls == 4
+
+        # The verdicts are remembered for the same task, but not for another one.
+        assert await memory_controller._validate_memos(memos, "The task") == validated_memos  # pyright: ignore[reportPrivateUsage]
+        assert memory_controller.prompter.num_model_calls == 4
+        assert await memory_controller._validate_memos(memos[:1], "Another task") == []  # pyright: ignore[reportPrivateUsage]
+        assert memory_controller.prompter.num_model_calls == 5
@@ -0,0 +1,119 @@
+import logging
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Tuple
+
+import pytest
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo, MemoryBank
+from autogen_ext.experimental.task_centric_memory._sqlite_dict import SqliteDict
+
+
+def test_sqlite_dict() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "dict.sqlite3")
+        d: SqliteDict[Tuple[str, str]] = SqliteDict(path)
+        d["1"] = ("a", "b")
+        d["2"] = ("c", "d")
+        d["1"] = ("e", "f")
+        del d["2"]
+        d["3"] = ("g", "h")
+        assert len(d) == 2
+        assert "2" not in d
+        assert list(d.items()) == [("1", ("e", "f")), ("3", ("g", "h"))]
+        d.close()
+
+        d = SqliteDict(path)
+        assert dict(d) == {"1": ("e", "f"), "3": ("g", "h")}
+        d.clear()
+        assert len(d) == 0
+        d.close()
+
+
+def test_compaction() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "dict.sqlite3")
+        d: SqliteDict[str] = SqliteDict(path)
+        d.set_many((str(i), "x" * 1000) for i in range(10_000))
+        d.commit()
+        d.clear()
+        d.commit()  # Most of the file is now unused, so the unused pages are freed.
+        d.close()
+        assert os.path.getsize(path) < 100_000
+
+
+def test_compact_enables_incremental_vacuum(caplog: pytest.LogCaptureFixture) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # A file created by an earlier version, without incremental vacuums.
+        path = os.path.join(temp_dir, "dict.sqlite3")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        connection.commit()
+        connection.close()
+
+        d: SqliteDict[str] = SqliteDict(path)
+        d.set_many((str(i), "x" * 1000) for i in range(10_000))
+        d.clear()
+        d.commit()
+        assert os.path.getsize(path) > 1_000_000
+        d.compact()
+        assert d._connection.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # type: ignore[reportPrivateUsage]
+        assert os.path.getsize(path) < 100_000
+
+        # Failures are logged instead of raised.
+        d._connection.execute("PRAGMA busy_timeout = 0")  # type: ignore[reportPrivateUsage]
+        writer = sqlite3.connect(path)
+        writer.execute("BEGIN IMMEDIATE")
+        with caplog.at_level(logging.WARNING):
+            d.compact()
+        assert "Failed to compact" in caplog.text
+        writer.close()
+        d.close()
+
+
+def test_memory_bank_migrates_pickles() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Lay out a memory bank as pickled by earlier versions.
+        os.makedirs(os.path.join(temp_dir, "string_map"))
+        with open(os.path.join(temp_dir, "uid_memo_dict.pkl"), "wb") as f:
+            pickle.dump({"1": Memo(task="A task", insight="An insight")}, f)
+        with open(os.path.join(temp_dir, "string_map", "uid_text_dict.pkl"), "wb") as f:
+            pickle.dump({"1": ("A topic", "1")}, f)
+
+        memory_bank = MemoryBank(reset=False, config={"path": temp_dir})
+        assert memory_bank.uid_memo_dict["1"] == Memo(task="A task", insight="An insight")
+        assert memory_bank.last_memo_id == 1
+        assert memory_bank.string_map.uid_text_dict["1"] == ("A topic", "1")
+        assert memory_bank.string_map.last_string_pair_id == 1
+        assert os.path.exists(os.path.join(temp_dir, "uid_memo_dict.pkl.migrated"))
+        memory_bank.uid_memo_dict.close()
+        memory_bank.string_map.uid_text_dict.close()
+
+        # The pickles aren't imported again.
+        memory_bank = MemoryBank(reset=False, config={"path": temp_dir})
+        assert len(memory_bank.uid_memo_dict) == 1
+
+
+def test_memory_bank_reset_retires_pickles() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.makedirs(os.path.join(temp_dir, "string_map"))
+        with open(os.path.join(temp_dir, "uid_memo_dict.pkl"), "wb") as f:
+            pickle.dump({"1": Memo(task="A task", insight="An insight")}, f)
+        with open(os.path.join(temp_dir, "string_map", "uid_text_dict.pkl"), "wb") as f:
+            pickle.dump({"1": ("A topic", "1")}, f)
+
+        memory_bank = MemoryBank(reset=True, config={"path": temp_dir})
+        assert not memory_bank.contains_memos()
+        memory_bank.uid_memo_dict.close()
+        memory_bank.string_map.uid_text_dict.close()
+        assert not os.path.exists(os.path.join(temp_dir, "uid_memo_dict.pkl"))
+        assert not os.path.exists(os.path.join(temp_dir, "string_map", "uid_text_dict.pkl"))
+
+        # Reopening without a reset doesn't bring back the cleared memos and string pairs.
+        memory_bank = MemoryBank(reset=False, config={"path": temp_dir})
+        assert len(memory_bank.uid_memo_dict) == 0
+        assert len(memory_bank.string_map.uid_text_dict) == 0
+        assert memory_bank.last_memo_id == 0
+        memory_bank.uid_memo_dict.close()
+        memory_bank.string_map.uid_text_dict.close()
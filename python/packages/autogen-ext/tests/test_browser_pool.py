@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+from autogen_ext.models.replay import ReplayChatCompletionClient
+from playwright.async_api import BrowserContext
+
+PAGE_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head><title>Pool Page</title></head>
+<body>
+    <h1>Pool Page</h1>
+    <video src="http://127.0.0.1:9/video.mp4" autoplay></video>
+</body>
+</html>
+"""
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_shares_browsers() -> None:
+    async with BrowserPool(sessions_per_browser=2, warm_contexts=1) as pool:
+        assert pool.num_browsers == 1
+        contexts = await asyncio.gather(*(pool.acquire() for _ in range(3)))
+        assert len(set(contexts)) == 3
+        assert pool.num_leased == 3
+        assert pool.stats.warm_leases == 1
+        # Three leased contexts and a warm one take two browsers of two contexts each.
+        await asyncio.sleep(0.5)
+        assert pool.num_browsers == 2
+
+        # Contexts are isolated from each other.
+        first, second = contexts[0], contexts[1]
+        await first.add_cookies([{"name": "session", "value": "1", "url": "https://example.com"}])
+        assert await second.cookies() == []
+
+        for context in contexts:
+            await pool.release(context)
+        assert pool.num_leased == 0
+        with pytest.raises(ValueError):
+            await pool.release(first)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_counts_navigations_and_blocks_media() -> None:
+    async with BrowserPool(warm_contexts=0, max_navigations_per_context=2) as pool:
+        context = await pool.acquire()
+        page = await context.new_page()
+        await page.goto("data:text/html," + PAGE_HTML)
+        assert pool.navigations(context) == 1
+        assert not pool.should_recycle(context)
+
+        await page.goto("data:text/html,<p>Second page</p>")
+        assert pool.navigations(context) == 2
+        assert pool.should_recycle(context)
+
+        await page.set_content(PAGE_HTML)
+        await page.wait_for_timeout(500)
+        assert pool.stats.blocked_requests >= 1
+        await pool.release(context)
+
+    with pytest.raises(RuntimeError):
+        await pool.acquire()
+
+
+@pytest.mark.asyncio
+async def test_web_surfer_keeps_its_page_when_recycling_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    async with BrowserPool(warm_contexts=0) as pool:
+        surfer = MultimodalWebSurfer(
+            "WebSurfer",
+            model_client=ReplayChatCompletionClient(["Hello"]),
+            browser_pool=pool,
+            start_page="data:text/html," + PAGE_HTML,
+            use_ocr=False,
+        )
+        await surfer._lazy_init()  # pyright: ignore[reportPrivateUsage]
+        context = surfer._context  # pyright: ignore[reportPrivateUsage]
+        page = surfer._page  # pyright: ignore[reportPrivateUsage]
+        assert context is not None and page is not None
+
+        async def failing_acquire() -> BrowserContext:
+            raise RuntimeError("No browser")
+
+        monkeypatch.setattr(pool, "acquire", failing_acquire)
+        with pytest.raises(RuntimeError):
+            await surfer._recycle_context()  # pyright: ignore[reportPrivateUsage]
+        assert surfer._context is context  # pyright: ignore[reportPrivateUsage]
+        assert surfer._page is page and not page.is_closed()  # pyright: ignore[reportPrivateUsage]
+        assert pool.num_leased == 1
+
+        monkeypatch.undo()
+        await surfer._recycle_context()  # pyright: ignore[reportPrivateUsage]
+        assert surfer._context is not context  # pyright: ignore[reportPrivateUsage]
+        assert page.is_closed()
+        assert pool.num_leased == 1
+        await surfer.close()
+        assert pool.num_leased == 0
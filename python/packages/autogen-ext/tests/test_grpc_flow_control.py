@@ -0,0 +1,157 @@
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+from autogen_ext.runtimes.grpc import FlowControlConfig
+from autogen_ext.runtimes.grpc._flow_control import CreditWindow
+from autogen_ext.runtimes.grpc._worker_runtime_host_servicer import CallbackChannelConnection
+
+
+async def _idle_requests() -> AsyncIterator[str]:
+    await asyncio.Event().wait()
+    yield ""
+
+
+async def _noop(message: str) -> None:
+    pass
+
+
+def _connection(flow_control: FlowControlConfig, shed: List[str] | None = None) -> CallbackChannelConnection[str, str]:
+    async def on_shed(message: str) -> None:
+        if shed is not None:
+            shed.append(message)
+
+    return CallbackChannelConnection[str, str](
+        _idle_requests(), "client", handle_callback=_noop, flow_control=flow_control, on_shed=on_shed
+    )
+
+
+def test_flow_control_config_validation() -> None:
+    with pytest.raises(ValueError):
+        FlowControlConfig(max_queue_size=-1)
+    with pytest.raises(ValueError):
+        FlowControlConfig(slow_consumer_timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_credit_window() -> None:
+    window = CreditWindow(2)
+    assert await window.acquire(0.01)
+    assert await window.acquire(0.01)
+    assert window.outstanding == 2
+    assert not await window.acquire(0.01)
+
+    waiter = asyncio.create_task(window.acquire(1))
+    await asyncio.sleep(0)
+    window.release()
+    assert await waiter
+    assert window.outstanding == 2
+
+    window.close()
+    assert not await window.acquire(0.01)
+
+
+@pytest.mark.asyncio
+async def test_credit_window_cancelled_waiter_passes_credit_on() -> None:
+    window = CreditWindow(1)
+    assert await window.acquire()
+    cancelled = asyncio.create_task(window.acquire())
+    waiter = asyncio.create_task(window.acquire())
+    await asyncio.sleep(0)
+
+    # The credit is handed to the first waiter, which is cancelled before it resumes.
+    window.release()
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert await asyncio.wait_for(waiter, 1)
+    assert window.outstanding == 1
+
+
+@pytest.mark.asyncio
+async def test_credit_window_unlimited() -> None:
+    window = CreditWindow(0)
+    for _ in range(100):
+        assert await window.acquire(0.01)
+    assert window.outstanding == 100
+
+
+@pytest.mark.asyncio
+async def test_channel_connection_drop_newest() -> None:
+    shed: List[str] = []
+    connection = _connection(
+        FlowControlConfig(max_queue_size=2, slow_consumer_timeout=0.01, shedding_policy="drop_newest"), shed
+    )
+    assert await connection.send("a")
+    assert await connection.send("b")
+    assert not await connection.send("c")
+    assert shed == ["c"]
+
+    metrics = connection.metrics()
+    assert metrics.send_queue_depth == 2
+    assert metrics.send_queue_capacity == 2
+    assert metrics.messages_shed == 1
+    assert metrics.slow_consumer_events == 1
+    assert metrics.is_slow_consumer
+
+    # Consuming clears the slow consumer flag.
+    assert await connection.__anext__() == "a"
+    assert not connection.metrics().is_slow_consumer
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_connection_drop_oldest() -> None:
+    shed: List[str] = []
+    connection = _connection(
+        FlowControlConfig(max_queue_size=2, slow_consumer_timeout=0.01, shedding_policy="drop_oldest"), shed
+    )
+    await connection.send("a")
+    await connection.send("b")
+    assert await connection.send("c")
+    assert shed == ["a"]
+    assert await connection.__anext__() == "b"
+    assert await connection.__anext__() == "c"
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_connection_disconnect() -> None:
+    shed: List[str] = []
+    connection = _connection(
+        FlowControlConfig(max_queue_size=1, slow_consumer_timeout=0.01, shedding_policy="disconnect"), shed
+    )
+    await connection.send("a")
+    assert not await connection.send("b")
+    assert connection.closed
+    assert sorted(shed) == ["a", "b"]
+    with pytest.raises(StopAsyncIteration):
+        await connection.__anext__()
+    assert not await connection.send("c")
+
+
+@pytest.mark.asyncio
+async def test_channel_connection_block() -> None:
+    connection = _connection(FlowControlConfig(max_queue_size=1, slow_consumer_timeout=0.01, shedding_policy="block"))
+    await connection.send("a")
+    blocked = asyncio.create_task(connection.send("b"))
+    await asyncio.sleep(0.05)
+    assert not blocked.done()
+    assert connection.metrics().is_slow_consumer
+    assert await connection.__anext__() == "a"
+    assert await blocked
+    assert await connection.__anext__() == "b"
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_channel_connection_credits() -> None:
+    connection = _connection(
+        FlowControlConfig(window_size=1, slow_consumer_timeout=0.01, shedding_policy="drop_newest")
+    )
+    assert await connection.acquire_credit()
+    assert connection.metrics().credits_available == 0
+    assert not await connection.acquire_credit()
+    connection.release_credit()
+    assert connection.metrics().credits_available == 1
+    await connection.close()
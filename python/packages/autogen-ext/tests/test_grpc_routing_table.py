@@ -0,0 +1,112 @@
+import pytest
+from autogen_core import AgentId, DefaultTopicId, TopicId, TypePrefixSubscription, TypeSubscription
+from autogen_ext.runtimes.grpc._routing_table import HostRoutingTable
+
+
+def test_exact_routes() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    table.register_agent_type("a2", "c2")
+    table.add_subscription(TypeSubscription("t1", "a1"), "c1")
+    table.add_subscription(TypeSubscription("t1", "a2"), "c2")
+    table.add_subscription(TypeSubscription("t2", "a2"), "c2")
+
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c1", "c2"}
+    assert table.get_client_ids(TopicId("t2", "s")) == {"c2"}
+    assert table.get_client_ids(TopicId("t3", "s")) == set()
+    assert table.get_client_id("a1") == "c1"
+
+
+def test_duplicates_and_registration_errors() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    with pytest.raises(ValueError, match="already registered"):
+        table.register_agent_type("a1", "c2")
+
+    subscription = TypeSubscription("t1", "a1")
+    table.add_subscription(subscription, "c1")
+    with pytest.raises(ValueError):
+        table.add_subscription(TypeSubscription("t1", "a1"), "c1")
+    with pytest.raises(ValueError):
+        table.add_subscription(TypePrefixSubscription("t", "a1", id=subscription.id), "c1")
+    with pytest.raises(ValueError):
+        table.remove_subscription("missing")
+
+
+def test_prefix_routes_are_updated_incrementally() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    assert table.get_client_ids(TopicId("chat:1", "s")) == set()
+
+    subscription = TypePrefixSubscription("chat:", "a1")
+    table.add_subscription(subscription, "c1")
+    assert table.get_client_ids(TopicId("chat:1", "s")) == {"c1"}
+    assert table.get_client_ids(TopicId("other", "s")) == set()
+
+    table.remove_subscription(subscription.id)
+    assert table.get_client_ids(TopicId("chat:1", "s")) == set()
+
+
+def test_registration_after_subscription() -> None:
+    table = HostRoutingTable()
+    table.add_subscription(TypeSubscription("t1", "a1"), "c1")
+    table.add_subscription(TypePrefixSubscription("t", "a1"), "c1")
+    assert table.get_client_ids(TopicId("t1", "s")) == set()
+    assert table.get_client_ids(TopicId("t2", "s")) == set()
+
+    table.register_agent_type("a1", "c1")
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c1"}
+    assert table.get_client_ids(TopicId("t2", "s")) == {"c1"}
+
+
+def test_remove_client() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    table.register_agent_type("a2", "c2")
+    table.add_subscription(TypeSubscription("t1", "a1"), "c1")
+    table.add_subscription(TypeSubscription("t1", "a2"), "c2")
+    table.add_subscription(TypePrefixSubscription("t", "a1"), "c1")
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c1", "c2"}
+    assert table.get_client_ids(TopicId("t2", "s")) == {"c1"}
+
+    table.remove_client("c1")
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c2"}
+    assert table.get_client_ids(TopicId("t2", "s")) == set()
+    assert table.get_client_id("a1") is None
+    assert len(table.subscriptions) == 1
+
+    # The agent type can be registered again by another client.
+    table.register_agent_type("a1", "c3")
+    table.add_subscription(TypeSubscription("t1", "a1"), "c3")
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c2", "c3"}
+
+
+def test_snapshot_is_not_mutated_by_writes() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    table.add_subscription(TypeSubscription("t1", "a1"), "c1")
+    snapshot = table._routes  # type: ignore[reportPrivateUsage]
+    table.register_agent_type("a2", "c2")
+    table.add_subscription(TypeSubscription("t1", "a2"), "c2")
+    assert snapshot["t1"] == {"c1"}
+    assert table.get_client_ids(TopicId("t1", "s")) == {"c1", "c2"}
+
+
+def test_subscribed_recipients() -> None:
+    table = HostRoutingTable()
+    table.register_agent_type("a1", "c1")
+    table.add_subscription(TypeSubscription("default", "a1"), "c1")
+    assert table.get_subscribed_recipients(DefaultTopicId()) == [AgentId("a1", "default")]
+
+
+def test_route_memo_is_bounded() -> None:
+    table = HostRoutingTable(max_routes=2)
+    table.register_agent_type("a1", "c1")
+    table.add_subscription(TypePrefixSubscription("t", "a1"), "c1")
+    assert table.get_client_ids(TopicId("unrouted", "s")) == set()
+    assert "unrouted" not in table._routes  # type: ignore[reportPrivateUsage]
+    for topic_type in ("t1", "t2", "t1", "t3"):
+        assert table.get_client_ids(TopicId(topic_type, "s")) == {"c1"}
+    assert list(table._routes) == ["t1", "t3"]  # type: ignore[reportPrivateUsage]
+    table.remove_client("c1")
+    assert len(table._routes) == 0  # type: ignore[reportPrivateUsage]
@@ -0,0 +1,78 @@
+import os
+from pathlib import Path
+
+import pytest
+from autogen_ext.agents.file_surfer._markdown_file_browser import MarkdownFileBrowser
+from markitdown import MarkItDown  # type: ignore
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Path:
+    lines = [f"2024-01-01 00:00:{i % 60:02d} INFO request {i} served   " for i in range(40000)]
+    lines[5000] = "2024-01-01 00:00:00 ERROR disk quota exceeded"
+    lines[30000] = "2024-01-01 00:00:00 ERROR disk quota exceeded again\n\n\n"
+    path = tmp_path / "server.log"
+    path.write_text("\r\n".join(lines))
+    return path
+
+
+def test_lazy_text_matches_markitdown(log_file: Path) -> None:
+    browser = MarkdownFileBrowser(viewport_size=1024, base_path=str(log_file.parent))
+    first_viewport = browser.open_path(str(log_file))
+
+    # Only the start of the file is read to show the first viewport.
+    assert not browser.is_fully_loaded
+    assert browser.viewport_count > 100
+    assert first_viewport.startswith("2024-01-01 00:00:00 INFO request 0 served\n")
+
+    expected = MarkItDown().convert_local(str(log_file)).text_content
+    assert browser.page_content == expected
+    assert browser.is_fully_loaded
+    assert browser.viewport_count == len(browser.viewport_pages)
+    assert "".join(expected[start:end] for start, end in browser.viewport_pages) == expected
+
+
+def test_find_on_page(log_file: Path) -> None:
+    browser = MarkdownFileBrowser(viewport_size=1024, base_path=str(log_file.parent))
+    browser.open_path(str(log_file))
+
+    viewport = browser.find_on_page("disk quota")
+    assert viewport is not None and "ERROR disk quota exceeded" in viewport
+    first_match = browser.viewport_current_page
+
+    viewport = browser.find_next()
+    assert viewport is not None and "exceeded again" in viewport
+    assert browser.viewport_current_page > first_match
+
+    # Searching wraps around to the start of the page.
+    browser.find_next()
+    assert browser.viewport_current_page == first_match
+
+    assert browser.find_on_page("quota * again") is not None
+    assert browser.find_on_page("no such words") is None
+
+
+def test_document_cache(tmp_path: Path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("first version")
+    other = tmp_path / "other.txt"
+    other.write_text("other file")
+    browser = MarkdownFileBrowser(base_path=str(tmp_path), document_cache_size=1)
+
+    assert browser.open_path(str(path)) == "first version"
+    document = browser._document  # pyright: ignore[reportPrivateUsage]
+    browser.open_path(str(tmp_path))
+    browser.open_path(str(path))
+    assert browser._document is document  # pyright: ignore[reportPrivateUsage]
+
+    # A changed file is converted again.
+    path.write_text("second version, which is longer")
+    os.utime(path, ns=(0, 10**9))
+    assert browser.open_path(str(path)) == "second version, which is longer"
+
+    # The least recently opened file is evicted.
+    browser.open_path(str(other))
+    document = browser._document  # pyright: ignore[reportPrivateUsage]
+    browser.open_path(str(path))
+    browser.open_path(str(other))
+    assert browser._document is not document  # pyright: ignore[reportPrivateUsage]
@@ -76,3 +76,30 @@ async def test_playwright_controller_fill_id() -> None:
         controller = PlaywrightController()
         await controller.fill_id(page, input_box_id, "test input")
         assert await page.evaluate("document.getElementById('input-box').value") == "test input"
+
+
+@pytest.mark.asyncio
+async def test_playwright_controller_page_state() -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.set_content(FAKE_HTML)
+
+        controller = PlaywrightController()
+        state = await controller.get_page_state(page)
+        await controller.get_interactive_rects(page)
+        assert await controller.get_page_state(page) == state
+
+        # Changes to the DOM are counted, as are those to the viewport.
+        await page.evaluate("document.getElementById('header').textContent = 'Changed'")
+        changed_state = await controller.get_page_state(page)
+        assert changed_state["documentId"] == state["documentId"]
+        assert changed_state["changes"] > state["changes"]
+
+        await page.set_viewport_size({"width": 800, "height": 600})
+        resized_state = await controller.get_page_state(page)
+        assert resized_state["viewport"] != changed_state["viewport"]
+
+        await page.goto("data:text/html," + FAKE_HTML)
+        assert (await controller.get_page_state(page))["documentId"] != state["documentId"]
@@ -17,10 +17,11 @@
     TypeSubscription,
     default_subscription,
     event,
+    rpc,
     try_get_known_serializers_for_type,
     type_subscription,
 )
-from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc import FlowControlConfig, GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -406,10 +407,10 @@ async def test_disconnected_agent() -> None:
     # to some private properties. This needs to be updated once they are available publicly
 
     def get_current_subscriptions() -> List[Subscription]:
-        return host._servicer._subscription_manager._subscriptions  # type: ignore[reportPrivateUsage]
+        return list(host._servicer._routing_table.subscriptions)  # type: ignore[reportPrivateUsage]
 
     async def get_subscribed_recipients() -> List[AgentId]:
-        return await host._servicer._subscription_manager.get_subscribed_recipients(DefaultTopicId())  # type: ignore[reportPrivateUsage]
+        return host._servicer._routing_table.get_subscribed_recipients(DefaultTopicId())  # type: ignore[reportPrivateUsage]
 
     try:
         await worker1.start()
@@ -685,6 +686,176 @@ async def test_instance_factory_messaging() -> None:
     await host.stop()
 
 
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_flow_control_window_and_metrics() -> None:
+    host_address = "localhost:50057"
+    flow_control = FlowControlConfig(max_queue_size=4, window_size=1, max_inflight_messages=2)
+    host = GrpcWorkerAgentRuntimeHost(address=host_address, flow_control=flow_control)
+    host.start()
+
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, flow_control=flow_control)
+    await worker1.start()
+    worker1.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address, flow_control=flow_control)
+    await worker2.start()
+    worker2.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker2.register_factory(
+        type=AgentType("loopback"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+
+    # More concurrent requests than the window allows; they are delivered one at a time.
+    results = await asyncio.gather(
+        *[worker1.send_message(MessageType(), AgentId("loopback", "default")) for _ in range(8)]
+    )
+    assert len(results) == 8
+
+    agent = await worker2.try_get_underlying_agent_instance(AgentId("loopback", "default"), LoopbackAgent)
+    assert agent.num_calls == 8
+
+    worker_metrics = worker1.get_connection_metrics()
+    assert worker_metrics.window_size == 1
+    assert worker_metrics.outstanding == 0
+    assert worker_metrics.send_queue_capacity == 4
+
+    host_metrics = host.get_client_metrics()
+    assert len(host_metrics) == 2
+    assert all(metrics.outstanding == 0 for metrics in host_metrics.values())
+    assert sum(metrics.messages_sent for metrics in host_metrics.values()) == 16
+    assert not any(metrics.is_slow_consumer for metrics in host_metrics.values())
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_concurrent_requests_from_multiple_workers() -> None:
+    host_address = "localhost:50058"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    target = GrpcWorkerAgentRuntime(host_address=host_address)
+    await target.start()
+    target.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+    await target.register_factory(
+        type=AgentType("loopback"), agent_factory=lambda: LoopbackAgent(), expected_class=LoopbackAgent
+    )
+
+    senders = [GrpcWorkerAgentRuntime(host_address=host_address) for _ in range(2)]
+    for sender in senders:
+        await sender.start()
+        sender.add_message_serializer(try_get_known_serializers_for_type(ContentMessage))
+
+    # Both senders number their requests from 1, so the request ids collide on the host.
+    results = await asyncio.gather(
+        *[
+            sender.send_message(ContentMessage(content=f"{i}-{j}"), AgentId("loopback", "default"))
+            for i, sender in enumerate(senders)
+            for j in range(5)
+        ]
+    )
+    assert sorted(result.content for result in results) == sorted(f"{i}-{j}" for i in range(2) for j in range(5))
+
+    for sender in senders:
+        await sender.stop()
+    await target.stop()
+    await host.stop()
+
+
+class RelayAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that forwards each request to the loopback agent.")
+
+    @rpc
+    async def on_new_message(self, message: MessageType, ctx: MessageContext) -> MessageType:
+        result: MessageType = await self.send_message(message, AgentId("loopback", "default"))
+        return result
+
+
+class BlockingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("An agent that answers once it is released.")
+        self.released = asyncio.Event()
+
+    @rpc
+    async def on_new_message(self, message: MessageType, ctx: MessageContext) -> MessageType:
+        await self.released.wait()
+        return message
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_flow_control_nested_requests_do_not_deadlock() -> None:
+    host_address = "localhost:50059"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    flow_control = FlowControlConfig(max_inflight_messages=1)
+    workers = [GrpcWorkerAgentRuntime(host_address=host_address, flow_control=flow_control) for _ in range(3)]
+    for worker in workers:
+        await worker.start()
+        worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await workers[1].register_factory(type=AgentType("relay"), agent_factory=lambda: RelayAgent())
+    await workers[2].register_factory(type=AgentType("loopback"), agent_factory=lambda: LoopbackAgent())
+
+    # The relay handlers hold the only in-flight slot of their worker while they wait for responses,
+    # which the worker must still read while the next request waits for the slot.
+    results = await asyncio.wait_for(
+        asyncio.gather(*[workers[0].send_message(MessageType(), AgentId("relay", "default")) for _ in range(3)]),
+        timeout=10,
+    )
+    assert len(results) == 3
+
+    for worker in workers:
+        await worker.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_flow_control_credits_returned_for_failed_and_cancelled_requests() -> None:
+    host_address = "localhost:50060"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+
+    flow_control = FlowControlConfig(window_size=1)
+    worker1 = GrpcWorkerAgentRuntime(host_address=host_address, flow_control=flow_control)
+    await worker1.start()
+    worker1.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    worker2 = GrpcWorkerAgentRuntime(host_address=host_address)
+    await worker2.start()
+    worker2.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker2.register_factory(type=AgentType("blocking"), agent_factory=lambda: BlockingAgent())
+    await worker2.register_factory(type=AgentType("loopback"), agent_factory=lambda: LoopbackAgent())
+
+    # The host answers a request for an unknown agent type with an error.
+    with pytest.raises(Exception, match="not found"):
+        await asyncio.wait_for(worker1.send_message(MessageType(), AgentId("missing", "default")), timeout=10)
+    assert worker1.get_connection_metrics().outstanding == 0
+
+    # A cancelled request gives its credit back.
+    blocked = asyncio.create_task(worker1.send_message(MessageType(), AgentId("blocking", "default")))
+    await asyncio.sleep(0.5)
+    assert worker1.get_connection_metrics().outstanding == 1
+    blocked.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await blocked
+    assert worker1.get_connection_metrics().outstanding == 0
+
+    # The late response of the cancelled request is ignored.
+    agent = await worker2.try_get_underlying_agent_instance(AgentId("blocking", "default"), BlockingAgent)
+    agent.released.set()
+    result = await asyncio.wait_for(worker1.send_message(MessageType(), AgentId("loopback", "default")), timeout=10)
+    assert isinstance(result, MessageType)
+
+    await worker1.stop()
+    await worker2.stop()
+    await host.stop()
+
+
 # GrpcWorkerAgentRuntimeHost eats exceptions in the main loop
 # @pytest.mark.grpc
 # @pytest.mark.asyncio
@@ -969,3 +969,132 @@ async def test_api_version_handling() -> None:
         warning_msg = mock_logger.warning.call_args[0][0]
         assert "vector search" in warning_msg.lower()
         assert "2023-11-01" in warning_msg
+
+
+class FakeSearchClient:
+    """A search client that returns one document per query after a delay, and records the searches."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.searches: List[Dict[str, Any]] = []
+
+    async def search(self, **kwargs: Any) -> Any:
+        self.searches.append(kwargs)
+        await asyncio.sleep(self.delay)
+        text = kwargs.get("search_text", "vector")
+
+        async def documents() -> Any:
+            yield {"id": text, "content": f"About {text}", "@search.score": 1.0}
+
+        return documents()
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeEmbeddingClient:
+    """An OpenAI client whose embeddings are the lengths of the inputs, and which records its requests."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.inputs: List[Any] = []
+        self.embeddings = self
+        self.closed = False
+
+    async def create(self, model: str, input: Any) -> Any:
+        self.inputs.append(input)
+        await asyncio.sleep(0.01)
+        texts = [input] if isinstance(input, str) else input
+        return MagicMock(data=[MagicMock(embedding=[float(len(text))]) for text in texts])
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_deduplicates_concurrent_queries() -> None:
+    tool = AzureAISearchTool.create_full_text_search(
+        name="test-search",
+        endpoint=MOCK_ENDPOINT,
+        index_name=MOCK_INDEX,
+        credential=MOCK_CREDENTIAL,
+        enable_caching=True,
+        cache_max_entries=2,
+    )
+    client = FakeSearchClient()
+
+    with patch.object(tool, "_get_client", return_value=client):
+        results = await asyncio.gather(*(tool.run("same query") for _ in range(5)))
+        assert len(client.searches) == 1
+        assert all(result.results[0].content["id"] == "same query" for result in results)
+
+        # The least recently used query is evicted.
+        await tool.run("second query")
+        await tool.run("third query")
+        await tool.run("same query")
+        assert len(client.searches) == 4
+        await tool.run("third query")
+        assert len(client.searches) == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_search() -> None:
+    tool = AzureAISearchTool.create_full_text_search(
+        name="test-search",
+        endpoint=MOCK_ENDPOINT,
+        index_name=MOCK_INDEX,
+        credential=MOCK_CREDENTIAL,
+        enable_caching=True,
+    )
+    client = FakeSearchClient(delay=0.05)
+    token_a = CancellationToken()
+
+    with patch.object(tool, "_get_client", return_value=client):
+        run_a = asyncio.create_task(tool.run("same query", token_a))
+        run_b = asyncio.create_task(tool.run("same query", CancellationToken()))
+        await asyncio.sleep(0.01)
+        token_a.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_a
+        result_b = await run_b
+        assert result_b.results[0].content["id"] == "same query"
+        assert len(client.searches) == 1
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_batched_cached_and_client_reused() -> None:
+    tool = AzureAISearchTool.create_vector_search(
+        name="test-search",
+        endpoint=MOCK_ENDPOINT,
+        index_name=MOCK_INDEX,
+        credential=MOCK_CREDENTIAL,
+        vector_fields=["embedding"],
+        embedding_provider="openai",
+        embedding_model="text-embedding-3-small",
+        openai_api_key="test-key",
+        enable_caching=True,
+        embedding_batch_size=3,
+    )
+    search_client = FakeSearchClient()
+
+    with (
+        patch("openai.AsyncOpenAI", FakeEmbeddingClient),
+        patch.object(tool, "_get_client", return_value=search_client),
+    ):
+        queries = ["a", "bb", "ccc", "dddd"]
+        await asyncio.gather(*(tool.run(query) for query in queries))
+        embedding_client = tool._embedding_client  # pyright: ignore[reportPrivateUsage]
+        assert isinstance(embedding_client, FakeEmbeddingClient)
+        assert embedding_client.inputs == [["a", "bb", "ccc"], "dddd"]
+        vectors = [search["vector_queries"][0].vector for search in search_client.searches]
+        assert sorted(vectors) == [[1.0], [2.0], [3.0], [4.0]]
+
+        # A query whose results expired is not embedded again, with the same client.
+        tool._cache.clear()  # pyright: ignore[reportPrivateUsage]
+        await tool.run("bb")
+        assert len(search_client.searches) == 5
+        assert embedding_client.inputs == [["a", "bb", "ccc"], "dddd"]
+        assert tool._embedding_client is embedding_client  # pyright: ignore[reportPrivateUsage]
+
+    await tool.close()
+    assert embedding_client.closed
@@ -0,0 +1,88 @@
+# mypy: disable-error-code="no-any-unimported"
+import os
+from pathlib import Path
+
+import pandas as pd
+from autogen_ext.tools.graphrag import GraphRAGIndexStore
+from graphrag.query.indexer_adapters import read_indexer_entities, read_indexer_reports
+
+
+def _write_index(
+    path: Path,
+    community_df: pd.DataFrame,
+    entity_df: pd.DataFrame,
+    report_df: pd.DataFrame,
+) -> None:
+    community_df.to_parquet(path / "communities.parquet")  # type: ignore
+    entity_df.to_parquet(path / "entities.parquet")  # type: ignore
+    report_df.to_parquet(path / "community_reports.parquet")  # type: ignore
+
+
+def test_index_store_matches_indexer_adapters(
+    tmp_path: Path,
+    community_df_fixture: pd.DataFrame,
+    entity_df_fixture: pd.DataFrame,
+    report_df_fixture: pd.DataFrame,
+) -> None:
+    _write_index(tmp_path, community_df_fixture, entity_df_fixture, report_df_fixture)
+    store = GraphRAGIndexStore(tmp_path, cache_dir=tmp_path / "cache")
+
+    entities = store.entities("entities", "communities", 2)
+    # The adapter fails on the community and level columns of the entities, which the store doesn't read.
+    expected_entities = read_indexer_entities(
+        pd.read_parquet(tmp_path / "entities.parquet").drop(columns=["community", "level"]),  # type: ignore
+        pd.read_parquet(tmp_path / "communities.parquet"),  # type: ignore
+        2,
+    )
+    assert [(e.id, e.title, e.community_ids) for e in entities] == [
+        (e.id, e.title, e.community_ids) for e in expected_entities
+    ]
+    reports = store.reports("community_reports", "communities", 2)
+    expected_reports = read_indexer_reports(
+        pd.read_parquet(tmp_path / "community_reports.parquet"),  # type: ignore
+        pd.read_parquet(tmp_path / "communities.parquet"),  # type: ignore
+        2,
+    )
+    assert [(r.id, r.full_content) for r in reports] == [(r.id, r.full_content) for r in expected_reports]
+
+    # Objects are shared, and unused columns are not read.
+    assert store.entities("entities", "communities", 2) is entities
+    assert store.stats.object_cache_hits == 1
+    assert "full_content_json" not in store.dataframe("community_reports", ["id", "full_content"]).columns
+    assert store.stats.arrow_files_written == 3
+
+    # Another store of the index, as in another process, maps the same Arrow files.
+    other = GraphRAGIndexStore(tmp_path, cache_dir=tmp_path / "cache")
+    assert other.table("entities").equals(store.table("entities"))
+    assert other.stats.arrow_files_written == 0
+
+    # Without memory mapping, the Parquet files are read directly.
+    unmapped = GraphRAGIndexStore(tmp_path, memory_map=False)
+    assert unmapped.dataframe("communities", ["id", "title"]).equals(store.dataframe("communities", ["id", "title"]))
+
+
+def test_index_store_reloads_changed_tables_and_looks_up_rows(
+    tmp_path: Path,
+    community_df_fixture: pd.DataFrame,
+    entity_df_fixture: pd.DataFrame,
+    report_df_fixture: pd.DataFrame,
+) -> None:
+    _write_index(tmp_path, community_df_fixture, entity_df_fixture, report_df_fixture)
+    store = GraphRAGIndexStore(tmp_path, cache_dir=tmp_path / "cache")
+
+    second_id, first_id = report_df_fixture["id"].tolist()[::-1]
+    rows = store.rows("community_reports", [second_id, "missing", first_id], columns=["id", "title"])
+    assert rows.column("id").to_pylist() == [second_id, first_id]
+    assert store.row_index("community_reports")[first_id] == 0
+
+    reports = store.reports("community_reports", "communities", 2)
+    changed = report_df_fixture.copy()
+    changed["title"] = ["Changed title", "Other title"]
+    changed.to_parquet(tmp_path / "community_reports.parquet")  # type: ignore
+    stat = os.stat(tmp_path / "community_reports.parquet")
+    os.utime(tmp_path / "community_reports.parquet", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    changed_reports = store.reports("community_reports", "communities", 2)
+    assert changed_reports is not reports
+    assert {report.title for report in changed_reports} <= {"Changed title", "Other title"}
+    assert store.stats.arrow_files_written == 3
@@ -5,7 +5,7 @@
 import pytest_asyncio
 import uvicorn
 from autogen_core import ComponentModel
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from pydantic import BaseModel, Field
 
 
@@ -57,6 +57,24 @@ async def test_patch_endpoint(body: TestArgs) -> TestResponse:
     return TestResponse(result=f"Received: {body.query} with value {body.value}")
 
 
+# Responses of the cached endpoint by status code
+cached_endpoint_responses: Dict[int, int] = {}
+
+
+@app.get("/cached")
+async def test_cached_endpoint(request: Request, query: str, value: int) -> Response:
+    # The query is the content of the response, and the value its max-age
+    etag = f'"{query}"'
+    status_code = 304 if request.headers.get("if-none-match") == etag else 200
+    cached_endpoint_responses[status_code] = cached_endpoint_responses.get(status_code, 0) + 1
+    return Response(
+        content=f"Received: {query}" if status_code == 200 else None,
+        status_code=status_code,
+        headers={"Cache-Control": f"max-age={value}", "ETag": etag},
+        media_type="text/plain",
+    )
+
+
 @pytest.fixture
 def test_config() -> ComponentModel:
     return ComponentModel(
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from autogen_core import CancellationToken, ComponentModel
+from autogen_ext.tools.http import HttpClientPool, HttpTool
+
+from .conftest import cached_endpoint_responses
+
+
+def _tool(test_config: ComponentModel, pool: HttpClientPool, **overrides: object) -> HttpTool:
+    config = {**test_config.config, **overrides}
+    return HttpTool(**config, client_pool=pool)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_clients(test_config: ComponentModel, test_server: None) -> None:
+    async with HttpClientPool() as pool:
+        first = _tool(test_config, pool)
+        second = _tool(test_config, pool, method="GET")
+        other_credentials = _tool(
+            test_config, pool, headers={"Content-Type": "application/json", "Authorization": "Bearer other"}
+        )
+
+        results = await asyncio.gather(
+            first.run_json({"query": "first", "value": 1}, CancellationToken()),
+            second.run_json({"query": "second", "value": 2}, CancellationToken()),
+            other_credentials.run_json({"query": "third", "value": 3}, CancellationToken()),
+        )
+        assert list(results) == [
+            '{"result":"Received: first with value 1"}',
+            '{"result":"Received: second with value 2"}',
+            '{"result":"Received: third with value 3"}',
+        ]
+        # The tools with the same server and credentials share a client.
+        assert pool.stats.clients_created == 2
+        assert pool.stats.cache_misses == 0
+
+        # The pool is not part of the component config.
+        assert "client_pool" not in first.dump_component().config
+
+    with pytest.raises(RuntimeError):
+        await first.run_json({"query": "closed", "value": 1}, CancellationToken())
+
+
+@pytest.mark.asyncio
+async def test_pool_caches_responses(test_config: ComponentModel, test_server: None) -> None:
+    cached_endpoint_responses.clear()
+    async with HttpClientPool(cache_size=8) as pool:
+        tool = _tool(test_config, pool, method="GET", path="/cached")
+
+        # A fresh response is served from the cache.
+        for _ in range(3):
+            assert await tool.run_json({"query": "fresh", "value": 60}, CancellationToken()) == "Received: fresh"
+        assert cached_endpoint_responses == {200: 1}
+        assert pool.stats.cache_hits == 2
+
+        # A stale response is revalidated with its ETag.
+        for _ in range(3):
+            assert await tool.run_json({"query": "stale", "value": 0}, CancellationToken()) == "Received: stale"
+        assert cached_endpoint_responses == {200: 2, 304: 2}
+        assert pool.stats.cache_revalidations == 2
+
+        # Other methods are not cached.
+        post_tool = _tool(test_config, pool)
+        for _ in range(2):
+            await post_tool.run_json({"query": "post", "value": 1}, CancellationToken())
+        assert pool.stats.cache_misses == 2
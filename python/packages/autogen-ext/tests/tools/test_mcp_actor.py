@@ -470,7 +470,7 @@ async def test_run_actor_exception_handling() -> None:
     # Create a mock session that will raise exceptions by modifying our mock session
     @asynccontextmanager
     async def mock_failing_session(
-        server_params: Any, sampling_callback: Any = None
+        server_params: Any, sampling_callback: Any = None, message_handler: Any = None
     ) -> AsyncGenerator[MagicMock, None]:
         mock_session = MagicMock()
         mock_session.initialize = AsyncMock(
@@ -1143,7 +1143,7 @@ async def test_run_actor_all_command_types_exception_handling() -> None:
     # Create a mock session that will raise exceptions for all command types
     @asynccontextmanager
     async def mock_failing_session(
-        server_params: Any, sampling_callback: Any = None
+        server_params: Any, sampling_callback: Any = None, message_handler: Any = None
     ) -> AsyncGenerator[MagicMock, None]:
         mock_session = MagicMock()
         mock_session.initialize = AsyncMock(
@@ -0,0 +1,119 @@
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from autogen_core import CancellationToken
+from autogen_ext.tools.mcp import McpSessionPool, McpWorkbench, StdioServerParams, mcp_server_tools
+
+
+@pytest.fixture
+def server_params() -> StdioServerParams:
+    server_path = Path(__file__).parent.parent / "mcp_server_comprehensive.py"
+    return StdioServerParams(command=sys.executable, args=[str(server_path)], read_timeout_seconds=30)
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_sessions_up_to_max(server_params: StdioServerParams) -> None:
+    async with McpSessionPool(max_sessions_per_server=2, health_check_interval=None, idle_timeout=None) as pool:
+
+        async def echo(text: str) -> str:
+            async with pool.session(server_params) as session:
+                result = await session.call_tool("echo", {"text": text})
+                assert result.content[0].type == "text"
+                return result.content[0].text
+
+        results = await asyncio.gather(*(echo(str(i)) for i in range(8)))
+        assert results == [f"Echo: {i}" for i in range(8)]
+        assert pool.num_sessions(server_params) == 2
+        assert pool.stats.sessions_started == 2
+
+        await asyncio.gather(*(echo(str(i)) for i in range(8)))
+        assert pool.stats.sessions_started == 2
+        assert pool.stats.leases == 16
+
+    assert pool.num_sessions(server_params) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_replaces_broken_session(server_params: StdioServerParams) -> None:
+    async with McpSessionPool(health_check_interval=None, idle_timeout=None) as pool:
+        await pool.start(server_params)
+        assert pool.num_sessions(server_params) == 1
+        (pooled,) = pool._sessions[pool._key(server_params)]  # pyright: ignore[reportPrivateUsage]
+
+        # End the session as if the server had exited.
+        pooled._closing.set()  # pyright: ignore[reportPrivateUsage]
+        await asyncio.sleep(0.5)
+        assert not pooled.usable
+
+        async with pool.session(server_params) as session:
+            result = await session.call_tool("echo", {"text": "again"})
+        assert result.content[0].type == "text" and result.content[0].text == "Echo: again"
+        assert pool.stats.sessions_failed == 1
+        assert pool.stats.sessions_started == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_health_check_and_idle_reaping(server_params: StdioServerParams) -> None:
+    async with McpSessionPool(max_sessions_per_server=3, idle_timeout=3600, health_check_interval=3600) as pool:
+        await pool.start(server_params)
+
+        async def echo() -> None:
+            async with pool.session(server_params) as session:
+                await session.call_tool("echo", {"text": "x"})
+
+        await asyncio.gather(*(echo() for _ in range(3)))
+        assert pool.num_sessions(server_params) == 3
+
+        # Idle sessions beyond the minimum of a started server are closed.
+        pool._idle_timeout = 0  # pyright: ignore[reportPrivateUsage]
+        await pool.check_sessions()
+        assert pool.num_sessions(server_params) == 1
+        assert pool.stats.sessions_reaped == 2
+
+    async with McpSessionPool(idle_timeout=None, health_check_interval=3600) as pool:
+        await pool.start(server_params)
+        (pooled,) = pool._sessions[pool._key(server_params)]  # pyright: ignore[reportPrivateUsage]
+        await pool.check_sessions()
+        assert pool._sessions[pool._key(server_params)] == [pooled]  # pyright: ignore[reportPrivateUsage]
+
+        # A session that doesn't answer a ping is replaced.
+        assert pooled.session is not None
+        pooled.session.send_ping = AsyncMock(side_effect=TimeoutError())  # type: ignore[method-assign]
+        await pool.check_sessions()
+        assert pool.stats.sessions_failed == 1
+        assert pooled not in pool._sessions[pool._key(server_params)]  # pyright: ignore[reportPrivateUsage]
+        assert pool.num_sessions(server_params) == 1
+        async with pool.session(server_params) as session:
+            await session.call_tool("echo", {"text": "x"})
+
+
+@pytest.mark.asyncio
+async def test_pool_session_fails_to_start() -> None:
+    params = StdioServerParams(command=sys.executable, args=["-c", "import sys; sys.exit(1)"], read_timeout_seconds=5)
+    async with McpSessionPool(health_check_interval=None, idle_timeout=None) as pool:
+        with pytest.raises(Exception):  # noqa: B017
+            async with pool.session(params):
+                pass
+        assert pool.num_sessions(params) == 0
+        assert pool.stats.sessions_failed == 1
+
+
+@pytest.mark.asyncio
+async def test_workbenches_and_adapters_share_pool(server_params: StdioServerParams) -> None:
+    async with McpSessionPool(max_sessions_per_server=2, health_check_interval=None, idle_timeout=None) as pool:
+        async with McpWorkbench(server_params, session_pool=pool) as first:
+            async with McpWorkbench(server_params, session_pool=pool) as second:
+                assert pool.num_sessions(server_params) == 1
+                results = await asyncio.gather(
+                    *(workbench.call_tool("echo", {"text": "hi"}) for workbench in (first, second, first, second))
+                )
+                assert all(not result.is_error and result.to_text() == "Echo: hi" for result in results)
+
+        tools = await mcp_server_tools(server_params, session_pool=pool)
+        echo = next(tool for tool in tools if tool.name == "echo")
+        result = await echo.run_json({"text": "adapter"}, CancellationToken())
+        assert "Echo: adapter" in echo.return_value_as_string(result)
+        assert pool.stats.sessions_started == 2
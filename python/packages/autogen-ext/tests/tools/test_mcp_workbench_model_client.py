@@ -820,7 +820,11 @@ async def test_sampling_callback_integration_through_session(sample_server_param
         await asyncio.sleep(0.1)
 
         # Verify that the session was created with the sampling_callback
-        mock_session_factory.assert_called_once_with(sample_server_params, sampling_callback=actor._sampling_callback)  # type: ignore[attr-defined]
+        mock_session_factory.assert_called_once_with(
+            sample_server_params,
+            sampling_callback=actor._sampling_callback,  # type: ignore[attr-defined]
+            message_handler=actor._message_handler,  # type: ignore[attr-defined]
+        )
 
         # Clean up by trying to close the actor gracefully
         if actor._active and actor._actor_task is not None:  # type: ignore[attr-defined]
@@ -0,0 +1,170 @@
+import asyncio
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from autogen_core.tools import ToolOverride
+from autogen_ext.tools.mcp import McpSessionActor, McpWorkbench, StdioServerParams
+from mcp import Tool
+from mcp import types as mcp_types
+from mcp.types import ListToolsResult
+
+
+@pytest.fixture
+def sample_server_params() -> StdioServerParams:
+    """Sample server parameters for testing."""
+    return StdioServerParams(command="echo", args=["test"])
+
+
+def _tool(name: str) -> Tool:
+    return Tool(
+        name=name,
+        description=f"The {name} tool",
+        inputSchema={"type": "object", "properties": {"x": {"type": "string"}}, "required": ["x"]},
+    )
+
+
+class _CountingActor:
+    """Stands in for McpSessionActor, listing the given tools and counting the listings."""
+
+    def __init__(self, *names: str) -> None:
+        self.tools = [_tool(name) for name in names]
+        self.tool_list_version = 0
+        self.calls = 0
+        self.delay = 0.0
+
+    async def call(self, type: str, args: Any = None) -> "asyncio.Future[ListToolsResult]":
+        assert type == "list_tools"
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        future: asyncio.Future[ListToolsResult] = asyncio.Future()
+        future.set_result(ListToolsResult(tools=list(self.tools)))
+        return future
+
+
+@pytest.mark.asyncio
+async def test_list_tools_is_cached_with_overrides(sample_server_params: StdioServerParams) -> None:
+    overrides: Dict[str, ToolOverride] = {"fetch": ToolOverride(name="web_fetch", description="Fetch a page")}
+    workbench = McpWorkbench(server_params=sample_server_params, tool_overrides=overrides)
+    actor = _CountingActor("fetch", "search")
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+
+    try:
+        first = await workbench.list_tools()
+        second = await workbench.list_tools()
+        assert actor.calls == 1
+        assert first == second
+        assert [tool["name"] for tool in second] == ["web_fetch", "search"]
+        assert second[0].get("description") == "Fetch a page"
+
+        # Callers get their own list, so changing it doesn't change the cache.
+        second.clear()
+        assert len(await workbench.list_tools()) == 2
+        assert actor.calls == 1
+    finally:
+        workbench._actor = None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_list_tools_cache_invalidated_by_tool_list_change(sample_server_params: StdioServerParams) -> None:
+    workbench = McpWorkbench(server_params=sample_server_params)
+    actor = _CountingActor("fetch")
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+
+    try:
+        assert [tool["name"] for tool in await workbench.list_tools()] == ["fetch"]
+        actor.tools.append(_tool("search"))
+        assert [tool["name"] for tool in await workbench.list_tools()] == ["fetch"]
+
+        actor.tool_list_version += 1
+        assert [tool["name"] for tool in await workbench.list_tools()] == ["fetch", "search"]
+        assert actor.calls == 2
+
+        # A new session, as after restarting the workbench, lists the tools again.
+        new_actor = _CountingActor("other")
+        workbench._actor = new_actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+        assert [tool["name"] for tool in await workbench.list_tools()] == ["other"]
+    finally:
+        workbench._actor = None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_list_tools_cache_ttl(sample_server_params: StdioServerParams) -> None:
+    workbench = McpWorkbench(server_params=sample_server_params, tools_cache_ttl=0.05)
+    actor = _CountingActor("fetch")
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+
+    try:
+        await workbench.list_tools()
+        await workbench.list_tools()
+        assert actor.calls == 1
+        await asyncio.sleep(0.1)
+        await workbench.list_tools()
+        assert actor.calls == 2
+    finally:
+        workbench._actor = None  # pyright: ignore[reportPrivateUsage]
+
+    workbench = McpWorkbench(server_params=sample_server_params, tools_cache_ttl=0)
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+    try:
+        await workbench.list_tools()
+        await workbench.list_tools()
+        assert actor.calls == 4
+    finally:
+        workbench._actor = None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_list_tools_share_one_listing(sample_server_params: StdioServerParams) -> None:
+    workbench = McpWorkbench(server_params=sample_server_params)
+    actor = _CountingActor("fetch", "search")
+    actor.delay = 0.05
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+
+    try:
+        results = await asyncio.gather(*(workbench.list_tools() for _ in range(10)))
+        assert actor.calls == 1
+        assert all(result == results[0] for result in results)
+    finally:
+        workbench._actor = None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_stop_clears_tools_cache(sample_server_params: StdioServerParams) -> None:
+    workbench = McpWorkbench(server_params=sample_server_params)
+    actor = _CountingActor("fetch")
+    workbench._actor = actor  # type: ignore[assignment] # pyright: ignore[reportPrivateUsage]
+    await workbench.list_tools()
+    actor.close = AsyncMock()  # type: ignore[attr-defined]
+
+    await workbench.stop()
+    assert workbench._tools_cache is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_tools_cache_ttl_in_config(sample_server_params: StdioServerParams) -> None:
+    workbench = McpWorkbench(server_params=sample_server_params, tools_cache_ttl=30)
+    config = workbench.dump_component()
+    assert config.config["tools_cache_ttl"] == 30
+    loaded = McpWorkbench.load_component(config)
+    assert loaded._tools_cache_ttl == 30  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_actor_counts_tool_list_changed_notifications(sample_server_params: StdioServerParams) -> None:
+    actor = McpSessionActor(sample_server_params)
+    assert actor.tool_list_version == 0
+
+    await actor._message_handler(  # pyright: ignore[reportPrivateUsage]
+        mcp_types.ServerNotification(mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed"))
+    )
+    assert actor.tool_list_version == 1
+
+    # Other notifications and messages leave the version as it is.
+    await actor._message_handler(  # pyright: ignore[reportPrivateUsage]
+        mcp_types.ServerNotification(
+            mcp_types.ResourceListChangedNotification(method="notifications/resources/list_changed")
+        )
+    )
+    await actor._message_handler(MagicMock())  # pyright: ignore[reportPrivateUsage]
+    await actor._message_handler(RuntimeError("transport error"))  # pyright: ignore[reportPrivateUsage]
+    assert actor.tool_list_version == 1
@@ -33,6 +33,7 @@ def ui(
     database_uri: Optional[str] = None,
     auth_config: Optional[str] = None,
     upgrade_database: bool = False,
+    reuse_teams: bool = False,
 ):
     """
     Run the AutoGen Studio UI.
@@ -47,6 +48,9 @@ def ui(
         database_uri (str, optional): Database URI to connect to. Defaults to None.
         auth_config (str, optional): Path to authentication configuration YAML. Defaults to None.
         upgrade_database (bool, optional): Whether to upgrade the database. Defaults to False.
+        reuse_teams (bool, optional): Whether to reuse the teams of finished runs for the next runs of the same
+            team in the same session, which start faster. Components that are not reset, like code executors,
+            keep their state between those runs. Defaults to False.
     """
     # Write configuration
     env_vars = {
@@ -66,6 +70,8 @@ def ui(
         env_vars["AUTOGENSTUDIO_AUTH_CONFIG"] = auth_config
     if upgrade_database:
         env_vars["AUTOGENSTUDIO_UPGRADE_DATABASE"] = "1"
+    if reuse_teams:
+        env_vars["AUTOGENSTUDIO_REUSE_TEAMS"] = "1"
 
     # Create temporary env file to share configuration with uvicorn workers
     env_file_path = get_env_file_path()
@@ -1,17 +1,20 @@
+import asyncio
 import json
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
 from loguru import logger
 from sqlalchemy import exc, inspect, text
 from sqlmodel import Session, SQLModel, and_, create_engine, select
 
-from ..datamodel import BaseDBModel, Response, Team
+from ..datamodel import BaseDBModel, Message, Response, Run, Team
 from ..teammanager import TeamManager
 from .schema_manager import SchemaManager
 
+T = TypeVar("T")
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, o):
@@ -40,7 +43,9 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        # SQLite connections are handed between threads by the pool, such as the message writer thread of
+        # the WebSocketManager, but are only used by one thread at a time
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -53,6 +58,25 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
             base_dir=base_dir,
         )
 
+    @property
+    def supports_threads(self) -> bool:
+        """Whether the database can be used from other threads. In-memory SQLite databases are per thread."""
+        url = self.engine.url
+        return url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:")
+
+    async def run_async(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a database call in a worker thread, so that it doesn't block the event loop.
+        Calls for in-memory SQLite databases run in the calling thread.
+
+        Args:
+            func: The database call, such as a method of this manager
+            *args: Positional arguments of the call
+            **kwargs: Keyword arguments of the call
+        """
+        if not self.supports_threads:
+            return func(*args, **kwargs)
+        return await asyncio.to_thread(func, *args, **kwargs)
+
     def _should_auto_upgrade(self) -> bool:
         """
         Check if auto upgrade should run based on schema differences
@@ -87,6 +111,7 @@ def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bo
                 return Response(message="Failed to initialize migrations", status=False)
 
             # Handle existing database
+            self._ensure_indexes(tables_exist)
             if auto_upgrade:
                 logger.info("Checking database schema...")
                 if self.schema_manager.ensure_schema_up_to_date():
@@ -105,6 +130,15 @@ def initialize_database(self, auto_upgrade: bool = False, force_init_alembic: bo
         finally:
             self._init_lock.release()
 
+    def _ensure_indexes(self, table_names: Sequence[str]) -> None:
+        """Create the indexes of the models that are missing in existing tables, such as those added to
+        the models after the tables were created, as create_all only creates the indexes of new tables."""
+        for table in SQLModel.metadata.sorted_tables:
+            if table.name not in table_names:
+                continue
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
     def reset_db(self, recreate_tables: bool = True) -> Response:
         """
         Reset the database by dropping all tables and optionally recreating them.
@@ -205,6 +239,30 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def bulk_insert(self, models: Sequence[BaseDBModel]) -> Response:
+        """Create entities in one transaction
+
+        Args:
+            models (Sequence[SQLModel]): The new model instances to create
+
+        Returns:
+            Response: Contains status, message and the number of created entities as data
+        """
+        if not models:
+            return Response(message="No entities to create", status=True, data=0)
+
+        # The created entities keep their values, including their new ids, after the commit
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while creating {len(models)} entities: {e}")
+                return Response(message=f"Error while creating entities: {e}", status=False, data=0)
+
+        return Response(message=f"{len(models)} entities created successfully", status=True, data=len(models))
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
@@ -242,6 +300,118 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        exclude_columns: Sequence[str] = (),
+    ) -> Response:
+        """List entities in pages, in the order of their ids
+
+        Args:
+            model_class: The model class of the entities
+            filters: Column values to filter by. A list value matches any of its values.
+            cursor: The id after which the page starts, which is the ``next_cursor`` of the previous page
+            limit: Maximum number of entities in the page. If None, all entities after the cursor are listed.
+            exclude_columns: Columns left out of the entities, such as large JSON columns
+
+        Returns:
+            Response: Contains status, message and data with the ``items`` of the page, as dictionaries,
+                and the ``next_cursor``, which is None for the last page
+        """
+        table = model_class.__table__  # type: ignore[attr-defined]
+        statement = select(*[column for column in table.columns if column.name not in exclude_columns])
+        for col, value in (filters or {}).items():
+            column = table.c[col]
+            statement = statement.where(column.in_(value) if isinstance(value, list) else column == value)
+        if cursor is not None:
+            statement = statement.where(table.c.id > cursor)
+        statement = statement.order_by(table.c.id)
+        if limit is not None:
+            # One more row tells whether there is a next page
+            statement = statement.limit(limit + 1)
+
+        with Session(self.engine) as session:
+            try:
+                items = [dict(row) for row in session.execute(statement).mappings()]
+            except Exception as e:
+                session.rollback()
+                logger.error("Error while getting items: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False, data=None)
+
+        next_cursor = None
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            next_cursor = items[-1]["id"]
+        return Response(
+            message=f"{model_class.__name__} Retrieved Successfully",
+            status=True,
+            data={"items": items, "next_cursor": next_cursor},
+        )
+
+    def get_session_runs(
+        self,
+        session_id: int,
+        cursor: Optional[int] = None,
+        limit: Optional[int] = None,
+        include_messages: bool = True,
+        include_config: bool = True,
+    ) -> Response:
+        """List the runs of a session in pages, with their messages
+
+        The messages of all runs of the page are read with one query, joined with the runs.
+
+        Args:
+            session_id: id of the session
+            cursor: The run id after which the page starts, which is the ``next_cursor`` of the previous page
+            limit: Maximum number of runs in the page. If None, all runs after the cursor are listed.
+            include_messages: Whether to list the messages of each run, under ``messages``
+            include_config: Whether to include the large JSON columns, the team result of the runs and
+                the config of the messages
+
+        Returns:
+            Response: Contains status, message and data with the ``items`` of the page, as dictionaries,
+                and the ``next_cursor``, which is None for the last page
+        """
+        response = self.get_page(
+            Run,
+            filters={"session_id": session_id},
+            cursor=cursor,
+            limit=limit,
+            exclude_columns=() if include_config else ("team_result", "messages"),
+        )
+        if not response.status or not include_messages or not response.data["items"]:
+            return response
+
+        runs: List[Dict[str, Any]] = response.data["items"]
+        messages_by_run: Dict[int, List[Dict[str, Any]]] = {run["id"]: [] for run in runs}
+        message_table = Message.__table__  # type: ignore[attr-defined]
+        run_table = Run.__table__  # type: ignore[attr-defined]
+        # The runs of the page are the runs of the session in the range of their ids
+        statement = (
+            select(*[column for column in message_table.columns if include_config or column.name != "config"])
+            .join(run_table, message_table.c.run_id == run_table.c.id)
+            .where(run_table.c.session_id == session_id, run_table.c.id <= runs[-1]["id"])
+            .order_by(message_table.c.id)
+        )
+        if cursor is not None:
+            statement = statement.where(run_table.c.id > cursor)
+
+        with Session(self.engine) as session:
+            try:
+                for row in session.execute(statement).mappings():
+                    messages_by_run[row["run_id"]].append(dict(row))
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while getting messages of session {session_id}: {e}")
+                return Response(message="Error while fetching Message", status=False, data=None)
+
+        for run in runs:
+            run["messages"] = messages_by_run[run["id"]]
+        return response
+
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
         """Delete an entity"""
         status_message = ""
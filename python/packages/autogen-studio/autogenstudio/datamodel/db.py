@@ -59,10 +59,13 @@ class Message(BaseDBModel, table=True):
     config: Union[MessageConfig, dict] = Field(
         default_factory=lambda: MessageConfig(source="", content=""), sa_column=Column(JSON)
     )
+    # Indexed for the history of sessions and runs, whose pages are ordered by id
     session_id: Optional[int] = Field(
-        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"))
+        default=None, sa_column=Column(Integer, ForeignKey("session.id", ondelete="NO ACTION"), index=True)
+    )
+    run_id: Optional[int] = Field(
+        default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE"), index=True)
     )
-    run_id: Optional[int] = Field(default=None, sa_column=Column(Integer, ForeignKey("run.id", ondelete="CASCADE")))
 
     message_meta: Optional[Union[MessageMeta, dict]] = Field(default={}, sa_column=Column(JSON))
 
@@ -93,7 +96,9 @@ class Run(BaseDBModel, table=True):
 
     __table_args__ = {"sqlite_autoincrement": True}
 
-    session_id: int = Field(sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False))
+    session_id: int = Field(
+        sa_column=Column(Integer, ForeignKey("session.id", ondelete="CASCADE"), nullable=False, index=True)
+    )
     status: RunStatus = Field(default=RunStatus.CREATED)
 
     # Store the original user task
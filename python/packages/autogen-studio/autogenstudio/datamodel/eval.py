@@ -80,3 +80,14 @@ class EvalResult(BaseModel):
     status: EvalRunStatus = EvalRunStatus.PENDING
     start_time: Optional[datetime] = Field(default=datetime.now())
     end_time: Optional[datetime] = None
+
+
+class EvalBatchItem(BaseModel):
+    """Result of one task of a batch evaluation with one runner."""
+
+    task_id: UUID | str
+    runner: str
+    status: EvalRunStatus = EvalRunStatus.PENDING
+    run_result: Optional[EvalRunResult] = None
+    score: Optional[EvalScore] = None
+    error: Optional[str] = None
@@ -0,0 +1,423 @@
+import asyncio
+import hashlib
+import json
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import aiofiles
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import MessageFactory
+from autogen_core import CancellationToken
+from loguru import logger
+
+from ..datamodel.eval import (
+    EvalBatchItem,
+    EvalDimensionScore,
+    EvalJudgeCriteria,
+    EvalRunResult,
+    EvalRunStatus,
+    EvalScore,
+    EvalTask,
+)
+from .judges import BaseEvalJudge
+from .runners import BaseEvalRunner
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchEvaluatorStats:
+    """Counters of a BatchEvaluator"""
+
+    items: int = 0
+    resumed: int = 0
+    completed: int = 0
+    failed: int = 0
+    runner_runs: int = 0
+    runner_cache_hits: int = 0
+    judge_calls: int = 0
+    verdict_cache_hits: int = 0
+
+
+class _RateLimiter:
+    """Spaces out the calls to a model to at most ``requests_per_minute``."""
+
+    def __init__(self, requests_per_minute: float) -> None:
+        self._interval = 60.0 / requests_per_minute
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next)
+        self._next = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def _hash(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _component_key(component: Union[BaseEvalRunner, BaseEvalJudge]) -> str:
+    """The key of the configuration of a runner or judge"""
+    try:
+        return _hash(component.dump_component().model_dump(mode="json"))
+    except Exception:
+        return _hash([type(component).__qualname__, component.name, component.description, component.metadata])
+
+
+def _model_name(component: Union[BaseEvalRunner, BaseEvalJudge]) -> str:
+    """The model of a runner or judge, to rate limit it by, or its name if it has no model client"""
+    model_client = getattr(component, "model_client", None)
+    if model_client is not None:
+        try:
+            model = model_client.dump_component().config.get("model")
+        except Exception:
+            model = None
+        if model:
+            return str(model)
+    return component.name
+
+
+def _dump_run_result(run_result: EvalRunResult) -> Dict[str, Any]:
+    data = run_result.model_dump(mode="json", exclude={"result"})
+    if run_result.result is not None:
+        data["result"] = {
+            "messages": [message.dump() for message in run_result.result.messages],
+            "stop_reason": run_result.result.stop_reason,
+        }
+    return data
+
+
+def _load_run_result(data: Dict[str, Any]) -> EvalRunResult:
+    result = data.pop("result", None)
+    run_result = EvalRunResult.model_validate(data)
+    if result is not None:
+        message_factory = MessageFactory()
+        run_result.result = TaskResult(
+            messages=[message_factory.create(message) for message in result["messages"]],
+            stop_reason=result.get("stop_reason"),
+        )
+    return run_result
+
+
+class BatchEvaluator:
+    """Evaluates a dataset of tasks with several runners and a judge.
+
+    Each task is run with each runner and the successful results are judged on all criteria, by a
+    pool of ``max_concurrency`` workers. The runs and judge calls of each model, the model of the
+    model client of a runner or judge, or the name of one without, are limited to the requests per
+    minute of the model in ``rate_limits``. For a team runner this limits the runs of the team, not
+    the model calls within them.
+
+    The results of runs are cached by the task and the runner configuration, and the verdicts of the
+    judge by the task, the text of the result, the judge configuration and the criterion, so that
+    repeated tasks, runners that give the same answers and later batches over the same dataset are
+    not run or judged again. Only the criteria without a cached verdict are sent to the judge, in one
+    call.
+
+    With a ``checkpoint_path``, each finished item is appended to a JSON lines file, and an interrupted
+    batch evaluated again with the same file resumes from its completed items. Items are only resumed
+    with the same runner, judge and criteria, so that changing the judge or criteria evaluates them again.
+
+    Args:
+        max_concurrency: Maximum number of items evaluated at the same time
+        rate_limits: Maximum requests per minute of each model, by model name
+        max_cache_entries: Maximum number of run results and of verdicts kept in the caches
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        rate_limits: Optional[Dict[str, float]] = None,
+        max_cache_entries: int = 10000,
+    ) -> None:
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_cache_entries = max_cache_entries
+        self.stats = BatchEvaluatorStats()
+        self._rate_limiters = {model: _RateLimiter(rate) for model, rate in (rate_limits or {}).items()}
+        self._run_cache: "OrderedDict[str, EvalRunResult]" = OrderedDict()
+        self._verdict_cache: "OrderedDict[str, EvalDimensionScore]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._models: "weakref.WeakKeyDictionary[Union[BaseEvalRunner, BaseEvalJudge], str]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def evaluate(
+        self,
+        tasks: Sequence[EvalTask],
+        runners: Sequence[BaseEvalRunner],
+        judge: BaseEvalJudge,
+        criteria: List[EvalJudgeCriteria],
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[EvalBatchItem]:
+        """
+        Evaluate each task with each runner.
+
+        Args:
+            tasks: The tasks to evaluate
+            runners: The runners to run each task with
+            judge: The judge to score the results with
+            criteria: The criteria to score the results on
+            checkpoint_path: Optional JSON lines file to record finished items in and resume from
+            cancellation_token: Optional token to cancel the runs and judge calls
+
+        Returns:
+            The results, for each task in order, with each runner in order
+        """
+        runner_keys = [_component_key(runner) for runner in runners]
+        judge_key = _component_key(judge)
+        criteria_keys = [_hash(criterion.model_dump(mode="json")) for criterion in criteria]
+
+        # Items evaluated with another judge or other criteria are not resumed from the checkpoint
+        specs = [
+            (task, runner, runner_key, _hash([str(task.task_id), runner_key, judge_key, criteria_keys]))
+            for task in tasks
+            for runner, runner_key in zip(runners, runner_keys)
+        ]
+        self.stats.items += len(specs)
+
+        checkpoint = await self._load_checkpoint(checkpoint_path) if checkpoint_path else {}
+        results: List[Optional[EvalBatchItem]] = [None] * len(specs)
+        pending: List[Tuple[int, EvalTask, BaseEvalRunner, str, str]] = []
+        for index, (task, runner, runner_key, item_key) in enumerate(specs):
+            item = checkpoint.get(item_key)
+            if item is not None and item.status == EvalRunStatus.COMPLETED:
+                results[index] = item
+                self.stats.resumed += 1
+            else:
+                pending.append((index, task, runner, runner_key, item_key))
+        if checkpoint:
+            logger.info(f"Resuming batch evaluation with {len(specs) - len(pending)} of {len(specs)} items completed")
+
+        checkpoint_file: Optional[Any] = None
+        checkpoint_lock = asyncio.Lock()
+        if checkpoint_path:
+            path = Path(checkpoint_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            interrupted = path.exists() and path.stat().st_size > 0
+            checkpoint_file = await aiofiles.open(path, "a", encoding="utf-8")
+            if interrupted:
+                # End a partial last line of an interrupted batch, blank lines are skipped on loading
+                await checkpoint_file.write("\n")
+
+        # Workers take the next pending item until there are none left
+        pending_items: Iterator[Tuple[int, EvalTask, BaseEvalRunner, str, str]] = iter(pending)
+
+        async def worker() -> None:
+            for index, task, runner, runner_key, item_key in pending_items:
+                item = await self._evaluate_item(
+                    task, runner, runner_key, judge, judge_key, criteria, criteria_keys, cancellation_token
+                )
+                results[index] = item
+                if item.status == EvalRunStatus.COMPLETED:
+                    self.stats.completed += 1
+                else:
+                    self.stats.failed += 1
+                if checkpoint_file is not None:
+                    line = json.dumps(self._dump_item(item_key, item)) + "\n"
+                    async with checkpoint_lock:
+                        await checkpoint_file.write(line)
+                        await checkpoint_file.flush()
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(pending)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker_task in workers:
+                worker_task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if checkpoint_file is not None:
+                await checkpoint_file.close()
+
+        return [item for item in results if item is not None]
+
+    def clear_cache(self) -> None:
+        """Forget the cached run results and verdicts"""
+        self._run_cache.clear()
+        self._verdict_cache.clear()
+
+    async def _evaluate_item(
+        self,
+        task: EvalTask,
+        runner: BaseEvalRunner,
+        runner_key: str,
+        judge: BaseEvalJudge,
+        judge_key: str,
+        criteria: List[EvalJudgeCriteria],
+        criteria_keys: List[str],
+        cancellation_token: Optional[CancellationToken],
+    ) -> EvalBatchItem:
+        item = EvalBatchItem(task_id=task.task_id, runner=runner.name, status=EvalRunStatus.RUNNING)
+        try:
+            item.run_result = await self._run(task, runner, runner_key, cancellation_token)
+            if not item.run_result.status:
+                item.status = EvalRunStatus.FAILED
+                item.error = item.run_result.error
+                return item
+            item.score = await self._judge(
+                task, item.run_result, judge, judge_key, criteria, criteria_keys, cancellation_token
+            )
+            item.status = EvalRunStatus.COMPLETED
+        except Exception as e:
+            logger.exception(f"Error evaluating task {task.task_id} with runner {runner.name}: {str(e)}")
+            item.status = EvalRunStatus.FAILED
+            item.error = str(e)
+        return item
+
+    async def _run(
+        self,
+        task: EvalTask,
+        runner: BaseEvalRunner,
+        runner_key: str,
+        cancellation_token: Optional[CancellationToken],
+    ) -> EvalRunResult:
+        run_key = _hash(["run", self._task_key(task), runner_key])
+        cached = self._cache_get(self._run_cache, run_key)
+        if cached is not None:
+            self.stats.runner_cache_hits += 1
+            return cached
+
+        async def run() -> EvalRunResult:
+            await self._acquire(runner)
+            self.stats.runner_runs += 1
+            run_result = await runner.run(task, cancellation_token)
+            if run_result.status:
+                self._cache_put(self._run_cache, run_key, run_result)
+            return run_result
+
+        return await self._once(run_key, run)
+
+    async def _judge(
+        self,
+        task: EvalTask,
+        run_result: EvalRunResult,
+        judge: BaseEvalJudge,
+        judge_key: str,
+        criteria: List[EvalJudgeCriteria],
+        criteria_keys: List[str],
+        cancellation_token: Optional[CancellationToken],
+    ) -> EvalScore:
+        result_key = self._result_key(run_result)
+        verdict_keys = [
+            _hash(["verdict", self._task_key(task), result_key, judge_key, criterion_key])
+            for criterion_key in criteria_keys
+        ]
+        verdicts: Dict[str, EvalDimensionScore] = {}
+        missing: List[Tuple[EvalJudgeCriteria, str]] = []
+        for criterion, verdict_key in zip(criteria, verdict_keys):
+            cached = self._cache_get(self._verdict_cache, verdict_key)
+            if cached is not None:
+                verdicts[verdict_key] = cached
+                self.stats.verdict_cache_hits += 1
+            else:
+                missing.append((criterion, verdict_key))
+
+        if missing:
+
+            async def judge_missing() -> Dict[str, EvalDimensionScore]:
+                await self._acquire(judge)
+                self.stats.judge_calls += 1
+                score = await judge.judge(task, run_result, [criterion for criterion, _ in missing], cancellation_token)
+                scores_by_dimension = {
+                    dimension_score.dimension: dimension_score for dimension_score in score.dimension_scores
+                }
+                judged: Dict[str, EvalDimensionScore] = {}
+                for criterion, verdict_key in missing:
+                    dimension_score = scores_by_dimension.get(criterion.dimension)
+                    if dimension_score is not None:
+                        judged[verdict_key] = dimension_score
+                        self._cache_put(self._verdict_cache, verdict_key, dimension_score)
+                return judged
+
+            verdicts.update(await self._once(_hash([key for _, key in missing]), judge_missing))
+
+        score = EvalScore(dimension_scores=[verdicts[key] for key in verdict_keys if key in verdicts])
+        valid_scores = [dimension_score.score for dimension_score in score.dimension_scores]
+        if valid_scores:
+            score.overall_score = sum(valid_scores) / len(valid_scores)
+        return score
+
+    async def _acquire(self, component: Union[BaseEvalRunner, BaseEvalJudge]) -> None:
+        if not self._rate_limiters:
+            return
+        model = self._models.get(component)
+        if model is None:
+            model = self._models[component] = _model_name(component)
+        rate_limiter = self._rate_limiters.get(model)
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+    async def _once(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Await the result of ``factory``, shared with the concurrent calls with the same key"""
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(factory())
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(inflight)
+
+    def _cache_get(self, cache: "OrderedDict[str, T]", key: str) -> Optional[T]:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: "OrderedDict[str, T]", key: str, value: T) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.max_cache_entries:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _task_key(task: EvalTask) -> str:
+        """The key of the content of a task, the same for copies of it with other IDs"""
+        return _hash(task.model_dump(mode="json", exclude={"task_id"}))
+
+    @staticmethod
+    def _result_key(run_result: EvalRunResult) -> str:
+        """The key of the text of a result, the same for results with other message IDs and times"""
+        if run_result.result is None:
+            return _hash(run_result.error)
+        return _hash(
+            [[message.source, message.to_text()] for message in run_result.result.messages]
+            + [run_result.result.stop_reason]
+        )
+
+    @staticmethod
+    def _dump_item(item_key: str, item: EvalBatchItem) -> Dict[str, Any]:
+        data = item.model_dump(mode="json", exclude={"run_result"})
+        data["key"] = item_key
+        data["run_result"] = _dump_run_result(item.run_result) if item.run_result is not None else None
+        return data
+
+    @staticmethod
+    async def _load_checkpoint(checkpoint_path: Union[str, Path]) -> Dict[str, EvalBatchItem]:
+        """Load the finished items of a checkpoint, the last of each item winning"""
+        items: Dict[str, EvalBatchItem] = {}
+        path = Path(checkpoint_path)
+        if not path.exists():
+            return items
+        async with aiofiles.open(path, encoding="utf-8") as f:
+            lines = await f.readlines()
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                item_key = data.pop("key")
+                run_result = data.pop("run_result", None)
+                item = EvalBatchItem.model_validate(data)
+                if run_result is not None:
+                    item.run_result = _load_run_result(run_result)
+            except Exception as e:
+                # The last line is partial if the batch was interrupted while writing it
+                logger.warning(f"Skipping line {line_number} of checkpoint {path}: {e}")
+                continue
+            items[item_key] = item
+        return items
@@ -49,10 +49,29 @@ class LLMEvalJudgeConfig(BaseEvalJudgeConfig):
     """Configuration for LLMEvalJudge."""
 
     model_client: Any  # ComponentModel
+    batch_criteria: bool = True
+
+
+class _CriterionVerdict(BaseModel):
+    """Verdict of the LLM on one criterion of a batched judgment."""
+
+    dimension: str
+    reason: str
+    score: float
+
+
+class _CriteriaVerdicts(BaseModel):
+    """Verdicts of the LLM on all criteria of a batched judgment."""
+
+    scores: List[_CriterionVerdict]
 
 
 class LLMEvalJudge(BaseEvalJudge, Component[LLMEvalJudgeConfig]):
-    """Judge that uses an LLM to evaluate results."""
+    """Judge that uses an LLM to evaluate results.
+
+    With ``batch_criteria``, all criteria are judged in one LLM call, and only the criteria missing
+    from its answer are judged one call each. Otherwise each criterion is judged in its own call.
+    """
 
     component_config_schema = LLMEvalJudgeConfig
     component_type = "eval_judge"
@@ -64,9 +83,11 @@ def __init__(
         name: str = "LLM Judge",
         description: str = "Evaluates results using an LLM",
         metadata: Optional[Dict[str, Any]] = None,
+        batch_criteria: bool = True,
     ):
         super().__init__(name, description, metadata)
         self.model_client = model_client
+        self.batch_criteria = batch_criteria
 
     async def judge(
         self,
@@ -79,12 +100,18 @@ async def judge(
         # Create a score object
         score = EvalScore(max_value=10.0)
 
-        # Judge each dimension in parallel
+        # Judge all dimensions in one call, then the dimensions missing from its answer in parallel
+        batched: Dict[str, EvalDimensionScore] = {}
+        if self.batch_criteria and len(criteria) > 1:
+            batched = await self._judge_dimensions(task, result, criteria, cancellation_token)
+
         dimension_score_tasks = []
         for criterion in criteria:
-            dimension_score_tasks.append(self._judge_dimension(task, result, criterion, cancellation_token))
+            if criterion.dimension not in batched:
+                dimension_score_tasks.append(self._judge_dimension(task, result, criterion, cancellation_token))
 
-        dimension_scores = await asyncio.gather(*dimension_score_tasks)
+        remaining_scores = iter(await asyncio.gather(*dimension_score_tasks))
+        dimension_scores = [batched.get(criterion.dimension) or next(remaining_scores) for criterion in criteria]
         score.dimension_scores = dimension_scores
 
         # Calculate overall score (average of dimension scores)
@@ -104,7 +131,7 @@ async def _judge_dimension(
         """Judge a specific dimension."""
         # Format task and result for the LLM
         task_description = self._format_task(task)
-        result_description = result.model_dump()
+        result_description = self._format_result(result)
 
         # Create the prompt
         prompt = f"""
@@ -158,6 +185,76 @@ async def _judge_dimension(
                 min_value=criterion.min_value,
             )
 
+    async def _judge_dimensions(
+        self,
+        task: EvalTask,
+        result: EvalRunResult,
+        criteria: List[EvalJudgeCriteria],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> Dict[str, EvalDimensionScore]:
+        """Judge all dimensions in one call, returning the scores of the dimensions that were answered."""
+        task_description = self._format_task(task)
+        result_description = self._format_result(result)
+        criteria_description = "\n".join(
+            f"- {criterion.dimension} (score from {criterion.min_value} to {criterion.max_value}): {criterion.prompt}"
+            for criterion in criteria
+        )
+
+        prompt = f"""
+        You are evaluating the quality of a system response to a task.
+        Task: {task_description}
+        Response: {result_description}
+        Evaluate the response on each of these criteria:
+        {criteria_description}
+        For each criterion, first provide a detailed explanation of your evaluation, then give your final
+        score as a single number within the range of the criterion. If the response is not relevant,
+        score it with the minimum of the range. If the response is perfect, score it with the maximum.
+        Format your answer as a json object with one entry per criterion:
+        {{
+            "scores": [
+                {{"dimension": "<criterion>", "reason": "<explanation>", "score": <score>}}
+            ]
+        }}
+        """
+
+        model_result = await self.model_client.create(
+            messages=[UserMessage(content=prompt, source="user")],
+            cancellation_token=cancellation_token,
+            json_output=_CriteriaVerdicts,
+        )
+        model_response = model_result.content if isinstance(model_result.content, str) else str(model_result.content)
+
+        try:
+            verdicts = _CriteriaVerdicts.model_validate_json(model_response)
+        except Exception as e:
+            logger.warning(f"Failed to parse batched LLM response, judging criteria one by one: {e}")
+            return {}
+
+        criteria_by_dimension = {criterion.dimension: criterion for criterion in criteria}
+        scores: Dict[str, EvalDimensionScore] = {}
+        for verdict in verdicts.scores:
+            criterion = criteria_by_dimension.get(verdict.dimension)
+            if criterion is None:
+                continue
+            scores[criterion.dimension] = EvalDimensionScore(
+                dimension=criterion.dimension,
+                reason=verdict.reason,
+                score=min(max(verdict.score, criterion.min_value), criterion.max_value),
+                max_value=criterion.max_value,
+                min_value=criterion.min_value,
+            )
+        return scores
+
+    def _format_result(self, result: EvalRunResult) -> str:
+        """Format the result for the LLM as the text of its messages."""
+        if result.result is None:
+            return result.error or ""
+
+        result_parts = [f"{message.source}: {message.to_text()}" for message in result.result.messages]
+        if result.result.stop_reason:
+            result_parts.append(f"Stop reason: {result.result.stop_reason}")
+        return "\n".join(result_parts)
+
     def _format_task(self, task: EvalTask) -> str:
         """Format the task for the LLM."""
         task_parts = []
@@ -200,6 +297,7 @@ def _to_config(self) -> LLMEvalJudgeConfig:
             description=base_config.description,
             metadata=base_config.metadata,
             model_client=self.model_client.dump_component(),
+            batch_criteria=self.batch_criteria,
         )
 
     @classmethod
@@ -207,7 +305,11 @@ def _from_config(cls, config: LLMEvalJudgeConfig) -> Self:
         """Create from configuration object with serialized model client."""
         model_client = ChatCompletionClient.load_component(config.model_client)
         return cls(
-            model_client=model_client, name=config.name, description=config.description, metadata=config.metadata
+            model_client=model_client,
+            name=config.name,
+            description=config.description,
+            metadata=config.metadata,
+            batch_criteria=config.batch_criteria,
         )
 
 
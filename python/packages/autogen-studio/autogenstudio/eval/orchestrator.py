@@ -9,7 +9,8 @@
 
 from ..database.db_manager import DatabaseManager
 from ..datamodel.db import EvalCriteriaDB, EvalRunDB, EvalTaskDB
-from ..datamodel.eval import EvalJudgeCriteria, EvalRunResult, EvalRunStatus, EvalScore, EvalTask
+from ..datamodel.eval import EvalBatchItem, EvalJudgeCriteria, EvalRunResult, EvalRunStatus, EvalScore, EvalTask
+from .batch import BatchEvaluator
 from .judges import BaseEvalJudge
 from .runners import BaseEvalRunner
 
@@ -42,15 +43,18 @@ class EvalOrchestrator:
     It can operate with or without a database manager for persistence.
     """
 
-    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None, batch_evaluator: Optional[BatchEvaluator] = None):
         """
         Initialize the orchestrator.
 
         Args:
             db_manager: Optional database manager for persistence.
                         If None, data is stored in memory only.
+            batch_evaluator: Optional evaluator for batches of tasks, whose caches are shared by the
+                        batches of the orchestrator. If None, one with the default limits is used.
         """
         self._db_manager = db_manager
+        self._batch_evaluator = batch_evaluator or BatchEvaluator()
 
         # In-memory storage (used when db_manager is None)
         self._tasks: Dict[str, EvalTask] = {}
@@ -400,6 +404,54 @@ async def _execute_run(self, run_id: str) -> None:
             if run_id in self._active_runs:
                 del self._active_runs[run_id]
 
+    async def run_batch(
+        self,
+        tasks: List[Union[str, EvalTask]],
+        runners: List[BaseEvalRunner],
+        judge: BaseEvalJudge,
+        criteria: List[Union[str, EvalJudgeCriteria]],
+        checkpoint_path: Optional[str] = None,
+    ) -> List[EvalBatchItem]:
+        """
+        Evaluate a dataset of tasks with each of several runners.
+
+        The tasks are evaluated by the batch evaluator of the orchestrator, concurrently and within
+        its rate limits, reusing the cached results of earlier runs and verdicts.
+
+        Args:
+            tasks: The tasks to evaluate (IDs or task objects)
+            runners: The runners to run each task with
+            judge: The judge to use for evaluation
+            criteria: List of criteria to use for evaluation (IDs or criteria objects)
+            checkpoint_path: Optional JSON lines file to record progress in, to resume an interrupted batch from
+
+        Returns:
+            The results, for each task in order, with each runner in order
+        """
+        task_objs = []
+        for task in tasks:
+            if isinstance(task, str):
+                task_obj = await self.get_task(task)
+                if not task_obj:
+                    raise ValueError(f"Task not found: {task}")
+                task_objs.append(task_obj)
+            else:
+                task_objs.append(task)
+
+        criteria_objs = []
+        for criterion in criteria:
+            if isinstance(criterion, str):
+                criterion_obj = await self.get_criteria(criterion)
+                if not criterion_obj:
+                    raise ValueError(f"Criteria not found: {criterion}")
+                criteria_objs.append(criterion_obj)
+            else:
+                criteria_objs.append(criterion)
+
+        return await self._batch_evaluator.evaluate(
+            task_objs, runners, judge, criteria_objs, checkpoint_path=checkpoint_path
+        )
+
     async def get_run_status(self, run_id: str) -> Optional[EvalRunStatus]:
         """
         Get the status of an evaluation run.
@@ -94,7 +94,9 @@ async def run(self, task: EvalTask, cancellation_token: Optional[CancellationTok
             # Run with the model
             model_result = await self.model_client.create(messages=model_input, cancellation_token=cancellation_token)
 
-            model_response = model_result.content if isinstance(model_result, str) else model_result.model_dump()
+            model_response = (
+                model_result.content if isinstance(model_result.content, str) else model_result.model_dump()
+            )
 
             task_result = TaskResult(
                 messages=[TextMessage(content=str(model_response), source="model")],
@@ -1,3 +1,4 @@
 from .teammanager import TeamManager
+from .template_cache import TeamTemplateCache, TeamTemplateCacheStats
 
-__all__ = ["TeamManager"]
+__all__ = ["TeamManager", "TeamTemplateCache", "TeamTemplateCacheStats"]
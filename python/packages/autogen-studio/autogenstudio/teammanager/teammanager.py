@@ -17,6 +17,7 @@
 
 from ..datamodel.types import EnvironmentVariable, LLMCallEventMessage, TeamResult
 from ..web.managers.run_context import RunContext
+from .template_cache import TeamTemplateCache
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +39,21 @@ def emit(self, record: logging.LogRecord):
 
 
 class TeamManager:
-    """Manages team operations including loading configs and running teams"""
+    """Manages team operations including loading configs and running teams
 
-    def __init__(self):
+    Args:
+        template_cache: Cache of teams to reuse across runs of the same config. If None, a new team is
+            built for each run and closed after it.
+        template_scope: Scope the teams of the cache are reused within, such as the user and session of the
+            run, as reused teams keep the state of components that are not reset, like code executors
+    """
+
+    def __init__(self, template_cache: Optional[TeamTemplateCache] = None, template_scope: Optional[str] = None):
         self._team: Optional[BaseGroupChat] = None
         self._run_context = RunContext()
+        self._template_cache = template_cache
+        self._template_scope = template_scope
+        self._template_key: Optional[str] = None
 
     @staticmethod
     async def load_from_file(path: Union[str, Path]) -> Any:
@@ -84,7 +95,10 @@ async def _create_team(
     ) -> BaseGroupChat:
         """Create team instance from config"""
         if isinstance(team_config, (str, Path)):
-            config = await self.load_from_file(team_config)
+            if self._template_cache is not None:
+                config = await self._template_cache.load_file(team_config)
+            else:
+                config = await self.load_from_file(team_config)
         elif isinstance(team_config, dict):
             config = team_config
         elif isinstance(team_config, ComponentModel):
@@ -98,7 +112,10 @@ async def _create_team(
             for var in env_vars:
                 os.environ[var.name] = var.value
 
-        self._team = BaseGroupChat.load_component(config)
+        if self._template_cache is not None:
+            self._template_key, self._team = await self._template_cache.acquire(config, env_vars, self._template_scope)
+        else:
+            self._team = BaseGroupChat.load_component(config)
 
         for agent in self._team._participants:  # type: ignore
             if hasattr(agent, "input_func") and isinstance(agent, UserProxyAgent) and input_func:
@@ -106,6 +123,18 @@ async def _create_team(
 
         return self._team
 
+    async def _release_team(self, team: BaseGroupChat, finished: bool) -> None:
+        """Return the team to the template cache, or close its agents"""
+        if self._template_cache is not None and self._template_key is not None:
+            key, self._template_key = self._template_key, None
+            await self._template_cache.release(key, team, reusable=finished)
+            return
+
+        if hasattr(team, "_participants"):
+            for agent in team._participants:  # type: ignore
+                if hasattr(agent, "close"):
+                    await agent.close()
+
     async def run_stream(
         self,
         task: str | BaseChatMessage | Sequence[BaseChatMessage] | None,
@@ -117,6 +146,7 @@ async def run_stream(
         """Stream team execution results"""
         start_time = time.time()
         team = None
+        finished = False
 
         # Setup logger correctly
         logger = logging.getLogger(EVENT_LOGGER_NAME)
@@ -140,16 +170,16 @@ async def run_stream(
                 while not llm_event_logger.events.empty():
                     event = await llm_event_logger.events.get()
                     yield event
+            else:
+                finished = True
         finally:
             # Cleanup - remove our handler
             if llm_event_logger in logger.handlers:
                 logger.handlers.remove(llm_event_logger)
 
             # Ensure cleanup happens
-            if team and hasattr(team, "_participants"):
-                for agent in team._participants:  # type: ignore
-                    if hasattr(agent, "close"):
-                        await agent.close()
+            if team:
+                await self._release_team(team, finished)
 
     async def run(
         self,
@@ -162,15 +192,15 @@ async def run(
         """Run team synchronously"""
         start_time = time.time()
         team = None
+        finished = False
 
         try:
             team = await self._create_team(team_config, input_func, env_vars)
             result = await team.run(task=task, cancellation_token=cancellation_token)
+            finished = not (cancellation_token and cancellation_token.is_cancelled())
 
             return TeamResult(task_result=result, usage="", duration=time.time() - start_time)
 
         finally:
-            if team and hasattr(team, "_participants"):
-                for agent in team._participants:  # type: ignore
-                    if hasattr(agent, "close"):
-                        await agent.close()
+            if team:
+                await self._release_team(team, finished)
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from autogen_agentchat.agents import UserProxyAgent
+from autogen_agentchat.teams import BaseGroupChat
+from autogen_core import ComponentModel
+
+from ..datamodel.types import EnvironmentVariable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TeamTemplateCacheStats:
+    """Counters of a TeamTemplateCache"""
+
+    builds: int = 0
+    reuses: int = 0
+    closed: int = 0
+
+
+@dataclass
+class _TeamTemplate:
+    component: ComponentModel
+    idle: List[BaseGroupChat] = field(default_factory=list)
+
+
+class TeamTemplateCache:
+    """Keeps the teams built from a team config for later runs with the same config, environment variables and scope.
+
+    Building a team imports and validates all of its components and creates new model clients, with new
+    HTTP connections, and new MCP sessions. The cache keeps the validated component model of each config,
+    and the teams of finished runs, which are reset to their initial state and handed out to the next runs
+    with the same config, environment variables and scope. Their agents start each run with fresh state, and
+    keep their model clients, connections and workbenches. Concurrent runs of a config each get their own team.
+
+    Resetting a team does not clear the state of all of its components: code executors keep their Jupyter
+    kernels and work directories, memories keep their contents, and workbenches keep their MCP sessions. A
+    reused team can so carry the state of a run into the next one, which is why teams are only reused
+    within a scope, such as the session of a user, and the cache is only used where it is passed explicitly.
+
+    Teams of runs that were cancelled or failed are closed instead of reused, as are teams beyond
+    ``max_idle_teams`` per config, and the teams of the least recently used configs beyond ``max_templates``.
+
+    Args:
+        max_templates: Maximum number of configs to keep teams for
+        max_idle_teams: Maximum number of teams to keep per config
+    """
+
+    def __init__(self, max_templates: int = 32, max_idle_teams: int = 4) -> None:
+        self.max_templates = max_templates
+        self.max_idle_teams = max_idle_teams
+        self.stats = TeamTemplateCacheStats()
+        self._templates: "OrderedDict[str, _TeamTemplate]" = OrderedDict()
+        self._files: Dict[str, Tuple[int, int, Any]] = {}
+        # The input functions of the user proxy agents of the built teams, restored when a team is released
+        self._input_funcs: "weakref.WeakKeyDictionary[BaseGroupChat, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    @staticmethod
+    def template_key(
+        config: Dict[str, Any], env_vars: Optional[Sequence[EnvironmentVariable]] = None, scope: Optional[str] = None
+    ) -> str:
+        """The key of a team config with environment variables, which model clients may read when they are built,
+        and the scope its teams are reused within"""
+        data = {
+            "config": config,
+            "env_vars": sorted((var.name, var.value) for var in env_vars or []),
+            "scope": scope,
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def load_file(self, path: Union[str, Path]) -> Any:
+        """Load a team config from a JSON/YAML file, parsing it again only when the file changes"""
+        from .teammanager import TeamManager
+
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Config file not found: {path}")
+        stat = path.stat()
+        key = str(path.resolve())
+        cached = self._files.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        config = await TeamManager.load_from_file(path)
+        self._files[key] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+    async def acquire(
+        self,
+        config: Dict[str, Any],
+        env_vars: Optional[Sequence[EnvironmentVariable]] = None,
+        scope: Optional[str] = None,
+    ) -> Tuple[str, BaseGroupChat]:
+        """Get a team for a run, reusing a team of a finished run of the config in the same scope if there is one
+
+        Args:
+            config: The team config
+            env_vars: Environment variables of the run
+            scope: The scope teams are reused within, such as the user and session of the run. Teams built
+                without a scope are reused by all runs of the config without one.
+
+        Returns:
+            Tuple[str, BaseGroupChat]: The key of the template, to release the team with, and the team
+        """
+        key = self.template_key(config, env_vars, scope)
+        template = self._templates.get(key)
+        if template is None:
+            template = _TeamTemplate(component=ComponentModel.model_validate(config))
+            self._templates[key] = template
+            while len(self._templates) > self.max_templates:
+                _, evicted = self._templates.popitem(last=False)
+                for team in evicted.idle:
+                    await self._close_team(team)
+        self._templates.move_to_end(key)
+
+        if template.idle:
+            self.stats.reuses += 1
+            return key, template.idle.pop()
+
+        team = BaseGroupChat.load_component(template.component)
+        self._input_funcs[team] = {
+            agent.name: agent.input_func
+            for agent in team._participants  # type: ignore
+            if isinstance(agent, UserProxyAgent)
+        }
+        self.stats.builds += 1
+        return key, team
+
+    async def release(self, key: str, team: BaseGroupChat, reusable: bool = True) -> None:
+        """Return the team of a run, to be reset for a later run, or closed
+
+        Args:
+            key: The key returned with the team by :meth:`acquire`
+            team: The team
+            reusable: Whether the run finished, so that the team can be reset and reused
+        """
+        template = self._templates.get(key)
+        if reusable and template is not None and len(template.idle) < self.max_idle_teams:
+            try:
+                await team.reset()
+                input_funcs = self._input_funcs.get(team, {})
+                for agent in team._participants:  # type: ignore
+                    if isinstance(agent, UserProxyAgent) and agent.name in input_funcs:
+                        agent.input_func = input_funcs[agent.name]
+                # Other teams of the config may have been released while this one was reset
+                if len(template.idle) < self.max_idle_teams and self._templates.get(key) is template:
+                    template.idle.append(team)
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to reset team for reuse: {e}")
+        await self._close_team(team)
+
+    async def clear(self) -> None:
+        """Close the kept teams and forget all configs"""
+        teams = [team for template in self._templates.values() for team in template.idle]
+        self._templates.clear()
+        self._files.clear()
+        for team in teams:
+            await self._close_team(team)
+
+    async def _close_team(self, team: BaseGroupChat) -> None:
+        self.stats.closed += 1
+        closed_clients: set[int] = set()
+        for agent in team._participants:  # type: ignore
+            try:
+                if hasattr(agent, "close"):
+                    await agent.close()
+                # The model clients were built with the team, so they are closed with it
+                model_client = getattr(agent, "_model_client", None)
+                if model_client is not None and id(model_client) not in closed_clients:
+                    closed_clients.add(id(model_client))
+                    await model_client.close()
+            except Exception as e:
+                logger.warning(f"Error closing agent {getattr(agent, 'name', agent)}: {e}")
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     CONFIG_DIR: str = "configs"  # Default config directory relative to app_root
     DEFAULT_USER_ID: str = "guestuser@gmail.com"
     UPGRADE_DATABASE: bool = False
+    # Reuse the teams of finished runs for the next runs of the same team in the same session.
+    # Components that are not reset, like code executors and memories, keep their state between those runs.
+    REUSE_TEAMS: bool = False
 
     # Lite mode settings
     LITE_MODE: bool = False
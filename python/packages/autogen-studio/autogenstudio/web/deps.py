@@ -9,7 +9,7 @@
 from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, status
 
 from ..database import DatabaseManager
-from ..teammanager import TeamManager
+from ..teammanager import TeamManager, TeamTemplateCache
 from .auth import AuthConfig, AuthManager, AuthMiddleware
 from .auth.dependencies import get_auth_manager
 from .config import settings
@@ -160,8 +160,9 @@ async def init_managers(database_uri: str, config_dir: str | Path, app_root: str
         await init_lite_mode(_db_manager)
 
         # Initialize connection manager
-        _websocket_manager = WebSocketManager(db_manager=_db_manager)
-        logger.info("Connection manager initialized")
+        team_template_cache = TeamTemplateCache() if settings.REUSE_TEAMS else None
+        _websocket_manager = WebSocketManager(db_manager=_db_manager, team_template_cache=team_template_cache)
+        logger.info(f"Connection manager initialized (team reuse {'on' if team_template_cache else 'off'})")
 
         # Initialize team manager
         _team_manager = TeamManager()
@@ -33,7 +33,8 @@
     SettingsConfig,
     TeamResult,
 )
-from ...teammanager import TeamManager
+from ...teammanager import TeamManager, TeamTemplateCache
+from .message_writer import MessageWriter
 from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -42,8 +43,18 @@
 class WebSocketManager:
     """Manages WebSocket connections and message streaming for team task execution"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        message_writer: Optional[MessageWriter] = None,
+        team_template_cache: Optional[TeamTemplateCache] = None,
+    ):
         self.db_manager = db_manager
+        # Messages are persisted in batches in the background, so that streams don't wait for the database
+        self.message_writer = message_writer or MessageWriter(db_manager)
+        # Teams of finished runs are reset and reused by the next runs of the same team config in the same
+        # session, if a cache is given. Components that are not reset, like code executors, keep their state.
+        self.team_template_cache = team_template_cache
         self._connections: Dict[int, WebSocket] = {}
         self._cancellation_tokens: Dict[int, CancellationToken] = {}
         # Track explicitly closed connections
@@ -92,15 +103,21 @@ async def start_stream(
         if run_id not in self._connections or run_id in self._closed_connections:
             raise ValueError(f"No active connection for run {run_id}")
         with RunContext.populate_context(run_id=run_id):
-            team_manager = TeamManager()
             cancellation_token = CancellationToken()
             self._cancellation_tokens[run_id] = cancellation_token
             final_result = None
             env_vars = None  # Ensure env_vars is always defined
+            session_id: Optional[int] = None
 
             try:
                 # Update run with task and status
                 run = await self._get_run(run_id)
+                if run is not None:
+                    session_id = run.session_id
+                team_manager = TeamManager(
+                    template_cache=self.team_template_cache,
+                    template_scope=f"{run.user_id}/{run.session_id}" if run is not None else None,
+                )
 
                 if run is not None and run.user_id:
                     # get user Settings
@@ -140,16 +157,22 @@ async def start_stream(
                                 LLMCallEventMessage,
                             ),
                         ):
-                            await self._save_message(run_id, message)
+                            await self._save_message(run_id, session_id, message)
                         # Capture final result if it's a TeamResult
                         elif isinstance(message, TeamResult):
                             final_result = message.model_dump()
+
+                # Persist the messages before the run is marked as finished
+                failed = await self.message_writer.flush(run_id)
+                save_error = f"{failed} of the messages of the run could not be saved" if failed else None
+                if failed:
+                    logger.error(f"{failed} messages of run {run_id} could not be saved")
                 if not cancellation_token.is_cancelled() and run_id not in self._closed_connections:
                     if final_result:
-                        await self._update_run(run_id, RunStatus.COMPLETE, team_result=final_result)
+                        await self._update_run(run_id, RunStatus.COMPLETE, team_result=final_result, error=save_error)
                     else:
                         logger.warning(f"No final result captured for completed run {run_id}")
-                        await self._update_run_status(run_id, RunStatus.COMPLETE)
+                        await self._update_run_status(run_id, RunStatus.COMPLETE, save_error)
                 else:
                     await self._send_message(
                         run_id,
@@ -169,21 +192,28 @@ async def start_stream(
                 await self._handle_stream_error(run_id, e)
             finally:
                 self._cancellation_tokens.pop(run_id, None)
+                # Also persist the messages of runs that failed or were cancelled
+                failed = await self.message_writer.flush(run_id)
+                if failed:
+                    logger.error(f"{failed} messages of run {run_id} could not be saved")
 
     async def _save_message(
-        self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
+        self,
+        run_id: int,
+        session_id: Optional[int],
+        message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage],
     ) -> None:
-        """Save a message to the database"""
-
-        run = await self._get_run(run_id)
-        if run:
-            db_message = Message(
-                session_id=run.session_id,
-                run_id=run_id,
-                config=self._convert_images_in_dict(message.model_dump()),
-                user_id=None,  # You might want to pass this from somewhere
-            )
-            self.db_manager.upsert(db_message)
+        """Queue a message to be saved to the database"""
+        if session_id is None:
+            # The run was not found
+            return
+        db_message = Message(
+            session_id=session_id,
+            run_id=run_id,
+            config=self._convert_images_in_dict(message.model_dump()),
+            user_id=None,  # You might want to pass this from somewhere
+        )
+        await self.message_writer.put(db_message)
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
@@ -477,6 +507,15 @@ async def cleanup(self) -> None:
         except Exception as e:
             logger.error(f"Error during WebSocketManager cleanup: {e}")
         finally:
+            try:
+                await self.message_writer.close()
+            except Exception as e:
+                logger.error(f"Error closing message writer: {e}")
+            try:
+                if self.team_template_cache is not None:
+                    await self.team_template_cache.clear()
+            except Exception as e:
+                logger.error(f"Error closing cached teams: {e}")
             # Always clear internal state, even if cleanup had errors
             self._connections.clear()
             self._cancellation_tokens.clear()
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+from ...database import DatabaseManager
+from ...datamodel import Message
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MessageWriterStats:
+    """Counters of a MessageWriter"""
+
+    messages_written: int = 0
+    batches_written: int = 0
+    messages_failed: int = 0
+
+
+class MessageWriter:
+    """Persists the messages of runs in the background, in batches.
+
+    Messages are put on a bounded queue, which makes a stream wait when the database is behind, and a
+    background task writes them with one insert transaction per batch of up to ``batch_size`` messages.
+    When the insert of a batch fails, its messages are inserted one at a time, so that only the messages
+    that cannot be written are lost, and :meth:`flush` returns how many of the messages of a run were lost.
+    The writes run on a dedicated thread, so that they do not block the event loop, except for in-memory
+    SQLite databases, whose connections are per thread, which are written on the event loop.
+
+    Args:
+        db_manager: Database manager to write the messages with
+        max_queue_size: Maximum number of messages waiting to be written
+        batch_size: Maximum number of messages written in one transaction
+    """
+
+    def __init__(self, db_manager: DatabaseManager, max_queue_size: int = 10000, batch_size: int = 500) -> None:
+        self.db_manager = db_manager
+        self.batch_size = max(batch_size, 1)
+        self.stats = MessageWriterStats()
+        self._max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue[Union[Message, asyncio.Future[None]]]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Messages that could not be written, per run, until a flush for the run reports them
+        self._failed: Dict[Optional[int], int] = {}
+        if db_manager.supports_threads:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autogenstudio-message-writer")
+
+    def _ensure_started(self) -> asyncio.Queue[Union[Message, asyncio.Future[None]]]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return self._queue
+
+    async def put(self, message: Message) -> None:
+        """Queue a message to be written, waiting while the queue is full"""
+        await self._ensure_started().put(message)
+
+    async def flush(self, run_id: Optional[int] = None) -> int:
+        """Wait until the messages queued so far are written
+
+        Args:
+            run_id: Run to report the failed messages of, or None for all runs
+
+        Returns:
+            int: The number of messages of the run that could not be written since its last flush
+        """
+        if self._queue is not None:
+            flushed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            await self._ensure_started().put(flushed)
+            await flushed
+        if run_id is None:
+            failed = sum(self._failed.values())
+            self._failed.clear()
+            return failed
+        return self._failed.pop(run_id, 0)
+
+    async def close(self) -> None:
+        """Write the queued messages and stop the writer"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Messages before a flush are written before the flush is done
+            messages: List[Message] = []
+            for item in batch:
+                if isinstance(item, Message):
+                    messages.append(item)
+                    continue
+                await self._write(messages)
+                messages = []
+                if not item.done():
+                    item.set_result(None)
+            await self._write(messages)
+
+    async def _write(self, messages: List[Message]) -> None:
+        if not messages:
+            return
+        if await self._insert(messages):
+            self.stats.messages_written += len(messages)
+            self.stats.batches_written += 1
+            return
+        if len(messages) == 1:
+            self._record_failed(messages[0])
+            return
+        # Insert the messages one at a time, so that a bad message does not lose the others
+        for message in messages:
+            if await self._insert([message]):
+                self.stats.messages_written += 1
+                self.stats.batches_written += 1
+            else:
+                self._record_failed(message)
+
+    async def _insert(self, messages: List[Message]) -> bool:
+        try:
+            if self._executor is not None:
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(self._executor, self.db_manager.bulk_insert, messages)
+            else:
+                response = self.db_manager.bulk_insert(messages)
+        except Exception as e:
+            logger.error(f"Error writing {len(messages)} messages: {e}")
+            return False
+        return response.status
+
+    def _record_failed(self, message: Message) -> None:
+        self.stats.messages_failed += 1
+        self._failed[message.run_id] = self._failed.get(message.run_id, 0) + 1
@@ -1,7 +1,7 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from ...datamodel import Message, Run, RunStatus, Session
@@ -58,8 +58,29 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
+async def get_run_messages(
+    run_id: int,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    include_config: bool = True,
+    db=Depends(get_db),
+) -> Dict:
+    """Get the messages of a run, in pages
+
+    Args:
+        cursor: The ``next_cursor`` of the previous page, to get the next page
+        limit: Maximum number of messages in the page. All messages are listed by default.
+        include_config: Whether to include the configs of the messages, which hold their content
+    """
+    messages = await db.run_async(
+        db.get_page,
+        Message,
+        filters={"run_id": run_id},
+        cursor=cursor,
+        limit=limit,
+        exclude_columns=() if include_config else ("config",),
+    )
+    if not messages.status:
+        raise HTTPException(status_code=500, detail="Database error while fetching messages")
 
-    return {"status": True, "data": messages.data}
+    return {"status": True, "data": messages.data["items"], "next_cursor": messages.data["next_cursor"]}
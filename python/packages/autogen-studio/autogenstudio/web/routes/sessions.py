@@ -1,10 +1,10 @@
 # api/routes/sessions.py
-from typing import Dict
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from loguru import logger
 
-from ...datamodel import Message, Response, Run, Session
+from ...datamodel import Response, Session
 from ..deps import get_db
 
 router = APIRouter()
@@ -63,60 +63,60 @@ async def delete_session(session_id: int, user_id: str, db=Depends(get_db)) -> D
 
 
 @router.get("/{session_id}/runs")
-async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -> Dict:
-    """Get complete session history organized by runs"""
+async def list_session_runs(
+    session_id: int,
+    user_id: str,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    include_messages: bool = True,
+    include_config: bool = True,
+    db=Depends(get_db),
+) -> Dict:
+    """Get session history organized by runs, in pages of runs
+
+    Args:
+        cursor: The ``next_cursor`` of the previous page, to get the next page
+        limit: Maximum number of runs in the page. All runs are listed by default.
+        include_messages: Whether to include the messages of the runs
+        include_config: Whether to include the team results of the runs and the configs of the messages
+    """
 
     try:
         # 1. Verify session exists and belongs to user
-        session = db.get(Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
+        session = await db.run_async(db.get, Session, filters={"id": session_id, "user_id": user_id}, return_json=False)
         if not session.status:
             raise HTTPException(status_code=500, detail="Database error while fetching session")
         if not session.data:
             raise HTTPException(status_code=404, detail="Session not found or access denied")
 
-        # 2. Get ordered runs for session
-        runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+        # 2. Get the page of ordered runs, with the messages of all its runs in one query
+        runs = await db.run_async(
+            db.get_session_runs,
+            session_id,
+            cursor=cursor,
+            limit=limit,
+            include_messages=include_messages,
+            include_config=include_config,
+        )
         if not runs.status:
             raise HTTPException(status_code=500, detail="Database error while fetching runs")
 
         # 3. Build response with messages per run
         run_data = []
-        if runs.data:  # It's ok to have no runs
-            for run in runs.data:
-                try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": run.status,
-                            "task": run.task,
-                            "team_result": run.team_result,
-                            "messages": messages.data or [],
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing run {run.id}: {str(e)}")
-                    # Include run with error state instead of failing entirely
-                    run_data.append(
-                        {
-                            "id": str(run.id),
-                            "created_at": run.created_at,
-                            "status": "ERROR",
-                            "task": run.task,
-                            "team_result": None,
-                            "messages": [],
-                            "error": f"Failed to process run: {str(e)}",
-                        }
-                    )
-
-        return {"status": True, "data": {"runs": run_data}}
+        for run in runs.data["items"]:
+            run_item = {
+                "id": str(run["id"]),
+                "created_at": run["created_at"],
+                "status": run["status"],
+                "task": run["task"],
+            }
+            if include_config:
+                run_item["team_result"] = run["team_result"]
+            if include_messages:
+                run_item["messages"] = run["messages"]
+            run_data.append(run_item)
+
+        return {"status": True, "data": {"runs": run_data, "next_cursor": runs.data["next_cursor"]}}
 
     except HTTPException:
         raise  # Re-raise HTTP exceptions
@@ -0,0 +1,266 @@
+"""Benchmark evaluating a dataset of tasks with several runners, one run at a time and with the BatchEvaluator.
+
+The dataset has ``--tasks`` tasks, of which ``--duplicates`` repeat earlier ones under other IDs, and each
+is evaluated with ``--runners`` model runners of different models, and judged on ``--criteria`` criteria
+by an LLM judge. The model clients are fakes that answer after ``--model-ms``, the runners with a fixed
+answer per task and the judge with a score for each criterion it is asked about. The phases are:
+
+- ``sequential``: each task is run and judged after the other, with one judge call per criterion and the
+  whole dump of the result in the prompts, as ``EvalOrchestrator._execute_run`` did for one run.
+- ``batch``: the BatchEvaluator with ``--concurrency`` workers, judging all criteria in one call.
+- ``batch_warm``: the same dataset again with the same BatchEvaluator, whose caches hold all results.
+- ``interrupted``: a new BatchEvaluator with a checkpoint, cancelled once half of the items are done.
+- ``resumed``: the interrupted batch evaluated again with its checkpoint.
+- ``rate_limited``: as ``batch``, with each model limited to ``--rpm`` requests per minute.
+
+Reported are the time, the items per second, the runner and judge model calls and the characters sent
+to the judge, and for ``rate_limited`` the most runner calls to one model in any second.
+
+Run with::
+
+    python benchmarks/eval_batch.py --tasks 200 --runners 2 --criteria 4 --model-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Sequence, Union
+
+from autogen_core import CancellationToken, Component
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelFamily,
+    ModelInfo,
+    RequestUsage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from autogenstudio.datamodel.eval import EvalDimensionScore, EvalJudgeCriteria, EvalRunResult, EvalTask
+from autogenstudio.eval.batch import BatchEvaluator
+from autogenstudio.eval.judges import LLMEvalJudge
+from autogenstudio.eval.runners import ModelEvalRunner
+from pydantic import BaseModel
+
+
+class FakeModelClientConfig(BaseModel):
+    model: str
+    model_ms: float
+
+
+class FakeModelClient(ChatCompletionClient, Component[FakeModelClientConfig]):
+    """Answers after ``model_ms``, as a runner with the end of the task, or as a judge with a score per criterion."""
+
+    component_type = "model"
+    component_config_schema = FakeModelClientConfig
+    component_provider_override = "eval_batch.FakeModelClient"
+
+    def __init__(self, model: str, model_ms: float, criteria: Sequence[EvalJudgeCriteria] = ()) -> None:
+        self.model = model
+        self.model_ms = model_ms
+        self.criteria = list(criteria)
+        self.calls = 0
+        self.prompt_chars = 0
+        self.call_times: List[float] = []
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        tool_choice: Any = "auto",
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        self.calls += 1
+        self.call_times.append(time.perf_counter())
+        prompt = "".join(str(message.content) for message in messages)
+        self.prompt_chars += len(prompt)
+        await asyncio.sleep(self.model_ms / 1000)
+        if json_output is EvalDimensionScore:
+            criterion = next(c for c in self.criteria if f'"dimension": "{c.dimension}"' in prompt)
+            content = EvalDimensionScore(
+                dimension=criterion.dimension, reason="Fine.", score=7, max_value=10, min_value=0
+            ).model_dump_json()
+        elif json_output is not None:
+            scores = [{"dimension": c.dimension, "reason": "Fine.", "score": 7} for c in self.criteria]
+            content = json.dumps({"scores": scores})
+        else:
+            content = f"{self.model} answers {prompt[-40:]} " + "lorem ipsum " * 40
+        usage = RequestUsage(prompt_tokens=len(prompt) // 4, completion_tokens=len(content) // 4)
+        return CreateResult(finish_reason="stop", content=content, usage=usage, cached=False)
+
+    def create_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[Union[str, CreateResult], None]:
+        raise NotImplementedError()
+
+    async def close(self) -> None:
+        pass
+
+    def actual_usage(self) -> RequestUsage:
+        return RequestUsage(prompt_tokens=0, completion_tokens=0)
+
+    def total_usage(self) -> RequestUsage:
+        return RequestUsage(prompt_tokens=0, completion_tokens=0)
+
+    def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return 0
+
+    def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
+        return 0
+
+    @property
+    def capabilities(self) -> Any:
+        return self.model_info
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return ModelInfo(vision=False, function_calling=False, json_output=True, family=ModelFamily.UNKNOWN)
+
+    def _to_config(self) -> FakeModelClientConfig:
+        return FakeModelClientConfig(model=self.model, model_ms=self.model_ms)
+
+    @classmethod
+    def _from_config(cls, config: FakeModelClientConfig) -> "FakeModelClient":
+        return cls(config.model, config.model_ms)
+
+
+class DumpingLLMEvalJudge(LLMEvalJudge):
+    """Puts the whole dump of the result in the prompt, as before the text of its messages."""
+
+    def _format_result(self, result: EvalRunResult) -> str:
+        return str(result.model_dump())
+
+
+def _dataset(args: argparse.Namespace) -> List[EvalTask]:
+    unique = args.tasks - args.duplicates
+    return [
+        EvalTask(task_id=f"task-{i}", input=f"Summarize document {i % unique}. " + "Some context. " * 20)
+        for i in range(args.tasks)
+    ]
+
+
+def _setup(args: argparse.Namespace, criteria: List[EvalJudgeCriteria]) -> Dict[str, Any]:
+    runner_clients = [FakeModelClient(f"model-{i}", args.model_ms) for i in range(args.runners)]
+    judge_client = FakeModelClient("judge", args.model_ms, criteria)
+    return {
+        "runner_clients": runner_clients,
+        "judge_client": judge_client,
+        "runners": [ModelEvalRunner(model_client=client, name=client.model) for client in runner_clients],
+    }
+
+
+def _calls(setup: Dict[str, Any], since: Dict[str, int]) -> Dict[str, int]:
+    runner_calls = sum(client.calls for client in setup["runner_clients"])
+    return {
+        "runner_calls": runner_calls - since.get("runner_calls", 0),
+        "judge_calls": setup["judge_client"].calls - since.get("judge_calls", 0),
+        "judge_prompt_chars": setup["judge_client"].prompt_chars - since.get("judge_prompt_chars", 0),
+    }
+
+
+def _summary(items: int, elapsed: float, calls: Dict[str, int]) -> Dict[str, Any]:
+    return {"elapsed_s": elapsed, "items": items, "items_per_s": items / elapsed, **calls}
+
+
+async def _sequential(args: argparse.Namespace, tasks: List[EvalTask], criteria: List[EvalJudgeCriteria]) -> Any:
+    setup = _setup(args, criteria)
+    judge = DumpingLLMEvalJudge(model_client=setup["judge_client"], batch_criteria=False)
+    start = time.perf_counter()
+    for task in tasks:
+        for runner in setup["runners"]:
+            run_result = await runner.run(task)
+            await judge.judge(task, run_result, criteria)
+    return _summary(len(tasks) * len(setup["runners"]), time.perf_counter() - start, _calls(setup, {}))
+
+
+async def _batch(args: argparse.Namespace, tasks: List[EvalTask], criteria: List[EvalJudgeCriteria]) -> Any:
+    results = {}
+    setup = _setup(args, criteria)
+    judge = LLMEvalJudge(model_client=setup["judge_client"])
+    evaluator = BatchEvaluator(max_concurrency=args.concurrency)
+    items = len(tasks) * len(setup["runners"])
+    for phase in ("batch", "batch_warm"):
+        since = _calls(setup, {})
+        start = time.perf_counter()
+        await evaluator.evaluate(tasks, setup["runners"], judge, criteria)
+        results[phase] = _summary(items, time.perf_counter() - start, _calls(setup, since))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        checkpoint_path = Path(temp_dir) / "checkpoint.jsonl"
+        setup = _setup(args, criteria)
+        judge = LLMEvalJudge(model_client=setup["judge_client"])
+        evaluator = BatchEvaluator(max_concurrency=args.concurrency)
+        start = time.perf_counter()
+        batch = asyncio.create_task(
+            evaluator.evaluate(tasks, setup["runners"], judge, criteria, checkpoint_path=checkpoint_path)
+        )
+        while evaluator.stats.completed < items // 2:
+            await asyncio.sleep(0.001)
+        batch.cancel()
+        await asyncio.gather(batch, return_exceptions=True)
+        results["interrupted"] = _summary(evaluator.stats.completed, time.perf_counter() - start, _calls(setup, {}))
+
+        since = _calls(setup, {})
+        evaluator = BatchEvaluator(max_concurrency=args.concurrency)
+        start = time.perf_counter()
+        await evaluator.evaluate(tasks, setup["runners"], judge, criteria, checkpoint_path=checkpoint_path)
+        results["resumed"] = {
+            **_summary(items, time.perf_counter() - start, _calls(setup, since)),
+            "resumed_items": evaluator.stats.resumed,
+        }
+
+    setup = _setup(args, criteria)
+    judge = LLMEvalJudge(model_client=setup["judge_client"])
+    rate_limits = {client.model: args.rpm for client in setup["runner_clients"] + [setup["judge_client"]]}
+    evaluator = BatchEvaluator(max_concurrency=args.concurrency, rate_limits=rate_limits)
+    start = time.perf_counter()
+    await evaluator.evaluate(tasks, setup["runners"], judge, criteria)
+    calls_per_second: Dict[str, Counter[int]] = defaultdict(Counter)
+    for client in setup["runner_clients"]:
+        for call_time in client.call_times:
+            calls_per_second[client.model][int(call_time - start)] += 1
+    results["rate_limited"] = {
+        **_summary(items, time.perf_counter() - start, _calls(setup, {})),
+        "rpm": args.rpm,
+        "max_runner_calls_per_s": max(max(counts.values()) for counts in calls_per_second.values()),
+    }
+    return results
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    criteria = [
+        EvalJudgeCriteria(dimension=f"criterion_{i}", prompt=f"Evaluate aspect {i} of the response.")
+        for i in range(args.criteria)
+    ]
+    tasks = _dataset(args)
+    return {"sequential": await _sequential(args, tasks, criteria), **await _batch(args, tasks, criteria)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--duplicates", type=int, default=20, help="Tasks repeating earlier tasks.")
+    parser.add_argument("--runners", type=int, default=2)
+    parser.add_argument("--criteria", type=int, default=4)
+    parser.add_argument("--model-ms", type=float, default=20.0, help="Latency of the fake models.")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rpm", type=float, default=1200.0, help="Requests per minute per model when rate limited.")
+    args = parser.parse_args()
+
+    result = {
+        "tasks": args.tasks,
+        "runners": args.runners,
+        "criteria": args.criteria,
+        "concurrency": args.concurrency,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark persisting streamed messages in the WebSocketManager, inline and with the MessageWriter.
+
+``--runs`` concurrent runs each stream ``--messages`` text messages through ``WebSocketManager.start_stream``
+to a fake websocket, from a fake team that waits ``--message-ms`` before each message, as for a model call.
+The database is a SQLite file in a temporary directory. The phases are:
+
+- ``inline``: each message is saved as before the MessageWriter, by getting the run and upserting the
+  message, each in its own session and transaction, on the event loop.
+- ``write_behind``: messages are queued to the MessageWriter, which writes them in batches on its thread.
+
+Reported are the messages persisted per second, the total time, and the mean and maximum lag of a
+ticker task on the event loop, which is how long other websockets of the server wait.
+
+Run with::
+
+    python benchmarks/message_persistence.py --runs 50 --messages 100
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage, TextMessage
+from autogenstudio.database import DatabaseManager
+from autogenstudio.datamodel import Message, MessageConfig, Run, RunStatus, Team, TeamResult
+from autogenstudio.datamodel.db import Session as SessionModel
+from autogenstudio.web.managers import connection
+from autogenstudio.web.managers.connection import WebSocketManager
+from autogenstudio.web.managers.message_writer import MessageWriter
+
+
+class FakeWebSocket:
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, data: Any) -> None:
+        pass
+
+
+def fake_team_manager(messages: int, message_ms: float) -> type:
+    class FakeTeamManager:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        async def run_stream(self, **kwargs: Any) -> AsyncGenerator[Any, None]:
+            for i in range(messages):
+                await asyncio.sleep(message_ms / 1000)
+                yield TextMessage(source="agent", content=f"Message {i} " + "lorem ipsum " * 20)
+            yield TeamResult(task_result=TaskResult(messages=[], stop_reason="done"), usage="", duration=0)
+
+    return FakeTeamManager
+
+
+class InlineWebSocketManager(WebSocketManager):
+    """Saves each message inline, as before the MessageWriter."""
+
+    async def _save_message(
+        self,
+        run_id: int,
+        session_id: Optional[int],
+        message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage],
+    ) -> None:
+        run = await self._get_run(run_id)
+        if run:
+            db_message = Message(
+                session_id=run.session_id,
+                run_id=run_id,
+                config=self._convert_images_in_dict(message.model_dump()),
+            )
+            self.db_manager.upsert(db_message)
+
+
+async def _ticker(lags: List[float], interval: float = 0.001) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def _run_phase(args: argparse.Namespace, phase: str) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DatabaseManager(f"sqlite:///{temp_dir}/bench.db", base_dir=temp_dir)
+        db.initialize_database(auto_upgrade=False)
+        team = Team(user_id="bench", component={"name": "Team", "type": "team"})
+        db.upsert(team)
+        session = SessionModel(user_id="bench", team_id=team.id, name="Session")
+        db.upsert(session)
+        run_ids = []
+        for _ in range(args.runs):
+            run = Run(
+                user_id="bench",
+                session_id=session.id or 1,
+                status=RunStatus.CREATED,
+                task=MessageConfig(content="task", source="user").model_dump(),
+            )
+            db.upsert(run)
+            run_ids.append(run.id)
+
+        if phase == "inline":
+            manager: WebSocketManager = InlineWebSocketManager(db)
+        else:
+            manager = WebSocketManager(db, message_writer=MessageWriter(db, batch_size=args.batch_size))
+        for run_id in run_ids:
+            await manager.connect(FakeWebSocket(), run_id)  # type: ignore[arg-type]
+
+        lags: List[float] = []
+        ticker = asyncio.create_task(_ticker(lags))
+        start = time.perf_counter()
+        await asyncio.gather(*(manager.start_stream(run_id, "task", {}) for run_id in run_ids))
+        elapsed = time.perf_counter() - start
+        ticker.cancel()
+        await manager.cleanup()
+
+        persisted = sum(len(db.get(Message, filters={"run_id": run_id}).data) for run_id in run_ids)
+        await db.close()
+    return {
+        "messages_per_s": persisted / elapsed,
+        "elapsed_s": elapsed,
+        "persisted": persisted,
+        "loop_lag_mean_ms": statistics.mean(lags) * 1000,
+        "loop_lag_max_ms": max(lags) * 1000,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    connection.TeamManager = fake_team_manager(args.messages, args.message_ms)  # type: ignore[misc]
+    return {phase: await _run_phase(args, phase) for phase in ("inline", "write_behind")}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50, help="Concurrent runs.")
+    parser.add_argument("--messages", type=int, default=100, help="Messages per run.")
+    parser.add_argument("--message-ms", type=float, default=5.0, help="Wait of the fake team before each message.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    result = {"runs": args.runs, "messages": args.messages, **asyncio.run(bench(args))}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Benchmark opening the history of a session, with the per-run queries and with the paginated joined query.
+
+A SQLite database in a temporary directory is seeded with ``--sessions`` sessions of ``--runs`` runs,
+each with ``--messages`` messages of about ``--message-bytes`` bytes. Then ``--opens`` histories of random
+sessions are opened, one at a time for the latency and ``--concurrency`` at a time, with a ticker task
+on the event loop measuring how long other requests wait. The phases are:
+
+- ``per_run_unindexed``: the runs of the session and then the messages of each run, one query each,
+  on the event loop, without the indexes on ``run_id`` and ``session_id``, as before.
+- ``per_run``: as ``per_run_unindexed``, with the indexes.
+- ``joined``: all runs of the session and all their messages in two queries, in a worker thread.
+- ``joined_page``: as ``joined``, for the first page of ``--page-size`` runs.
+- ``joined_page_projected``: as ``joined_page``, without the team results and message configs.
+
+Reported are the median and p95 latency of an open, the opens per second with concurrent opens, and
+the maximum event loop lag.
+
+Run with::
+
+    python benchmarks/session_history.py --sessions 50 --runs 40 --messages 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from autogenstudio.database import DatabaseManager
+from autogenstudio.datamodel import Message, MessageConfig, Run, RunStatus, Team
+from autogenstudio.datamodel.db import Session as SessionModel
+from sqlalchemy import text
+
+INDEXES = {
+    "ix_message_run_id": "message (run_id)",
+    "ix_message_session_id": "message (session_id)",
+    "ix_run_session_id": "run (session_id)",
+}
+
+
+def _seed(db: DatabaseManager, args: argparse.Namespace) -> List[int]:
+    rng = random.Random(args.seed)
+    team = Team(user_id="bench", component={"name": "Team", "type": "team"})
+    db.upsert(team)
+    content = "lorem ipsum " * (args.message_bytes // 12)
+    session_ids = []
+    for _ in range(args.sessions):
+        session = SessionModel(user_id="bench", team_id=team.id, name="Session")
+        db.upsert(session)
+        session_ids.append(session.id)
+    # Runs of the sessions are interleaved, as for users working at the same time
+    runs = [
+        Run(
+            user_id="bench",
+            session_id=session_id,
+            status=RunStatus.COMPLETE,
+            task=MessageConfig(content="task", source="user").model_dump(),
+            team_result={"task_result": {"messages": [{"content": content}]}, "usage": "", "duration": 1.0},
+        )
+        for _ in range(args.runs)
+        for session_id in rng.sample(session_ids, len(session_ids))
+    ]
+    db.bulk_insert(runs)
+    for run in runs:
+        db.bulk_insert(
+            [
+                Message(
+                    session_id=run.session_id,
+                    run_id=run.id,
+                    config=MessageConfig(content=f"{i} {content}", source="agent").model_dump(),
+                )
+                for i in range(args.messages)
+            ]
+        )
+    return session_ids
+
+
+def _open_per_run(db: DatabaseManager, session_id: int) -> List[Dict[str, Any]]:
+    """The queries of list_session_runs before the joined query."""
+    runs = db.get(Run, filters={"session_id": session_id}, order="asc", return_json=False)
+    run_data = []
+    for run in runs.data:
+        messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
+        run_data.append({"id": run.id, "team_result": run.team_result, "messages": messages.data})
+    return run_data
+
+
+async def _open(db: DatabaseManager, phase: str, session_id: int, page_size: int) -> Any:
+    if phase.startswith("per_run"):
+        return _open_per_run(db, session_id)
+    limit: Optional[int] = page_size if phase.startswith("joined_page") else None
+    include_config = phase != "joined_page_projected"
+    return await db.run_async(db.get_session_runs, session_id, limit=limit, include_config=include_config)
+
+
+async def _ticker(lags: List[float], interval: float = 0.001) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(loop.time() - start - interval)
+
+
+async def _run_phase(
+    db: DatabaseManager, args: argparse.Namespace, phase: str, session_ids: List[int]
+) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    sessions = [rng.choice(session_ids) for _ in range(args.opens)]
+    latencies = []
+    for session_id in sessions:
+        start = time.perf_counter()
+        await _open(db, phase, session_id, args.page_size)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    lags: List[float] = []
+    ticker = asyncio.create_task(_ticker(lags))
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def open_session(session_id: int) -> None:
+        async with semaphore:
+            await _open(db, phase, session_id, args.page_size)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(open_session(session_id) for session_id in sessions))
+    elapsed = time.perf_counter() - start
+    # Let the ticker measure the last wait, which is the whole phase if the opens never yield
+    await asyncio.sleep(0.01)
+    ticker.cancel()
+    return {
+        "latency_median_ms": statistics.median(latencies) * 1000,
+        "latency_p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "opens_per_s": len(sessions) / elapsed,
+        "loop_lag_max_ms": max(lags) * 1000,
+    }
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db = DatabaseManager(f"sqlite:///{temp_dir}/bench.db", base_dir=temp_dir)
+        db.initialize_database(auto_upgrade=False)
+        session_ids = _seed(db, args)
+        with db.engine.begin() as connection:
+            for name in INDEXES:
+                connection.execute(text(f"DROP INDEX {name}"))
+        results["per_run_unindexed"] = await _run_phase(db, args, "per_run_unindexed", session_ids)
+        with db.engine.begin() as connection:
+            for name, columns in INDEXES.items():
+                connection.execute(text(f"CREATE INDEX {name} ON {columns}"))
+        for phase in ("per_run", "joined", "joined_page", "joined_page_projected"):
+            results[phase] = await _run_phase(db, args, phase, session_ids)
+        await db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=40, help="Runs per session.")
+    parser.add_argument("--messages", type=int, default=50, help="Messages per run.")
+    parser.add_argument("--message-bytes", type=int, default=600)
+    parser.add_argument("--opens", type=int, default=50, help="Session histories opened per phase.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=10, help="Runs per page.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    result = {
+        "sessions": args.sessions,
+        "runs": args.runs,
+        "messages": args.messages,
+        "page_size": args.page_size,
+        **asyncio.run(bench(args)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
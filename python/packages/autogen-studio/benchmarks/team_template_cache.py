@@ -0,0 +1,153 @@
+"""Benchmark run-start latency of TeamManager without a team template cache, and with a cold and a warm one.
+
+The team is a ``RoundRobinGroupChat`` of ``--agents`` assistant agents, each with its own
+``OpenAIChatCompletionClient`` and a function tool, and a termination after one message per agent. The
+model clients call a fake OpenAI server on localhost, which answers after ``--model-ms``. Each phase
+runs the team ``--runs`` times, one run after another, as a user would from the Studio UI. The phases are:
+
+- ``uncached``: a new team is built for each run and closed after it, as before the cache.
+- ``cold``: each run uses a new TeamTemplateCache, so it builds the team, as the first run of a config does.
+- ``warm``: the runs share a TeamTemplateCache, after one run to warm it up, so they reuse a reset team
+  with its model clients and their open connections.
+
+Reported are the median and p95 time from the start of a run to its first message, which is the task
+and comes once the team is ready, to the first model response, and to the end of the run.
+
+Run with::
+
+    python benchmarks/team_template_cache.py --agents 4 --runs 30
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.conditions import MaxMessageTermination
+from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.teams import RoundRobinGroupChat
+from autogen_core.tools import FunctionTool
+from autogen_ext.models.openai import OpenAIChatCompletionClient
+from autogenstudio.teammanager import TeamManager, TeamTemplateCache
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def _fake_openai_app(model_ms: float) -> Starlette:
+    async def chat_completions(request: Request) -> JSONResponse:
+        await request.json()
+        await asyncio.sleep(model_ms / 1000)
+        return JSONResponse(
+            {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": "Done."}, "finish_reason": "stop"}
+                ],
+                "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+            }
+        )
+
+    return Starlette(routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])])
+
+
+def _start_server(model_ms: float) -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    config = uvicorn.Config(_fake_openai_app(model_ms), host="127.0.0.1", port=port, log_level="error")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return port
+
+
+def _team_config(agents: int, port: int) -> Dict[str, Any]:
+    participants = [
+        AssistantAgent(
+            name=f"agent_{i}",
+            model_client=OpenAIChatCompletionClient(
+                model="gpt-4o", api_key="bench", base_url=f"http://127.0.0.1:{port}/v1"
+            ),
+            tools=[FunctionTool(add, description="Add two numbers.")],
+            system_message=f"You are agent {i}.",
+        )
+        for i in range(agents)
+    ]
+    team = RoundRobinGroupChat(participants, termination_condition=MaxMessageTermination(agents + 1))
+    return team.dump_component().model_dump()
+
+
+async def _run(config: Dict[str, Any], cache: Optional[TeamTemplateCache]) -> Dict[str, float]:
+    start = time.perf_counter()
+    times: Dict[str, float] = {}
+    async for message in TeamManager(template_cache=cache).run_stream(task="Add 1 and 2.", team_config=config):
+        if isinstance(message, TextMessage):
+            now = time.perf_counter() - start
+            times.setdefault("ready", now)
+            if message.source != "user":
+                times.setdefault("first_response", now)
+    times["run"] = time.perf_counter() - start
+    return times
+
+
+def _summary(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    result = {}
+    for name in ("ready", "first_response", "run"):
+        values = sorted(run[name] for run in runs)
+        result[f"{name}_median_ms"] = statistics.median(values) * 1000
+        result[f"{name}_p95_ms"] = values[int(len(values) * 0.95)] * 1000
+    return result
+
+
+async def bench(args: argparse.Namespace) -> Dict[str, Any]:
+    port = _start_server(args.model_ms)
+    config = _team_config(args.agents, port)
+    results: Dict[str, Any] = {}
+
+    results["uncached"] = _summary([await _run(config, None) for _ in range(args.runs)])
+
+    cold_runs = []
+    for _ in range(args.runs):
+        cache = TeamTemplateCache()
+        cold_runs.append(await _run(config, cache))
+        await cache.clear()
+    results["cold"] = _summary(cold_runs)
+
+    cache = TeamTemplateCache()
+    await _run(config, cache)
+    results["warm"] = _summary([await _run(config, cache) for _ in range(args.runs)])
+    results["warm"]["builds"] = cache.stats.builds
+    await cache.clear()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--model-ms", type=float, default=0.0, help="Latency of the fake model.")
+    args = parser.parse_args()
+
+    result = {"agents": args.agents, "runs": args.runs, **asyncio.run(bench(args))}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
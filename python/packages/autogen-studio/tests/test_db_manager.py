@@ -1,5 +1,6 @@
 import asyncio 
 import pytest
+from sqlalchemy import inspect
 from sqlmodel import Session, text, select
 from typing import Generator
 
@@ -188,3 +189,77 @@ def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         finally:
             asyncio.run(db.close())
             db.reset_db() 
+
+    def test_initialize_database_creates_missing_indexes(self, test_db: DatabaseManager):
+        """Test that the indexes of the models are added to the tables of an existing database"""
+        with test_db.engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_message_run_id"))
+            conn.execute(text("DROP INDEX ix_run_session_id"))
+
+        response = test_db.initialize_database(auto_upgrade=False)
+
+        assert response.status is True
+        inspector = inspect(test_db.engine)
+        assert "ix_message_run_id" in {index["name"] for index in inspector.get_indexes("message")}
+        assert "ix_run_session_id" in {index["name"] for index in inspector.get_indexes("run")}
+
+    def test_paginated_session_history(self, test_db: DatabaseManager, test_user: str):
+        """Test pages of runs and messages, with and without their configs"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session")
+        other_session = SessionModel(user_id=test_user, team_id=team.id, name="Other")
+        test_db.upsert(session)
+        test_db.upsert(other_session)
+        run_ids = []
+        for session_id in [session.id, other_session.id, session.id, session.id]:
+            run = Run(
+                user_id=test_user,
+                session_id=session_id or 1,
+                status=RunStatus.COMPLETE,
+                task=MessageConfig(content="Task", source="user").model_dump(),
+                team_result={"usage": "", "duration": 0},
+            )
+            test_db.upsert(run)
+            run_ids.append(run.id)
+        test_db.bulk_insert(
+            [
+                Message(
+                    user_id=test_user,
+                    session_id=session_id,
+                    run_id=run_id,
+                    config=MessageConfig(content=f"Message {i}", source="assistant").model_dump(),
+                )
+                for i in range(3)
+                for run_id, session_id in zip(run_ids, [session.id, other_session.id, session.id, session.id])
+            ]
+        )
+
+        # Pages of the runs of the session, with their messages
+        first = test_db.get_session_runs(session.id or 1, limit=2)
+        assert [run["id"] for run in first.data["items"]] == [run_ids[0], run_ids[2]]
+        assert [m["config"]["content"] for m in first.data["items"][1]["messages"]] == [
+            "Message 0",
+            "Message 1",
+            "Message 2",
+        ]
+        second = test_db.get_session_runs(session.id or 1, cursor=first.data["next_cursor"], limit=2)
+        assert [run["id"] for run in second.data["items"]] == [run_ids[3]]
+        assert len(second.data["items"][0]["messages"]) == 3
+        assert second.data["next_cursor"] is None
+
+        # Without the configs of the messages and the team results of the runs
+        projected = test_db.get_session_runs(session.id or 1, include_config=False)
+        assert "team_result" not in projected.data["items"][0]
+        assert all("config" not in m for run in projected.data["items"] for m in run["messages"])
+
+        # Pages of the messages of a run
+        page = test_db.get_page(Message, filters={"run_id": run_ids[0]}, limit=2, exclude_columns=("config",))
+        assert len(page.data["items"]) == 2 and "config" not in page.data["items"][0]
+        rest = test_db.get_page(Message, filters={"run_id": run_ids[0]}, cursor=page.data["next_cursor"], limit=2)
+        assert [m["config"]["content"] for m in rest.data["items"]] == ["Message 2"]
+        assert rest.data["next_cursor"] is None
+
+        # The same query in a worker thread
+        threaded = asyncio.run(test_db.run_async(test_db.get_session_runs, session.id or 1))
+        assert [run["id"] for run in threaded.data["items"]] == [run_ids[0], run_ids[2], run_ids[3]]
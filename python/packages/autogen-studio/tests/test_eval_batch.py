@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+from autogenstudio.datamodel.eval import EvalDimensionScore, EvalJudgeCriteria, EvalRunStatus, EvalTask
+from autogenstudio.eval.batch import BatchEvaluator
+from autogenstudio.eval.judges import LLMEvalJudge
+from autogenstudio.eval.orchestrator import EvalOrchestrator
+from autogenstudio.eval.runners import ModelEvalRunner
+
+CRITERIA = [
+    EvalJudgeCriteria(dimension="relevance", prompt="Is the answer relevant?"),
+    EvalJudgeCriteria(dimension="accuracy", prompt="Is the answer accurate?"),
+]
+
+
+def _verdicts(score: float) -> str:
+    return json.dumps({"scores": [{"dimension": c.dimension, "reason": "ok", "score": score} for c in CRITERIA]})
+
+
+async def test_llm_judge_batches_criteria() -> None:
+    judge_client = ReplayChatCompletionClient([_verdicts(8)])
+    runner = ModelEvalRunner(model_client=ReplayChatCompletionClient(["Paris"]))
+    task = EvalTask(input="What is the capital of France?")
+
+    result = await runner.run(task)
+    score = await LLMEvalJudge(model_client=judge_client).judge(task, result, CRITERIA)
+
+    assert [ds.dimension for ds in score.dimension_scores] == ["relevance", "accuracy"]
+    assert score.overall_score == 8
+    # One call for both criteria, with the text of the result instead of its whole dump
+    assert len(judge_client.create_calls) == 1
+    prompt = judge_client.create_calls[0]["messages"][0].content
+    assert "model: Paris" in prompt and "models_usage" not in prompt
+
+
+async def test_batch_evaluator_caches_and_resumes(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.jsonl"
+    tasks = [
+        EvalTask(task_id="france", input="What is the capital of France?"),
+        EvalTask(task_id="germany", input="What is the capital of Germany?"),
+        # Same content as the first task, so its run and verdicts are cached
+        EvalTask(task_id="france-again", input="What is the capital of France?"),
+    ]
+    runner = ModelEvalRunner(model_client=ReplayChatCompletionClient(["Paris", "Berlin"]))
+    judge = LLMEvalJudge(model_client=ReplayChatCompletionClient([_verdicts(9), _verdicts(7)]))
+
+    evaluator = BatchEvaluator(max_concurrency=1)
+    items = await evaluator.evaluate(tasks, [runner], judge, CRITERIA, checkpoint_path=checkpoint_path)
+
+    assert [item.task_id for item in items] == ["france", "germany", "france-again"]
+    assert all(item.status == EvalRunStatus.COMPLETED for item in items)
+    assert [item.score.overall_score for item in items if item.score] == [9, 7, 9]
+    assert evaluator.stats.runner_runs == 2
+    assert evaluator.stats.runner_cache_hits == 1
+    assert evaluator.stats.judge_calls == 2
+    assert evaluator.stats.verdict_cache_hits == 2
+
+    # An interrupted batch leaves a partial last line, which is skipped on resuming
+    lines = checkpoint_path.read_text().splitlines()
+    checkpoint_path.write_text("\n".join(lines[:2]) + "\n" + lines[2][:20])
+    resumed = BatchEvaluator()
+    items = await resumed.evaluate(tasks, [runner], judge, CRITERIA, checkpoint_path=checkpoint_path)
+
+    assert resumed.stats.resumed == 2
+    assert items[0].run_result is not None and items[0].run_result.result is not None
+    assert items[0].run_result.result.messages[0].to_text() == "Paris"
+    # The replay clients are exhausted, so the remaining item can only fail
+    assert items[2].status == EvalRunStatus.FAILED
+    items = await resumed.evaluate(tasks, [runner], judge, CRITERIA, checkpoint_path=checkpoint_path)
+    assert resumed.stats.resumed == 4
+
+
+async def test_batch_evaluator_resumes_only_with_same_judge_and_criteria(tmp_path: Path) -> None:
+    checkpoint_path = tmp_path / "checkpoint.jsonl"
+    tasks = [EvalTask(task_id="france", input="What is the capital of France?")]
+    runner = ModelEvalRunner(model_client=ReplayChatCompletionClient(["Paris"] * 3))
+    # A single criterion is judged on its own
+    relevance_verdict = EvalDimensionScore(
+        dimension="relevance", reason="ok", score=5, max_value=10, min_value=0
+    ).model_dump_json()
+    judge = LLMEvalJudge(model_client=ReplayChatCompletionClient([_verdicts(9), relevance_verdict]))
+    await BatchEvaluator().evaluate(tasks, [runner], judge, CRITERIA, checkpoint_path=checkpoint_path)
+
+    # Another judge judges the item again instead of resuming it with the scores of the first judge
+    other_judge = LLMEvalJudge(model_client=ReplayChatCompletionClient([_verdicts(3)]), name="Other Judge")
+    evaluator = BatchEvaluator()
+    items = await evaluator.evaluate(tasks, [runner], other_judge, CRITERIA, checkpoint_path=checkpoint_path)
+    assert evaluator.stats.resumed == 0
+    assert items[0].score is not None and items[0].score.overall_score == 3
+
+    # As do other criteria
+    evaluator = BatchEvaluator()
+    items = await evaluator.evaluate(tasks, [runner], judge, CRITERIA[:1], checkpoint_path=checkpoint_path)
+    assert evaluator.stats.resumed == 0
+    assert items[0].score is not None and items[0].score.overall_score == 5
+
+    evaluator = BatchEvaluator()
+    items = await evaluator.evaluate(tasks, [runner], judge, CRITERIA, checkpoint_path=checkpoint_path)
+    assert evaluator.stats.resumed == 1
+    assert items[0].score is not None and items[0].score.overall_score == 9
+
+
+async def test_orchestrator_run_batch() -> None:
+    orchestrator = EvalOrchestrator()
+    task_id = await orchestrator.create_task(EvalTask(input="What is the capital of France?"))
+    criteria_ids = [await orchestrator.create_criteria(criterion) for criterion in CRITERIA]
+    runner = ModelEvalRunner(model_client=ReplayChatCompletionClient(["Paris"]))
+    judge = LLMEvalJudge(model_client=ReplayChatCompletionClient([_verdicts(10)]))
+
+    items = await orchestrator.run_batch([task_id], [runner], judge, criteria_ids)
+
+    assert len(items) == 1
+    assert items[0].score is not None and items[0].score.overall_score == 10
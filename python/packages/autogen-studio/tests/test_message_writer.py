@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any, AsyncGenerator, Generator, List
+
+import pytest
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import TextMessage
+
+from autogenstudio.database import DatabaseManager
+from autogenstudio.datamodel import Message, MessageConfig, Run, RunStatus, Team, TeamResult
+from autogenstudio.datamodel.db import Session as SessionModel
+from autogenstudio.web.managers import connection
+from autogenstudio.web.managers.connection import WebSocketManager
+from autogenstudio.web.managers.message_writer import MessageWriter
+
+
+@pytest.fixture
+def test_db(tmp_path) -> Generator[DatabaseManager, None, None]:
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}", base_dir=tmp_path)
+    db.reset_db()
+    db.initialize_database(auto_upgrade=False)
+    yield db
+    asyncio.run(db.close())
+
+
+@pytest.fixture
+def run_id(test_db: DatabaseManager) -> int:
+    team = Team(user_id="test_user", component={"name": "Team", "type": "team"})
+    test_db.upsert(team)
+    session = SessionModel(user_id="test_user", team_id=team.id, name="Session")
+    test_db.upsert(session)
+    run = Run(
+        user_id="test_user",
+        session_id=session.id or 1,
+        status=RunStatus.CREATED,
+        task=MessageConfig(content="task", source="user").model_dump(),
+    )
+    test_db.upsert(run)
+    assert run.id is not None
+    return run.id
+
+
+def _messages(db: DatabaseManager, run_id: int) -> List[str]:
+    response = db.get(Message, filters={"run_id": run_id}, order="asc")
+    return [message.config["content"] for message in response.data]
+
+
+async def test_message_writer_batches_and_flushes(test_db: DatabaseManager, run_id: int) -> None:
+    writer = MessageWriter(test_db, max_queue_size=8, batch_size=4)
+    for i in range(10):
+        await writer.put(Message(session_id=1, run_id=run_id, config={"source": "agent", "content": f"message {i}"}))
+    await writer.flush()
+
+    assert _messages(test_db, run_id) == [f"message {i}" for i in range(10)]
+    assert writer.stats.messages_written == 10
+    assert writer.stats.batches_written <= 5
+
+    await writer.put(Message(session_id=1, run_id=run_id, config={"source": "agent", "content": "last"}))
+    await writer.close()
+    assert _messages(test_db, run_id)[-1] == "last"
+
+
+class FailingDatabaseManager:
+    """Fails the inserts that include a message with the content ``bad``"""
+
+    def __init__(self, db: DatabaseManager) -> None:
+        self.db = db
+        self.supports_threads = db.supports_threads
+        self.inserts = 0
+
+    def bulk_insert(self, models: List[Message]) -> Any:
+        self.inserts += 1
+        if any(model.config["content"] == "bad" for model in models):
+            raise RuntimeError("insert failed")
+        return self.db.bulk_insert(models)
+
+
+async def test_message_writer_isolates_failed_messages(test_db: DatabaseManager, run_id: int) -> None:
+    db = FailingDatabaseManager(test_db)
+    writer = MessageWriter(db, batch_size=8)  # type: ignore[arg-type]
+    for content in ["first", "bad", "last"]:
+        await writer.put(Message(session_id=1, run_id=run_id, config={"source": "agent", "content": content}))
+
+    # Only the bad message is lost, and the flush for its run reports it once
+    assert await writer.flush(run_id) == 1
+    assert _messages(test_db, run_id) == ["first", "last"]
+    assert writer.stats.messages_written == 2
+    assert writer.stats.messages_failed == 1
+    assert await writer.flush(run_id) == 0
+    await writer.close()
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, data: Any) -> None:
+        self.sent.append(data)
+
+
+class FakeTeamManager:
+    def __init__(self, **kwargs: Any) -> None:
+        pass
+
+    async def run_stream(self, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        for i in range(20):
+            yield TextMessage(source="agent", content=f"message {i}")
+        yield TeamResult(
+            task_result=TaskResult(messages=[], stop_reason="done"),
+            usage="",
+            duration=0,
+        )
+
+
+async def test_start_stream_persists_messages_before_completing(
+    test_db: DatabaseManager, run_id: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(connection, "TeamManager", FakeTeamManager)
+    manager = WebSocketManager(test_db, message_writer=MessageWriter(test_db, batch_size=8))
+    websocket = FakeWebSocket()
+    await manager.connect(websocket, run_id)  # type: ignore[arg-type]
+
+    await manager.start_stream(run_id, "task", {})
+
+    assert _messages(test_db, run_id) == [f"message {i}" for i in range(20)]
+    assert manager.message_writer.stats.batches_written < 20
+    run = test_db.get(Run, filters={"id": run_id}).data[0]
+    assert run.status == RunStatus.COMPLETE
+    await manager.cleanup()
+
+
+async def test_start_stream_records_unsaved_messages(
+    test_db: DatabaseManager, run_id: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class BadMessageTeamManager(FakeTeamManager):
+        async def run_stream(self, **kwargs: Any) -> AsyncGenerator[Any, None]:
+            yield TextMessage(source="agent", content="bad")
+            async for message in super().run_stream(**kwargs):
+                yield message
+
+    monkeypatch.setattr(connection, "TeamManager", BadMessageTeamManager)
+    db = FailingDatabaseManager(test_db)
+    manager = WebSocketManager(test_db, message_writer=MessageWriter(db, batch_size=8))  # type: ignore[arg-type]
+    await manager.connect(FakeWebSocket(), run_id)  # type: ignore[arg-type]
+
+    await manager.start_stream(run_id, "task", {})
+
+    assert _messages(test_db, run_id) == [f"message {i}" for i in range(20)]
+    run = test_db.get(Run, filters={"id": run_id}).data[0]
+    assert run.status == RunStatus.COMPLETE
+    assert run.error_message == "1 of the messages of the run could not be saved"
+    await manager.cleanup()
@@ -5,7 +5,7 @@
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from autogenstudio.teammanager import TeamManager
+from autogenstudio.teammanager import TeamManager, TeamTemplateCache
 from autogenstudio.datamodel.types import TeamResult, EnvironmentVariable
 from autogen_core import CancellationToken
 
@@ -147,3 +147,109 @@ async def mock_run_stream(*args, **kwargs):
             # Verify the last message is a TeamResult
             assert isinstance(streamed_messages[-1], type(mock_messages[-1]))
  
+
+
+@pytest.fixture
+def replay_config():
+    """A team config whose model client replays responses, so that it can run"""
+    from autogen_agentchat.agents import AssistantAgent
+    from autogen_agentchat.conditions import MaxMessageTermination
+    from autogen_agentchat.teams import RoundRobinGroupChat
+    from autogen_ext.models.replay import ReplayChatCompletionClient
+
+    agent = AssistantAgent(
+        name="assistant",
+        model_client=ReplayChatCompletionClient([f"Response {i}" for i in range(10)]),
+    )
+    team = RoundRobinGroupChat([agent], termination_condition=MaxMessageTermination(2))
+    return team.dump_component().model_dump()
+
+
+class TestTeamTemplateCache:
+    @pytest.mark.asyncio
+    async def test_reuses_reset_teams(self, replay_config):
+        """Test that finished runs hand their reset team to the next run of the config"""
+        cache = TeamTemplateCache()
+
+        first = await TeamManager(template_cache=cache).run(task="First", team_config=replay_config)
+        second = await TeamManager(template_cache=cache).run(task="Second", team_config=replay_config)
+
+        assert cache.stats.builds == 1
+        assert cache.stats.reuses == 1
+        # The second run starts from the initial state, with only its own task
+        assert [m.content for m in first.task_result.messages] == ["First", "Response 0"]
+        assert [m.content for m in second.task_result.messages] == ["Second", "Response 1"]
+
+        # Other environment variables build another team
+        env_vars = [EnvironmentVariable(name="TEST_TEMPLATE_CACHE", value="1", type="string")]
+        await TeamManager(template_cache=cache).run(task="Third", team_config=replay_config, env_vars=env_vars)
+        assert cache.stats.builds == 2
+        assert len(cache) == 2
+
+        await cache.clear()
+        assert cache.stats.closed == 2
+
+    @pytest.mark.asyncio
+    async def test_reuses_teams_within_scope(self, replay_config):
+        """Test that teams are only reused by runs in the same scope, as they keep the state of some components"""
+        cache = TeamTemplateCache()
+
+        await TeamManager(template_cache=cache, template_scope="alice/1").run(task="First", team_config=replay_config)
+        await TeamManager(template_cache=cache, template_scope="bob/2").run(task="Second", team_config=replay_config)
+        assert cache.stats.builds == 2
+        assert cache.stats.reuses == 0
+
+        await TeamManager(template_cache=cache, template_scope="alice/1").run(task="Third", team_config=replay_config)
+        assert cache.stats.reuses == 1
+        await cache.clear()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("reuse_teams", [False, True])
+    async def test_server_reuses_teams_only_when_enabled(self, tmp_path, monkeypatch, reuse_teams):
+        """Test that the server's websocket manager only gets a template cache with the REUSE_TEAMS setting"""
+        from autogenstudio.web import deps
+        from autogenstudio.web.config import settings
+
+        monkeypatch.setattr(settings, "REUSE_TEAMS", reuse_teams)
+        (tmp_path / "configs").mkdir()
+        await deps.init_managers(f"sqlite:///{tmp_path / 'test.db'}", tmp_path / "configs", tmp_path)
+        try:
+            websocket_manager = await deps.get_websocket_manager()
+            assert isinstance(websocket_manager.team_template_cache, TeamTemplateCache) is reuse_teams
+        finally:
+            await deps.cleanup_managers()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_cancelled_runs(self, replay_config):
+        """Test that concurrent runs get their own teams, and teams of cancelled runs are closed"""
+        cache = TeamTemplateCache(max_idle_teams=1)
+
+        results = await asyncio.gather(
+            *(TeamManager(template_cache=cache).run(task=f"Task {i}", team_config=replay_config) for i in range(3))
+        )
+        assert all(len(result.task_result.messages) == 2 for result in results)
+        assert cache.stats.builds == 3
+        # Only one team is kept for the config
+        assert cache.stats.closed == 2
+
+        cancellation_token = CancellationToken()
+        stream = TeamManager(template_cache=cache).run_stream(
+            task="Cancelled", team_config=replay_config, cancellation_token=cancellation_token
+        )
+        async for _ in stream:
+            cancellation_token.cancel()
+            break
+        await stream.aclose()
+        assert cache.stats.reuses == 1
+        assert cache.stats.closed == 3
+
+    @pytest.mark.asyncio
+    async def test_load_file_parses_changed_files(self, config_file, sample_config):
+        """Test that config files are parsed again only when they change"""
+        cache = TeamTemplateCache()
+        assert await cache.load_file(config_file) == sample_config
+        assert await cache.load_file(config_file) is await cache.load_file(config_file)
+
+        changed = dict(sample_config, label="Changed")
+        await asyncio.to_thread(Path(config_file).write_text, json.dumps(changed, indent=2))
+        assert (await cache.load_file(config_file))["label"] == "Changed"